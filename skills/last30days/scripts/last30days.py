@@ -4,6 +4,8 @@ last30days - Research a topic from the last 30 days on Reddit + X + YouTube + We
 
 Usage:
     python3 last30days.py <topic> [options]
+    python3 last30days.py --topics-file topics.txt [options]
+    python3 last30days.py serve [--stop]     # keep a warm daemon for repeat queries
 
 Options:
     --mock              Use fixtures instead of real API calls
@@ -14,33 +16,44 @@ Options:
     --debug             Enable verbose debug logging
     --store             Persist findings to SQLite database
     --diagnose          Show source availability diagnostics and exit
+    --topics-file=PATH  Batch mode: research every topic in PATH, one JSON line per topic
 """
 
 import argparse
 import atexit
+import io
 import json
 import os
 import signal
 import sys
 import threading
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import time
+import traceback
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
 from datetime import datetime, timezone
 from pathlib import Path
+from urllib.parse import urlparse
 
 # Add lib to path
 SCRIPT_DIR = Path(__file__).parent.resolve()
 sys.path.insert(0, str(SCRIPT_DIR))
 
+# lib modules reach back for register_child_pid() via `import last30days`;
+# make that resolve to this module when run as a script, not a fresh copy.
+sys.modules.setdefault("last30days", sys.modules[__name__])
+
 # ---------------------------------------------------------------------------
 # Global timeout & child process management
 # ---------------------------------------------------------------------------
 _child_pids: set = set()
 _child_pids_lock = threading.Lock()
 
+# enrich_threads: full Reddit thread fetches (for comments), at most
+# enrich_max_items and at most the Reddit items render_compact shows
 TIMEOUT_PROFILES = {
-    "quick":   {"global": 90,  "future": 30, "reddit_future": 60,  "youtube_future": 60,  "tiktok_future": 90,   "instagram_future": 90,   "hackernews_future": 30,  "bluesky_future": 30,  "truthsocial_future": 30,  "polymarket_future": 15,  "http": 15, "enrich_per": 8,  "enrich_total": 30, "enrich_max_items": 10},
-    "default": {"global": 180, "future": 60, "reddit_future": 90,  "youtube_future": 90,  "tiktok_future": 120,  "instagram_future": 120,  "hackernews_future": 60,  "bluesky_future": 60,  "truthsocial_future": 60,  "polymarket_future": 30,  "http": 30, "enrich_per": 15, "enrich_total": 45, "enrich_max_items": 15},
-    "deep":    {"global": 300, "future": 90, "reddit_future": 120, "youtube_future": 120, "tiktok_future": 150,  "instagram_future": 150,  "hackernews_future": 90,  "bluesky_future": 90,  "truthsocial_future": 90,  "polymarket_future": 45,  "http": 30, "enrich_per": 15, "enrich_total": 60, "enrich_max_items": 25},
+    "quick":   {"global": 90,  "future": 30, "reddit_future": 60,  "youtube_future": 60,  "tiktok_future": 90,   "instagram_future": 90,   "hackernews_future": 30,  "bluesky_future": 30,  "truthsocial_future": 30,  "polymarket_future": 15,  "http": 15, "enrich_per": 8,  "enrich_total": 30, "enrich_max_items": 10, "enrich_threads": 10},
+    "default": {"global": 180, "future": 60, "reddit_future": 90,  "youtube_future": 90,  "tiktok_future": 120,  "instagram_future": 120,  "hackernews_future": 60,  "bluesky_future": 60,  "truthsocial_future": 60,  "polymarket_future": 30,  "http": 30, "enrich_per": 15, "enrich_total": 45, "enrich_max_items": 15, "enrich_threads": 15},
+    "deep":    {"global": 300, "future": 90, "reddit_future": 120, "youtube_future": 120, "tiktok_future": 150,  "instagram_future": 150,  "hackernews_future": 90,  "bluesky_future": 90,  "truthsocial_future": 90,  "polymarket_future": 45,  "http": 30, "enrich_per": 15, "enrich_total": 60, "enrich_max_items": 25, "enrich_threads": 15},
 }
 
 # Valid source names for the --search flag
@@ -83,6 +96,84 @@ def parse_search_flag(search_str: str) -> set:
     return sources
 
 
+# --search aliases -> source keys used by run_research
+SOURCE_ALIASES = {
+    "hn": "hackernews",
+    "bsky": "bluesky",
+    "truth": "truthsocial",
+    "xhs": "xiaohongshu",
+}
+
+
+def parse_quorum_flag(quorum_str: str) -> dict:
+    """Parse and validate the --quorum flag value.
+
+    The spec is a comma-separated list of terms, all of which must hold:
+      - a source name (e.g. "reddit") is required to have finished
+      - "+N" requires N further sources (any others) to have finished
+      - "items=N" requires N items in total across finished sources
+
+    Examples: "reddit,x,+2"  "items=40"  "reddit,items=25"
+
+    Args:
+        quorum_str: Quorum spec string
+
+    Returns:
+        Dict with keys: required (set), others (int), min_items (int)
+
+    Raises:
+        SystemExit: If the spec is invalid
+    """
+    quorum = {"required": set(), "others": 0, "min_items": 0}
+    for term in quorum_str.split(","):
+        term = term.strip().lower()
+        if not term:
+            continue
+        try:
+            if term.startswith("+"):
+                quorum["others"] = int(term[1:])
+                continue
+            if term.startswith("items="):
+                quorum["min_items"] = int(term[len("items="):])
+                continue
+        except ValueError:
+            print(f"Error: Invalid --quorum term '{term}'.", file=sys.stderr)
+            sys.exit(1)
+        if term not in VALID_SEARCH_SOURCES:
+            print(
+                f"Error: Unknown quorum source '{term}'. "
+                f"Valid: {', '.join(sorted(VALID_SEARCH_SOURCES))}",
+                file=sys.stderr,
+            )
+            sys.exit(1)
+        quorum["required"].add(SOURCE_ALIASES.get(term, term))
+    if not quorum["required"] and not quorum["others"] and not quorum["min_items"]:
+        print("Error: --quorum requires at least one term.", file=sys.stderr)
+        sys.exit(1)
+    return quorum
+
+
+def quorum_met(quorum: dict, settled: dict) -> bool:
+    """Check whether finished sources satisfy a quorum spec.
+
+    Args:
+        quorum: Parsed spec from parse_quorum_flag()
+        settled: Source name -> item count for every source that has finished
+            (failed sources count as finished with 0 items)
+
+    Returns:
+        True when every term of the spec holds. Named sources only need to
+        have finished; "+N" counts other sources that returned items, so
+        fast failures (auth errors, skipped probes) can't meet it.
+    """
+    if not quorum["required"].issubset(settled):
+        return False
+    others = sum(1 for name, count in settled.items() if count and name not in quorum["required"])
+    if others < quorum["others"]:
+        return False
+    return sum(settled.values()) >= quorum["min_items"]
+
+
 def register_child_pid(pid: int):
     """Track a child process for cleanup."""
     with _child_pids_lock:
@@ -109,29 +200,87 @@ def _cleanup_children():
 atexit.register(_cleanup_children)
 
 
-def _install_global_timeout(timeout_seconds: int):
-    """Install a global timeout watchdog.
+# Grace period after the global deadline for the partial report to render
+# before the hard-exit backstop fires.
+DEADLINE_GRACE_SECONDS = 20
+
+_deadline = None  # time.monotonic() value at which the global timeout fires
+_deadline_seconds = None
+_deadline_hit = threading.Event()
+_deadline_timers: list = []
 
-    Uses SIGALRM on Unix, threading.Timer as fallback.
+
+def _install_global_timeout(timeout_seconds: int, backstop: bool = True):
+    """Install the global timeout.
+
+    Cancellation is cooperative: when the deadline passes, tracked child
+    process groups are killed and run_research() stops waiting on outstanding
+    sources, filling in timeout errors so the normal normalize/score/render
+    path still runs on whatever completed. A hard exit fires
+    DEADLINE_GRACE_SECONDS later as a backstop in case that path hangs.
+
+    Installing again replaces the previous deadline (the serve daemon does
+    this once per request, with backstop=False so it never exits itself).
     """
-    if hasattr(signal, 'SIGALRM'):
-        def _handler(signum, frame):
-            sys.stderr.write(f"\n[TIMEOUT] Global timeout ({timeout_seconds}s) exceeded. Cleaning up.\n")
-            sys.stderr.flush()
-            _cleanup_children()
-            sys.exit(1)
-        signal.signal(signal.SIGALRM, _handler)
-        signal.alarm(timeout_seconds)
-    else:
-        # Windows fallback
-        def _watchdog():
-            sys.stderr.write(f"\n[TIMEOUT] Global timeout ({timeout_seconds}s) exceeded. Cleaning up.\n")
-            sys.stderr.flush()
-            _cleanup_children()
-            os._exit(1)
-        timer = threading.Timer(timeout_seconds, _watchdog)
+    global _deadline, _deadline_seconds
+    _clear_global_timeout()
+    _deadline_hit.clear()
+    _deadline = time.monotonic() + timeout_seconds
+    _deadline_seconds = timeout_seconds
+
+    def _on_deadline():
+        sys.stderr.write(
+            f"\n[TIMEOUT] Global timeout ({timeout_seconds}s) exceeded. "
+            "Emitting partial results.\n"
+        )
+        sys.stderr.flush()
+        _deadline_hit.set()
+        _cleanup_children()
+
+    def _backstop():
+        sys.stderr.write("\n[TIMEOUT] Partial report did not finish in time. Exiting.\n")
+        sys.stderr.flush()
+        _cleanup_children()
+        os._exit(1)
+
+    timers = [(timeout_seconds, _on_deadline)]
+    if backstop:
+        timers.append((timeout_seconds + DEADLINE_GRACE_SECONDS, _backstop))
+    for delay, fn in timers:
+        timer = threading.Timer(delay, fn)
         timer.daemon = True
         timer.start()
+        _deadline_timers.append(timer)
+
+
+def _clear_global_timeout():
+    """Cancel the global timeout's timers and forget its deadline."""
+    global _deadline, _deadline_seconds
+    for timer in _deadline_timers:
+        timer.cancel()
+    _deadline_timers.clear()
+    _deadline = None
+    _deadline_seconds = None
+
+
+def deadline_passed() -> bool:
+    """Return True once the global timeout has fired."""
+    return _deadline_hit.is_set() or (_deadline is not None and time.monotonic() >= _deadline)
+
+
+def time_left(limit: float) -> float:
+    """Cap a wait at the time remaining before the global deadline.
+
+    Args:
+        limit: Wait the caller would use without a global deadline
+
+    Returns:
+        min(limit, seconds until the deadline), never negative
+    """
+    if _deadline is None:
+        return limit
+    return max(0.0, min(limit, _deadline - time.monotonic()))
+
 
 from lib import (
     bird_x,
@@ -154,6 +303,7 @@ from lib import (
     schema,
     score,
     scrapecreators_x,
+    serve,
     ui,
     tiktok,
     instagram,
@@ -161,6 +311,7 @@ from lib import (
     xai_x,
     youtube_yt,
 )
+from lib.journal import RunJournal
 
 
 def load_fixture(name: str) -> dict:
@@ -172,6 +323,12 @@ def load_fixture(name: str) -> dict:
     return {}
 
 
+def _rank_reddit_items(items: list, from_date: str, to_date: str) -> list:
+    """Indices of raw Reddit items, best first, by the score the report ranks them by."""
+    scored = score.score_reddit_items(normalize.normalize_reddit_items(items, from_date, to_date))
+    return sorted(range(len(items)), key=lambda i: scored[i].score, reverse=True)
+
+
 def _search_reddit(
     topic: str,
     config: dict,
@@ -180,11 +337,13 @@ def _search_reddit(
     to_date: str,
     depth: str,
     mock: bool,
+    prefetcher: reddit_enrich.ThreadPrefetcher = None,
 ) -> tuple:
     """Search Reddit (runs in thread).
 
     Uses ScrapeCreators when SCRAPECREATORS_API_KEY is available (preferred).
-    Falls back to OpenAI Responses API otherwise.
+    Falls back to OpenAI Responses API otherwise. With a prefetcher, thread
+    URLs streamed back by OpenAI start fetching before the search finishes.
 
     Returns:
         Tuple of (reddit_items, raw_response, error, used_scrapecreators)
@@ -243,6 +402,7 @@ def _search_reddit(
                     depth=depth,
                     auth_source=config.get("OPENAI_AUTH_SOURCE", "api_key"),
                     account_id=config.get("OPENAI_CHATGPT_ACCOUNT_ID"),
+                    on_url=prefetcher.add if prefetcher else None,
                 )
             except http.HTTPError as e:
                 raw_response = {"error": str(e)}
@@ -322,11 +482,14 @@ def _search_x(
     depth: str,
     mock: bool,
     x_source: str = "xai",
+    on_item=None,
 ) -> tuple:
     """Search X via Bird CLI or xAI (runs in thread).
 
     Args:
         x_source: 'bird' or 'xai' - which backend to use
+        on_item: Called with each xAI item as it streams in, so a caller
+            that stops waiting can keep what arrived
 
     Returns:
         Tuple of (x_items, raw_response, error)
@@ -347,6 +510,7 @@ def _search_x(
                 from_date,
                 to_date,
                 depth=depth,
+                speculative=True,
             )
         except Exception as e:
             raw_response = {"error": str(e)}
@@ -388,6 +552,7 @@ def _search_x(
             from_date,
             to_date,
             depth=depth,
+            on_item=on_item,
         )
     except http.HTTPError as e:
         raw_response = {"error": str(e)}
@@ -397,6 +562,8 @@ def _search_x(
         x_error = f"{type(e).__name__}: {e}"
 
     x_items = xai_x.parse_x_response(raw_response or {})
+    if raw_response and raw_response.get("partial") and not x_error:
+        x_error = f"xAI stream cut short, kept {len(x_items)} posts"
 
     return x_items, raw_response, x_error
 
@@ -406,9 +573,13 @@ def _search_youtube(
     from_date: str,
     to_date: str,
     depth: str,
+    budget: float = None,
 ) -> tuple:
     """Search YouTube via yt-dlp (runs in thread).
 
+    Args:
+        budget: Seconds the search and transcript fetches may take
+
     Returns:
         Tuple of (youtube_items, youtube_error)
     """
@@ -416,7 +587,7 @@ def _search_youtube(
 
     try:
         response = youtube_yt.search_and_transcribe(
-            topic, from_date, to_date, depth=depth,
+            topic, from_date, to_date, depth=depth, budget=budget,
         )
     except Exception as e:
         return [], f"{type(e).__name__}: {e}"
@@ -435,9 +606,13 @@ def _search_tiktok(
     to_date: str,
     depth: str,
     token: str,
+    budget: float = None,
 ) -> tuple:
     """Search TikTok via ScrapeCreators (runs in thread).
 
+    Args:
+        budget: Seconds the search and caption fetches may take
+
     Returns:
         Tuple of (tiktok_items, tiktok_error)
     """
@@ -445,7 +620,7 @@ def _search_tiktok(
 
     try:
         response = tiktok.search_and_enrich(
-            topic, from_date, to_date, depth=depth, token=token,
+            topic, from_date, to_date, depth=depth, token=token, budget=budget,
         )
     except Exception as e:
         return [], f"{type(e).__name__}: {e}"
@@ -464,9 +639,13 @@ def _search_instagram(
     to_date: str,
     depth: str,
     token: str,
+    budget: float = None,
 ) -> tuple:
     """Search Instagram via ScrapeCreators (runs in thread).
 
+    Args:
+        budget: Seconds the search and caption fetches may take
+
     Returns:
         Tuple of (instagram_items, instagram_error)
     """
@@ -474,7 +653,7 @@ def _search_instagram(
 
     try:
         response = instagram.search_and_enrich(
-            topic, from_date, to_date, depth=depth, token=token,
+            topic, from_date, to_date, depth=depth, token=token, budget=budget,
         )
     except Exception as e:
         return [], f"{type(e).__name__}: {e}"
@@ -578,9 +757,13 @@ def _search_polymarket(
     from_date: str,
     to_date: str,
     depth: str,
+    mock: bool = False,
 ) -> tuple:
     """Search Polymarket via Gamma API (runs in thread).
 
+    Args:
+        mock: Leave the local event index alone (no build in test runs)
+
     Returns:
         Tuple of (pm_items, pm_error)
     """
@@ -588,7 +771,7 @@ def _search_polymarket(
 
     try:
         response = polymarket.search_polymarket(
-            topic, from_date, to_date, depth=depth,
+            topic, from_date, to_date, depth=depth, use_index=not mock,
         )
     except Exception as e:
         return [], f"{type(e).__name__}: {e}"
@@ -601,45 +784,171 @@ def _search_polymarket(
     return pm_items, pm_error
 
 
+# Web search fan-in ('merge' mode): once one backend has answered, wait at
+# most this long for the others before merging what's in
+WEB_MERGE_GRACE = 5
+
+
+def _search_web_backend(
+    backend: str,
+    topic: str,
+    config: dict,
+    from_date: str,
+    to_date: str,
+    depth: str,
+) -> list:
+    """Run one native web search backend and return its raw results."""
+    from lib import brave_search, parallel_search, openrouter_search
+
+    if backend == "parallel":
+        return parallel_search.search_web(
+            topic, from_date, to_date, config["PARALLEL_API_KEY"], depth=depth,
+        )
+    if backend == "brave":
+        return brave_search.search_web(
+            topic, from_date, to_date, config["BRAVE_API_KEY"], depth=depth,
+        )
+    if backend == "openrouter":
+        return openrouter_search.search_web(
+            topic, from_date, to_date, config["OPENROUTER_API_KEY"], depth=depth,
+        )
+    return []
+
+
+def _merge_web_results(results: dict, backends: list) -> list:
+    """Combine backends' raw results, dropping repeated URLs.
+
+    Earlier backends in priority order win when the same URL comes back
+    from more than one.
+    """
+    merged = []
+    for backend in backends:
+        for i, item in enumerate(results.get(backend) or []):
+            item = dict(item)
+            item["id"] = f"{backend}-{i}"  # Unique across backends for the dedupe
+            merged.append(item)
+    kept = {
+        w.id for w in websearch.dedupe_websearch(
+            websearch.normalize_websearch_items(merged, "", "")
+        )
+    }
+    result = []
+    for item in merged:
+        if item["id"] in kept:
+            del item["id"]
+            result.append(item)
+    return result
+
+
+def _fan_out_web(
+    backends: list,
+    mode: str,
+    topic: str,
+    config: dict,
+    from_date: str,
+    to_date: str,
+    depth: str,
+    budget: float = None,
+) -> tuple:
+    """Query several web backends at once and race or merge their results.
+
+    'race' returns the first backend to come back with results. 'merge'
+    waits for all of them (at most WEB_MERGE_GRACE past the first answer)
+    and merges with URL dedupe. Either way, a backend that errors or is
+    still running at the budget just doesn't contribute.
+
+    Returns:
+        Tuple of (raw_results, web_error)
+    """
+    results = {}
+    errors = {}
+    executor = ThreadPoolExecutor(max_workers=len(backends))
+    futures = {
+        executor.submit(_search_web_backend, backend, topic, config, from_date, to_date, depth): backend
+        for backend in backends
+    }
+    deadline = time.monotonic() + budget if budget else None
+    grace_started = False
+    try:
+        pending = set(futures)
+        while pending:
+            timeout = None if deadline is None else max(0, deadline - time.monotonic())
+            done, pending = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+            if not done:
+                break
+            for future in done:
+                backend = futures[future]
+                try:
+                    items = future.result()
+                except Exception as e:
+                    errors[backend] = f"{type(e).__name__}: {e}"
+                    continue
+                if items:
+                    results[backend] = items
+            if results and mode == "race":
+                break
+            if results and mode == "merge" and not grace_started:
+                # The grace period runs from the first answer; later ones
+                # don't extend it
+                grace_started = True
+                grace_end = time.monotonic() + WEB_MERGE_GRACE
+                if deadline is None or grace_end < deadline:
+                    deadline = grace_end
+    finally:
+        # Don't wait on backends that lost the race or missed the budget
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    answered = [b for b in backends if b in results]
+    sys.stderr.write(f"[web] {mode}: results from {', '.join(answered) or 'no backend'}\n")
+    sys.stderr.flush()
+
+    if not results:
+        if errors:
+            return [], "; ".join(f"{b}: {e}" for b, e in errors.items())
+        return [], None
+    if mode == "race":
+        return results[answered[0]], None
+    return _merge_web_results(results, backends), None
+
+
 def _search_web(
     topic: str,
     config: dict,
     from_date: str,
     to_date: str,
     depth: str,
+    budget: float = None,
 ) -> tuple:
     """Search the web via native API backend (runs in thread).
 
-    Uses the best available backend: Parallel AI > Brave > OpenRouter.
+    By default uses the best available backend: Parallel AI > Brave >
+    OpenRouter. With WEB_SEARCH_MODE=race or merge and more than one key
+    configured, all backends run concurrently (see _fan_out_web).
+
+    Args:
+        budget: Seconds the fan-out modes may wait on backends
 
     Returns:
         Tuple of (web_items, web_error)
         web_items are raw dicts ready for websearch.normalize_websearch_items()
     """
-    from lib import brave_search, parallel_search, openrouter_search
-
-    backend = env.get_web_search_source(config)
-    if not backend:
+    backends = env.get_web_search_backends(config)
+    if not backends:
         return [], "No web search API keys configured"
 
-    web_error = None
-    raw_results = []
-
-    try:
-        if backend == "parallel":
-            raw_results = parallel_search.search_web(
-                topic, from_date, to_date, config["PARALLEL_API_KEY"], depth=depth,
-            )
-        elif backend == "brave":
-            raw_results = brave_search.search_web(
-                topic, from_date, to_date, config["BRAVE_API_KEY"], depth=depth,
-            )
-        elif backend == "openrouter":
-            raw_results = openrouter_search.search_web(
-                topic, from_date, to_date, config["OPENROUTER_API_KEY"], depth=depth,
+    mode = env.get_web_search_mode(config)
+    if mode != "priority" and len(backends) > 1:
+        raw_results, web_error = _fan_out_web(
+            backends, mode, topic, config, from_date, to_date, depth, budget,
+        )
+    else:
+        web_error = None
+        try:
+            raw_results = _search_web_backend(
+                env.get_web_search_source(config), topic, config, from_date, to_date, depth,
             )
-    except Exception as e:
-        return [], f"{type(e).__name__}: {e}"
+        except Exception as e:
+            return [], f"{type(e).__name__}: {e}"
 
     # Add IDs and date_confidence for websearch.normalize_websearch_items()
     for i, item in enumerate(raw_results):
@@ -659,13 +968,20 @@ def _search_xiaohongshu(
     from_date: str,
     to_date: str,
     depth: str,
+    probe: bool = False,
 ) -> tuple:
     """Search Xiaohongshu via xiaohongshu-mcp HTTP API (runs in thread).
 
+    Args:
+        probe: Check the API is up and logged in first, and quietly return
+            no items if not (startup no longer probes; see probe_sources)
+
     Returns:
         Tuple of (xiaohongshu_items, xiaohongshu_error)
         Items are in web-item dict shape and can be normalized with websearch module.
     """
+    if probe and not env.is_xiaohongshu_available(config):
+        return [], None
     base_url = env.get_xiaohongshu_api_base(config)
     try:
         items = xiaohongshu_api.search_feeds(
@@ -695,6 +1011,11 @@ def _search_xiaohongshu(
     return items, None
 
 
+# Phase 2 deadline: supplemental searches still running after this are
+# abandoned and the results they streamed in so far are kept
+SUPPLEMENTAL_TIMEOUT = 30
+
+
 def _run_supplemental(
     topic: str,
     reddit_items: list,
@@ -767,9 +1088,6 @@ def _run_supplemental(
     sys.stderr.write(f"[Phase 2] Drilling into {' + '.join(parts)}\n")
     sys.stderr.flush()
 
-    supplemental_reddit = []
-    supplemental_x = []
-
     # Collect existing URLs to avoid adding duplicates before dedupe
     existing_urls = set()
     for item in reddit_items:
@@ -777,84 +1095,98 @@ def _run_supplemental(
     for item in x_items:
         existing_urls.add(item.get("url", ""))
 
-    # Run supplemental searches in parallel
-    reddit_future = None
-    x_future = None
-    resolved_future = None
+    # Run supplemental searches in parallel. Each search streams its items in
+    # per subreddit/handle, so whatever has arrived by the deadline is kept.
+    arrived = {"reddit": [], "x": [], "resolved": []}
+    arrived_lock = threading.Lock()
 
+    def collector(key):
+        def on_items(items):
+            with arrived_lock:
+                arrived[key].extend(items)
+        return on_items
+
+    futures = {}
     max_workers = sum([bool(has_subs), bool(has_handles), bool(has_resolved)])
-    with ThreadPoolExecutor(max_workers=max(max_workers, 1)) as executor:
+    executor = ThreadPoolExecutor(max_workers=max(max_workers, 1))
+    try:
         if has_subs:
-            reddit_future = executor.submit(
+            futures[executor.submit(
                 openai_reddit.search_subreddits,
                 entities["reddit_subreddits"],
                 topic,
                 from_date,
                 to_date,
                 count_per,
-            )
+                on_items=collector("reddit"),
+            )] = "reddit"
 
         if has_handles:
-            x_future = executor.submit(
+            futures[executor.submit(
                 bird_x.search_handles,
                 entities["x_handles"],
                 topic,
                 from_date,
                 count_per,
-            )
+                on_items=collector("x"),
+            )] = "x"
 
         if has_resolved:
             # Resolved handle: search unfiltered (topic=None) to get all recent posts
-            resolved_future = executor.submit(
+            futures[executor.submit(
                 bird_x.search_handles,
                 [resolved_handle],
                 None,  # No topic filter - get all recent activity
                 from_date,
                 10,  # More results for the topic entity
-            )
+                on_items=collector("resolved"),
+            )] = "resolved"
 
-        if reddit_future:
-            try:
-                raw_reddit = reddit_future.result(timeout=30)
-                # Filter out URLs already found in Phase 1
-                supplemental_reddit = [
-                    item for item in raw_reddit
-                    if item.get("url", "") not in existing_urls
-                ]
-            except TimeoutError:
-                sys.stderr.write("[Phase 2] Supplemental Reddit timed out (30s)\n")
-            except Exception as e:
-                sys.stderr.write(f"[Phase 2] Supplemental Reddit error: {e}\n")
+        done, not_done = wait(futures, timeout=time_left(SUPPLEMENTAL_TIMEOUT))
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
 
-        if x_future:
-            try:
-                raw_x = x_future.result(timeout=30)
-                supplemental_x = [
-                    item for item in raw_x
-                    if item.get("url", "") not in existing_urls
-                ]
-            except TimeoutError:
-                sys.stderr.write("[Phase 2] Supplemental X timed out (30s)\n")
-            except Exception as e:
-                sys.stderr.write(f"[Phase 2] Supplemental X error: {e}\n")
+    labels = {
+        "reddit": "Supplemental Reddit",
+        "x": "Supplemental X",
+        "resolved": f"Resolved handle @{resolved_handle}",
+    }
+    for future in done:
+        try:
+            future.result()
+        except Exception as e:
+            sys.stderr.write(f"[Phase 2] {labels[futures[future]]} error: {e}\n")
+    with arrived_lock:
+        raw_reddit = list(arrived["reddit"])
+        raw_x = list(arrived["x"])
+        raw_resolved = list(arrived["resolved"])
+    for future in not_done:
+        key = futures[future]
+        kept = len({"reddit": raw_reddit, "x": raw_x, "resolved": raw_resolved}[key])
+        sys.stderr.write(
+            f"[Phase 2] {labels[key]} timed out ({SUPPLEMENTAL_TIMEOUT}s), keeping {kept} that arrived\n"
+        )
 
-        if resolved_future:
-            try:
-                raw_resolved = resolved_future.result(timeout=30)
-                # Lower relevance for unfiltered handle posts (no topic keyword signal)
-                for item in raw_resolved:
-                    item["relevance"] = 0.5
-                resolved_new = [
-                    item for item in raw_resolved
-                    if item.get("url", "") not in existing_urls
-                ]
-                supplemental_x.extend(resolved_new)
-                if resolved_new:
-                    sys.stderr.write(f"[Phase 2] +{len(resolved_new)} from @{resolved_handle}\n")
-            except TimeoutError:
-                sys.stderr.write(f"[Phase 2] Resolved handle @{resolved_handle} timed out (30s)\n")
-            except Exception as e:
-                sys.stderr.write(f"[Phase 2] Resolved handle error: {e}\n")
+    # Filter out URLs already found in Phase 1
+    supplemental_reddit = [
+        item for item in raw_reddit
+        if item.get("url", "") not in existing_urls
+    ]
+    supplemental_x = [
+        item for item in raw_x
+        if item.get("url", "") not in existing_urls
+    ]
+
+    # Lower relevance for unfiltered handle posts (no topic keyword signal)
+    for item in raw_resolved:
+        item["relevance"] = 0.5
+    resolved_new = [
+        item for item in raw_resolved
+        if item.get("url", "") not in existing_urls
+    ]
+    supplemental_x.extend(resolved_new)
+    if resolved_new:
+        sys.stderr.write(f"[Phase 2] +{len(resolved_new)} from @{resolved_handle}\n")
 
     if supplemental_reddit or supplemental_x:
         sys.stderr.write(
@@ -865,6 +1197,107 @@ def _run_supplemental(
     return supplemental_reddit, supplemental_x
 
 
+def _collect_source(name: str, future, progress: ui.ProgressDisplay = None) -> tuple:
+    """Unpack a finished source future into a uniform outcome.
+
+    Source search functions return differently shaped tuples (Reddit also
+    reports whether ScrapeCreators was used, Reddit and X carry their raw
+    responses). This flattens them for run_research's collection loop.
+
+    Returns:
+        Tuple of (items, error, raw_response, used_scrapecreators)
+    """
+    try:
+        result = future.result()
+        if name == "reddit":
+            items, raw, error, used_sc = result
+        elif name == "x":
+            items, raw, error = result
+            used_sc = False
+        else:
+            items, error = result
+            raw, used_sc = None, False
+        outcome = (items, error, raw, used_sc)
+    except Exception as e:
+        outcome = ([], f"{type(e).__name__}: {e}", None, False)
+    _report_source(name, outcome, progress)
+    return outcome
+
+
+def _timed_out_outcome(name: str, error: str, streamed: dict) -> tuple:
+    """Outcome for a source abandoned at its deadline.
+
+    Keeps whatever items the source streamed in before timing out.
+    """
+    items = list(streamed.get(name, []))
+    if items:
+        error = f"{error}, kept {len(items)} streamed"
+    return (items, error, None, False)
+
+
+def _report_source(
+    name: str,
+    outcome: tuple,
+    progress: ui.ProgressDisplay = None,
+    message: str = None,
+):
+    """Show a finished source's error and close its progress spinner.
+
+    Args:
+        message: Error text to show verbatim instead of "<Source> error: ..."
+    """
+    items, error = outcome[0], outcome[1]
+    if error and progress:
+        progress.show_error(message or f"{render.SOURCE_LABELS[name]} error: {error}")
+    end = getattr(progress, f"end_{name}", None) if progress else None
+    if end:
+        end(len(items))
+    if name == "web":
+        sys.stderr.write(f"[web] {len(items)} results\n")
+        sys.stderr.flush()
+
+
+def _gather_results(
+    outcomes: dict,
+    web_needed: bool,
+    raw_reddit_enriched: list,
+    pending_sources: list,
+) -> tuple:
+    """Assemble run_research's result tuple from per-source outcomes.
+
+    Args:
+        outcomes: Source name -> (items, error, raw_response, used_scrapecreators)
+        web_needed: Whether the assistant must run its own web search
+        raw_reddit_enriched: Enriched raw Reddit threads (empty before enrichment)
+        pending_sources: Source names still running when results were gathered
+
+    Returns:
+        Same tuple shape as run_research()
+    """
+    def items(name):
+        return list(outcomes[name][0]) if name in outcomes else []
+
+    def error(name):
+        return outcomes[name][1] if name in outcomes else None
+
+    def raw(name):
+        return outcomes[name][2] if name in outcomes else None
+
+    # Xiaohongshu notes are web-shaped and share the web bucket
+    web_items = items("web") + items("xiaohongshu")
+
+    return (
+        items("reddit"), items("x"), items("youtube"), items("tiktok"),
+        items("instagram"), items("hackernews"), items("bluesky"),
+        items("truthsocial"), items("polymarket"), web_items, web_needed,
+        raw("reddit"), raw("x"), list(raw_reddit_enriched),
+        error("reddit"), error("x"), error("youtube"), error("tiktok"),
+        error("instagram"), error("hackernews"), error("bluesky"),
+        error("truthsocial"), error("polymarket"), error("web"),
+        list(pending_sources),
+    )
+
+
 def run_research(
     topic: str,
     sources: str,
@@ -880,6 +1313,7 @@ def run_research(
     run_tiktok: bool = False,
     run_instagram: bool = False,
     run_xiaohongshu: bool = False,
+    probe_xiaohongshu: bool = False,
     timeouts: dict = None,
     resolved_handle: str = None,
     do_hackernews: bool = True,
@@ -887,15 +1321,34 @@ def run_research(
     do_truthsocial: bool = True,
     do_polymarket: bool = True,
     no_native_web: bool = False,
+    quorum: dict = None,
+    on_quorum=None,
+    journal: RunJournal = None,
 ) -> tuple:
     """Run the research pipeline.
 
+    Args:
+        probe_xiaohongshu: Probe the Xiaohongshu API inside its search task
+            and skip it quietly if unavailable (for runs that didn't ask for
+            it explicitly).
+        quorum: Optional spec from parse_quorum_flag(). Once the finished
+            sources satisfy it, collection stops and the sources still running
+            are returned in pending_sources.
+        on_quorum: Optional callback for follow-up mode. Called once with a
+            partial result tuple (same shape as the return value, before
+            enrichment) when the quorum is met; collection then continues and
+            the full results are returned as usual.
+        journal: Optional RunJournal. Completed sources and enriched Reddit
+            threads are appended to it; sources and threads it already holds
+            (from a --resume) are reused instead of fetched again.
+
     Returns:
         Tuple of (reddit_items, x_items, youtube_items, tiktok_items, instagram_items,
                   hackernews_items, bluesky_items, truthsocial_items, polymarket_items, web_items, web_needed,
                   raw_openai, raw_xai, raw_reddit_enriched,
                   reddit_error, x_error, youtube_error, tiktok_error, instagram_error,
-                  hackernews_error, bluesky_error, truthsocial_error, polymarket_error, web_error)
+                  hackernews_error, bluesky_error, truthsocial_error, polymarket_error, web_error,
+                  pending_sources)
 
     Note: web_needed is True when web search should be performed by the assistant
     (i.e., no native web search API keys are configured). When native web search
@@ -904,6 +1357,11 @@ def run_research(
     if timeouts is None:
         timeouts = TIMEOUT_PROFILES[depth]
     future_timeout = timeouts["future"]
+    # YouTube, TikTok and Instagram stop waiting on transcripts in time to
+    # hand back their results before their source (or the global) timeout
+    youtube_budget = max(1, time_left(timeouts.get("youtube_future", future_timeout)) - 2)
+    tiktok_budget = max(1, time_left(timeouts.get("tiktok_future", future_timeout)) - 2)
+    instagram_budget = max(1, time_left(timeouts.get("instagram_future", future_timeout)) - 2)
 
     reddit_items = []
     x_items = []
@@ -929,20 +1387,28 @@ def run_research(
     polymarket_error = None
     web_error = None
     xiaohongshu_error = None
+    pending_sources = []
 
     # Determine web search mode
     do_web = sources in ("all", "web", "reddit-web", "x-web")
     web_backend = env.get_web_search_source(config) if (do_web and not no_native_web) else None
     web_needed = do_web and not web_backend
+    web_label = web_backend
+    if web_backend and env.get_web_search_mode(config) != "priority":
+        web_backends = env.get_web_search_backends(config)
+        if len(web_backends) > 1:
+            web_label = f"{'+'.join(web_backends)} ({env.get_web_search_mode(config)})"
 
     # Web-only mode
     if sources == "web":
         if web_backend:
             # Native web search available — run it
-            sys.stderr.write(f"[web] Searching via {web_backend}\n")
+            sys.stderr.write(f"[web] Searching via {web_label}\n")
             sys.stderr.flush()
             try:
-                web_items, web_error = _search_web(topic, config, from_date, to_date, depth)
+                web_items, web_error = _search_web(
+                    topic, config, from_date, to_date, depth, budget=future_timeout,
+                )
                 if web_error and progress:
                     progress.show_error(f"Web error: {web_error}")
             except Exception as e:
@@ -956,11 +1422,22 @@ def run_research(
             if progress:
                 progress.start_web_only()
                 progress.end_web_only()
+        # Sources below run one after another here, so stop starting new ones
+        # once the global timeout has fired.
+        if deadline_passed():
+            skipped = f"skipped (global timeout {_deadline_seconds}s)"
+            if run_youtube:
+                youtube_error = f"YouTube search {skipped}"
+            if run_tiktok:
+                tiktok_error = f"TikTok search {skipped}"
+            if run_instagram:
+                instagram_error = f"Instagram search {skipped}"
+            run_xiaohongshu = run_youtube = run_tiktok = run_instagram = False
         # Optional Xiaohongshu search in web-only mode.
         if run_xiaohongshu:
             try:
                 xhs_items, xiaohongshu_error = _search_xiaohongshu(
-                    topic, config, from_date, to_date, depth,
+                    topic, config, from_date, to_date, depth, probe_xiaohongshu,
                 )
                 web_items.extend(xhs_items)
                 if xiaohongshu_error and progress:
@@ -974,7 +1451,9 @@ def run_research(
             if progress:
                 progress.start_youtube()
             try:
-                youtube_items, youtube_error = _search_youtube(topic, from_date, to_date, depth)
+                youtube_items, youtube_error = _search_youtube(
+                    topic, from_date, to_date, depth, budget=youtube_budget,
+                )
                 if youtube_error and progress:
                     progress.show_error(f"YouTube error: {youtube_error}")
             except Exception as e:
@@ -987,7 +1466,10 @@ def run_research(
             if progress:
                 progress.start_tiktok()
             try:
-                tiktok_items, tiktok_error = _search_tiktok(topic, from_date, to_date, depth, env.get_tiktok_token(config))
+                tiktok_items, tiktok_error = _search_tiktok(
+                    topic, from_date, to_date, depth, env.get_tiktok_token(config),
+                    budget=max(1, time_left(timeouts.get("tiktok_future", future_timeout)) - 2),
+                )
                 if tiktok_error and progress:
                     progress.show_error(f"TikTok error: {tiktok_error}")
             except Exception as e:
@@ -1001,7 +1483,10 @@ def run_research(
                 progress.start_instagram()
             try:
                 ig_timeout = timeouts.get("instagram_future", future_timeout)
-                instagram_items, instagram_error = _search_instagram(topic, from_date, to_date, depth, env.get_instagram_token(config))
+                instagram_items, instagram_error = _search_instagram(
+                    topic, from_date, to_date, depth, env.get_instagram_token(config),
+                    budget=max(1, time_left(ig_timeout) - 2),
+                )
                 if instagram_error and progress:
                     progress.show_error(f"Instagram error: {instagram_error}")
             except Exception as e:
@@ -1010,7 +1495,7 @@ def run_research(
                     progress.show_error(f"Instagram error: {e}")
             if progress:
                 progress.end_instagram(len(instagram_items))
-        return reddit_items, x_items, youtube_items, tiktok_items, instagram_items, hackernews_items, bluesky_items, truthsocial_items, polymarket_items, web_items, web_needed, raw_openai, raw_xai, raw_reddit_enriched, reddit_error, x_error, youtube_error, tiktok_error, instagram_error, hackernews_error, bluesky_error, truthsocial_error, polymarket_error, web_error
+        return reddit_items, x_items, youtube_items, tiktok_items, instagram_items, hackernews_items, bluesky_items, truthsocial_items, polymarket_items, web_items, web_needed, raw_openai, raw_xai, raw_reddit_enriched, reddit_error, x_error, youtube_error, tiktok_error, instagram_error, hackernews_error, bluesky_error, truthsocial_error, polymarket_error, web_error, pending_sources
 
     # Determine which searches to run
     do_reddit = sources in ("both", "reddit", "all", "reddit-web")
@@ -1018,18 +1503,24 @@ def run_research(
     # do_hackernews / do_polymarket are always True by default, but can be
     # restricted via the --search flag to run a focused source subset.
 
+    # Reuse sources journaled by an interrupted run (--resume)
+    requested = {
+        "reddit": do_reddit, "x": do_x, "youtube": run_youtube,
+        "tiktok": run_tiktok, "instagram": run_instagram,
+        "xiaohongshu": run_xiaohongshu, "hackernews": do_hackernews,
+        "bluesky": do_bluesky, "truthsocial": do_truthsocial,
+        "polymarket": do_polymarket, "web": bool(web_backend),
+    }
+    resumed = {
+        name: outcome for name, outcome in (journal.sources.items() if journal else [])
+        if requested.get(name)
+    }
+    if resumed:
+        sys.stderr.write(f"[resume] Reusing journaled {', '.join(sorted(resumed))}\n")
+        sys.stderr.flush()
+
     # Run Reddit, X, YouTube, HN, Polymarket, and Web searches in parallel
-    reddit_future = None
-    x_future = None
-    youtube_future = None
-    tiktok_future = None
-    instagram_future = None
-    xiaohongshu_future = None
-    hackernews_future = None
-    bluesky_future = None
-    truthsocial_future = None
-    polymarket_future = None
-    web_future = None
+    futures = {}  # future -> source name
     max_workers = (
         2
         + (1 if run_youtube else 0)
@@ -1043,371 +1534,864 @@ def run_research(
         + (1 if web_backend else 0)
     )
 
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+    # Top-K Reddit threads start fetching while the OpenAI search streams
+    reddit_prefetcher = None
+    if do_reddit and "reddit" not in resumed and not mock:
+        reddit_prefetcher = reddit_enrich.ThreadPrefetcher(timeouts["enrich_threads"])
+
+    # Items sources stream in before finishing; kept if the source times out
+    streamed = {"x": []}
+
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    try:
         # Submit searches
-        if do_reddit:
+        if do_reddit and "reddit" not in resumed:
             if progress:
                 progress.start_reddit()
-            reddit_future = executor.submit(
+            futures[executor.submit(
                 _search_reddit, topic, config, selected_models,
-                from_date, to_date, depth, mock
-            )
+                from_date, to_date, depth, mock, reddit_prefetcher
+            )] = "reddit"
 
-        if do_x:
+        if do_x and "x" not in resumed:
             if progress:
                 progress.start_x()
-            x_future = executor.submit(
+            futures[executor.submit(
                 _search_x, topic, config, selected_models,
-                from_date, to_date, depth, mock, x_source
-            )
+                from_date, to_date, depth, mock, x_source, streamed["x"].append
+            )] = "x"
 
-        if run_youtube:
+        if run_youtube and "youtube" not in resumed:
             if progress:
                 progress.start_youtube()
-            youtube_future = executor.submit(
-                _search_youtube, topic, from_date, to_date, depth
-            )
+            futures[executor.submit(
+                _search_youtube, topic, from_date, to_date, depth, youtube_budget,
+            )] = "youtube"
 
-        if run_tiktok:
+        if run_tiktok and "tiktok" not in resumed:
             if progress:
                 progress.start_tiktok()
-            tiktok_future = executor.submit(
+            futures[executor.submit(
                 _search_tiktok, topic, from_date, to_date, depth,
-                env.get_tiktok_token(config),
-            )
+                env.get_tiktok_token(config), tiktok_budget,
+            )] = "tiktok"
 
-        if run_instagram:
+        if run_instagram and "instagram" not in resumed:
             if progress:
                 progress.start_instagram()
-            instagram_future = executor.submit(
+            futures[executor.submit(
                 _search_instagram, topic, from_date, to_date, depth,
-                env.get_instagram_token(config),
-            )
+                env.get_instagram_token(config), instagram_budget,
+            )] = "instagram"
 
-        if run_xiaohongshu:
-            xiaohongshu_future = executor.submit(
+        if run_xiaohongshu and "xiaohongshu" not in resumed:
+            futures[executor.submit(
                 _search_xiaohongshu, topic, config, from_date, to_date, depth,
-            )
+                probe_xiaohongshu,
+            )] = "xiaohongshu"
 
-        if do_hackernews:
+        if do_hackernews and "hackernews" not in resumed:
             if progress:
                 progress.start_hackernews()
-            hackernews_future = executor.submit(
+            futures[executor.submit(
                 _search_hackernews, topic, from_date, to_date, depth
-            )
+            )] = "hackernews"
 
-        if do_bluesky:
-            bluesky_future = executor.submit(
+        if do_bluesky and "bluesky" not in resumed:
+            futures[executor.submit(
                 _search_bluesky, topic, from_date, to_date, depth, config
-            )
+            )] = "bluesky"
 
-        if do_truthsocial:
-            truthsocial_future = executor.submit(
+        if do_truthsocial and "truthsocial" not in resumed:
+            futures[executor.submit(
                 _search_truthsocial, topic, from_date, to_date, depth, config
-            )
+            )] = "truthsocial"
 
-        if do_polymarket:
+        if do_polymarket and "polymarket" not in resumed:
             if progress:
                 progress.start_polymarket()
-            polymarket_future = executor.submit(
-                _search_polymarket, topic, from_date, to_date, depth
-            )
+            futures[executor.submit(
+                _search_polymarket, topic, from_date, to_date, depth, mock,
+            )] = "polymarket"
 
-        if web_backend:
-            sys.stderr.write(f"[web] Searching via {web_backend}\n")
+        if web_backend and "web" not in resumed:
+            sys.stderr.write(f"[web] Searching via {web_label}\n")
             sys.stderr.flush()
-            web_future = executor.submit(
-                _search_web, topic, config, from_date, to_date, depth
-            )
+            # Leave the fan-out modes a moment to merge before the source deadline
+            web_budget = max(1, timeouts.get("web_future", future_timeout) - 2)
+            futures[executor.submit(
+                _search_web, topic, config, from_date, to_date, depth, web_budget
+            )] = "web"
+
+        # Collect results as they finish. Each source has its own timeout,
+        # measured from submission, so one slow source can't stall the rest.
+        outcomes = dict(resumed)  # source name -> (items, error, raw, used_scrapecreators)
+        started = time.monotonic()
+        deadlines = {
+            future: started + timeouts.get(f"{name}_future", future_timeout)
+            for future, name in futures.items()
+        }
+        pending = dict(futures)
+        while pending:
+            wait_for = time_left(min(deadlines[f] for f in pending) - time.monotonic())
+            done, _ = wait(pending, timeout=wait_for, return_when=FIRST_COMPLETED)
+
+            for future in done:
+                name = pending.pop(future)
+                outcomes[name] = _collect_source(name, future, progress)
+                if journal and not outcomes[name][1]:
+                    journal.record_source(name, outcomes[name])
+
+            if deadline_passed():
+                # Global timeout: keep what finished, fail the rest
+                for future, name in pending.items():
+                    future.cancel()
+                    error = f"{render.SOURCE_LABELS[name]} search timed out (global timeout {_deadline_seconds}s)"
+                    outcomes[name] = _timed_out_outcome(name, error, streamed)
+                    _report_source(name, outcomes[name], progress, message=outcomes[name][1])
+                break
+
+            for future in [f for f in pending if deadlines[f] <= time.monotonic()]:
+                name = pending.pop(future)
+                future.cancel()
+                source_timeout = timeouts.get(f"{name}_future", future_timeout)
+                error = f"{render.SOURCE_LABELS[name]} search timed out after {source_timeout}s"
+                outcomes[name] = _timed_out_outcome(name, error, streamed)
+                _report_source(name, outcomes[name], progress, message=outcomes[name][1])
+
+            if quorum and pending and quorum_met(
+                quorum, {name: len(o[0]) for name, o in outcomes.items()}
+            ):
+                pending_sources = sorted(pending.values())
+                sys.stderr.write(
+                    f"[quorum] Met with {', '.join(sorted(outcomes))} — "
+                    f"pending: {', '.join(pending_sources)}\n"
+                )
+                sys.stderr.flush()
+                if on_quorum:
+                    # Emit the partial results now, keep collecting for the follow-up
+                    on_quorum(_gather_results(outcomes, web_needed, [], pending_sources))
+                    quorum = None
+                    pending_sources = []
+                else:
+                    for future in pending:
+                        future.cancel()
+                    break
+    finally:
+        # Don't block on sources that timed out or were left pending by a quorum
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    (reddit_items, x_items, youtube_items, tiktok_items, instagram_items,
+     hackernews_items, bluesky_items, truthsocial_items, polymarket_items,
+     web_items, web_needed, raw_openai, raw_xai, raw_reddit_enriched,
+     reddit_error, x_error, youtube_error, tiktok_error, instagram_error,
+     hackernews_error, bluesky_error, truthsocial_error, polymarket_error,
+     web_error, pending_sources) = _gather_results(outcomes, web_needed, [], pending_sources)
+    reddit_used_sc = outcomes.get("reddit", ([], None, None, False))[3]
 
-        # Collect results (with timeouts to prevent indefinite blocking)
-        reddit_used_sc = False  # Track if ScrapeCreators was used for Reddit
-        if reddit_future:
-            reddit_timeout = timeouts.get("reddit_future", future_timeout)
-            try:
-                reddit_items, raw_openai, reddit_error, reddit_used_sc = reddit_future.result(timeout=reddit_timeout)
-                if reddit_error and progress:
-                    progress.show_error(f"Reddit error: {reddit_error}")
-            except TimeoutError:
-                reddit_error = f"Reddit search timed out after {reddit_timeout}s"
-                if progress:
-                    progress.show_error(reddit_error)
-            except Exception as e:
-                reddit_error = f"{type(e).__name__}: {e}"
-                if progress:
-                    progress.show_error(f"Reddit error: {e}")
+    # Enrich Reddit items with real data (parallel, capped)
+    # Skip enrichment if ScrapeCreators already provided comments + engagement
+    enrich_max = timeouts["enrich_max_items"]
+    enrich_total_timeout = timeouts["enrich_total"]
+    items_to_enrich = reddit_items[:enrich_max]
+    rate_limited = False  # Set True if Reddit returns 429 during enrichment
+    if deadline_passed():
+        items_to_enrich = []  # Global timeout: report what the searches found
+
+    # Reuse threads enriched before an interruption (--resume)
+    reused = set()  # indices into items_to_enrich
+    if journal and journal.enriched and not reddit_used_sc:
+        for i, item in enumerate(items_to_enrich):
+            enriched = journal.get_enriched(item.get("url"))
+            if enriched:
+                reddit_items[i] = enriched
+                raw_reddit_enriched.append(enriched)
+                reused.add(i)
+
+    if reddit_used_sc and items_to_enrich:
+        # ScrapeCreators already enriched items with comments — just copy to raw list
+        sys.stderr.write(f"[Reddit] Skipping old enrichment — ScrapeCreators already provided comments\n")
+        sys.stderr.flush()
+        raw_reddit_enriched = list(reddit_items[:enrich_max])
+        items_to_enrich = []  # Skip the enrichment block below
+
+    if items_to_enrich:
+        if progress:
+            progress.start_reddit_enrich(1, len(items_to_enrich))
+
+        if mock:
+            # Sequential mock enrichment (fast, no need for parallelism)
+            for i, item in enumerate(items_to_enrich):
+                if progress and i > 0:
+                    progress.update_reddit_enrich(i + 1, len(items_to_enrich))
+                try:
+                    mock_thread = load_fixture("reddit_thread_sample.json")
+                    reddit_items[i] = reddit_enrich.enrich_reddit_item(item, mock_thread)
+                except Exception as e:
+                    if progress:
+                        progress.show_error(f"Enrich failed for {item.get('url', 'unknown')}: {e}")
+                raw_reddit_enriched.append(reddit_items[i])
+        else:
+            # Full thread fetches (for comments) are kept to the items the
+            # report will show. With more candidates than that, one /by_id
+            # request refreshes engagement for all of them, and threads are
+            # fetched for the ones that score highest with it.
+            completed_count = len(reused)
+            rate_limited = False
+            pending = [i for i in range(len(items_to_enrich)) if i not in reused]
+            thread_max = timeouts["enrich_threads"]
+            threaded = set(pending)
+            if len(pending) > thread_max:
+                try:
+                    engagement = reddit_enrich.fetch_engagement_batch(
+                        [items_to_enrich[i] for i in pending], timeout=timeouts["enrich_per"],
+                    )
+                except reddit_enrich.RedditRateLimitError:
+                    rate_limited = True
+                    engagement = {}
+                    if progress:
+                        progress.show_error("Reddit rate-limited (429) — skipping remaining enrichment")
+                for i in pending:
+                    submission = engagement.get(items_to_enrich[i].get("url"))
+                    if submission:
+                        reddit_enrich.apply_engagement(reddit_items[i], submission)
+                ranked = _rank_reddit_items([reddit_items[i] for i in pending], from_date, to_date)
+                threaded = {pending[j] for j in ranked[:thread_max]}
+            if reddit_prefetcher:
+                # Prefetches that already went out cost nothing more, so use
+                # them; queued ones for any other thread are cancelled before
+                # they reach reddit.com
+                threaded |= {i for i in pending if reddit_prefetcher.started(items_to_enrich[i].get("url"))}
+                reddit_prefetcher.keep_only([] if rate_limited else [items_to_enrich[i].get("url") for i in threaded])
+            if rate_limited:
+                threaded = set()
+            for i in pending:
+                if i not in threaded:
+                    # Engagement only: not journaled, so --resume still
+                    # fetches the thread if it turns out to be needed
+                    completed_count += 1
+                    raw_reddit_enriched.append(reddit_items[i])
             if progress:
-                progress.end_reddit(len(reddit_items))
+                progress.update_reddit_enrich(completed_count, len(items_to_enrich))
 
-        if x_future:
+            # Parallel thread enrichment with bounded concurrency and total timeout
+            # Uses short HTTP timeout (10s) and 1 retry to fail fast on 429
+            enrich_pool = ThreadPoolExecutor(max_workers=5)
+            futures = {
+                enrich_pool.submit(
+                    reddit_enrich.enrich_reddit_item, items_to_enrich[i], prefetcher=reddit_prefetcher,
+                ): i
+                for i in pending
+                if i in threaded
+            }
             try:
-                x_items, raw_xai, x_error = x_future.result(timeout=future_timeout)
-                if x_error and progress:
-                    progress.show_error(f"X error: {x_error}")
+                for future in as_completed(futures, timeout=time_left(enrich_total_timeout)):
+                    idx = futures[future]
+                    completed_count += 1
+                    if progress:
+                        progress.update_reddit_enrich(completed_count, len(items_to_enrich))
+                    try:
+                        reddit_items[idx] = future.result(timeout=timeouts["enrich_per"])
+                        if journal:
+                            journal.record_enriched(reddit_items[idx])
+                    except reddit_enrich.RedditRateLimitError:
+                        rate_limited = True
+                        if progress:
+                            progress.show_error(
+                                "Reddit rate-limited (429) — skipping remaining enrichment"
+                            )
+                        # Cancel remaining futures and bail
+                        for f in futures:
+                            f.cancel()
+                        break
+                    except Exception as e:
+                        if progress:
+                            progress.show_error(
+                                f"Enrich failed for {items_to_enrich[idx].get('url', 'unknown')}: {e}"
+                            )
+                    raw_reddit_enriched.append(reddit_items[idx])
             except TimeoutError:
-                x_error = f"X search timed out after {future_timeout}s"
                 if progress:
-                    progress.show_error(x_error)
-            except Exception as e:
-                x_error = f"{type(e).__name__}: {e}"
-                if progress:
-                    progress.show_error(f"X error: {e}")
-            if progress:
-                progress.end_x(len(x_items))
+                    progress.show_error(
+                        f"Enrichment timed out after {enrich_total_timeout}s "
+                        f"({completed_count}/{len(items_to_enrich)} done)"
+                    )
+                # Keep unenriched items as-is
+                for idx in futures.values():
+                    if reddit_items[idx] not in raw_reddit_enriched:
+                        raw_reddit_enriched.append(reddit_items[idx])
+            finally:
+                # Don't wait on stragglers past the enrichment budget
+                enrich_pool.shutdown(wait=False, cancel_futures=True)
 
-        if youtube_future:
-            yt_timeout = timeouts.get("youtube_future", future_timeout)
-            try:
-                youtube_items, youtube_error = youtube_future.result(timeout=yt_timeout)
-                if youtube_error and progress:
-                    progress.show_error(f"YouTube error: {youtube_error}")
-            except TimeoutError:
-                youtube_error = f"YouTube search timed out after {yt_timeout}s"
-                if progress:
-                    progress.show_error(youtube_error)
-            except Exception as e:
-                youtube_error = f"{type(e).__name__}: {e}"
-                if progress:
-                    progress.show_error(f"YouTube error: {e}")
-            if progress:
-                progress.end_youtube(len(youtube_items))
+        if progress:
+            progress.end_reddit_enrich()
 
-        if tiktok_future:
-            tk_timeout = timeouts.get("tiktok_future", future_timeout)
-            try:
-                tiktok_items, tiktok_error = tiktok_future.result(timeout=tk_timeout)
-                if tiktok_error and progress:
-                    progress.show_error(f"TikTok error: {tiktok_error}")
-            except TimeoutError:
-                tiktok_error = f"TikTok search timed out after {tk_timeout}s"
-                if progress:
-                    progress.show_error(tiktok_error)
-            except Exception as e:
-                tiktok_error = f"{type(e).__name__}: {e}"
-                if progress:
-                    progress.show_error(f"TikTok error: {e}")
-            if progress:
-                progress.end_tiktok(len(tiktok_items))
+    if reddit_prefetcher:
+        reddit_prefetcher.close()
 
-        if instagram_future:
-            ig_timeout = timeouts.get("instagram_future", future_timeout)
-            try:
-                instagram_items, instagram_error = instagram_future.result(timeout=ig_timeout)
-                if instagram_error and progress:
-                    progress.show_error(f"Instagram error: {instagram_error}")
-            except TimeoutError:
-                instagram_error = f"Instagram search timed out after {ig_timeout}s"
-                if progress:
-                    progress.show_error(instagram_error)
-            except Exception as e:
-                instagram_error = f"{type(e).__name__}: {e}"
-                if progress:
-                    progress.show_error(f"Instagram error: {e}")
-            if progress:
-                progress.end_instagram(len(instagram_items))
+    # Enrich HN stories with comments
+    if hackernews_items and not deadline_passed():
+        try:
+            hackernews_items = hackernews.enrich_top_stories(hackernews_items, depth=depth)
+        except Exception as e:
+            sys.stderr.write(f"[HN] Enrichment error: {e}\n")
+            sys.stderr.flush()
 
-        if xiaohongshu_future:
-            try:
-                xhs_items, xiaohongshu_error = xiaohongshu_future.result(timeout=future_timeout)
-                web_items.extend(xhs_items)
-                if xiaohongshu_error and progress:
-                    progress.show_error(f"Xiaohongshu error: {xiaohongshu_error}")
-            except TimeoutError:
-                xiaohongshu_error = f"Xiaohongshu search timed out after {future_timeout}s"
-                if progress:
-                    progress.show_error(xiaohongshu_error)
-            except Exception as e:
-                xiaohongshu_error = f"{type(e).__name__}: {e}"
-                if progress:
-                    progress.show_error(f"Xiaohongshu error: {e}")
+    # Phase 2: Supplemental search based on entities from Phase 1
+    # Skip on --quick (speed matters), mock mode, or if Reddit is rate-limiting
+    # Also skip Reddit supplemental when ScrapeCreators was used (subreddit drilling already done)
+    if depth != "quick" and not mock and (reddit_items or x_items) and not deadline_passed():
+        sup_reddit, sup_x = _run_supplemental(
+            topic, reddit_items, x_items,
+            from_date, to_date, depth, x_source, progress,
+            skip_reddit=(rate_limited or reddit_used_sc),
+            resolved_handle=resolved_handle,
+        )
+        if sup_reddit:
+            reddit_items.extend(sup_reddit)
+        if sup_x:
+            x_items.extend(sup_x)
 
-        if hackernews_future:
-            hn_timeout = timeouts.get("hackernews_future", future_timeout)
-            try:
-                hackernews_items, hackernews_error = hackernews_future.result(timeout=hn_timeout)
-                if hackernews_error and progress:
-                    progress.show_error(f"HN error: {hackernews_error}")
-            except TimeoutError:
-                hackernews_error = f"HN search timed out after {hn_timeout}s"
-                if progress:
-                    progress.show_error(hackernews_error)
-            except Exception as e:
-                hackernews_error = f"{type(e).__name__}: {e}"
-                if progress:
-                    progress.show_error(f"HN error: {e}")
-            if progress:
-                progress.end_hackernews(len(hackernews_items))
+    return reddit_items, x_items, youtube_items, tiktok_items, instagram_items, hackernews_items, bluesky_items, truthsocial_items, polymarket_items, web_items, web_needed, raw_openai, raw_xai, raw_reddit_enriched, reddit_error, x_error, youtube_error, tiktok_error, instagram_error, hackernews_error, bluesky_error, truthsocial_error, polymarket_error, web_error, pending_sources
 
-        if bluesky_future:
-            bsky_timeout = timeouts.get("bluesky_future", future_timeout)
-            try:
-                bluesky_items, bluesky_error = bluesky_future.result(timeout=bsky_timeout)
-                if bluesky_error and progress:
-                    progress.show_error(f"Bluesky error: {bluesky_error}")
-            except TimeoutError:
-                bluesky_error = f"Bluesky search timed out after {bsky_timeout}s"
-                if progress:
-                    progress.show_error(bluesky_error)
-            except Exception as e:
-                bluesky_error = f"{type(e).__name__}: {e}"
-                if progress:
-                    progress.show_error(f"Bluesky error: {e}")
 
-        if truthsocial_future:
-            ts_timeout = timeouts.get("truthsocial_future", future_timeout)
-            try:
-                truthsocial_items, truthsocial_error = truthsocial_future.result(timeout=ts_timeout)
-                if truthsocial_error and progress:
-                    progress.show_error(f"Truth Social error: {truthsocial_error}")
-            except TimeoutError:
-                truthsocial_error = f"Truth Social search timed out after {ts_timeout}s"
-                if progress:
-                    progress.show_error(truthsocial_error)
-            except Exception as e:
-                truthsocial_error = f"{type(e).__name__}: {e}"
-                if progress:
-                    progress.show_error(f"Truth Social error: {e}")
+def _build_report(
+    topic: str,
+    from_date: str,
+    to_date: str,
+    mode: str,
+    selected_models: dict,
+    results: tuple,
+    resolved_handle: str = None,
+    progress: ui.ProgressDisplay = None,
+) -> schema.Report:
+    """Normalize, filter, score, dedupe and link run_research() results.
 
-        if polymarket_future:
-            pm_timeout = timeouts.get("polymarket_future", future_timeout)
-            try:
-                polymarket_items, polymarket_error = polymarket_future.result(timeout=pm_timeout)
-                if polymarket_error and progress:
-                    progress.show_error(f"Polymarket error: {polymarket_error}")
-            except TimeoutError:
-                polymarket_error = f"Polymarket search timed out after {pm_timeout}s"
-                if progress:
-                    progress.show_error(polymarket_error)
-            except Exception as e:
-                polymarket_error = f"{type(e).__name__}: {e}"
-                if progress:
-                    progress.show_error(f"Polymarket error: {e}")
-            if progress:
-                progress.end_polymarket(len(polymarket_items))
+    Args:
+        results: Result tuple from run_research()
+        resolved_handle: X handle resolved by the agent (without @)
 
-        if web_future:
-            try:
-                web_items, web_error = web_future.result(timeout=future_timeout)
-                if web_error and progress:
-                    progress.show_error(f"Web error: {web_error}")
-            except TimeoutError:
-                web_error = f"Web search timed out after {future_timeout}s"
-                if progress:
-                    progress.show_error(web_error)
-            except Exception as e:
-                web_error = f"{type(e).__name__}: {e}"
-                if progress:
-                    progress.show_error(f"Web error: {e}")
-            sys.stderr.write(f"[web] {len(web_items)} results\n")
+    Returns:
+        Report with items, errors and context snippet populated
+    """
+    (reddit_items, x_items, youtube_items, tiktok_items, instagram_items,
+     hackernews_items, bluesky_items, truthsocial_items, polymarket_items,
+     web_items, _web_needed, _raw_openai, _raw_xai, _raw_reddit_enriched,
+     reddit_error, x_error, youtube_error, tiktok_error, instagram_error,
+     hackernews_error, bluesky_error, truthsocial_error, polymarket_error,
+     web_error, pending_sources) = results
+
+    if progress:
+        progress.start_processing()
+
+    # Normalize items
+    normalized_reddit = normalize.normalize_reddit_items(reddit_items, from_date, to_date)
+    normalized_x = normalize.normalize_x_items(x_items, from_date, to_date)
+    normalized_youtube = normalize.normalize_youtube_items(youtube_items, from_date, to_date) if youtube_items else []
+    normalized_tiktok = normalize.normalize_tiktok_items(tiktok_items, from_date, to_date) if tiktok_items else []
+    normalized_ig = normalize.normalize_instagram_items(instagram_items, from_date, to_date) if instagram_items else []
+    normalized_hn = normalize.normalize_hackernews_items(hackernews_items, from_date, to_date) if hackernews_items else []
+    normalized_bsky = normalize.normalize_bluesky_items(bluesky_items, from_date, to_date) if bluesky_items else []
+    normalized_ts = normalize.normalize_truthsocial_items(truthsocial_items, from_date, to_date) if truthsocial_items else []
+    normalized_pm = normalize.normalize_polymarket_items(polymarket_items, from_date, to_date) if polymarket_items else []
+    normalized_web = websearch.normalize_websearch_items(web_items, from_date, to_date) if web_items else []
+
+    # Hard date filter: exclude items with verified dates outside the range
+    # This is the safety net - even if prompts let old content through, this filters it
+    filtered_reddit = normalize.filter_by_date_range(normalized_reddit, from_date, to_date)
+    filtered_x = normalize.filter_by_date_range(normalized_x, from_date, to_date)
+    # YouTube: skip hard date filter — youtube_yt.py already applies a soft filter
+    # that prefers recent videos but keeps older ones for evergreen topics.
+    # YouTube content has a longer shelf life than tweets/posts.
+    filtered_youtube = normalized_youtube
+    # TikTok: hard date filter (tiktok.py already pre-filters, but safety net)
+    filtered_tiktok = normalize.filter_by_date_range(normalized_tiktok, from_date, to_date) if normalized_tiktok else []
+    # Instagram: hard date filter (instagram.py already pre-filters, but safety net)
+    filtered_ig = normalize.filter_by_date_range(normalized_ig, from_date, to_date) if normalized_ig else []
+    filtered_hn = normalize.filter_by_date_range(normalized_hn, from_date, to_date) if normalized_hn else []
+    filtered_bsky = normalize.filter_by_date_range(normalized_bsky, from_date, to_date) if normalized_bsky else []
+    filtered_ts = normalize.filter_by_date_range(normalized_ts, from_date, to_date) if normalized_ts else []
+    # Polymarket: skip hard date filter - markets are active/traded, updatedAt is fine
+    filtered_pm = normalized_pm
+    filtered_web = normalize.filter_by_date_range(normalized_web, from_date, to_date) if normalized_web else []
+
+    # Score items
+    scored_reddit = score.score_reddit_items(filtered_reddit)
+    scored_x = score.score_x_items(filtered_x)
+    scored_youtube = score.score_youtube_items(filtered_youtube) if filtered_youtube else []
+    scored_tiktok = score.score_tiktok_items(filtered_tiktok) if filtered_tiktok else []
+    scored_ig = score.score_instagram_items(filtered_ig) if filtered_ig else []
+    scored_hn = score.score_hackernews_items(filtered_hn) if filtered_hn else []
+    scored_bsky = score.score_bluesky_items(filtered_bsky) if filtered_bsky else []
+    scored_ts = score.score_truthsocial_items(filtered_ts) if filtered_ts else []
+    scored_pm = score.score_polymarket_items(filtered_pm) if filtered_pm else []
+    scored_web = score.score_websearch_items(filtered_web) if filtered_web else []
+
+    # Sort items
+    sorted_reddit = score.sort_items(scored_reddit)
+    sorted_x = score.sort_items(scored_x)
+    sorted_youtube = score.sort_items(scored_youtube) if scored_youtube else []
+    sorted_tiktok = score.sort_items(scored_tiktok) if scored_tiktok else []
+    sorted_ig = score.sort_items(scored_ig) if scored_ig else []
+    sorted_hn = score.sort_items(scored_hn) if scored_hn else []
+    sorted_bsky = score.sort_items(scored_bsky) if scored_bsky else []
+    sorted_ts = score.sort_items(scored_ts) if scored_ts else []
+    sorted_pm = score.sort_items(scored_pm) if scored_pm else []
+    sorted_web = score.sort_items(scored_web) if scored_web else []
+
+    # Dedupe items
+    deduped_reddit = dedupe.dedupe_reddit(sorted_reddit)
+    deduped_x = dedupe.dedupe_x(sorted_x)
+    deduped_youtube = dedupe.dedupe_youtube(sorted_youtube) if sorted_youtube else []
+    deduped_tiktok = dedupe.dedupe_tiktok(sorted_tiktok) if sorted_tiktok else []
+    deduped_ig = dedupe.dedupe_instagram(sorted_ig) if sorted_ig else []
+    deduped_hn = dedupe.dedupe_hackernews(sorted_hn) if sorted_hn else []
+    deduped_bsky = dedupe.dedupe_bluesky(sorted_bsky) if sorted_bsky else []
+    deduped_ts = dedupe.dedupe_truthsocial(sorted_ts) if sorted_ts else []
+    deduped_pm = dedupe.dedupe_polymarket(sorted_pm) if sorted_pm else []
+    deduped_web = websearch.dedupe_websearch(sorted_web) if sorted_web else []
+
+    # Minimum result guarantee: if all Reddit results were filtered out but
+    # we had raw results, keep top 3 by relevance regardless of score
+    if not deduped_reddit and normalized_reddit:
+        print("[REDDIT WARNING] All results scored below threshold, keeping top 3 by relevance", file=sys.stderr)
+        by_relevance = sorted(normalized_reddit, key=lambda item: item.relevance, reverse=True)
+        deduped_reddit = by_relevance[:3]
+
+    # Cross-source linking: annotate items that discuss the same story
+    dedupe.cross_source_link(
+        deduped_reddit, deduped_x, deduped_youtube, deduped_tiktok, deduped_ig, deduped_hn, deduped_bsky, deduped_ts, deduped_pm, deduped_web,
+    )
+
+    if progress:
+        progress.end_processing()
+
+    # Create report
+    report = schema.create_report(
+        topic,
+        from_date,
+        to_date,
+        mode,
+        selected_models.get("openai"),
+        selected_models.get("xai"),
+    )
+    report.reddit = deduped_reddit
+    report.x = deduped_x
+    report.youtube = deduped_youtube
+    report.tiktok = deduped_tiktok
+    report.instagram = deduped_ig
+    report.hackernews = deduped_hn
+    report.bluesky = deduped_bsky
+    report.truthsocial = deduped_ts
+    report.polymarket = deduped_pm
+    report.web = deduped_web
+    report.reddit_error = reddit_error
+    report.x_error = x_error
+    report.youtube_error = youtube_error
+    report.tiktok_error = tiktok_error
+    report.instagram_error = instagram_error
+    report.hackernews_error = hackernews_error
+    report.bluesky_error = bluesky_error
+    report.truthsocial_error = truthsocial_error
+    report.polymarket_error = polymarket_error
+    report.web_error = web_error
+    report.pending_sources = pending_sources
+    report.resolved_x_handle = resolved_handle
+
+    # Generate context snippet
+    report.context_snippet_md = render.render_context_snippet(report)
+
+
+    return report
+
+
+# Topics researched at once in batch mode. Each topic already fans out across
+# its sources, so keep this small to stay polite to the upstream APIs.
+BATCH_CONCURRENCY = 3
+
+
+def load_topics_file(path: str) -> list:
+    """Read topics for batch mode: one per line, blank lines and # comments skipped.
+
+    Use "-" to read from stdin. Duplicate topics are only researched once.
+    """
+    if path == "-":
+        lines = sys.stdin.read().splitlines()
+    else:
+        lines = Path(path).expanduser().read_text(encoding="utf-8").splitlines()
+    topics = []
+    for line in lines:
+        topic = line.strip()
+        if topic and not topic.startswith("#") and topic not in topics:
+            topics.append(topic)
+    return topics
+
+
+def run_batch(
+    topics: list,
+    sources: str,
+    config: dict,
+    selected_models: dict,
+    from_date: str,
+    to_date: str,
+    depth: str,
+    mode: str,
+    mock: bool = False,
+    concurrency: int = BATCH_CONCURRENCY,
+    resume: bool = False,
+    quorum: dict = None,
+    on_result=None,
+    **research_kwargs,
+) -> list:
+    """Research several topics in one process.
+
+    Config, source probes and model selection are done once by the caller and
+    shared by every topic, as are the module-level caches. Up to `concurrency`
+    topics run at once; per-topic spinners are suppressed since they would
+    interleave.
+
+    Args:
+        on_result: Optional callback(topic, report, error), called as each
+            topic finishes (from the batch's worker threads, one at a time)
+        research_kwargs: Passed through to run_research() for every topic
+
+    Returns:
+        List of (topic, report, error) in input order. report is None when
+        the topic failed, with error describing why.
+    """
+    emit_lock = threading.Lock()
+
+    def research_one(topic: str) -> tuple:
+        started = time.time()
+        try:
+            journal = None if mock else RunJournal(
+                topic, from_date, to_date, depth, resume=resume,
+            )
+            results = run_research(
+                topic, sources, config, selected_models, from_date, to_date,
+                depth, mock, None, quorum=quorum, journal=journal, **research_kwargs,
+            )
+            report = _build_report(topic, from_date, to_date, mode, selected_models, results)
+            if journal and not report.pending_sources and not deadline_passed():
+                journal.discard()
+            outcome = (topic, report, None)
+        except Exception as e:
+            outcome = (topic, None, f"{type(e).__name__}: {e}")
+
+        elapsed = time.time() - started
+        with emit_lock:
+            if outcome[2]:
+                sys.stderr.write(f"[batch] {topic}: failed after {elapsed:.1f}s ({outcome[2]})\n")
+            else:
+                sys.stderr.write(f"[batch] {topic}: done in {elapsed:.1f}s\n")
             sys.stderr.flush()
+            if on_result:
+                on_result(*outcome)
+        return outcome
 
-    # Enrich Reddit items with real data (parallel, capped)
-    # Skip enrichment if ScrapeCreators already provided comments + engagement
-    enrich_max = timeouts["enrich_max_items"]
-    enrich_total_timeout = timeouts["enrich_total"]
-    items_to_enrich = reddit_items[:enrich_max]
-    rate_limited = False  # Set True if Reddit returns 429 during enrichment
+    executor = ThreadPoolExecutor(max_workers=max(1, concurrency))
+    try:
+        futures = [executor.submit(research_one, topic) for topic in topics]
+        outcomes = {}
+        for future in as_completed(futures):
+            topic, report, error = future.result()
+            outcomes[topic] = (topic, report, error)
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
 
-    if reddit_used_sc and items_to_enrich:
-        # ScrapeCreators already enriched items with comments — just copy to raw list
-        sys.stderr.write(f"[Reddit] Skipping old enrichment — ScrapeCreators already provided comments\n")
-        sys.stderr.flush()
-        raw_reddit_enriched = list(reddit_items[:enrich_max])
-        items_to_enrich = []  # Skip the enrichment block below
+    return [outcomes[topic] for topic in topics]
 
-    if items_to_enrich:
-        if progress:
-            progress.start_reddit_enrich(1, len(items_to_enrich))
 
-        if mock:
-            # Sequential mock enrichment (fast, no need for parallelism)
-            for i, item in enumerate(items_to_enrich):
-                if progress and i > 0:
-                    progress.update_reddit_enrich(i + 1, len(items_to_enrich))
-                try:
-                    mock_thread = load_fixture("reddit_thread_sample.json")
-                    reddit_items[i] = reddit_enrich.enrich_reddit_item(item, mock_thread)
-                except Exception as e:
-                    if progress:
-                        progress.show_error(f"Enrich failed for {item.get('url', 'unknown')}: {e}")
-                raw_reddit_enriched.append(reddit_items[i])
-        else:
-            # Parallel enrichment with bounded concurrency and total timeout
-            # Uses short HTTP timeout (10s) and 1 retry to fail fast on 429
-            completed_count = 0
-            rate_limited = False
-            with ThreadPoolExecutor(max_workers=5) as enrich_pool:
-                futures = {
-                    enrich_pool.submit(reddit_enrich.enrich_reddit_item, item): i
-                    for i, item in enumerate(items_to_enrich)
-                }
-                try:
-                    for future in as_completed(futures, timeout=enrich_total_timeout):
-                        idx = futures[future]
-                        completed_count += 1
-                        if progress:
-                            progress.update_reddit_enrich(completed_count, len(items_to_enrich))
-                        try:
-                            reddit_items[idx] = future.result(timeout=timeouts["enrich_per"])
-                        except reddit_enrich.RedditRateLimitError:
-                            rate_limited = True
-                            if progress:
-                                progress.show_error(
-                                    "Reddit rate-limited (429) — skipping remaining enrichment"
-                                )
-                            # Cancel remaining futures and bail
-                            for f in futures:
-                                f.cancel()
-                            break
-                        except Exception as e:
-                            if progress:
-                                progress.show_error(
-                                    f"Enrich failed for {items_to_enrich[idx].get('url', 'unknown')}: {e}"
-                                )
-                        raw_reddit_enriched.append(reddit_items[idx])
-                except TimeoutError:
-                    if progress:
-                        progress.show_error(
-                            f"Enrichment timed out after {enrich_total_timeout}s "
-                            f"({completed_count}/{len(items_to_enrich)} done)"
-                        )
-                    # Keep unenriched items as-is
-                    for idx in futures.values():
-                        if reddit_items[idx] not in raw_reddit_enriched:
-                            raw_reddit_enriched.append(reddit_items[idx])
+def probe_sources(config: dict) -> dict:
+    """Detect which optional sources are usable with this config.
+
+    This is the slow part of startup (`bird whoami` spawns Node, plus the
+    yt-dlp check), so the serve daemon keeps the result. Xiaohongshu is
+    only ruled out here if a recent probe failed; the probe itself runs in
+    the Xiaohongshu search task.
+    """
+    # Inject .env credentials into Bird module before auth check
+    bird_x.set_credentials(config.get('AUTH_TOKEN'), config.get('CT0'))
+
+    return {
+        # Auto-detect Bird (no prompts - just use it if available)
+        "x_source_status": env.get_x_source_status(config),
+        # Auto-detect yt-dlp for YouTube search
+        "has_ytdlp": env.is_ytdlp_available(),
+        # Auto-detect ScrapeCreators/Apify for TikTok
+        "has_tiktok": env.is_tiktok_available(config),
+        # Auto-detect ScrapeCreators for Instagram
+        "has_instagram": env.is_instagram_available(config),
+        # Xiaohongshu HTTP API (requires service + login), probed lazily
+        "has_xiaohongshu": not env.is_xiaohongshu_known_down(config),
+        # Auto-detect Bluesky (requires BSKY_HANDLE + BSKY_APP_PASSWORD)
+        "has_bluesky": env.is_bluesky_available(config),
+        # Auto-detect Truth Social (requires TRUTHSOCIAL_TOKEN)
+        "has_truthsocial": env.is_truthsocial_available(config),
+    }
+
+
+# How long the serve daemon trusts its probe results and model selection
+# before re-checking (a changed config re-checks immediately).
+WARM_TTL_SECONDS = 600
+
+
+def _prewarm_hosts(config: dict, search_sources: set = None) -> list:
+    """Hosts the planned sources will hit, for connection warm-up.
+
+    Keyed hosts are only listed when their key is configured, so calling
+    this with an empty config gives the hosts every run hits.
+
+    Args:
+        config: Loaded config (or {} before it is loaded)
+        search_sources: Parsed --search value, or None for all sources
+    """
+    wanted = {SOURCE_ALIASES.get(s, s) for s in search_sources} if search_sources else None
+
+    def want(*names):
+        return wanted is None or any(name in wanted for name in names)
+
+    from lib import brave_search, parallel_search, openrouter_search
+
+    has_sc = bool(config.get("SCRAPECREATORS_API_KEY"))
+    urls = []
+    if want("reddit"):
+        urls.append("https://www.reddit.com/")
+        if config.get("OPENAI_API_KEY"):
+            if config.get("OPENAI_AUTH_SOURCE") == env.AUTH_SOURCE_CODEX:
+                urls.append(openai_reddit.CODEX_RESPONSES_URL)
+            else:
+                urls.append(openai_reddit.OPENAI_RESPONSES_URL)
+    if want("x") and config.get("XAI_API_KEY"):
+        urls.append(xai_x.XAI_RESPONSES_URL)
+    # Only warmed for http's own opener: the other ScrapeCreators clients
+    # (and Reddit's, when requests is installed) go through requests
+    if want("reddit") and has_sc and reddit._requests is None:
+        urls.append(reddit.SCRAPECREATORS_BASE)
+    if want("hackernews"):
+        urls.append(hackernews.ALGOLIA_SEARCH_URL)
+    if want("polymarket"):
+        urls.append(polymarket.GAMMA_SEARCH_URL)
+    if want("bluesky") and env.is_bluesky_available(config):
+        urls.extend([bluesky.BSKY_SESSION_URL, bluesky.BSKY_SEARCH_URL])
+    if want("truthsocial") and env.is_truthsocial_available(config):
+        urls.append(truthsocial.TRUTHSOCIAL_SEARCH_URL)
+    if want("web"):
+        web_urls = {
+            "parallel": parallel_search.ENDPOINT,
+            "brave": brave_search.ENDPOINT,
+            "openrouter": openrouter_search.ENDPOINT,
+        }
+        urls.extend(web_urls[b] for b in env.get_web_search_backends(config))
+    return list(dict.fromkeys(urlparse(url).hostname for url in urls))
+
+
+def _warm_setup(warm: dict = None, prewarm: bool = False, search_sources: set = None) -> tuple:
+    """Load config and probe sources, reusing the daemon's warm state.
+
+    With prewarm, DNS lookups and TLS handshakes (a HEAD request each,
+    rate-limited hosts paced by their limiter) to the planned sources'
+    hosts run in the background while config loads, sources are probed and
+    models are selected: keyless hosts before the config is read, keyed
+    ones as soon as it is.
+
+    Returns:
+        (config, probes, model_cache) where model_cache is a dict the caller
+        may memoize model selection in (a throwaway dict outside the daemon)
+    """
+    if prewarm:
+        http.warm_connections(_prewarm_hosts({}, search_sources))
+    config = env.get_config()
+    if prewarm:
+        http.warm_connections(_prewarm_hosts(config, search_sources))
+    if warm is None:
+        return config, probe_sources(config), {}
+    if warm.get("config") != config or warm.get("expires", 0) < time.monotonic():
+        warm.clear()
+        warm.update(
+            config=config,
+            probes=probe_sources(config),
+            models={},
+            expires=time.monotonic() + WARM_TTL_SECONDS,
+        )
+    return config, warm["probes"], warm["models"]
+
+
+class _EmitWriter(io.TextIOBase):
+    """Text stream that hands each write to emit(stream, text)."""
+
+    def __init__(self, stream: str, emit):
+        self._stream = stream
+        self._emit = emit
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, text: str) -> int:
+        if text:
+            self._emit(self._stream, text)
+        return len(text)
+
+
+# Serve daemon output routing. sys.stdout/sys.stderr are replaced once by
+# _RoutedStream; each thread writes to the route of the request it was
+# started under (handler thread, source threads, their pools...). Threads a
+# request leaves running fall back to the daemon's own streams once that
+# request ends, instead of writing into the next client's output.
+_route_local = threading.local()
+
+
+class _OutputRoute:
+    """Where one request's threads write, until the request ends."""
+
+    def __init__(self, stdout, stderr):
+        self.streams = {"stdout": stdout, "stderr": stderr}
+        self.active = True
+
+
+class _RoutedStream(io.TextIOBase):
+    """sys.stdout/sys.stderr stand-in that writes to the calling thread's route."""
+
+    def __init__(self, name: str, fallback):
+        self._name = name
+        self._fallback = fallback
+
+    def writable(self) -> bool:
+        return True
+
+    def _target(self):
+        route = getattr(_route_local, "route", None)
+        if route is not None and route.active:
+            return route.streams[self._name]
+        return self._fallback
+
+    def write(self, text: str) -> int:
+        return self._target().write(text)
+
+    def flush(self):
+        self._target().flush()
+
+
+def _start_with_route(thread, _start=threading.Thread.start):
+    """Thread.start that hands the starting thread's output route to the new thread."""
+    route = getattr(_route_local, "route", None)
+    if route is not None:
+        run = thread.run
+
+        def run_routed():
+            _route_local.route = route
+            run()
+
+        thread.run = run_routed
+    _start(thread)
+
+
+def _install_output_routing():
+    """Route sys.stdout/sys.stderr per request (serve daemon only)."""
+    threading.Thread.start = _start_with_route
+    if not isinstance(sys.stdout, _RoutedStream):
+        sys.stdout = _RoutedStream("stdout", sys.stdout)
+    if not isinstance(sys.stderr, _RoutedStream):
+        sys.stderr = _RoutedStream("stderr", sys.stderr)
+
+
+def _serve_request(argv: list, cwd: str, warm: dict, emit) -> int:
+    """Run one CLI invocation inside the daemon, streaming its output.
+
+    Needs _install_output_routing(); output from this thread and every
+    thread it starts goes to emit until the request returns.
+
+    Returns:
+        Exit code
+    """
+    out, err = _EmitWriter("stdout", emit), _EmitWriter("stderr", emit)
+    route = _OutputRoute(out, err)
+    _route_local.route = route
+    code = 0
+    prev_cwd = os.getcwd()
+    try:
+        os.chdir(cwd)
+        try:
+            main(argv, warm=warm)
+        except SystemExit as e:
+            if isinstance(e.code, str):
+                err.write(e.code + "\n")
+                code = 1
+            else:
+                code = e.code or 0
+        except Exception:
+            traceback.print_exc(file=err)
+            code = 1
+    except OSError as e:
+        err.write(f"Error: {e}\n")
+        code = 1
+    finally:
+        os.chdir(prev_cwd)
+        route.active = False
+        _route_local.route = None
+        # Left running, the timers would fire in the idle daemon (or
+        # during the next request)
+        _clear_global_timeout()
+    return code
+
+
+def _serve_main(argv: list):
+    """`last30days.py serve [--stop]`: run (or stop) the research daemon."""
+    parser = argparse.ArgumentParser(
+        prog="last30days.py serve",
+        description="Keep config, source probes and model selection warm for repeat queries",
+    )
+    parser.add_argument("--socket", type=str, default=None, metavar="PATH",
+                        help=f"Unix socket path (default: {serve.get_socket_path()})")
+    parser.add_argument("--stop", action="store_true", help="Stop a running daemon")
+    args = parser.parse_args(argv)
+    path = Path(args.socket).expanduser() if args.socket else None
+
+    if not serve.is_supported():
+        print("Error: serve needs Unix domain sockets, which this platform lacks", file=sys.stderr)
+        sys.exit(1)
+    if args.stop:
+        if not serve.shutdown(path):
+            print("No daemon running", file=sys.stderr)
+            sys.exit(1)
+        return
 
-        if progress:
-            progress.end_reddit_enrich()
+    # Spinner animation would be captured into every reply
+    ui.IS_TTY = False
+    _install_output_routing()
+    warm = {}
+    try:
+        serve.serve(lambda req_argv, cwd, emit: _serve_request(req_argv, cwd, warm, emit), path)
+    except RuntimeError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    except KeyboardInterrupt:
+        pass
 
-    # Enrich HN stories with comments
-    if hackernews_items:
-        try:
-            hackernews_items = hackernews.enrich_top_stories(hackernews_items, depth=depth)
-        except Exception as e:
-            sys.stderr.write(f"[HN] Enrichment error: {e}\n")
-            sys.stderr.flush()
 
-    # Phase 2: Supplemental search based on entities from Phase 1
-    # Skip on --quick (speed matters), mock mode, or if Reddit is rate-limiting
-    # Also skip Reddit supplemental when ScrapeCreators was used (subreddit drilling already done)
-    if depth != "quick" and not mock and (reddit_items or x_items):
-        sup_reddit, sup_x = _run_supplemental(
-            topic, reddit_items, x_items,
-            from_date, to_date, depth, x_source, progress,
-            skip_reddit=(rate_limited or reddit_used_sc),
-            resolved_handle=resolved_handle,
-        )
-        if sup_reddit:
-            reddit_items.extend(sup_reddit)
-        if sup_x:
-            x_items.extend(sup_x)
+def _echo_output(stream: str, text: str):
+    """Print output streamed back from the daemon as it arrives."""
+    target = sys.stdout if stream == "stdout" else sys.stderr
+    target.write(text)
+    target.flush()
 
-    return reddit_items, x_items, youtube_items, tiktok_items, instagram_items, hackernews_items, bluesky_items, truthsocial_items, polymarket_items, web_items, web_needed, raw_openai, raw_xai, raw_reddit_enriched, reddit_error, x_error, youtube_error, tiktok_error, instagram_error, hackernews_error, bluesky_error, truthsocial_error, polymarket_error, web_error
 
+def main(argv: list = None, warm: dict = None):
+    """CLI entry point.
+
+    Args:
+        argv: Arguments (default: sys.argv[1:])
+        warm: Set by the serve daemon: its cached config/probe/model state.
+            Also means "running inside the daemon": no forwarding to a
+            daemon, no hard exits.
+    """
+    argv = sys.argv[1:] if argv is None else argv
+    if warm is None and argv[:1] == ["serve"]:
+        return _serve_main(argv[1:])
 
-def main():
     # Fix Unicode output on Windows (cp1252 can't encode emoji)
-    if sys.platform == "win32":
+    if warm is None and sys.platform == "win32":
         sys.stdout.reconfigure(encoding="utf-8", errors="replace")
         sys.stderr.reconfigure(encoding="utf-8", errors="replace")
 
@@ -1504,8 +2488,54 @@ def main():
         metavar="DIR",
         help="Auto-save raw research output to DIR/{topic-slug}.md",
     )
+    parser.add_argument(
+        "--quorum",
+        type=str,
+        default=None,
+        metavar="SPEC",
+        help=(
+            "Emit a partial report once enough sources finish, marking the rest as pending. "
+            "Comma-separated terms: source names, +N (any N others with results), items=N. "
+            "Example: --quorum reddit,x,+2"
+        ),
+    )
+    parser.add_argument(
+        "--quorum-followup",
+        action="store_true",
+        help=(
+            "With --quorum, keep waiting for pending sources and emit the full report as a follow-up "
+            "(with --emit json: one document per line, marked \"followup\": false/true)"
+        ),
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Reuse sources and enriched threads journaled by an interrupted run of the same topic/range/depth",
+    )
+    parser.add_argument(
+        "--topics-file",
+        type=str,
+        default=None,
+        metavar="PATH",
+        help=(
+            "Batch mode: research every topic in PATH (one per line, '-' for stdin) in one process, "
+            "emitting one JSON document per line as each topic finishes"
+        ),
+    )
+    parser.add_argument(
+        "--batch-concurrency",
+        type=int,
+        default=BATCH_CONCURRENCY,
+        metavar="N",
+        help=f"Topics researched at once in batch mode (default: {BATCH_CONCURRENCY})",
+    )
+    parser.add_argument(
+        "--no-daemon",
+        action="store_true",
+        help="Run in this process even if a `last30days.py serve` daemon is running",
+    )
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     args.topic = " ".join(args.topic) if args.topic else None
 
     # Enable debug logging if requested
@@ -1526,38 +2556,65 @@ def main():
     else:
         depth = "default"
 
-    # Install global timeout watchdog
+    # Batch mode: many topics sharing one setup
+    topics = None
+    if args.topics_file:
+        if args.topic:
+            print("Error: Pass either a topic or --topics-file, not both", file=sys.stderr)
+            sys.exit(1)
+        if args.x_handle or args.quorum_followup:
+            print("Error: --x-handle and --quorum-followup apply to a single topic", file=sys.stderr)
+            sys.exit(1)
+        try:
+            topics = load_topics_file(args.topics_file)
+        except OSError as e:
+            print(f"Error: Cannot read topics file: {e}", file=sys.stderr)
+            sys.exit(1)
+        if not topics:
+            print("Error: Topics file has no topics", file=sys.stderr)
+            sys.exit(1)
+
+    # Install global timeout watchdog (in batch mode, one budget per wave of topics)
     timeouts = TIMEOUT_PROFILES[depth]
     global_timeout = args.timeout or timeouts["global"]
-    _install_global_timeout(global_timeout)
-
-    # Load config
-    config = env.get_config()
+    if topics:
+        waves = -(-len(topics) // max(1, args.batch_concurrency))
+        global_timeout = args.timeout or timeouts["global"] * waves
+
+    # Hand off to a running daemon (see `last30days.py serve`); stdin
+    # topics and debug logging only make sense locally. The daemon gets the
+    # same budget a local run would have before its hard-exit backstop.
+    if (
+        warm is None
+        and not args.no_daemon
+        and not args.debug
+        and args.topics_file != "-"
+        and not os.environ.get("LAST30DAYS_NO_DAEMON")
+    ):
+        reply = serve.research(
+            argv, os.getcwd(),
+            timeout=global_timeout + DEADLINE_GRACE_SECONDS,
+            on_output=_echo_output,
+        )
+        if reply is not None:
+            sys.exit(reply["exit_code"])
 
-    # Inject .env credentials into Bird module before auth check
-    bird_x.set_credentials(config.get('AUTH_TOKEN'), config.get('CT0'))
+    _install_global_timeout(global_timeout, backstop=warm is None)
 
-    # Auto-detect Bird (no prompts - just use it if available)
-    x_source_status = env.get_x_source_status(config)
+    # Load config and probe sources (cached across requests by the daemon)
+    config, probes, model_cache = _warm_setup(
+        warm,
+        prewarm=not (args.mock or args.diagnose),
+        search_sources=parse_search_flag(args.search) if args.search else None,
+    )
+    x_source_status = probes["x_source_status"]
     x_source = x_source_status["source"]  # 'bird', 'xai', or None
-
-    # Auto-detect yt-dlp for YouTube search
-    has_ytdlp = env.is_ytdlp_available()
-
-    # Auto-detect ScrapeCreators/Apify for TikTok
-    has_tiktok = env.is_tiktok_available(config)
-
-    # Auto-detect ScrapeCreators for Instagram
-    has_instagram = env.is_instagram_available(config)
-
-    # Auto-detect Xiaohongshu HTTP API (requires service + login)
-    has_xiaohongshu = env.is_xiaohongshu_available(config)
-
-    # Auto-detect Bluesky (requires BSKY_HANDLE + BSKY_APP_PASSWORD)
-    has_bluesky = env.is_bluesky_available(config)
-
-    # Auto-detect Truth Social (requires TRUTHSOCIAL_TOKEN)
-    has_truthsocial = env.is_truthsocial_available(config)
+    has_ytdlp = probes["has_ytdlp"]
+    has_tiktok = probes["has_tiktok"]
+    has_instagram = probes["has_instagram"]
+    has_xiaohongshu = probes["has_xiaohongshu"]
+    has_bluesky = probes["has_bluesky"]
+    has_truthsocial = probes["has_truthsocial"]
 
     # --diagnose: show source availability and exit
     if args.diagnose:
@@ -1573,7 +2630,7 @@ def main():
             "youtube": has_ytdlp,
             "tiktok": has_tiktok,
             "instagram": has_instagram,
-            "xiaohongshu": has_xiaohongshu,
+            "xiaohongshu": env.is_xiaohongshu_available(config, use_cache=False),
             "xiaohongshu_api_base": env.get_xiaohongshu_api_base(config),
             "hackernews": True,
             "bluesky": has_bluesky,
@@ -1588,13 +2645,15 @@ def main():
         sys.exit(0)
 
     # Validate topic (--diagnose doesn't need one)
-    if not args.topic:
+    if not args.topic and not topics:
         print("Error: Please provide a topic to research.", file=sys.stderr)
         print("Usage: python3 last30days.py <topic> [options]", file=sys.stderr)
         sys.exit(1)
 
     # Initialize progress display with topic
-    progress = ui.ProgressDisplay(args.topic, show_banner=True)
+    progress = ui.ProgressDisplay(
+        args.topic or f"{len(topics)} topics (batch)", show_banner=True,
+    )
 
     # Show diagnostic banner when sources are missing
     web_source = env.get_web_search_source(config)
@@ -1672,7 +2731,9 @@ def main():
             mock_xai_models,
         )
     else:
-        selected_models = models.get_models(config)
+        if "selected" not in model_cache:
+            model_cache["selected"] = models.get_models(config)
+        selected_models = model_cache["selected"]
 
     # Determine mode string
     if sources == "all":
@@ -1700,7 +2761,9 @@ def main():
     search_run_youtube = has_ytdlp
     search_run_tiktok = has_tiktok
     search_run_instagram = has_instagram
-    search_run_xiaohongshu = has_xiaohongshu
+    # Mock runs don't probe Xiaohongshu (or record it as down) unless asked
+    search_run_xiaohongshu = has_xiaohongshu and not args.mock
+    probe_xiaohongshu = True
     if args.search:
         search_sources = parse_search_flag(args.search)
         has_reddit = "reddit" in search_sources
@@ -1714,6 +2777,7 @@ def main():
         search_run_instagram = "instagram" in search_sources and has_instagram
         # If explicitly requested, attempt Xiaohongshu even when preflight says unavailable.
         search_run_xiaohongshu = "xiaohongshu" in search_sources
+        probe_xiaohongshu = not search_run_xiaohongshu
         include_search_web = "web" in search_sources
         # Map to existing sources string
         if has_reddit and has_x:
@@ -1726,24 +2790,38 @@ def main():
         else:
             sources = "web"  # hn/polymarket only; no Reddit/X
 
-    # Run research
-    reddit_items, x_items, youtube_items, tiktok_items, instagram_items, hackernews_items, bluesky_items, truthsocial_items, polymarket_items, web_items, web_needed, raw_openai, raw_xai, raw_reddit_enriched, reddit_error, x_error, youtube_error, tiktok_error, instagram_error, hackernews_error, bluesky_error, truthsocial_error, polymarket_error, web_error = run_research(
-        args.topic,
-        sources,
-        config,
-        selected_models,
-        from_date,
-        to_date,
-        depth,
-        args.mock,
-        progress,
+    # Build source info for status footer
+    source_info = {}
+    if not x_source:
+        if x_source_status["bird_installed"]:
+            source_info["x_skip_reason"] = "Bird installed but not authenticated — log into x.com in browser"
+        else:
+            source_info["x_skip_reason"] = "No Bird CLI, XAI_API_KEY, or SCRAPECREATORS_API_KEY"
+    if not has_ytdlp:
+        source_info["youtube_skip_reason"] = "yt-dlp not installed — fix: brew install yt-dlp"
+    if not has_tiktok:
+        source_info["tiktok_skip_reason"] = "No SCRAPECREATORS_API_KEY - sign up at scrapecreators.com (100 free credits)"
+    if not has_instagram:
+        source_info["instagram_skip_reason"] = "No SCRAPECREATORS_API_KEY - sign up at scrapecreators.com (100 free credits)"
+    if not has_xiaohongshu:
+        source_info["xiaohongshu_skip_reason"] = (
+            f"Xiaohongshu API unavailable or not logged in - start xiaohongshu-mcp and login "
+            f"(base: {env.get_xiaohongshu_api_base(config)})"
+        )
+    if not web_source:
+        source_info["web_skip_reason"] = "assistant will use WebSearch (add BRAVE_API_KEY for native search)"
+
+    # Quorum mode: emit once enough sources are in
+    quorum = parse_quorum_flag(args.quorum) if args.quorum else None
+
+    research_kwargs = dict(
         x_source=x_source or "xai",
         run_youtube=search_run_youtube,
         run_tiktok=search_run_tiktok,
         run_instagram=search_run_instagram,
         run_xiaohongshu=search_run_xiaohongshu,
+        probe_xiaohongshu=probe_xiaohongshu,
         timeouts=timeouts,
-        resolved_handle=args.x_handle,
         do_hackernews=search_do_hackernews,
         do_bluesky=search_do_bluesky,
         do_truthsocial=search_do_truthsocial,
@@ -1751,123 +2829,78 @@ def main():
         no_native_web=args.no_native_web,
     )
 
-    # Processing phase
-    progress.start_processing()
-
-    # Normalize items
-    normalized_reddit = normalize.normalize_reddit_items(reddit_items, from_date, to_date)
-    normalized_x = normalize.normalize_x_items(x_items, from_date, to_date)
-    normalized_youtube = normalize.normalize_youtube_items(youtube_items, from_date, to_date) if youtube_items else []
-    normalized_tiktok = normalize.normalize_tiktok_items(tiktok_items, from_date, to_date) if tiktok_items else []
-    normalized_ig = normalize.normalize_instagram_items(instagram_items, from_date, to_date) if instagram_items else []
-    normalized_hn = normalize.normalize_hackernews_items(hackernews_items, from_date, to_date) if hackernews_items else []
-    normalized_bsky = normalize.normalize_bluesky_items(bluesky_items, from_date, to_date) if bluesky_items else []
-    normalized_ts = normalize.normalize_truthsocial_items(truthsocial_items, from_date, to_date) if truthsocial_items else []
-    normalized_pm = normalize.normalize_polymarket_items(polymarket_items, from_date, to_date) if polymarket_items else []
-    normalized_web = websearch.normalize_websearch_items(web_items, from_date, to_date) if web_items else []
-
-    # Hard date filter: exclude items with verified dates outside the range
-    # This is the safety net - even if prompts let old content through, this filters it
-    filtered_reddit = normalize.filter_by_date_range(normalized_reddit, from_date, to_date)
-    filtered_x = normalize.filter_by_date_range(normalized_x, from_date, to_date)
-    # YouTube: skip hard date filter — youtube_yt.py already applies a soft filter
-    # that prefers recent videos but keeps older ones for evergreen topics.
-    # YouTube content has a longer shelf life than tweets/posts.
-    filtered_youtube = normalized_youtube
-    # TikTok: hard date filter (tiktok.py already pre-filters, but safety net)
-    filtered_tiktok = normalize.filter_by_date_range(normalized_tiktok, from_date, to_date) if normalized_tiktok else []
-    # Instagram: hard date filter (instagram.py already pre-filters, but safety net)
-    filtered_ig = normalize.filter_by_date_range(normalized_ig, from_date, to_date) if normalized_ig else []
-    filtered_hn = normalize.filter_by_date_range(normalized_hn, from_date, to_date) if normalized_hn else []
-    filtered_bsky = normalize.filter_by_date_range(normalized_bsky, from_date, to_date) if normalized_bsky else []
-    filtered_ts = normalize.filter_by_date_range(normalized_ts, from_date, to_date) if normalized_ts else []
-    # Polymarket: skip hard date filter - markets are active/traded, updatedAt is fine
-    filtered_pm = normalized_pm
-    filtered_web = normalize.filter_by_date_range(normalized_web, from_date, to_date) if normalized_web else []
-
-    # Score items
-    scored_reddit = score.score_reddit_items(filtered_reddit)
-    scored_x = score.score_x_items(filtered_x)
-    scored_youtube = score.score_youtube_items(filtered_youtube) if filtered_youtube else []
-    scored_tiktok = score.score_tiktok_items(filtered_tiktok) if filtered_tiktok else []
-    scored_ig = score.score_instagram_items(filtered_ig) if filtered_ig else []
-    scored_hn = score.score_hackernews_items(filtered_hn) if filtered_hn else []
-    scored_bsky = score.score_bluesky_items(filtered_bsky) if filtered_bsky else []
-    scored_ts = score.score_truthsocial_items(filtered_ts) if filtered_ts else []
-    scored_pm = score.score_polymarket_items(filtered_pm) if filtered_pm else []
-    scored_web = score.score_websearch_items(filtered_web) if filtered_web else []
-
-    # Sort items
-    sorted_reddit = score.sort_items(scored_reddit)
-    sorted_x = score.sort_items(scored_x)
-    sorted_youtube = score.sort_items(scored_youtube) if scored_youtube else []
-    sorted_tiktok = score.sort_items(scored_tiktok) if scored_tiktok else []
-    sorted_ig = score.sort_items(scored_ig) if scored_ig else []
-    sorted_hn = score.sort_items(scored_hn) if scored_hn else []
-    sorted_bsky = score.sort_items(scored_bsky) if scored_bsky else []
-    sorted_ts = score.sort_items(scored_ts) if scored_ts else []
-    sorted_pm = score.sort_items(scored_pm) if scored_pm else []
-    sorted_web = score.sort_items(scored_web) if scored_web else []
-
-    # Dedupe items
-    deduped_reddit = dedupe.dedupe_reddit(sorted_reddit)
-    deduped_x = dedupe.dedupe_x(sorted_x)
-    deduped_youtube = dedupe.dedupe_youtube(sorted_youtube) if sorted_youtube else []
-    deduped_tiktok = dedupe.dedupe_tiktok(sorted_tiktok) if sorted_tiktok else []
-    deduped_ig = dedupe.dedupe_instagram(sorted_ig) if sorted_ig else []
-    deduped_hn = dedupe.dedupe_hackernews(sorted_hn) if sorted_hn else []
-    deduped_bsky = dedupe.dedupe_bluesky(sorted_bsky) if sorted_bsky else []
-    deduped_ts = dedupe.dedupe_truthsocial(sorted_ts) if sorted_ts else []
-    deduped_pm = dedupe.dedupe_polymarket(sorted_pm) if sorted_pm else []
-    deduped_web = websearch.dedupe_websearch(sorted_web) if sorted_web else []
-
-    # Minimum result guarantee: if all Reddit results were filtered out but
-    # we had raw results, keep top 3 by relevance regardless of score
-    if not deduped_reddit and normalized_reddit:
-        print("[REDDIT WARNING] All results scored below threshold, keeping top 3 by relevance", file=sys.stderr)
-        by_relevance = sorted(normalized_reddit, key=lambda item: item.relevance, reverse=True)
-        deduped_reddit = by_relevance[:3]
+    if topics:
+        def emit_topic(topic, report, error):
+            if report is None:
+                doc = {"topic": topic, "error": error}
+            else:
+                doc = report.to_dict()
+            print(json.dumps(doc, default=str))
+            sys.stdout.flush()
+
+        batch = run_batch(
+            topics, sources, config, selected_models, from_date, to_date, depth, mode,
+            mock=args.mock,
+            concurrency=args.batch_concurrency,
+            resume=args.resume,
+            quorum=quorum,
+            on_result=emit_topic,
+            **research_kwargs,
+        )
+        failed = sum(1 for _, report, _ in batch if report is None)
+        sys.stderr.write(f"[batch] {len(batch) - failed}/{len(batch)} topics completed\n")
+        sys.stderr.flush()
+        # Abandoned source threads (quorum or global timeout) must not hold up exit
+        if warm is None and (deadline_passed() or any(r and r.pending_sources for _, r, _ in batch)):
+            _cleanup_children()
+            os._exit(1 if failed == len(batch) else 0)
+        sys.exit(1 if failed == len(batch) else 0)
+
+    on_quorum = None
+    partial_reports = []
+    if quorum and args.quorum_followup:
+        def on_quorum(partial_results):
+            partial = _build_report(
+                args.topic, from_date, to_date, mode, selected_models, partial_results,
+                resolved_handle=args.x_handle,
+            )
+            partial_reports.append(partial)
+            if args.emit == "json":
+                # One document per line, so the follow-up is parseable too
+                print(json.dumps(dict(partial.to_dict(), followup=False), default=str))
+            else:
+                output_result(partial, args.emit, partial_results[10], args.topic, from_date, to_date, missing_keys, args.days, source_info)
+            sys.stdout.flush()
 
-    # Cross-source linking: annotate items that discuss the same story
-    dedupe.cross_source_link(
-        deduped_reddit, deduped_x, deduped_youtube, deduped_tiktok, deduped_ig, deduped_hn, deduped_bsky, deduped_ts, deduped_pm, deduped_web,
+    # Journal completed work so an interrupted run can be resumed
+    journal = None if args.mock else RunJournal(
+        args.topic, from_date, to_date, depth, resume=args.resume,
     )
 
-    progress.end_processing()
-
-    # Create report
-    report = schema.create_report(
+    # Run research
+    results = run_research(
         args.topic,
+        sources,
+        config,
+        selected_models,
         from_date,
         to_date,
-        mode,
-        selected_models.get("openai"),
-        selected_models.get("xai"),
+        depth,
+        args.mock,
+        progress,
+        resolved_handle=args.x_handle,
+        quorum=quorum,
+        on_quorum=on_quorum,
+        journal=journal,
+        **research_kwargs,
     )
-    report.reddit = deduped_reddit
-    report.x = deduped_x
-    report.youtube = deduped_youtube
-    report.tiktok = deduped_tiktok
-    report.instagram = deduped_ig
-    report.hackernews = deduped_hn
-    report.bluesky = deduped_bsky
-    report.truthsocial = deduped_ts
-    report.polymarket = deduped_pm
-    report.web = deduped_web
-    report.reddit_error = reddit_error
-    report.x_error = x_error
-    report.youtube_error = youtube_error
-    report.tiktok_error = tiktok_error
-    report.instagram_error = instagram_error
-    report.hackernews_error = hackernews_error
-    report.bluesky_error = bluesky_error
-    report.truthsocial_error = truthsocial_error
-    report.polymarket_error = polymarket_error
-    report.web_error = web_error
-    report.resolved_x_handle = args.x_handle
+    web_needed, raw_openai, raw_xai, raw_reddit_enriched = results[10:14]
 
-    # Generate context snippet
-    report.context_snippet_md = render.render_context_snippet(report)
+    # Processing phase
+    report = _build_report(
+        args.topic, from_date, to_date, mode, selected_models, results,
+        resolved_handle=args.x_handle, progress=progress,
+    )
 
     # Write outputs
     render.write_outputs(report, raw_openai, raw_xai, raw_reddit_enriched)
@@ -1876,33 +2909,20 @@ def main():
     if sources == "web":
         progress.show_web_only_complete()
     else:
-        progress.show_complete(len(deduped_reddit), len(deduped_x), len(deduped_youtube), len(deduped_hn), len(deduped_pm), len(deduped_tiktok), len(deduped_ig))
+        progress.show_complete(len(report.reddit), len(report.x), len(report.youtube), len(report.hackernews), len(report.polymarket), len(report.tiktok), len(report.instagram))
 
-    # Build source info for status footer
-    source_info = {}
-    if not x_source:
-        if x_source_status["bird_installed"]:
-            source_info["x_skip_reason"] = "Bird installed but not authenticated — log into x.com in browser"
-        else:
-            source_info["x_skip_reason"] = "No Bird CLI, XAI_API_KEY, or SCRAPECREATORS_API_KEY"
-    if not has_ytdlp:
-        source_info["youtube_skip_reason"] = "yt-dlp not installed — fix: brew install yt-dlp"
-    elif has_ytdlp and not report.youtube:
+    if has_ytdlp and not report.youtube:
         source_info["youtube_skip_reason"] = "0 results (query may be too specific)"
-    if not has_tiktok:
-        source_info["tiktok_skip_reason"] = "No SCRAPECREATORS_API_KEY - sign up at scrapecreators.com (100 free credits)"
-    if not has_instagram:
-        source_info["instagram_skip_reason"] = "No SCRAPECREATORS_API_KEY - sign up at scrapecreators.com (100 free credits)"
-    if not has_xiaohongshu:
-        source_info["xiaohongshu_skip_reason"] = (
-            f"Xiaohongshu API unavailable or not logged in - start xiaohongshu-mcp and login "
-            f"(base: {env.get_xiaohongshu_api_base(config)})"
-        )
-    if not web_source:
-        source_info["web_skip_reason"] = "assistant will use WebSearch (add BRAVE_API_KEY for native search)"
 
-    # Output result
-    output_result(report, args.emit, web_needed, args.topic, from_date, to_date, missing_keys, args.days, source_info)
+    # Output result (a follow-up after the partial quorum report, if one was emitted)
+    if partial_reports and args.emit == "json":
+        print(json.dumps(dict(report.to_dict(), followup=True), default=str))
+    else:
+        if partial_reports:
+            print("\n" + "="*60)
+            print("### FOLLOW-UP: LATE RESULTS ###")
+            print("="*60)
+        output_result(report, args.emit, web_needed, args.topic, from_date, to_date, missing_keys, args.days, source_info)
 
     # Auto-save raw research to file if --save-dir is set
     if args.save_dir:
@@ -1927,7 +2947,7 @@ def main():
         run_id = store_mod.record_run(topic_id, source_mode=mode, status="completed")
 
         findings = []
-        for item in deduped_reddit:
+        for item in report.reddit:
             findings.append({
                 "source": "reddit",
                 "url": item.url,
@@ -1937,7 +2957,7 @@ def main():
                 "engagement_score": item.engagement.score if item.engagement else 0,
                 "relevance_score": item.relevance,
             })
-        for item in deduped_x:
+        for item in report.x:
             findings.append({
                 "source": "x",
                 "url": item.url,
@@ -1947,7 +2967,7 @@ def main():
                 "engagement_score": item.engagement.likes if item.engagement else 0,
                 "relevance_score": item.relevance,
             })
-        for item in deduped_youtube:
+        for item in report.youtube:
             findings.append({
                 "source": "youtube",
                 "url": item.url,
@@ -1957,7 +2977,7 @@ def main():
                 "engagement_score": item.engagement.views if item.engagement and item.engagement.views else 0,
                 "relevance_score": item.relevance,
             })
-        for item in deduped_hn:
+        for item in report.hackernews:
             findings.append({
                 "source": "hackernews",
                 "url": item.hn_url,
@@ -1967,7 +2987,7 @@ def main():
                 "engagement_score": item.engagement.score if item.engagement else 0,
                 "relevance_score": item.relevance,
             })
-        for item in deduped_bsky:
+        for item in report.bluesky:
             findings.append({
                 "source": "bluesky",
                 "url": item.url,
@@ -1977,7 +2997,7 @@ def main():
                 "engagement_score": item.engagement.likes if item.engagement else 0,
                 "relevance_score": item.relevance,
             })
-        for item in deduped_pm:
+        for item in report.polymarket:
             findings.append({
                 "source": "polymarket",
                 "url": item.url,
@@ -1987,7 +3007,7 @@ def main():
                 "engagement_score": item.engagement.volume if item.engagement and item.engagement.volume else 0,
                 "relevance_score": item.relevance,
             })
-        for item in deduped_ig:
+        for item in report.instagram:
             findings.append({
                 "source": "instagram",
                 "url": item.url,
@@ -1997,7 +3017,7 @@ def main():
                 "engagement_score": item.engagement.views if item.engagement and item.engagement.views else 0,
                 "relevance_score": item.relevance,
             })
-        for item in deduped_web:
+        for item in report.web:
             findings.append({
                 "source": "web",
                 "url": item.url,
@@ -2020,6 +3040,19 @@ def main():
         )
         sys.stderr.flush()
 
+    # A complete run has nothing left to resume
+    if journal and not report.pending_sources and not deadline_passed():
+        journal.discard()
+
+    # Quorum report without follow-up, or a run cut short by the global
+    # timeout: don't wait for abandoned source threads (the interpreter joins
+    # them at exit). The daemon just leaves them to finish in the background.
+    if warm is None and (report.pending_sources or deadline_passed()):
+        sys.stdout.flush()
+        sys.stderr.flush()
+        _cleanup_children()
+        os._exit(0)
+
 
 def output_result(
     report: schema.Report,
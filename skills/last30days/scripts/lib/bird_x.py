@@ -4,15 +4,20 @@ Uses a vendored subset of @steipete/bird v0.8.0 (MIT License) to search X
 via Twitter's GraphQL API. No external `bird` CLI binary needed - just Node.js 22+.
 """
 
+import atexit
+import itertools
 import json
 import os
 import signal
 import shutil
 import subprocess
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 # Path to the vendored bird-search wrapper
 _BIRD_SEARCH_MJS = Path(__file__).parent / "vendor" / "bird-search" / "bird-search.mjs"
@@ -24,16 +29,28 @@ DEPTH_CONFIG = {
     "deep": 60,
 }
 
+# Most Bird Node processes running at once (each one is a GraphQL session
+# against X, so fanning out too wide invites rate limiting)
+BIRD_MAX_CONCURRENCY = 3
+_bird_slots = threading.BoundedSemaphore(BIRD_MAX_CONCURRENCY)
+
+# How often (seconds) a search waiting on a slot, the worker or a process
+# checks whether it has been cancelled
+CANCEL_POLL = 0.1
+
 # Module-level credentials injected from .env config
 _credentials: Dict[str, str] = {}
 
 
 def set_credentials(auth_token: Optional[str], ct0: Optional[str]):
     """Inject AUTH_TOKEN/CT0 from .env config so Node subprocesses can use them."""
+    before = dict(_credentials)
     if auth_token:
         _credentials['AUTH_TOKEN'] = auth_token
     if ct0:
         _credentials['CT0'] = ct0
+    if _credentials != before:
+        _stop_worker()  # Restart with the new env on next use
 
 
 def _subprocess_env() -> Dict[str, str]:
@@ -106,6 +123,185 @@ def _extract_core_subject(topic: str) -> str:
     return ' '.join(result[:3]) or topic.lower().strip()  # Max 3 words
 
 
+class _WorkerDied(Exception):
+    """The Bird worker exited before answering."""
+
+
+class _BirdWorker:
+    """One long-lived `bird-search.mjs --worker` process shared by all threads.
+
+    Requests are written as JSON lines tagged with an id; a reader thread
+    hands each response line to the thread waiting on that id, so several
+    searches can be in flight at once.
+    """
+
+    def __init__(self):
+        preexec = os.setsid if hasattr(os, 'setsid') else None
+        self._proc = subprocess.Popen(
+            ["node", str(_BIRD_SEARCH_MJS), "--worker"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            bufsize=1,
+            preexec_fn=preexec,
+            env=_subprocess_env(),
+        )
+        self._ids = itertools.count(1)
+        self._pending: Dict[int, list] = {}  # id -> [Event, reply]
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._dead = False
+        threading.Thread(target=self._read_loop, daemon=True).start()
+
+    @property
+    def alive(self) -> bool:
+        return not self._dead and self._proc.poll() is None
+
+    def _read_loop(self):
+        try:
+            for line in self._proc.stdout:
+                try:
+                    reply = json.loads(line)
+                except ValueError:
+                    continue
+                with self._lock:
+                    slot = self._pending.pop(reply.get("id"), None)
+                if slot:
+                    slot[1] = reply
+                    slot[0].set()
+        except (OSError, ValueError):
+            pass
+        # EOF: the worker exited. Wake everyone still waiting.
+        self._dead = True
+        with self._lock:
+            slots = list(self._pending.values())
+            self._pending.clear()
+        for slot in slots:
+            slot[0].set()
+
+    def call(
+        self,
+        request: Dict[str, Any],
+        timeout: float,
+        cancel: Optional[threading.Event] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Send a request and wait for its reply.
+
+        Returns:
+            The reply dict, or None if it didn't arrive within timeout (or
+            cancel was set first)
+
+        Raises:
+            _WorkerDied: If the worker is gone or exits before answering
+        """
+        rid = next(self._ids)
+        slot = [threading.Event(), None]
+        with self._lock:
+            if self._dead:
+                raise _WorkerDied()
+            self._pending[rid] = slot
+        try:
+            with self._write_lock:
+                self._proc.stdin.write(json.dumps({"id": rid, **request}) + "\n")
+                self._proc.stdin.flush()
+        except (OSError, ValueError):
+            with self._lock:
+                self._pending.pop(rid, None)
+            raise _WorkerDied()
+
+        deadline = time.monotonic() + timeout
+        while not slot[0].wait(min(CANCEL_POLL, max(0.0, deadline - time.monotonic()))):
+            if time.monotonic() >= deadline or (cancel and cancel.is_set()):
+                with self._lock:
+                    self._pending.pop(rid, None)
+                return None
+        if slot[1] is None:
+            raise _WorkerDied()
+        return slot[1]
+
+    def close(self):
+        """Stop the worker (it exits on stdin EOF; terminate if it lingers)."""
+        try:
+            self._proc.stdin.close()
+        except (OSError, ValueError):
+            pass
+        try:
+            self._proc.wait(timeout=2)
+        except subprocess.TimeoutExpired:
+            self._proc.kill()
+
+
+# Times a dead worker is replaced before falling back to a process per search
+WORKER_MAX_RESTARTS = 2
+
+_worker: Optional[_BirdWorker] = None
+_worker_starts = 0
+_worker_lock = threading.Lock()
+
+
+def _get_worker() -> Optional[_BirdWorker]:
+    """Get the shared Bird worker, starting it on first use.
+
+    Returns None when the worker is disabled (LAST30DAYS_BIRD_WORKER=0),
+    can't start, or has died too often; callers then spawn per search.
+    """
+    global _worker, _worker_starts
+    if os.environ.get("LAST30DAYS_BIRD_WORKER", "1").lower() in ("0", "false", "no"):
+        return None
+    with _worker_lock:
+        if _worker and _worker.alive:
+            return _worker
+        if _worker_starts > WORKER_MAX_RESTARTS or not is_bird_installed():
+            return None
+        _worker_starts += 1
+        try:
+            _worker = _BirdWorker()
+        except OSError as e:
+            _log(f"Could not start Bird worker: {e}")
+            _worker = None
+        return _worker
+
+
+def _stop_worker():
+    """Stop the shared Bird worker, if running."""
+    global _worker
+    with _worker_lock:
+        worker, _worker = _worker, None
+    if worker:
+        worker.close()
+
+
+atexit.register(_stop_worker)
+
+
+def _worker_call(
+    request: Dict[str, Any],
+    timeout: float,
+    cancel: Optional[threading.Event] = None,
+) -> Optional[Dict[str, Any]]:
+    """Run a request on the Bird worker.
+
+    Returns:
+        The reply dict, {"ok": False, "error": <timeout>} if it timed out or
+        was cancelled, or None if no worker is available (caller falls back
+        to spawning)
+    """
+    worker = _get_worker()
+    if not worker:
+        return None
+    try:
+        reply = worker.call(request, timeout, cancel)
+    except _WorkerDied:
+        _log("Bird worker exited, falling back to one process per search")
+        return None
+    if reply is None:
+        if cancel and cancel.is_set():
+            return {"ok": False, "error": "Search cancelled"}
+        return {"ok": False, "error": f"Search timed out after {timeout}s"}
+    return reply
+
+
 def is_bird_installed() -> bool:
     """Check if vendored Bird search module is available.
 
@@ -126,6 +322,10 @@ def is_bird_authenticated() -> Optional[str]:
     if not is_bird_installed():
         return None
 
+    reply = _worker_call({"op": "whoami"}, 15)
+    if reply is not None:
+        return reply.get("result") if reply.get("ok") and reply.get("result") else None
+
     try:
         result = subprocess.run(
             ["node", str(_BIRD_SEARCH_MJS), "--whoami"],
@@ -180,13 +380,24 @@ def get_bird_status() -> Dict[str, Any]:
     }
 
 
-def _run_bird_search(query: str, count: int, timeout: int) -> Dict[str, Any]:
+def _run_bird_search(
+    query: str,
+    count: int,
+    timeout: int,
+    cancel: Optional[threading.Event] = None,
+) -> Dict[str, Any]:
     """Run a search using the vendored bird-search.mjs module.
 
+    Goes through the shared worker process when available, otherwise
+    spawns a one-shot process.
+
     Args:
         query: Full search query string (including since: filter)
         count: Number of results to request
         timeout: Timeout in seconds
+        cancel: Optional event; once set, the search gives up (waiting for
+            a slot, on the worker, or killing its process) and frees its
+            BIRD_MAX_CONCURRENCY slot
 
     Returns:
         Raw Bird JSON response or error dict.
@@ -198,6 +409,24 @@ def _run_bird_search(query: str, count: int, timeout: int) -> Dict[str, Any]:
         "--json",
     ]
 
+    while not _bird_slots.acquire(timeout=CANCEL_POLL):
+        if cancel and cancel.is_set():
+            return {"error": "Search cancelled", "items": []}
+    try:
+        if cancel and cancel.is_set():
+            return {"error": "Search cancelled", "items": []}
+        reply = _worker_call({"op": "search", "query": query, "count": count}, timeout, cancel)
+        if reply is None:
+            return _spawn_bird_search(cmd, timeout, cancel)
+        if not reply.get("ok"):
+            return {"error": reply.get("error") or "Bird search failed", "items": []}
+        return reply.get("result") or []
+    finally:
+        _bird_slots.release()
+
+
+def _spawn_bird_search(cmd: List[str], timeout: int, cancel: Optional[threading.Event] = None) -> Dict[str, Any]:
+    """Run one bird-search.mjs process and parse its JSON output."""
     # Use process groups for clean cleanup on timeout/kill
     preexec = os.setsid if hasattr(os, 'setsid') else None
 
@@ -218,16 +447,27 @@ def _run_bird_search(query: str, count: int, timeout: int) -> Dict[str, Any]:
         except ImportError:
             pass
 
+        deadline = time.monotonic() + timeout
         try:
-            stdout, stderr = proc.communicate(timeout=timeout)
-        except subprocess.TimeoutExpired:
-            # Kill the entire process group
-            try:
-                os.killpg(os.getpgid(proc.pid), signal.SIGTERM)
-            except (ProcessLookupError, PermissionError, OSError):
-                proc.kill()
-            proc.wait(timeout=5)
-            return {"error": f"Search timed out after {timeout}s", "items": []}
+            while True:
+                try:
+                    stdout, stderr = proc.communicate(
+                        timeout=min(CANCEL_POLL, max(0.0, deadline - time.monotonic())),
+                    )
+                    break
+                except subprocess.TimeoutExpired:
+                    cancelled = cancel is not None and cancel.is_set()
+                    if not cancelled and time.monotonic() < deadline:
+                        continue
+                    # Kill the entire process group
+                    try:
+                        os.killpg(os.getpgid(proc.pid), signal.SIGTERM)
+                    except (ProcessLookupError, PermissionError, OSError):
+                        proc.kill()
+                    proc.wait(timeout=5)
+                    if cancelled:
+                        return {"error": "Search cancelled", "items": []}
+                    return {"error": f"Search timed out after {timeout}s", "items": []}
         finally:
             try:
                 from last30days import unregister_child_pid
@@ -251,11 +491,78 @@ def _run_bird_search(query: str, count: int, timeout: int) -> Dict[str, Any]:
         return {"error": str(e), "items": []}
 
 
+# Words too generic to stand alone as the last-chance retry query
+_LOW_SIGNAL_WORDS = {
+    'trendiest', 'trending', 'hottest', 'hot', 'popular', 'viral',
+    'best', 'top', 'latest', 'new', 'plugin', 'plugins',
+    'skill', 'skills', 'tool', 'tools',
+}
+
+
+def _fallback_queries(core_topic: str) -> List[Tuple[str, str]]:
+    """Build the search terms to try, in priority order.
+
+    Returns:
+        List of (terms, log message) pairs: the full core topic, its first
+        two words (3+ word topics), then the strongest remaining token
+        (often the product name). Duplicates are dropped.
+    """
+    core_words = core_topic.split()
+    attempts = [(core_topic, "")]
+
+    # Retry with fewer keywords if query has 3+ words
+    if len(core_words) > 2:
+        shorter = ' '.join(core_words[:2])
+        attempts.append((shorter, f"0 results for '{core_topic}', retrying with '{shorter}'"))
+
+    # Last-chance retry: use strongest remaining token (often the product name)
+    candidates = [w for w in core_words if w not in _LOW_SIGNAL_WORDS]
+    if candidates:
+        strongest = max(candidates, key=len)
+        attempts.append((
+            strongest,
+            f"0 results for '{core_topic}', retrying with strongest token '{strongest}'",
+        ))
+
+    seen = set()
+    unique = []
+    for terms, message in attempts:
+        if terms not in seen:
+            seen.add(terms)
+            unique.append((terms, message))
+    return unique
+
+
+def _search_speculative(queries: List[str], count: int, timeout: int) -> Dict[str, Any]:
+    """Run all fallback queries at once and keep the best non-empty one.
+
+    Returns as soon as the highest-priority query that can still win has
+    results; lower-priority queries still running are cancelled, so they
+    give their BIRD_MAX_CONCURRENCY slots back straight away rather than
+    holding them until their own timeout.
+    """
+    pool = ThreadPoolExecutor(max_workers=len(queries))
+    cancel = threading.Event()
+    try:
+        futures = [pool.submit(_run_bird_search, q, count, timeout, cancel) for q in queries]
+        for i, future in enumerate(futures):
+            response = future.result()
+            if parse_bird_response(response):
+                if i:
+                    _log(f"Fallback query matched: {queries[i]}")
+                return response
+        return response  # Nothing matched: the last query's response, like the serial path
+    finally:
+        cancel.set()
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
 def search_x(
     topic: str,
     from_date: str,
     to_date: str,
     depth: str = "default",
+    speculative: bool = False,
 ) -> Dict[str, Any]:
     """Search X using Bird CLI with automatic retry on 0 results.
 
@@ -264,6 +571,9 @@ def search_x(
         from_date: Start date (YYYY-MM-DD)
         to_date: End date (YYYY-MM-DD) - unused but kept for API compatibility
         depth: Research depth - "quick", "default", or "deep"
+        speculative: Issue the fallback queries alongside the primary one
+            instead of after it comes back empty. Costs extra searches but
+            caps a miss at about one query's latency.
 
     Returns:
         Raw Bird JSON response or error dict.
@@ -273,36 +583,25 @@ def search_x(
 
     # Extract core subject - X search is literal, not semantic
     core_topic = _extract_core_subject(topic)
-    query = f"{core_topic} since:{from_date}"
-
-    _log(f"Searching: {query}")
-    response = _run_bird_search(query, count, timeout)
-
-    # Check if we got results
-    items = parse_bird_response(response)
-
-    # Retry with fewer keywords if 0 results and query has 3+ words
-    core_words = core_topic.split()
-    if not items and len(core_words) > 2:
-        shorter = ' '.join(core_words[:2])
-        _log(f"0 results for '{core_topic}', retrying with '{shorter}'")
-        query = f"{shorter} since:{from_date}"
+    attempts = _fallback_queries(core_topic)
+
+    if speculative and len(attempts) > 1:
+        queries = [f"{terms} since:{from_date}" for terms, _ in attempts]
+        _log(f"Searching: {queries[0]} (+{len(queries) - 1} fallback queries in parallel)")
+        return _search_speculative(queries, count, timeout)
+
+    response = None
+    for terms, message in attempts:
+        if message:
+            _log(message)
+        query = f"{terms} since:{from_date}"
+        if not message:
+            _log(f"Searching: {query}")
         response = _run_bird_search(query, count, timeout)
-        items = parse_bird_response(response)
 
-    # Last-chance retry: use strongest remaining token (often the product name)
-    if not items and core_words:
-        low_signal = {
-            'trendiest', 'trending', 'hottest', 'hot', 'popular', 'viral',
-            'best', 'top', 'latest', 'new', 'plugin', 'plugins',
-            'skill', 'skills', 'tool', 'tools',
-        }
-        candidates = [w for w in core_words if w not in low_signal]
-        if candidates:
-            strongest = max(candidates, key=len)
-            _log(f"0 results for '{core_topic}', retrying with strongest token '{strongest}'")
-            query = f"{strongest} since:{from_date}"
-            response = _run_bird_search(query, count, timeout)
+        # Check if we got results
+        if parse_bird_response(response):
+            break
 
     return response
 
@@ -312,76 +611,51 @@ def search_handles(
     topic: Optional[str],
     from_date: str,
     count_per: int = 5,
+    on_items: Optional[Callable[[List[Dict[str, Any]]], None]] = None,
 ) -> List[Dict[str, Any]]:
     """Search specific X handles for topic-related content.
 
     Runs targeted Bird searches using `from:handle topic` syntax.
     Used in Phase 2 supplemental search after entity extraction.
+    Handles are searched concurrently, up to BIRD_MAX_CONCURRENCY at once.
 
     Args:
         handles: List of X handles to search (without @)
         topic: Search topic (core subject), or None for unfiltered search
         from_date: Start date (YYYY-MM-DD)
         count_per: Results to request per handle
+        on_items: Optional callback, called with each handle's items as
+            soon as they arrive (so a caller with a deadline can keep them)
 
     Returns:
-        List of raw item dicts (same format as parse_bird_response output).
+        List of raw item dicts (same format as parse_bird_response output),
+        in arrival order.
     """
     all_items = []
+    lock = threading.Lock()
     core_topic = _extract_core_subject(topic) if topic else None
 
-    for handle in handles:
+    def search_one(handle: str):
         handle = handle.lstrip("@")
         if core_topic:
             query = f"from:{handle} {core_topic} since:{from_date}"
         else:
             query = f"from:{handle} since:{from_date}"
 
-        cmd = [
-            "node", str(_BIRD_SEARCH_MJS),
-            query,
-            "--count", str(count_per),
-            "--json",
-        ]
-
-        preexec = os.setsid if hasattr(os, 'setsid') else None
-
-        try:
-            proc = subprocess.Popen(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                preexec_fn=preexec,
-            )
+        response = _run_bird_search(query, count_per, 15)
+        if isinstance(response, dict) and response.get("error"):
+            _log(f"Handle search failed for @{handle}: {response['error']}")
+            return
 
-            try:
-                stdout, stderr = proc.communicate(timeout=15)
-            except subprocess.TimeoutExpired:
-                try:
-                    os.killpg(os.getpgid(proc.pid), signal.SIGTERM)
-                except (ProcessLookupError, PermissionError, OSError):
-                    proc.kill()
-                proc.wait(timeout=5)
-                _log(f"Handle search timed out for @{handle}")
-                continue
-
-            if proc.returncode != 0:
-                _log(f"Handle search failed for @{handle}: {(stderr or '').strip()}")
-                continue
-
-            output = (stdout or "").strip()
-            if not output:
-                continue
-
-            response = json.loads(output)
-            items = parse_bird_response(response)
+        items = parse_bird_response(response)
+        with lock:
             all_items.extend(items)
+        if items and on_items:
+            on_items(items)
 
-        except json.JSONDecodeError:
-            _log(f"Invalid JSON from handle search for @{handle}")
-        except Exception as e:
-            _log(f"Handle search error for @{handle}: {e}")
+    if handles:
+        with ThreadPoolExecutor(max_workers=min(BIRD_MAX_CONCURRENCY, len(handles))) as pool:
+            list(pool.map(search_one, handles))
 
     return all_items
 
@@ -4,15 +4,22 @@ Uses bsky.social for auth and public.api.bsky.app for post search.
 Requires BSKY_HANDLE and BSKY_APP_PASSWORD env vars.
 """
 
+import base64
+import json
 import math
+import os
 import re
 import sys
+import threading
+import time
 from datetime import datetime, timezone
+from pathlib import Path
 from typing import Any, Dict, List, Optional
 
-from . import http
+from . import cache, http
 
 BSKY_SESSION_URL = "https://bsky.social/xrpc/com.atproto.server.createSession"
+BSKY_REFRESH_URL = "https://bsky.social/xrpc/com.atproto.server.refreshSession"
 BSKY_SEARCH_URL = "https://public.api.bsky.app/xrpc/app.bsky.feed.searchPosts"
 
 DEPTH_CONFIG = {
@@ -21,8 +28,24 @@ DEPTH_CONFIG = {
     "deep": 60,
 }
 
-# Module-level token cache (valid for the lifetime of a single research run)
+# searchPosts pages (of DEPTH_CONFIG posts each) to walk with the cursor
+DEPTH_PAGES = {
+    "quick": 1,
+    "default": 1,
+    "deep": 3,
+}
+
+# Module-level token cache for the current process, with the handle it
+# belongs to and the access token's expiry (None if it can't be read)
 _cached_token: Optional[str] = None
+_cached_handle: Optional[str] = None
+_cached_expiry: Optional[float] = None
+
+# Treat tokens this close to expiry as expired (seconds)
+TOKEN_EXPIRY_MARGIN = 60
+
+# Serializes refresh/login so concurrent searches don't each create a session
+_session_lock = threading.Lock()
 
 
 def _log(msg: str):
@@ -32,6 +55,77 @@ def _log(msg: str):
         sys.stderr.flush()
 
 
+def _jwt_expiry(token: str) -> Optional[float]:
+    """Read the exp claim from a JWT (no signature check), or None."""
+    try:
+        payload = token.split(".")[1]
+        payload += "=" * (-len(payload) % 4)
+        exp = json.loads(base64.urlsafe_b64decode(payload)).get("exp")
+        return float(exp) if exp else None
+    except (IndexError, ValueError, TypeError, AttributeError):
+        return None
+
+
+def _is_fresh(expiry: Optional[float]) -> bool:
+    return expiry is not None and expiry > time.time() + TOKEN_EXPIRY_MARGIN
+
+
+def _remember(handle: str, token: str):
+    """Cache an access token in memory for this process."""
+    global _cached_token, _cached_handle, _cached_expiry
+    _cached_token = token
+    _cached_handle = handle
+    _cached_expiry = _jwt_expiry(token)
+
+
+def _memory_token(handle: str) -> Optional[str]:
+    """Return the in-memory token for a handle if it hasn't expired."""
+    if not _cached_token or _cached_handle != handle:
+        return None
+    if _cached_expiry is not None and not _is_fresh(_cached_expiry):
+        return None
+    return _cached_token
+
+
+def _sessions_path() -> Path:
+    return cache.CACHE_DIR / "bluesky_sessions.json"
+
+
+def _load_sessions() -> Dict[str, Dict[str, str]]:
+    """Load persisted sessions ({handle: {accessJwt, refreshJwt}})."""
+    try:
+        with open(_sessions_path(), "r") as f:
+            data = json.load(f)
+        return data if isinstance(data, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_sessions(sessions: Dict[str, Dict[str, str]]):
+    """Write persisted sessions to a file private to the user."""
+    cache.ensure_cache_dir()
+    try:
+        fd = os.open(str(_sessions_path()), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w") as f:
+            json.dump(sessions, f)
+    except OSError:
+        pass  # Silently fail on cache write errors
+
+
+def _save_session(handle: str, session: Dict[str, Any]):
+    """Persist a handle's access and refresh tokens.
+
+    Only sessions whose tokens carry a readable expiry are kept, since
+    that's what tells us when to refresh.
+    """
+    access, refresh = session.get("accessJwt"), session.get("refreshJwt")
+    if not (_jwt_expiry(access or "") and _jwt_expiry(refresh or "")):
+        return
+    sessions = _load_sessions()
+    sessions[handle] = {"accessJwt": access, "refreshJwt": refresh}
+    _write_sessions(sessions)
+
+
 def _create_session(handle: str, app_password: str) -> Optional[str]:
     """Create an AT Protocol session and return the access token.
 
@@ -42,9 +136,9 @@ def _create_session(handle: str, app_password: str) -> Optional[str]:
     Returns:
         Access JWT string, or None on failure.
     """
-    global _cached_token
-    if _cached_token:
-        return _cached_token
+    token = _memory_token(handle)
+    if token:
+        return token
 
     try:
         response = http.request(
@@ -55,7 +149,8 @@ def _create_session(handle: str, app_password: str) -> Optional[str]:
         )
         token = response.get("accessJwt")
         if token:
-            _cached_token = token
+            _remember(handle, token)
+            _save_session(handle, response)
             _log("Session created successfully")
             return token
         _log("No accessJwt in session response")
@@ -65,6 +160,72 @@ def _create_session(handle: str, app_password: str) -> Optional[str]:
         return None
 
 
+def _refresh_session(handle: str, refresh_token: str) -> Optional[str]:
+    """Exchange a refresh token for a new session; returns the access token."""
+    try:
+        response = http.request(
+            "POST",
+            BSKY_REFRESH_URL,
+            headers={"Authorization": f"Bearer {refresh_token}"},
+            timeout=15,
+            retries=1,
+        )
+    except Exception as e:
+        _log(f"Session refresh failed: {e}")
+        return None
+    token = response.get("accessJwt")
+    if not token:
+        return None
+    _remember(handle, token)
+    _save_session(handle, response)
+    _log("Session refreshed")
+    return token
+
+
+def _get_access_token(handle: str, app_password: str) -> Optional[str]:
+    """Get an access token, logging in only when nothing cached works.
+
+    Order: in-memory token, persisted access token (keyed by handle),
+    refreshSession with the persisted refresh token, then createSession
+    with the app password. createSession is heavily rate-limited on
+    bsky.social, so it is the last resort.
+    """
+    token = _memory_token(handle)
+    if token:
+        return token
+
+    with _session_lock:
+        token = _memory_token(handle)  # Another thread may have just logged in
+        if token:
+            return token
+
+        stored = _load_sessions().get(handle) or {}
+        access = stored.get("accessJwt")
+        if access and _is_fresh(_jwt_expiry(access)):
+            _remember(handle, access)
+            return access
+
+        refresh = stored.get("refreshJwt")
+        if refresh and _is_fresh(_jwt_expiry(refresh)):
+            token = _refresh_session(handle, refresh)
+            if token:
+                return token
+
+        return _create_session(handle, app_password)
+
+
+def _invalidate_token(handle: str):
+    """Forget a rejected access token; the refresh token is kept."""
+    global _cached_token
+    if _cached_handle == handle:
+        _cached_token = None
+    sessions = _load_sessions()
+    stored = sessions.get(handle)
+    if stored and stored.get("accessJwt"):
+        stored["accessJwt"] = ""
+        _write_sessions(sessions)
+
+
 def _extract_core_subject(topic: str) -> str:
     """Extract core subject from verbose query for Bluesky search."""
     text = topic.lower().strip()
@@ -131,8 +292,8 @@ def search_bluesky(
     if not handle or not app_password:
         return {"posts": [], "error": "Bluesky credentials not configured"}
 
-    # Authenticate
-    token = _create_session(handle, app_password)
+    # Authenticate (cached/refreshed session when possible)
+    token = _get_access_token(handle, app_password)
     if not token:
         return {"posts": [], "error": "Bluesky auth failed"}
 
@@ -147,14 +308,42 @@ def search_bluesky(
         "limit": str(min(count, 100)),
         "sort": "top",
     }
-    url = f"{BSKY_SEARCH_URL}?{urlencode(params)}"
 
-    try:
-        response = http.request(
-            "GET", url,
-            headers={"Authorization": f"Bearer {token}"},
-            timeout=30,
+    def fetch_page(cursor):
+        nonlocal token
+        page_params = dict(params, cursor=cursor) if cursor else params
+        url = f"{BSKY_SEARCH_URL}?{urlencode(page_params)}"
+        try:
+            response = http.request(
+                "GET", url,
+                headers={"Authorization": f"Bearer {token}"},
+                timeout=30,
+            )
+        except http.HTTPError as e:
+            if e.status_code != 401:
+                raise
+            # Cached token was revoked or expired early: refresh/login once
+            _invalidate_token(handle)
+            token = _get_access_token(handle, app_password)
+            if not token:
+                raise
+            response = http.request(
+                "GET", url,
+                headers={"Authorization": f"Bearer {token}"},
+                timeout=30,
+            )
+        return response, response.get("cursor")
+
+    def has_recent(page):
+        # Stop paging once a whole page predates the range
+        return any(
+            (_parse_date(post) or _parse_date(post.get("record") or {}) or to_date) >= from_date
+            for post in page.get("posts", [])
         )
+
+    max_pages = DEPTH_PAGES.get(depth, DEPTH_PAGES["default"])
+    try:
+        pages = http.fetch_pages(fetch_page, None, max_pages, has_recent)
     except http.HTTPError as e:
         _log(f"Search failed: {e}")
         return {"posts": [], "error": str(e)}
@@ -162,8 +351,11 @@ def search_bluesky(
         _log(f"Search failed: {e}")
         return {"posts": [], "error": str(e)}
 
+    response = pages[0]
+    if len(pages) > 1:
+        response = dict(response, posts=[post for page in pages for post in page.get("posts", [])])
     posts = response.get("posts", [])
-    _log(f"Found {len(posts)} posts")
+    _log(f"Found {len(posts)} posts ({len(pages)} pages)")
     return response
 
 
@@ -4,6 +4,7 @@ import hashlib
 import json
 import os
 import tempfile
+import threading
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Optional
@@ -13,6 +14,10 @@ DEFAULT_TTL_HOURS = 24
 MODEL_CACHE_TTL_DAYS = 7
 MODEL_CACHE_FILE = CACHE_DIR / "model_selection.json"
 
+# Provider selections run concurrently; each update is a read-modify-write
+# of the one model cache file
+_model_cache_lock = threading.Lock()
+
 
 def ensure_cache_dir():
     """Ensure cache directory exists. Supports env override and sandbox fallback."""
@@ -115,6 +120,14 @@ def save_cache(cache_key: str, data: dict):
         pass  # Silently fail on cache write errors
 
 
+def delete_cache(cache_key: str):
+    """Remove one cache entry, if present."""
+    try:
+        get_cache_path(cache_key).unlink()
+    except OSError:
+        pass
+
+
 def clear_cache():
     """Clear all cache files."""
     if CACHE_DIR.exists():
@@ -153,13 +166,15 @@ def save_model_cache(data: dict):
 
 def get_cached_model(provider: str) -> Optional[str]:
     """Get cached model selection for a provider."""
-    cache = load_model_cache()
+    with _model_cache_lock:
+        cache = load_model_cache()
     return cache.get(provider)
 
 
 def set_cached_model(provider: str, model: str):
     """Cache model selection for a provider."""
-    cache = load_model_cache()
-    cache[provider] = model
-    cache['updated_at'] = datetime.now(timezone.utc).isoformat()
-    save_model_cache(cache)
+    with _model_cache_lock:
+        cache = load_model_cache()
+        cache[provider] = model
+        cache['updated_at'] = datetime.now(timezone.utc).isoformat()
+        save_model_cache(cache)
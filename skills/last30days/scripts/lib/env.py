@@ -1,12 +1,13 @@
 """Environment and API key management for last30days skill."""
 
 import base64
+import hashlib
 import json
 import os
 import time
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional, Dict, Any, Literal
+from typing import Optional, Dict, Any, List, Literal
 
 # Allow override via environment variable for testing
 # Set LAST30DAYS_CONFIG_DIR="" for clean/no-config mode
@@ -212,6 +213,28 @@ def _find_project_env() -> Optional[Path]:
     return None
 
 
+# Keys get_config() reads (env var overrides config file), with defaults
+CONFIG_KEYS = [
+    ('XAI_API_KEY', None),
+    ('OPENROUTER_API_KEY', None),
+    ('PARALLEL_API_KEY', None),
+    ('BRAVE_API_KEY', None),
+    ('WEB_SEARCH_MODE', 'priority'),
+    ('XIAOHONGSHU_API_BASE', None),
+    ('OPENAI_MODEL_POLICY', 'auto'),
+    ('OPENAI_MODEL_PIN', None),
+    ('XAI_MODEL_POLICY', 'latest'),
+    ('XAI_MODEL_PIN', None),
+    ('SCRAPECREATORS_API_KEY', None),
+    ('APIFY_API_TOKEN', None),
+    ('AUTH_TOKEN', None),
+    ('CT0', None),
+    ('BSKY_HANDLE', None),
+    ('BSKY_APP_PASSWORD', None),
+    ('TRUTHSOCIAL_TOKEN', None),
+]
+
+
 def get_config() -> Dict[str, Any]:
     """Load configuration from multiple sources.
 
@@ -241,26 +264,7 @@ def get_config() -> Dict[str, Any]:
         'CODEX_AUTH_FILE': openai_auth.codex_auth_file,
     }
 
-    keys = [
-        ('XAI_API_KEY', None),
-        ('OPENROUTER_API_KEY', None),
-        ('PARALLEL_API_KEY', None),
-        ('BRAVE_API_KEY', None),
-        ('XIAOHONGSHU_API_BASE', None),
-        ('OPENAI_MODEL_POLICY', 'auto'),
-        ('OPENAI_MODEL_PIN', None),
-        ('XAI_MODEL_POLICY', 'latest'),
-        ('XAI_MODEL_PIN', None),
-        ('SCRAPECREATORS_API_KEY', None),
-        ('APIFY_API_TOKEN', None),
-        ('AUTH_TOKEN', None),
-        ('CT0', None),
-        ('BSKY_HANDLE', None),
-        ('BSKY_APP_PASSWORD', None),
-        ('TRUTHSOCIAL_TOKEN', None),
-    ]
-
-    for key, default in keys:
+    for key, default in CONFIG_KEYS:
         config[key] = os.environ.get(key) or merged_env.get(key, default)
 
     # Track which config source was used
@@ -274,6 +278,25 @@ def get_config() -> Dict[str, Any]:
     return config
 
 
+def config_env_fingerprint(environ: Optional[Dict[str, str]] = None) -> str:
+    """Hash the environment variables that shape a run.
+
+    Covers the config keys, LAST30DAYS_* settings, Codex auth and the PATH
+    and HOME used to find bird / yt-dlp. Two processes with the same
+    fingerprint (and cwd) load the same config and probe the same tools.
+    """
+    environ = os.environ if environ is None else environ
+    names = {'OPENAI_API_KEY', 'CODEX_AUTH_FILE', 'PATH', 'HOME'}
+    names.update(key for key, _ in CONFIG_KEYS)
+    # Which daemon to use (or whether to) doesn't change the run itself
+    ignored = {'LAST30DAYS_SOCKET', 'LAST30DAYS_NO_DAEMON'}
+    relevant = sorted(
+        (key, value) for key, value in environ.items()
+        if key not in ignored and (key in names or key.startswith('LAST30DAYS_'))
+    )
+    return hashlib.sha256(json.dumps(relevant).encode()).hexdigest()
+
+
 def config_exists() -> bool:
     """Check if any configuration source exists."""
     if _find_project_env():
@@ -345,6 +368,34 @@ def get_web_search_source(config: Dict[str, Any]) -> Optional[str]:
     return None
 
 
+WEB_SEARCH_MODES = ('priority', 'race', 'merge')
+
+
+def get_web_search_backends(config: Dict[str, Any]) -> List[str]:
+    """All configured web search backends, in priority order."""
+    return [
+        backend for backend, key in (
+            ('parallel', 'PARALLEL_API_KEY'),
+            ('brave', 'BRAVE_API_KEY'),
+            ('openrouter', 'OPENROUTER_API_KEY'),
+        )
+        if config.get(key)
+    ]
+
+
+def get_web_search_mode(config: Dict[str, Any]) -> str:
+    """How to use several configured web search backends.
+
+    'priority' runs only the best one (get_web_search_source), 'race' runs
+    all and keeps the first good response, 'merge' runs all and combines
+    their results.
+
+    Returns: One of WEB_SEARCH_MODES (unknown values fall back to 'priority')
+    """
+    mode = str(config.get('WEB_SEARCH_MODE') or 'priority').strip().lower()
+    return mode if mode in WEB_SEARCH_MODES else 'priority'
+
+
 def get_missing_keys(config: Dict[str, Any]) -> str:
     """Determine which sources are missing (accounting for Bird and ScrapeCreators).
 
@@ -542,12 +593,30 @@ def get_xiaohongshu_api_base(config: Dict[str, Any]) -> str:
     return (config.get('XIAOHONGSHU_API_BASE') or "http://host.docker.internal:18060").rstrip("/")
 
 
-def is_xiaohongshu_available(config: Dict[str, Any]) -> bool:
-    """Check whether Xiaohongshu HTTP API is reachable and logged in."""
+# A failed Xiaohongshu probe is remembered this long (minutes), so runs
+# without the service don't each wait out the probe timeouts
+XIAOHONGSHU_DOWN_TTL_MINUTES = 5
+
+
+def _xiaohongshu_down_key(base: str) -> str:
+    return "xhs_down_" + hashlib.sha256(base.encode()).hexdigest()[:16]
+
+
+def is_xiaohongshu_known_down(config: Dict[str, Any]) -> bool:
+    """Check whether a probe of this Xiaohongshu API base failed recently.
+
+    Cheap (a cache file check), so it can run at startup in place of the probe.
+    """
+    from . import cache
+
+    key = _xiaohongshu_down_key(get_xiaohongshu_api_base(config))
+    return cache.load_cache(key, ttl_hours=XIAOHONGSHU_DOWN_TTL_MINUTES / 60) is not None
+
+
+def _probe_xiaohongshu(base: str) -> bool:
     # Import here to avoid heavy imports at module load.
     from . import http
 
-    base = get_xiaohongshu_api_base(config)
     try:
         # Keep health probe snappy, but allow one retry for transient hiccups.
         health = http.get(f"{base}/health", timeout=3, retries=2)
@@ -568,6 +637,30 @@ def is_xiaohongshu_available(config: Dict[str, Any]) -> bool:
         return False
 
 
+def is_xiaohongshu_available(config: Dict[str, Any], use_cache: bool = True) -> bool:
+    """Check whether Xiaohongshu HTTP API is reachable and logged in.
+
+    A failed probe is cached for XIAOHONGSHU_DOWN_TTL_MINUTES. With
+    use_cache=False (--diagnose) the API is probed without reading the
+    cache and a failure is not recorded. A successful probe clears the
+    record either way.
+    """
+    from . import cache
+
+    base = get_xiaohongshu_api_base(config)
+    key = _xiaohongshu_down_key(base)
+    if use_cache and is_xiaohongshu_known_down(config):
+        return False
+
+    if _probe_xiaohongshu(base):
+        cache.delete_cache(key)
+        return True
+    if not use_cache:
+        return False
+    cache.save_cache(key, {"base": base, "available": False})
+    return False
+
+
 # Backward compat alias
 is_apify_available = is_tiktok_available
 
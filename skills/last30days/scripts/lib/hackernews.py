@@ -29,6 +29,9 @@ ENRICH_LIMITS = {
     "deep": 10,
 }
 
+# Comment hits per batched Algolia search (fetch_comments_batch)
+BATCH_COMMENT_HITS = 200
+
 
 def _log(msg: str):
     """Log to stderr (only in TTY mode to avoid cluttering Claude Code output)."""
@@ -63,6 +66,87 @@ def _strip_html(text: str) -> str:
     return text.strip()
 
 
+_QUERY_PREFIXES = (
+    r"^last \d+ days?\s+",
+    r"^what(?:'s| is| are) (?:people saying about|happening with|going on with)\s+",
+    r"^how (?:is|are)\s+",
+    r"^tell me about\s+",
+    r"^research\s+",
+)
+
+_STOP_WORDS = frozenset({
+    "a", "an", "the", "of", "for", "in", "on", "to", "and", "or", "with",
+    "about", "vs", "is", "are", "new", "latest", "news",
+})
+
+# Reciprocal rank fusion constant (rank k+1 scores 1/(k+1) per result list)
+RRF_K = 10
+
+# RRF weight of the by-date result lists. They are recency-sorted and carry
+# no relevance signal, so they count for less than the relevance lists.
+RRF_BY_DATE_WEIGHT = 0.5
+
+
+def _extract_core_subject(topic: str) -> str:
+    """Strip conversational prefixes ('what are people saying about', ...)."""
+    import re
+    core = topic.strip()
+    for pattern in _QUERY_PREFIXES:
+        core = re.sub(pattern, "", core, flags=re.IGNORECASE)
+    return core.strip()
+
+
+def _expand_queries(topic: str) -> List[str]:
+    """Algolia queries for a topic: as given, core subject, keywords only.
+
+    Algolia requires every word of a query to match, so dropping filler
+    words is what widens the net. Deduped, order preserved.
+    """
+    core = _extract_core_subject(topic)
+    keywords = " ".join(w for w in core.split() if w.lower() not in _STOP_WORDS)
+    queries = []
+    for q in (topic.strip(), core, keywords):
+        if q and q.lower() not in {x.lower() for x in queries}:
+            queries.append(q)
+    return queries
+
+
+def _search_variant(url: str, query: str, numeric_filters: str, count: int) -> Dict[str, Any]:
+    """One Algolia story search (relevance or by-date endpoint)."""
+    from urllib.parse import urlencode
+    params = {
+        "query": query,
+        "tags": "story",
+        "numericFilters": numeric_filters,
+        "hitsPerPage": str(count),
+    }
+    return http.request("GET", f"{url}?{urlencode(params)}", timeout=30)
+
+
+def _merge_hits(
+    result_lists: List[List[Dict[str, Any]]],
+    count: int,
+    weights: Optional[List[float]] = None,
+) -> List[Dict[str, Any]]:
+    """Merge hit lists by objectID, ranked by weighted reciprocal rank fusion.
+
+    A story near the top of several lists beats one that tops only one.
+    weights (one per list, default 1.0) scale each list's contribution.
+    """
+    weights = weights or [1.0] * len(result_lists)
+    scores: Dict[str, float] = {}
+    hits: Dict[str, Dict[str, Any]] = {}
+    for result, weight in zip(result_lists, weights):
+        for rank, hit in enumerate(result):
+            object_id = hit.get("objectID")
+            if not object_id:
+                continue
+            scores[object_id] = scores.get(object_id, 0.0) + weight / (RRF_K + rank + 1)
+            hits.setdefault(object_id, hit)
+    ranked = sorted(hits, key=lambda oid: scores[oid], reverse=True)
+    return [hits[oid] for oid in ranked[:count]]
+
+
 def search_hackernews(
     topic: str,
     from_date: str,
@@ -71,6 +155,10 @@ def search_hackernews(
 ) -> Dict[str, Any]:
     """Search Hacker News via Algolia API.
 
+    The topic is expanded into a few queries (see _expand_queries), each
+    run against both the relevance and the by-date endpoint at once. Hits
+    are merged by objectID into one ranking.
+
     Args:
         topic: Search topic
         from_date: Start date (YYYY-MM-DD)
@@ -78,37 +166,43 @@ def search_hackernews(
         depth: 'quick', 'default', or 'deep'
 
     Returns:
-        Dict with Algolia response (contains 'hits' list).
+        Dict with merged 'hits' list and optional 'error' (all searches failed).
     """
     count = DEPTH_CONFIG.get(depth, DEPTH_CONFIG["default"])
     from_ts = _date_to_unix(from_date)
     to_ts = _date_to_unix(to_date) + 86400  # Include the end date
+    numeric_filters = f"created_at_i>{from_ts},created_at_i<{to_ts}"
+    queries = _expand_queries(topic)
 
-    _log(f"Searching for '{topic}' (since {from_date}, count={count})")
-
-    # Use relevance-sorted search (better for topic matching)
-    params = {
-        "query": topic,
-        "tags": "story",
-        "numericFilters": f"created_at_i>{from_ts},created_at_i<{to_ts}",
-        "hitsPerPage": str(count),
-    }
-
-    from urllib.parse import urlencode
-    url = f"{ALGOLIA_SEARCH_URL}?{urlencode(params)}"
-
-    try:
-        response = http.request("GET", url, timeout=30)
-    except http.HTTPError as e:
-        _log(f"Search failed: {e}")
-        return {"hits": [], "error": str(e)}
-    except Exception as e:
-        _log(f"Search failed: {e}")
-        return {"hits": [], "error": str(e)}
+    _log(f"Searching for {queries} (since {from_date}, count={count})")
 
-    hits = response.get("hits", [])
-    _log(f"Found {len(hits)} stories")
-    return response
+    variants = [(url, q) for q in queries for url in (ALGOLIA_SEARCH_URL, ALGOLIA_SEARCH_BY_DATE_URL)]
+    results: Dict[int, List[Dict[str, Any]]] = {}
+    errors = []
+    with ThreadPoolExecutor(max_workers=len(variants)) as executor:
+        futures = {
+            executor.submit(_search_variant, url, q, numeric_filters, count): i
+            for i, (url, q) in enumerate(variants)
+        }
+        for future in as_completed(futures):
+            try:
+                results[futures[future]] = future.result().get("hits", [])
+            except Exception as e:
+                _log(f"Search failed: {e}")
+                errors.append(str(e))
+
+    if not results:
+        return {"hits": [], "error": errors[0] if errors else "No searches ran"}
+
+    # Fuse in variant order so ties go to the plain relevance search
+    order = sorted(results)
+    weights = [
+        RRF_BY_DATE_WEIGHT if variants[i][0] == ALGOLIA_SEARCH_BY_DATE_URL else 1.0
+        for i in order
+    ]
+    hits = _merge_hits([results[i] for i in order], count, weights)
+    _log(f"Found {len(hits)} stories across {len(results)} searches")
+    return {"hits": hits}
 
 
 def parse_hackernews_response(response: Dict[str, Any]) -> List[Dict[str, Any]]:
@@ -158,29 +252,19 @@ def parse_hackernews_response(response: Dict[str, Any]) -> List[Dict[str, Any]]:
     return items
 
 
-def _fetch_item_comments(object_id: str, max_comments: int = 5) -> Dict[str, Any]:
-    """Fetch top-level comments for a story from Algolia items endpoint.
+def _format_comments(raw_comments: List[Dict[str, Any]], max_comments: int) -> Dict[str, Any]:
+    """Pick the top comments by points and pull a one-line insight from each.
 
     Args:
-        object_id: HN story ID
+        raw_comments: Comment dicts with 'author', 'text' and 'points'
         max_comments: Max comments to return
 
     Returns:
         Dict with 'comments' list and 'comment_insights' list.
     """
-    url = f"{ALGOLIA_ITEM_URL}/{object_id}"
-
-    try:
-        data = http.request("GET", url, timeout=15)
-    except Exception as e:
-        _log(f"Failed to fetch comments for {object_id}: {e}")
-        return {"comments": [], "comment_insights": []}
-
-    children = data.get("children", [])
-
     # Sort by points (highest first), filter to actual comments
     real_comments = [
-        c for c in children
+        c for c in raw_comments
         if c.get("text") and c.get("author")
     ]
     real_comments.sort(key=lambda c: c.get("points") or 0, reverse=True)
@@ -203,12 +287,108 @@ def _fetch_item_comments(object_id: str, max_comments: int = 5) -> Dict[str, Any
     return {"comments": comments, "comment_insights": insights}
 
 
+def _fetch_item_comments(object_id: str, max_comments: int = 5) -> Dict[str, Any]:
+    """Fetch top-level comments for a story from Algolia items endpoint.
+
+    Args:
+        object_id: HN story ID
+        max_comments: Max comments to return
+
+    Returns:
+        Dict with 'comments' list and 'comment_insights' list.
+    """
+    url = f"{ALGOLIA_ITEM_URL}/{object_id}"
+
+    try:
+        data = http.request("GET", url, timeout=15)
+    except Exception as e:
+        _log(f"Failed to fetch comments for {object_id}: {e}")
+        return {"comments": [], "comment_insights": []}
+
+    return _format_comments(data.get("children", []), max_comments)
+
+
+def _search_story_comments(story_ids: List[str], page: int = 0) -> Dict[str, Any]:
+    """Search comments across several stories in one Algolia request."""
+    from urllib.parse import urlencode
+
+    params = {
+        "tags": "comment,(" + ",".join(f"story_{sid}" for sid in story_ids) + ")",
+        "hitsPerPage": str(BATCH_COMMENT_HITS),
+        "page": str(page),
+    }
+    url = f"{ALGOLIA_SEARCH_URL}?{urlencode(params)}"
+    return http.request("GET", url, timeout=15)
+
+
+def fetch_comments_batch(object_ids: List[str], max_comments: int = 5) -> Dict[str, Dict[str, Any]]:
+    """Fetch top comments for many stories with one or two Algolia searches.
+
+    Searches tags=comment,(story_1,story_2,...) and groups the hits by
+    story_id, instead of pulling each story's full item tree. Only
+    top-level comments are kept, as with _fetch_item_comments. If the first
+    page was full, stories still short of max_comments get one more search
+    of their own (the next page, if every story is still short).
+
+    Args:
+        object_ids: HN story IDs
+        max_comments: Max comments per story
+
+    Returns:
+        Dict mapping story ID -> {'comments', 'comment_insights'} for every
+        requested story.
+
+    Raises:
+        http.HTTPError: If the first search fails (caller should fall back
+            to per-story fetches)
+    """
+    grouped = {str(sid): {} for sid in object_ids}  # story ID -> objectID -> comment
+    remaining = list(grouped)
+    page = 0
+
+    for attempt in range(2):
+        try:
+            data = _search_story_comments(remaining, page)
+        except Exception:
+            if attempt == 0:
+                raise
+            break  # Keep what the first search found
+
+        hits = data.get("hits", [])
+        for hit in hits:
+            story_id = str(hit.get("story_id", ""))
+            if story_id not in grouped or str(hit.get("parent_id", "")) != story_id:
+                continue
+            grouped[story_id][hit.get("objectID")] = {
+                "author": hit.get("author"),
+                "text": hit.get("comment_text"),
+                "points": hit.get("points"),
+            }
+
+        truncated = (data.get("nbHits") or 0) > page * BATCH_COMMENT_HITS + len(hits)
+        short = [sid for sid in remaining if len(grouped[sid]) < max_comments]
+        # A narrower story set starts its own results at page 0; the same
+        # set would just get the same hits back, so move on a page
+        page = page + 1 if short == remaining else 0
+        remaining = short
+        if not truncated or not remaining:
+            break
+
+    return {
+        sid: _format_comments(list(comments.values()), max_comments)
+        for sid, comments in grouped.items()
+    }
+
+
 def enrich_top_stories(
     items: List[Dict[str, Any]],
     depth: str = "default",
 ) -> List[Dict[str, Any]]:
     """Fetch comments for top N stories by points.
 
+    Comments come from one batched Algolia search (fetch_comments_batch),
+    falling back to a per-story item fetch if that fails.
+
     Args:
         items: Parsed HN items
         depth: Research depth (controls how many to enrich)
@@ -231,6 +411,17 @@ def enrich_top_stories(
 
     _log(f"Enriching top {len(to_enrich)} stories with comments")
 
+    try:
+        batch = fetch_comments_batch([items[idx]["object_id"] for idx in to_enrich])
+    except Exception as e:
+        _log(f"Batched comment search failed ({e}), fetching per story")
+    else:
+        for idx in to_enrich:
+            result = batch.get(str(items[idx]["object_id"]), {})
+            items[idx]["top_comments"] = result.get("comments", [])
+            items[idx]["comment_insights"] = result.get("comment_insights", [])
+        return items
+
     with ThreadPoolExecutor(max_workers=5) as executor:
         futures = {
             executor.submit(
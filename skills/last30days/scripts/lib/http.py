@@ -1,12 +1,17 @@
 """HTTP utilities for last30days skill (stdlib only)."""
 
+import http.client
 import json
 import os
+import socket
+import ssl
 import sys
+import threading
 import time
 import urllib.error
 import urllib.request
-from typing import Any, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 from urllib.parse import urlencode
 
 DEFAULT_TIMEOUT = 30
@@ -31,6 +36,196 @@ class HTTPError(Exception):
         self.body = body
 
 
+class RateLimiter:
+    """Thread-safe token bucket shared by concurrent callers of one API.
+
+    acquire() blocks until a call is allowed: up to `burst` calls at once,
+    refilling at `rate` calls per second.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Wait for a token."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+# Shared by every unauthenticated www.reddit.com call (thread enrichment and
+# Phase 2 subreddit searches), which Reddit throttles per IP
+REDDIT_RATE_LIMITER = RateLimiter(rate=2.0, burst=4)
+
+# Shared by every ScrapeCreators call (Reddit, TikTok, Instagram), which is
+# throttled per API key
+SCRAPECREATORS_RATE_LIMITER = RateLimiter(rate=5.0, burst=4)
+
+
+# Connection warm-up. urllib sends "Connection: close", so an open socket
+# can't be handed to a later request; what carries over instead is the DNS
+# answer, one shared SSL context (loading the CA store per request is not
+# free) and a TLS session ticket per host, so the first real request to a
+# warmed host skips the lookup and does an abbreviated handshake.
+DNS_CACHE_TTL = 300
+
+_dns_cache: Dict[Tuple[str, int], Tuple[float, List[Tuple[str, int]]]] = {}
+_tls_sessions: Dict[str, ssl.SSLSession] = {}
+_warmed: Dict[str, float] = {}
+_warm_lock = threading.Lock()
+_ssl_context = None
+
+
+def _get_ssl_context() -> ssl.SSLContext:
+    """One default-verified SSL context shared by every HTTPS request."""
+    global _ssl_context
+    with _warm_lock:
+        if _ssl_context is None:
+            _ssl_context = ssl.create_default_context()
+        return _ssl_context
+
+
+def _resolve(host: str, port: int) -> List[Tuple[str, int]]:
+    """Resolve a host, caching the answer for DNS_CACHE_TTL seconds."""
+    cached = _dns_cache.get((host, port))
+    if cached and time.monotonic() - cached[0] < DNS_CACHE_TTL:
+        return cached[1]
+    infos = socket.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+    addrs = [info[4][:2] for info in infos]
+    _dns_cache[(host, port)] = (time.monotonic(), addrs)
+    return addrs
+
+
+class _WarmHTTPSConnection(http.client.HTTPSConnection):
+    """HTTPSConnection that uses cached DNS answers and TLS sessions.
+
+    Connections through a proxy (set_tunnel) are left to HTTPSConnection:
+    the address that matters there is the proxy's, and the TLS session
+    belongs to the tunnelled host.
+    """
+
+    _tunnelled = False
+
+    def set_tunnel(self, *args, **kwargs):
+        self._tunnelled = True
+        super().set_tunnel(*args, **kwargs)
+
+    def connect(self):
+        if self._tunnelled:
+            super().connect()
+            return
+        sock = None
+        cached = _dns_cache.get((self.host, self.port))
+        if cached and time.monotonic() - cached[0] < DNS_CACHE_TTL:
+            for addr in cached[1]:
+                try:
+                    sock = socket.create_connection(addr, self.timeout, self.source_address)
+                    break
+                except OSError:
+                    continue
+        if sock is None:
+            # Nothing cached (or every cached address failed): resolve as usual
+            sock = socket.create_connection((self.host, self.port), self.timeout, self.source_address)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.sock = _get_ssl_context().wrap_socket(
+            sock,
+            server_hostname=self.host,
+            session=_tls_sessions.get(self.host),
+        )
+
+    def getresponse(self):
+        # Held before the call: with "Connection: close" getresponse() drops
+        # self.sock (the socket stays open until the response is read)
+        sock = self.sock
+        response = super().getresponse()
+        # TLS 1.3 tickets arrive after the handshake; by now they've been read
+        session = getattr(sock, "session", None)
+        if session is not None and not self._tunnelled:
+            _tls_sessions[self.host] = session
+        return response
+
+
+class _WarmHTTPSHandler(urllib.request.HTTPSHandler):
+    def https_open(self, req):
+        return self.do_open(_WarmHTTPSConnection, req, context=_get_ssl_context())
+
+
+_opener = urllib.request.build_opener(_WarmHTTPSHandler)
+
+
+def _urlopen(req: urllib.request.Request, timeout: float):
+    """urlopen() through the warm-connection opener."""
+    return _opener.open(req, timeout=timeout)
+
+
+# Warming a host sends it a real HEAD request, so hosts behind a shared rate
+# limiter take a token from it first
+_WARM_RATE_LIMITERS = {
+    "www.reddit.com": REDDIT_RATE_LIMITER,
+    "api.scrapecreators.com": SCRAPECREATORS_RATE_LIMITER,
+}
+
+
+def _warm_host(host: str, timeout: float):
+    """Resolve host, then send it HEAD / to complete a TLS handshake.
+
+    Reading the response is what picks up the TLS 1.3 session ticket.
+    """
+    try:
+        _resolve(host, 443)
+        limiter = _WARM_RATE_LIMITERS.get(host)
+        if limiter:
+            limiter.acquire()
+        conn = _WarmHTTPSConnection(host, timeout=timeout, context=_get_ssl_context())
+        try:
+            conn.request("HEAD", "/", headers={"User-Agent": USER_AGENT})
+            conn.getresponse().read()
+        finally:
+            conn.close()
+        log(f"Warmed {host}")
+    except Exception as e:
+        log(f"Warm-up failed for {host}: {type(e).__name__}: {e}")
+
+
+def warm_connections(hosts: List[str], timeout: float = 5.0) -> List[threading.Thread]:
+    """Resolve and TLS-handshake with hosts in the background.
+
+    Each host gets one HEAD / request (paced by its rate limiter, if it
+    has one), so only list hosts the run is about to call. Returns
+    immediately. Hosts warmed within DNS_CACHE_TTL are skipped, so
+    a long-lived process (the serve daemon) can call this every run.
+
+    Args:
+        hosts: Hostnames the upcoming requests will hit (HTTPS, port 443)
+        timeout: Per-host connect/handshake timeout in seconds
+
+    Returns:
+        The (daemon) warm-up threads, for callers that want to join them
+    """
+    threads = []
+    now = time.monotonic()
+    for host in dict.fromkeys(hosts):
+        with _warm_lock:
+            if now - _warmed.get(host, -DNS_CACHE_TTL) < DNS_CACHE_TTL:
+                continue
+            _warmed[host] = now
+        thread = threading.Thread(target=_warm_host, args=(host, timeout), daemon=True)
+        thread.start()
+        threads.append(thread)
+    return threads
+
+
 def request(
     method: str,
     url: str,
@@ -71,7 +266,7 @@ def request(
     last_error = None
     for attempt in range(retries):
         try:
-            with urllib.request.urlopen(req, timeout=timeout) as response:
+            with _urlopen(req, timeout=timeout) as response:
                 body = response.read().decode('utf-8')
                 log(f"Response: {response.status} ({len(body)} bytes)")
                 if raw:
@@ -144,6 +339,188 @@ def post_raw(url: str, json_data: Dict[str, Any], headers: Optional[Dict[str, st
     return request("POST", url, headers=headers, json_data=json_data, raw=True, **kwargs)
 
 
+def _parse_sse_data(data_lines: List[str]) -> Optional[Dict[str, Any]]:
+    """Decode the data: lines of one server-sent event as JSON."""
+    data = "\n".join(data_lines).strip()
+    if not data or data == "[DONE]":
+        return None
+    try:
+        return json.loads(data)
+    except json.JSONDecodeError:
+        return None
+
+
+def stream_sse(
+    url: str,
+    json_data: Dict[str, Any],
+    headers: Optional[Dict[str, str]] = None,
+    timeout: int = DEFAULT_TIMEOUT,
+    retries: int = MAX_RETRIES,
+) -> Iterator[Dict[str, Any]]:
+    """POST a JSON body and yield server-sent events as they arrive.
+
+    Unlike post_raw, nothing waits for the stream to finish: each event's
+    JSON payload is yielded as soon as its blank-line terminator is read.
+    Opening the connection is retried like request(); once events have
+    started flowing, a dropped connection raises instead (the caller
+    decides what to keep).
+
+    Args:
+        url: Request URL
+        json_data: JSON body
+        headers: Optional headers dict
+        timeout: Socket timeout in seconds (per read, not for the whole stream)
+        retries: Attempts to open the connection
+
+    Yields:
+        Parsed JSON event payloads ([DONE] and non-JSON events are skipped)
+
+    Raises:
+        HTTPError: On request failure or a dropped stream
+    """
+    headers = dict(headers or {})
+    headers.setdefault("User-Agent", USER_AGENT)
+    headers.setdefault("Content-Type", "application/json")
+    headers.setdefault("Accept", "text/event-stream")
+    req = urllib.request.Request(
+        url, data=json.dumps(json_data).encode('utf-8'), headers=headers, method="POST",
+    )
+
+    log(f"POST {url} (stream)")
+
+    response = None
+    for attempt in range(retries):
+        try:
+            response = _urlopen(req, timeout=timeout)
+            break
+        except urllib.error.HTTPError as e:
+            body = None
+            try:
+                body = e.read().decode('utf-8')
+            except:
+                pass
+            log(f"HTTP Error {e.code}: {e.reason}")
+            error = HTTPError(f"HTTP {e.code}: {e.reason}", e.code, body)
+            # Don't retry client errors (4xx) except rate limits
+            if (400 <= e.code < 500 and e.code != 429) or attempt == retries - 1:
+                raise error
+            time.sleep(RETRY_DELAY * (2 ** attempt))
+        except (OSError, TimeoutError) as e:
+            log(f"Connection error: {type(e).__name__}: {e}")
+            if attempt == retries - 1:
+                raise HTTPError(f"Connection error: {type(e).__name__}: {e}")
+            time.sleep(RETRY_DELAY * (attempt + 1))
+
+    with response:
+        data_lines: List[str] = []
+        try:
+            for raw_line in response:
+                line = raw_line.decode('utf-8', errors='replace').rstrip("\r\n")
+                if not line:
+                    event = _parse_sse_data(data_lines)
+                    data_lines = []
+                    if event is not None:
+                        yield event
+                elif line.startswith("data:"):
+                    data_lines.append(line[5:].strip())
+        except (OSError, TimeoutError) as e:
+            log(f"Stream interrupted: {type(e).__name__}: {e}")
+            raise HTTPError(f"Stream interrupted: {type(e).__name__}: {e}")
+        event = _parse_sse_data(data_lines)
+        if event is not None:
+            yield event
+
+
+def response_from_events(events: List[Any]) -> Dict[str, Any]:
+    """Build a Responses API response dict from its stream events.
+
+    Uses the last event carrying a full response (response.completed and
+    friends), or an error event. Failing that, the output text is rebuilt
+    from output_text deltas; untyped events (older Codex streams) count
+    their delta/text too.
+
+    Args:
+        events: Parsed SSE payloads, e.g. from stream_sse()
+
+    Returns:
+        Response dict, {"error": ...}, or {} if nothing usable arrived
+    """
+    for evt in reversed(events):
+        if not isinstance(evt, dict):
+            continue
+        if isinstance(evt.get("response"), dict):
+            return evt["response"]
+        if evt.get("type") == "error":
+            return {"error": evt.get("error") or evt}
+
+    output_text = ""
+    for evt in events:
+        if not isinstance(evt, dict):
+            continue
+        event_type = evt.get("type")
+        if event_type not in (None, "response.output_text.delta"):
+            continue
+        for key in ("delta", "text") if event_type is None else ("delta",):
+            if isinstance(evt.get(key), str):
+                output_text += evt[key]
+                break
+    if not output_text:
+        return {}
+    return {
+        "output": [
+            {"type": "message", "content": [{"type": "output_text", "text": output_text}]}
+        ]
+    }
+
+
+def fetch_pages(
+    fetch_page: Callable[[Any], Tuple[Any, Any]],
+    first_cursor: Any,
+    max_pages: int,
+    keep_going: Callable[[Any], bool],
+) -> List[Any]:
+    """Fetch paginated results, requesting each next page before checking the current one.
+
+    Page N+1 is already in flight while page N is examined, so checking
+    (parsing, date filtering) overlaps the network wait.
+
+    Args:
+        fetch_page: fetch_page(cursor) -> (page, next_cursor); next_cursor
+            None means there are no more pages
+        first_cursor: Cursor for the first page
+        max_pages: Most pages to fetch
+        keep_going: keep_going(page) -> False to stop after this page (e.g.
+            its posts are all older than the date range); a prefetched next
+            page is then discarded
+
+    Returns:
+        Pages in order. An error on a later page ends pagination and keeps
+        the pages before it.
+
+    Raises:
+        Whatever fetch_page raises for the first page
+    """
+    page, cursor = fetch_page(first_cursor)
+    pages = []
+    pool = ThreadPoolExecutor(max_workers=1)
+    try:
+        while True:
+            prefetch = None
+            if cursor is not None and len(pages) + 1 < max_pages:
+                prefetch = pool.submit(fetch_page, cursor)
+            pages.append(page)
+            if prefetch is None or not keep_going(page):
+                break
+            try:
+                page, cursor = prefetch.result()
+            except Exception as e:
+                log(f"Pagination stopped after {len(pages)} pages: {e}")
+                break
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+    return pages
+
+
 def get_reddit_json(path: str, timeout: int = DEFAULT_TIMEOUT, retries: int = MAX_RETRIES) -> Dict[str, Any]:
     """Fetch Reddit thread JSON.
 
@@ -171,4 +548,5 @@ def get_reddit_json(path: str, timeout: int = DEFAULT_TIMEOUT, retries: int = MA
         "Accept": "application/json",
     }
 
+    REDDIT_RATE_LIMITER.acquire()
     return get(url, headers=headers, timeout=timeout, retries=retries)
@@ -0,0 +1,149 @@
+"""Crash-resumable run journal for last30days skill.
+
+Each research run appends what it finishes to an NDJSON file keyed by
+(topic, date range, depth): one line per completed source with its raw
+results, and one line per enriched Reddit thread. If the process dies
+(global timeout backstop, OOM, Ctrl-C), rerunning with --resume reloads
+those lines and only redoes what's missing.
+
+Lines are appended and flushed one at a time, so a crash can at worst
+leave a truncated final line, which is skipped on load.
+"""
+
+import json
+import sys
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from . import cache
+
+
+def _log(msg: str):
+    """Log to stderr."""
+    sys.stderr.write(f"[journal] {msg}\n")
+    sys.stderr.flush()
+
+
+def get_journal_path(topic: str, from_date: str, to_date: str, depth: str) -> Path:
+    """Get the journal file path for a run."""
+    cache.ensure_cache_dir()
+    journal_dir = cache.CACHE_DIR / "journal"
+    journal_dir.mkdir(parents=True, exist_ok=True)
+    key = cache.get_cache_key(topic, from_date, to_date, depth)
+    return journal_dir / f"{key}.ndjson"
+
+
+class RunJournal:
+    """Append-only record of one research run's completed work."""
+
+    def __init__(
+        self,
+        topic: str,
+        from_date: str,
+        to_date: str,
+        depth: str,
+        resume: bool = False,
+    ):
+        """Open the journal for a run.
+
+        Args:
+            resume: Load existing entries. Otherwise any previous journal
+                for the same run key is discarded.
+        """
+        self.path = get_journal_path(topic, from_date, to_date, depth)
+        self._lock = threading.Lock()
+        self.sources: Dict[str, tuple] = {}
+        self.enriched: Dict[str, Dict[str, Any]] = {}
+
+        if resume:
+            self._load()
+            if self.sources or self.enriched:
+                _log(
+                    f"Resuming: {len(self.sources)} source(s), "
+                    f"{len(self.enriched)} enriched thread(s) from {self.path.name}"
+                )
+        else:
+            self.discard()
+
+        if not self.path.exists():
+            self._append({
+                "type": "run",
+                "topic": topic,
+                "from": from_date,
+                "to": to_date,
+                "depth": depth,
+                "started_at": datetime.now(timezone.utc).isoformat(),
+            })
+
+    def _load(self):
+        """Read entries from an existing journal, skipping damaged lines."""
+        if not self.path.exists():
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue  # Truncated write from a crash
+                    if entry.get("type") == "source":
+                        self.sources[entry["name"]] = (
+                            entry.get("items") or [],
+                            entry.get("error"),
+                            entry.get("raw"),
+                            entry.get("used_scrapecreators", False),
+                        )
+                    elif entry.get("type") == "enriched" and entry.get("url"):
+                        self.enriched[entry["url"]] = entry["item"]
+        except OSError:
+            pass
+
+    def _append(self, entry: Dict[str, Any]):
+        """Append one entry and flush it to disk."""
+        line = json.dumps(entry, default=str)
+        with self._lock:
+            try:
+                with open(self.path, "a", encoding="utf-8") as f:
+                    f.write(line + "\n")
+                    f.flush()
+            except OSError:
+                pass  # Journaling is best-effort, like the cache
+
+    def record_source(self, name: str, outcome: tuple):
+        """Journal a completed source.
+
+        Args:
+            name: Source name (e.g. "reddit")
+            outcome: (items, error, raw_response, used_scrapecreators)
+        """
+        items, error, raw, used_sc = outcome
+        self.sources[name] = outcome
+        self._append({
+            "type": "source",
+            "name": name,
+            "items": items,
+            "error": error,
+            "raw": raw,
+            "used_scrapecreators": used_sc,
+        })
+
+    def record_enriched(self, item: Dict[str, Any]):
+        """Journal an enriched Reddit thread, keyed by URL."""
+        url = item.get("url")
+        if not url:
+            return
+        self.enriched[url] = item
+        self._append({"type": "enriched", "url": url, "item": item})
+
+    def get_enriched(self, url: Optional[str]) -> Optional[Dict[str, Any]]:
+        """Get a previously enriched thread by URL."""
+        return self.enriched.get(url) if url else None
+
+    def discard(self):
+        """Delete the journal file (run finished cleanly or starting over)."""
+        try:
+            self.path.unlink()
+        except OSError:
+            pass
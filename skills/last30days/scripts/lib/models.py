@@ -1,10 +1,19 @@
 """Model auto-selection for last30days skill."""
 
+import functools
 import re
-from typing import Dict, List, Optional, Tuple
+import sys
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple
 
 from . import cache, http, env
 
+# Seconds get_models() waits for discovery before using fallbacks. A lookup
+# still running at the deadline finishes in the background and caches its
+# pick for the next run.
+DISCOVERY_DEADLINE = 3.0
+
 # OpenAI API
 OPENAI_MODELS_URL = "https://api.openai.com/v1/models"
 OPENAI_FALLBACK_MODELS = ["gpt-5.2", "gpt-5.1", "gpt-5", "gpt-4.1", "gpt-4o"]
@@ -145,41 +154,93 @@ def select_xai_model(
     return XAI_ALIASES["latest"]
 
 
+def _log(msg: str):
+    """Log to stderr (only in TTY mode, like the source modules)."""
+    if sys.stderr.isatty():
+        sys.stderr.write(f"[Models] {msg}\n")
+        sys.stderr.flush()
+
+
+def _select_concurrently(
+    selectors: Dict[str, Callable[[], str]],
+    fallbacks: Dict[str, str],
+    deadline: float,
+) -> Dict[str, str]:
+    """Run model selectors in parallel, using fallbacks for any that are late.
+
+    Daemon threads rather than an executor: a lookup that misses the
+    deadline must not hold up interpreter exit, only the cache write.
+    """
+    results: Dict[str, str] = {}
+
+    def run(provider: str, select: Callable[[], str]):
+        try:
+            results[provider] = select()
+        except Exception as e:
+            _log(f"{provider} model discovery failed: {type(e).__name__}: {e}")
+
+    threads = [
+        threading.Thread(target=run, args=(provider, select), daemon=True, name=f"models-{provider}")
+        for provider, select in selectors.items()
+    ]
+    for thread in threads:
+        thread.start()
+    end = time.monotonic() + deadline
+    for thread in threads:
+        thread.join(max(0.0, end - time.monotonic()))
+
+    selected = {}
+    for provider in selectors:
+        if provider in results:
+            selected[provider] = results[provider]
+        else:
+            _log(f"{provider} model discovery still running, using {fallbacks[provider]}")
+            selected[provider] = fallbacks[provider]
+    return selected
+
+
 def get_models(
     config: Dict,
     mock_openai_models: Optional[List[Dict]] = None,
     mock_xai_models: Optional[List[Dict]] = None,
+    deadline: float = DISCOVERY_DEADLINE,
 ) -> Dict[str, Optional[str]]:
     """Get selected models for both providers.
 
+    Both providers are looked up concurrently. Any lookup not done within
+    the deadline falls back to OPENAI_FALLBACK_MODELS / XAI_ALIASES and is
+    left to refresh the model cache in the background.
+
     Returns:
         Dict with 'openai' and 'xai' keys
     """
     result = {"openai": None, "xai": None}
+    selectors = {}
+    fallbacks = {}
 
     if config.get("OPENAI_API_KEY"):
+        policy = config.get("OPENAI_MODEL_POLICY", "auto")
+        pin = config.get("OPENAI_MODEL_PIN")
         if config.get("OPENAI_AUTH_SOURCE") == env.AUTH_SOURCE_CODEX:
             # Codex auth doesn't use the OpenAI models list endpoint
-            policy = config.get("OPENAI_MODEL_POLICY", "auto")
-            pin = config.get("OPENAI_MODEL_PIN")
             if policy == "pinned" and pin:
                 result["openai"] = pin
             else:
                 result["openai"] = CODEX_FALLBACK_MODELS[0]
         else:
-            result["openai"] = select_openai_model(
-                config["OPENAI_API_KEY"],
-                config.get("OPENAI_MODEL_POLICY", "auto"),
-                config.get("OPENAI_MODEL_PIN"),
-                mock_openai_models,
+            selectors["openai"] = functools.partial(
+                select_openai_model, config["OPENAI_API_KEY"], policy, pin, mock_openai_models,
             )
+            fallbacks["openai"] = pin if policy == "pinned" and pin else OPENAI_FALLBACK_MODELS[0]
 
     if config.get("XAI_API_KEY"):
-        result["xai"] = select_xai_model(
-            config["XAI_API_KEY"],
-            config.get("XAI_MODEL_POLICY", "latest"),
-            config.get("XAI_MODEL_PIN"),
-            mock_xai_models,
+        policy = config.get("XAI_MODEL_POLICY", "latest")
+        pin = config.get("XAI_MODEL_PIN")
+        selectors["xai"] = functools.partial(
+            select_xai_model, config["XAI_API_KEY"], policy, pin, mock_xai_models,
         )
+        fallbacks["xai"] = pin if policy == "pinned" and pin else XAI_ALIASES.get(policy, XAI_ALIASES["latest"])
 
+    if selectors:
+        result.update(_select_concurrently(selectors, fallbacks, deadline))
     return result
@@ -3,7 +3,9 @@
 import json
 import re
 import sys
-from typing import Any, Dict, List, Optional
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
 
 from . import http, env
 
@@ -95,40 +97,61 @@ def _parse_sse_stream_raw(raw: str) -> List[Dict[str, Any]]:
 
 def _parse_codex_stream(raw: str) -> Dict[str, Any]:
     """Parse SSE stream from Codex responses into a response-like dict."""
-    events = _parse_sse_stream_raw(raw)
+    return http.response_from_events(_parse_sse_stream_raw(raw))
 
-    # Prefer explicit completed response payload if present
-    for evt in reversed(events):
-        if isinstance(evt, dict):
-            if evt.get("type") == "response.completed" and isinstance(evt.get("response"), dict):
-                return evt["response"]
-            if isinstance(evt.get("response"), dict):
-                return evt["response"]
 
-    # Fallback: reconstruct output text from deltas
-    output_text = ""
-    for evt in events:
-        if not isinstance(evt, dict):
-            continue
-        delta = evt.get("delta")
-        if isinstance(delta, str):
-            output_text += delta
-            continue
-        text = evt.get("text")
-        if isinstance(text, str):
-            output_text += text
+# A complete Reddit thread URL in the model's JSON output ("url": "...")
+_STREAMED_URL_RE = re.compile(r'"url"\s*:\s*"(https?://[^"\s]*reddit\.com/r/[^"\s/]+/comments/[^"\s]+)"')
 
-    if output_text:
-        return {
-            "output": [
-                {
-                    "type": "message",
-                    "content": [{"type": "output_text", "text": output_text}],
-                }
-            ]
-        }
 
-    return {}
+class _ThreadUrlExtractor:
+    """Pulls Reddit thread URLs out of output text deltas as they stream in.
+
+    Only URLs whose closing quote has arrived are reported, so a URL split
+    across deltas is picked up once the rest of it lands.
+    """
+
+    def __init__(self, on_url: Callable[[str], None]):
+        self.on_url = on_url
+        self.text = ""
+        self._pos = 0
+        self._seen = set()
+
+    def feed(self, delta: str):
+        self.text += delta
+        for match in _STREAMED_URL_RE.finditer(self.text, self._pos):
+            self._pos = match.end()
+            url = match.group(1)
+            if url in self._seen:
+                continue
+            self._seen.add(url)
+            try:
+                self.on_url(url)
+            except Exception as e:
+                _log_error(f"Streamed URL callback failed: {e}")
+
+
+def _stream_response(
+    url: str,
+    payload: Dict[str, Any],
+    headers: Dict[str, str],
+    timeout: int,
+    on_url: Optional[Callable[[str], None]] = None,
+) -> Dict[str, Any]:
+    """Run a streamed Responses API call and return a response-like dict.
+
+    Thread URLs are handed to on_url as soon as they appear in the output
+    text, while the model is still writing the rest.
+    """
+    extractor = _ThreadUrlExtractor(on_url) if on_url else None
+    events = []
+    for event in http.stream_sse(url, dict(payload, stream=True), headers=headers, timeout=timeout):
+        events.append(event)
+        if extractor and event.get("type") == "response.output_text.delta":
+            delta = event.get("delta")
+            if isinstance(delta, str):
+                extractor.feed(delta)
+    return http.response_from_events(events)
 
 # Depth configurations: (min, max) threads to request
 # Request MORE than needed since many get filtered by date
@@ -243,9 +266,13 @@ def search_reddit(
     account_id: Optional[str] = None,
     mock_response: Optional[Dict] = None,
     _retry: bool = False,
+    on_url: Optional[Callable[[str], None]] = None,
 ) -> Dict[str, Any]:
     """Search Reddit for relevant threads using OpenAI Responses API.
 
+    Responses are streamed; thread URLs are reported through on_url as the
+    model emits them, so callers can start fetching threads early.
+
     Args:
         api_key: OpenAI API key
         model: Model to use
@@ -254,6 +281,7 @@ def search_reddit(
         to_date: End date (YYYY-MM-DD) - only include threads before this
         depth: Research depth - "quick", "default", or "deep"
         mock_response: Mock response for testing
+        on_url: Called with each Reddit thread URL as it streams in
 
     Returns:
         Raw API response
@@ -306,8 +334,7 @@ def search_reddit(
         for current_model in codex_models_to_try:
             try:
                 payload = _build_payload(current_model, instructions_text, topic, auth_source)
-                raw = http.post_raw(url, payload, headers=headers, timeout=timeout)
-                return _parse_codex_stream(raw or "")
+                return _stream_response(url, payload, headers, timeout, on_url)
             except http.HTTPError as e:
                 last_error = e
                 if e.status_code == 400:
@@ -336,7 +363,7 @@ def search_reddit(
         }
 
         try:
-            return http.post(url, payload, headers=headers, timeout=timeout)
+            return _stream_response(url, payload, headers, timeout, on_url)
         except http.HTTPError as e:
             last_error = e
             if _is_model_access_error(e):
@@ -454,17 +481,74 @@ def search_reddit_public(
     return all_items[: max_items * 2]
 
 
+# Concurrent subreddit searches in Phase 2 (paced by http.REDDIT_RATE_LIMITER)
+SUBREDDIT_SEARCH_WORKERS = 4
+
+
+def _search_subreddit(sub: str, core: str, count_per: int) -> List[Dict[str, Any]]:
+    """Search one subreddit via Reddit's free JSON endpoint.
+
+    Returns:
+        Raw item dicts (ids are assigned by the caller)
+
+    Raises:
+        http.HTTPError: On request failure
+    """
+    url = f"https://www.reddit.com/r/{sub}/search/.json"
+    params = f"q={_url_encode(core)}&restrict_sr=on&sort=new&limit={count_per}&raw_json=1"
+    full_url = f"{url}?{params}"
+
+    headers = {
+        "User-Agent": http.USER_AGENT,
+        "Accept": "application/json",
+    }
+
+    http.REDDIT_RATE_LIMITER.acquire()
+    data = http.get(full_url, headers=headers, timeout=15, retries=1)
+
+    # Reddit search returns {"data": {"children": [...]}}
+    items = []
+    children = data.get("data", {}).get("children", [])
+    for child in children:
+        if child.get("kind") != "t3":  # t3 = link/submission
+            continue
+        post = child.get("data", {})
+        permalink = post.get("permalink", "")
+        if not permalink:
+            continue
+
+        item = {
+            "title": str(post.get("title", "")).strip(),
+            "url": f"https://www.reddit.com{permalink}",
+            "subreddit": str(post.get("subreddit", sub)).strip(),
+            "date": None,
+            "why_relevant": f"Found in r/{sub} supplemental search",
+            "relevance": 0.65,  # Slightly lower default for supplemental
+        }
+
+        # Parse date from created_utc
+        created_utc = post.get("created_utc")
+        if created_utc:
+            from . import dates as dates_mod
+            item["date"] = dates_mod.timestamp_to_date(created_utc)
+
+        items.append(item)
+    return items
+
+
 def search_subreddits(
     subreddits: List[str],
     topic: str,
     from_date: str,
     to_date: str,
     count_per: int = 5,
+    on_items: Optional[Callable[[List[Dict[str, Any]]], None]] = None,
 ) -> List[Dict[str, Any]]:
     """Search specific subreddits via Reddit's free JSON endpoint.
 
     No API key needed. Uses reddit.com/r/{sub}/search/.json endpoint.
     Used in Phase 2 supplemental search after entity extraction.
+    Subreddits are searched concurrently; a 429 skips those not yet started.
 
     Args:
         subreddits: List of subreddit names (without r/)
@@ -472,62 +556,44 @@ def search_subreddits(
         from_date: Start date (YYYY-MM-DD)
         to_date: End date (YYYY-MM-DD)
         count_per: Results to request per subreddit
+        on_items: Optional callback, called with each subreddit's items as
+            soon as they arrive (so a caller with a deadline can keep them)
 
     Returns:
-        List of raw item dicts (same format as parse_reddit_response output).
+        List of raw item dicts (same format as parse_reddit_response output),
+        in arrival order.
     """
     all_items = []
+    lock = threading.Lock()
+    rate_limited = threading.Event()
     core = _extract_core_subject(topic)
 
-    for sub in subreddits:
+    def search_one(sub: str):
         sub = sub.lstrip("r/")
+        if rate_limited.is_set():
+            return
         try:
-            url = f"https://www.reddit.com/r/{sub}/search/.json"
-            params = f"q={_url_encode(core)}&restrict_sr=on&sort=new&limit={count_per}&raw_json=1"
-            full_url = f"{url}?{params}"
-
-            headers = {
-                "User-Agent": http.USER_AGENT,
-                "Accept": "application/json",
-            }
-
-            data = http.get(full_url, headers=headers, timeout=15, retries=1)
-
-            # Reddit search returns {"data": {"children": [...]}}
-            children = data.get("data", {}).get("children", [])
-            for i, child in enumerate(children):
-                if child.get("kind") != "t3":  # t3 = link/submission
-                    continue
-                post = child.get("data", {})
-                permalink = post.get("permalink", "")
-                if not permalink:
-                    continue
-
-                item = {
-                    "id": f"RS{len(all_items)+1}",
-                    "title": str(post.get("title", "")).strip(),
-                    "url": f"https://www.reddit.com{permalink}",
-                    "subreddit": str(post.get("subreddit", sub)).strip(),
-                    "date": None,
-                    "why_relevant": f"Found in r/{sub} supplemental search",
-                    "relevance": 0.65,  # Slightly lower default for supplemental
-                }
-
-                # Parse date from created_utc
-                created_utc = post.get("created_utc")
-                if created_utc:
-                    from . import dates as dates_mod
-                    item["date"] = dates_mod.timestamp_to_date(created_utc)
-
-                all_items.append(item)
-
+            items = _search_subreddit(sub, core, count_per)
         except http.HTTPError as e:
             _log_info(f"Subreddit search failed for r/{sub}: {e}")
-            if e.status_code == 429:
+            if e.status_code == 429 and not rate_limited.is_set():
+                rate_limited.set()
                 _log_info("Reddit rate-limited (429) — skipping remaining subreddits")
-                break
+            return
         except Exception as e:
             _log_info(f"Subreddit search error for r/{sub}: {e}")
+            return
+
+        with lock:
+            for item in items:
+                item["id"] = f"RS{len(all_items)+1}"
+                all_items.append(item)
+        if items and on_items:
+            on_items(items)
+
+    if subreddits:
+        with ThreadPoolExecutor(max_workers=min(SUBREDDIT_SEARCH_WORKERS, len(subreddits))) as pool:
+            list(pool.map(search_one, subreddits))
 
     return all_items
 
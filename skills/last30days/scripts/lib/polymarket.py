@@ -7,12 +7,13 @@ No API key needed - public read-only API with generous rate limits (350 req/10s)
 import json
 import math
 import re
+import sqlite3
 import sys
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Any, Dict, List, Optional
 from urllib.parse import quote_plus, urlencode
 
-from . import http
+from . import http, polymarket_index
 
 GAMMA_SEARCH_URL = "https://gamma-api.polymarket.com/public-search"
 
@@ -31,6 +32,14 @@ RESULT_CAP = {
 }
 
 
+# Candidate events to pull from the local index (re-ranked and capped later)
+INDEX_CANDIDATES = {
+    "quick": 15,
+    "default": 40,
+    "deep": 60,
+}
+
+
 def _log(msg: str):
     """Log to stderr (only in TTY mode to avoid cluttering Claude Code output)."""
     if sys.stderr.isatty():
@@ -175,13 +184,70 @@ def _run_queries_parallel(
                 errors.append(str(e))
 
 
+def _search_index(topic: str, depth: str) -> Optional[Dict[str, Any]]:
+    """Answer a search from the local event index (see polymarket_index).
+
+    Runs the same two passes as the Gamma search, as local full-text
+    queries, then refreshes prices for the matched events only. A stale
+    index is still used; building and refreshing happen in the background
+    and never hold up the search.
+
+    Returns:
+        Same shape as search_polymarket(), or None if the index isn't
+        usable yet (still building, no FTS5) or matched nothing, and the
+        API should be searched
+    """
+    conn = polymarket_index.connect()
+    if conn is None:
+        return None
+    try:
+        if not polymarket_index.is_fresh(conn):
+            polymarket_index.refresh_in_background()
+        if not polymarket_index.is_complete(conn):
+            _log("Local index still building, searching Gamma API")
+            return None
+
+        limit = INDEX_CANDIDATES.get(depth, INDEX_CANDIDATES["default"])
+        queries = _expand_queries(topic)
+        events = polymarket_index.search(conn, queries, limit)
+
+        seen_queries = {q.lower() for q in queries}
+        domain_queries = [
+            dq for dq in _extract_domain_queries(topic, events) if dq.lower() not in seen_queries
+        ]
+        if domain_queries:
+            _log(f"Domain expansion queries: {domain_queries}")
+            seen_ids = {e.get("id") for e in events}
+            for event in polymarket_index.search(conn, domain_queries, limit):
+                if event.get("id") not in seen_ids:
+                    seen_ids.add(event.get("id"))
+                    events.append(event)
+
+        if not events:
+            # Gamma's search is fuzzier than FTS; give it a chance
+            return None
+        _log(f"Found {len(events)} indexed events for {queries + domain_queries}")
+        events = polymarket_index.refresh_prices(conn, events)
+    except sqlite3.Error as e:
+        _log(f"Local index failed, searching Gamma API: {e}")
+        return None
+    finally:
+        conn.close()
+
+    return {"events": events, "_cap": RESULT_CAP.get(depth, RESULT_CAP["default"])}
+
+
 def search_polymarket(
     topic: str,
     from_date: str,
     to_date: str,
     depth: str = "default",
+    use_index: bool = True,
 ) -> Dict[str, Any]:
-    """Search Polymarket via Gamma API with two-pass query expansion.
+    """Search Polymarket events for a topic.
+
+    Served from the local event index when it's ready. Otherwise searches
+    the Gamma API with two-pass query expansion:
 
     Pass 1: Run expanded queries in parallel, merge and dedupe by event ID.
     Pass 2: Extract domain-indicator terms from first-pass titles, search those.
@@ -191,10 +257,16 @@ def search_polymarket(
         from_date: Start date (YYYY-MM-DD) - used for activity filtering
         to_date: End date (YYYY-MM-DD)
         depth: 'quick', 'default', or 'deep'
+        use_index: Try the local event index first
 
     Returns:
         Dict with 'events' list and optional 'error'.
     """
+    if use_index:
+        result = _search_index(topic, depth)
+        if result is not None:
+            return result
+
     pages = DEPTH_CONFIG.get(depth, DEPTH_CONFIG["default"])
     cap = RESULT_CAP.get(depth, RESULT_CAP["default"])
     queries = _expand_queries(topic)
@@ -0,0 +1,353 @@
+"""Local Polymarket event index (SQLite + FTS5).
+
+Prediction-market events change slowly and only a few thousand are active,
+so instead of fanning search queries out to the Gamma API on every run the
+active events are kept in a local full-text index:
+
+- First use walks the Gamma /events listing of open events in id order,
+  resuming across runs from the last id indexed, until the whole active
+  set is indexed
+- After that, a refresh only pulls events updated since the newest one
+  already indexed (usually a single page); closures show up as updates
+- Builds and refreshes run on a background thread; lookups use the index
+  as it stands, and searches go to the Gamma API until it is first built
+- Topic lookups are local FTS5 queries; the network is only used to
+  refresh prices for the events a lookup matched
+
+Index location: ~/.cache/last30days/polymarket_index.db
+"""
+
+import json
+import re
+import sqlite3
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlencode
+
+from . import cache, http
+
+GAMMA_EVENTS_URL = "https://gamma-api.polymarket.com/events"
+
+# Events per listing page
+PAGE_SIZE = 100
+
+# An index refreshed this recently (seconds) is used as-is
+REFRESH_INTERVAL = 15 * 60
+
+# Seconds one background build/refresh may run (a build resumes next time)
+REFRESH_BUDGET = 60
+
+# Events per /events?id=... price refresh request
+PRICE_BATCH_SIZE = 20
+
+SCHEMA = """
+PRAGMA journal_mode=WAL;
+
+CREATE TABLE IF NOT EXISTS events (
+    id TEXT PRIMARY KEY,
+    updated_at TEXT,
+    data TEXT NOT NULL
+);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS events_fts USING fts5(
+    event_id UNINDEXED, title, tags, questions,
+    tokenize='porter unicode61'
+);
+
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+# Allow override for testing
+_db_override = None
+
+# Held while a background refresh runs (one at a time per process)
+_refresh_lock = threading.Lock()
+
+
+def _log(msg: str):
+    """Log to stderr (only in TTY mode, like the polymarket module)."""
+    if sys.stderr.isatty():
+        sys.stderr.write(f"[PM index] {msg}\n")
+        sys.stderr.flush()
+
+
+def _get_db_path() -> Path:
+    if _db_override:
+        return _db_override
+    cache.ensure_cache_dir()
+    return cache.CACHE_DIR / "polymarket_index.db"
+
+
+def connect(db_path: Optional[Path] = None) -> Optional[sqlite3.Connection]:
+    """Open the index, or return None if it can't be used (e.g. no FTS5)."""
+    try:
+        conn = sqlite3.connect(str(db_path or _get_db_path()), timeout=5)
+        conn.executescript(SCHEMA)
+        return conn
+    except sqlite3.Error as e:
+        _log(f"Index unavailable: {e}")
+        return None
+
+
+def _get_meta(conn: sqlite3.Connection, key: str) -> Optional[str]:
+    row = conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+    return row[0] if row else None
+
+
+def _set_meta(conn: sqlite3.Connection, key: str, value: Any):
+    conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, str(value)))
+
+
+def _index_text(event: Dict[str, Any]) -> tuple:
+    """Searchable text for an event: (title, tags, market questions)."""
+    tags = " ".join(
+        str(tag.get("label", "") if isinstance(tag, dict) else tag)
+        for tag in event.get("tags") or []
+    )
+    questions = " ".join(
+        str(m.get("question", "")) for m in event.get("markets") or [] if isinstance(m, dict)
+    )
+    return str(event.get("title", "")), tags, questions
+
+
+def upsert_events(conn: sqlite3.Connection, events: List[Dict[str, Any]]):
+    """Insert or replace events; closed events are dropped from the index."""
+    for event in events:
+        event_id = str(event.get("id") or "")
+        if not event_id:
+            continue
+        conn.execute("DELETE FROM events_fts WHERE event_id = ?", (event_id,))
+        if event.get("closed"):
+            conn.execute("DELETE FROM events WHERE id = ?", (event_id,))
+            continue
+        conn.execute(
+            "INSERT OR REPLACE INTO events (id, updated_at, data) VALUES (?, ?, ?)",
+            (event_id, event.get("updatedAt") or "", json.dumps(event)),
+        )
+        conn.execute(
+            "INSERT INTO events_fts (event_id, title, tags, questions) VALUES (?, ?, ?, ?)",
+            (event_id, *_index_text(event)),
+        )
+
+
+def _fetch_events_page(params: Dict[str, str]) -> List[Dict[str, Any]]:
+    """One page of the Gamma /events listing."""
+    query = {"limit": str(PAGE_SIZE), **params}
+    response = http.request("GET", f"{GAMMA_EVENTS_URL}?{urlencode(query)}", timeout=15, retries=2)
+    return response if isinstance(response, list) else []
+
+
+def _id_key(event_id: Any) -> tuple:
+    """Sort key for Gamma event ids (numeric strings)."""
+    text = str(event_id or "")
+    return (0, int(text)) if text.isdigit() else (1, text)
+
+
+def is_complete(conn: sqlite3.Connection) -> bool:
+    """True once the index has been fully built (usable for lookups)."""
+    return _get_meta(conn, "complete") == "1"
+
+
+def is_fresh(conn: sqlite3.Connection) -> bool:
+    """True if the index is built and was refreshed within REFRESH_INTERVAL."""
+    refreshed_at = float(_get_meta(conn, "refreshed_at") or 0)
+    return is_complete(conn) and time.time() - refreshed_at < REFRESH_INTERVAL
+
+
+def _build(conn: sqlite3.Connection, deadline: float) -> bool:
+    """Continue the initial build: open events in id order.
+
+    The cursor is the last id indexed. Each page starts one event before
+    the next unseen position, so the cursor event should lead it; if it
+    doesn't, events closed since the last page have shifted the listing
+    and the walk steps back a page rather than skip anything. New events
+    get higher ids and land past the cursor.
+    """
+    if _get_meta(conn, "build_watermark") is None:
+        # Anything updated after this is picked up by the first incremental
+        # refresh once the build completes
+        newest = _fetch_events_page({"order": "updatedAt", "ascending": "false", "limit": "1"})
+        _set_meta(conn, "build_watermark", (newest[0].get("updatedAt") or "") if newest else "")
+        conn.commit()
+
+    cursor = _get_meta(conn, "build_cursor")
+    offset = int(_get_meta(conn, "build_offset") or 0)
+    while time.monotonic() < deadline:
+        start = max(0, offset - 1) if cursor else 0
+        page = _fetch_events_page({
+            "closed": "false", "order": "id", "ascending": "true", "offset": str(start),
+        })
+        if cursor and start and page and _id_key(page[0].get("id")) > _id_key(cursor):
+            offset = max(0, start - PAGE_SIZE + 1)
+            continue
+
+        fresh = [e for e in page if not cursor or _id_key(e.get("id")) > _id_key(cursor)]
+        upsert_events(conn, fresh)
+        if fresh:
+            cursor = str(max((e.get("id") for e in fresh), key=_id_key))
+        offset = start + len(page)
+
+        if len(page) < PAGE_SIZE:
+            _set_meta(conn, "watermark", _get_meta(conn, "build_watermark") or "")
+            _set_meta(conn, "complete", "1")
+            _set_meta(conn, "refreshed_at", time.time())
+            conn.commit()
+            _log(f"Index built ({offset} events)")
+            return True
+
+        _set_meta(conn, "build_cursor", cursor or "")
+        _set_meta(conn, "build_offset", offset)
+        conn.commit()
+    return False
+
+
+def _refresh_incremental(conn: sqlite3.Connection, deadline: float):
+    """Pull events updated since the watermark, newest first.
+
+    The listing isn't filtered to open events, so closures (which bump
+    updatedAt) are seen and dropped from the index. Events updated while
+    paging move to the front, which repeats entries but never skips any.
+    """
+    watermark = _get_meta(conn, "watermark") or ""
+    newest = None
+    offset = 0
+    while time.monotonic() < deadline:
+        page = _fetch_events_page({"order": "updatedAt", "ascending": "false", "offset": str(offset)})
+        if offset == 0 and page:
+            newest = max(e.get("updatedAt") or "" for e in page)
+        fresh = [e for e in page if (e.get("updatedAt") or "") > watermark]
+        upsert_events(conn, fresh)
+        offset += len(page)
+        if len(page) < PAGE_SIZE or len(fresh) < len(page):
+            if newest and newest > watermark:
+                _set_meta(conn, "watermark", newest)
+            _set_meta(conn, "refreshed_at", time.time())
+            conn.commit()
+            return
+        conn.commit()
+
+
+def refresh(conn: sqlite3.Connection, budget: float = REFRESH_BUDGET, force: bool = False) -> bool:
+    """Bring the index up to date, within a time budget.
+
+    While the index is still being built, each call continues the walk
+    where the last one stopped. Once built, only events updated after the
+    stored watermark are fetched. Network errors end the refresh early;
+    a built index stays usable with whatever it has.
+
+    Args:
+        conn: Index connection
+        budget: Seconds to spend fetching pages
+        force: Refresh even if the index was refreshed recently
+
+    Returns:
+        True if the index is complete (usable for lookups)
+    """
+    if not force and is_fresh(conn):
+        return True
+    deadline = time.monotonic() + budget
+    try:
+        if is_complete(conn):
+            _refresh_incremental(conn, deadline)
+        else:
+            _build(conn, deadline)
+    except http.HTTPError as e:
+        _log(f"Refresh stopped: {e}")
+    conn.commit()
+    return is_complete(conn)
+
+
+def refresh_in_background(budget: float = REFRESH_BUDGET) -> Optional[threading.Thread]:
+    """Start refresh() on a daemon thread, unless one is already running.
+
+    Returns:
+        The thread, or None if a refresh was already in progress
+    """
+    if not _refresh_lock.acquire(blocking=False):
+        return None
+
+    def run():
+        try:
+            conn = connect()
+            if conn is None:
+                return
+            try:
+                refresh(conn, budget)
+            except sqlite3.Error as e:
+                _log(f"Refresh failed: {e}")
+            finally:
+                conn.close()
+        finally:
+            _refresh_lock.release()
+
+    thread = threading.Thread(target=run, daemon=True, name="polymarket-index-refresh")
+    thread.start()
+    return thread
+
+
+def _fts_query(queries: List[str]) -> str:
+    """FTS5 query matching any of the queries (all words of each)."""
+    groups = []
+    for query in queries:
+        tokens = re.findall(r"\w+", query.lower())
+        if tokens:
+            groups.append("(" + " AND ".join(f'"{t}"' for t in tokens) + ")")
+    return " OR ".join(groups)
+
+
+def search(conn: sqlite3.Connection, queries: List[str], limit: int) -> List[Dict[str, Any]]:
+    """Look up indexed events matching any query, best BM25 match first."""
+    match = _fts_query(queries)
+    if not match:
+        return []
+    rows = conn.execute(
+        """SELECT e.data FROM events_fts
+           JOIN events e ON e.id = events_fts.event_id
+           WHERE events_fts MATCH ?
+           ORDER BY bm25(events_fts)
+           LIMIT ?""",
+        (match, limit),
+    ).fetchall()
+    return [json.loads(row[0]) for row in rows]
+
+
+def _fetch_events_by_id(event_ids: List[str]) -> List[Dict[str, Any]]:
+    query = urlencode([("id", event_id) for event_id in event_ids])
+    response = http.request("GET", f"{GAMMA_EVENTS_URL}?{query}", timeout=15, retries=2)
+    return response if isinstance(response, list) else []
+
+
+def refresh_prices(conn: sqlite3.Connection, events: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Re-fetch matched events so their prices are current.
+
+    Fresh copies are written back to the index. An event whose refresh
+    fails keeps its indexed copy.
+
+    Returns:
+        Events in the same order, fresh where available
+    """
+    ids = [str(e.get("id")) for e in events if e.get("id")]
+    batches = [ids[i:i + PRICE_BATCH_SIZE] for i in range(0, len(ids), PRICE_BATCH_SIZE)]
+    if not batches:
+        return events
+
+    fresh: Dict[str, Dict[str, Any]] = {}
+    with ThreadPoolExecutor(max_workers=min(4, len(batches))) as executor:
+        futures = [executor.submit(_fetch_events_by_id, batch) for batch in batches]
+        for future in futures:
+            try:
+                for event in future.result():
+                    fresh[str(event.get("id"))] = event
+            except Exception as e:
+                _log(f"Price refresh failed: {e}")
+
+    upsert_events(conn, list(fresh.values()))
+    conn.commit()
+    return [fresh.get(str(e.get("id")), e) for e in events]
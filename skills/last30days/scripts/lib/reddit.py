@@ -14,6 +14,7 @@ API docs: https://scrapecreators.com/docs
 import re
 import sys
 from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, TimeoutError as FutureTimeoutError, as_completed, wait
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional, Set
 
@@ -26,24 +27,37 @@ from . import http
 
 SCRAPECREATORS_BASE = "https://api.scrapecreators.com/v1/reddit"
 
+# Concurrent ScrapeCreators calls per search, and the pacing shared by every
+# ScrapeCreators call in the process (searches and comment fetches here,
+# plus TikTok and Instagram captions)
+SC_MAX_WORKERS = 4
+SC_RATE_LIMITER = http.SCRAPECREATORS_RATE_LIMITER
+
+# Posts from finished global searches needed before subreddit discovery
+# starts the targeted searches (it also runs once every global search is in)
+SUBREDDIT_DISCOVERY_MIN_POSTS = 15
+
 # Depth configurations: how many API calls per phase
 DEPTH_CONFIG = {
     "quick": {
         "global_searches": 1,
         "subreddit_searches": 2,
         "comment_enrichments": 3,
+        "comment_budget": 15,
         "timeframe": "week",
     },
     "default": {
         "global_searches": 2,
         "subreddit_searches": 3,
         "comment_enrichments": 5,
+        "comment_budget": 25,
         "timeframe": "month",
     },
     "deep": {
         "global_searches": 3,
         "subreddit_searches": 5,
         "comment_enrichments": 8,
+        "comment_budget": 40,
         "timeframe": "month",
     },
 }
@@ -243,6 +257,7 @@ def _global_search(
     Returns:
         List of post dicts
     """
+    SC_RATE_LIMITER.acquire()
     if not _requests:
         _log("requests library not installed, falling back to urllib")
         # Use stdlib http module as fallback
@@ -292,6 +307,7 @@ def _subreddit_search(
     Returns:
         List of post dicts
     """
+    SC_RATE_LIMITER.acquire()
     if not _requests:
         try:
             from urllib.parse import urlencode
@@ -341,6 +357,7 @@ def fetch_post_comments(
     Returns:
         List of comment dicts with score, author, body, etc.
     """
+    SC_RATE_LIMITER.acquire()
     if not _requests:
         try:
             from urllib.parse import urlencode
@@ -389,6 +406,67 @@ def _dedupe_posts(posts: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     return unique
 
 
+def _run_searches(
+    queries: List[str],
+    core: str,
+    topic: str,
+    token: str,
+    timeframe: str,
+    max_subs: int,
+) -> tuple:
+    """Run global searches and the subreddit searches they lead to.
+
+    Args:
+        queries: Global search queries (first sorted by relevance, rest by top)
+        core: Core subject searched within each discovered subreddit
+        topic: Original topic (for subreddit discovery scoring)
+        max_subs: Maximum subreddit searches
+
+    Returns:
+        (global_posts, sub_posts, subs): raw posts per query in query order,
+        raw posts per subreddit, and the subreddits searched in order
+    """
+    global_posts: Dict[int, List[Dict[str, Any]]] = {}
+    sub_posts: Dict[str, List[Dict[str, Any]]] = {}
+    subs: List[str] = []
+
+    with ThreadPoolExecutor(max_workers=SC_MAX_WORKERS) as pool:
+        pending = {}
+        for i, query in enumerate(queries):
+            sort = "relevance" if i == 0 else "top"
+            _log(f"Global search {i+1}/{len(queries)}: '{query}' (sort={sort})")
+            future = pool.submit(_global_search, query, token, sort=sort, timeframe=timeframe)
+            pending[future] = ("global", i)
+
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                kind, key = pending.pop(future)
+                posts = future.result()
+                if kind == "global":
+                    _log(f"  -> {len(posts)} results from global search {key+1}")
+                    global_posts[key] = posts
+                else:
+                    _log(f"  -> {len(posts)} results from r/{key}")
+                    sub_posts[key] = posts
+
+            if len(subs) >= max_subs:
+                continue
+            so_far = [post for i in sorted(global_posts) for post in global_posts[i]]
+            all_global_in = len(global_posts) == len(queries)
+            if not all_global_in and len(so_far) < SUBREDDIT_DISCOVERY_MIN_POSTS:
+                continue
+            for sub in discover_subreddits(so_far, topic=topic, max_subs=max_subs):
+                if sub in subs or len(subs) >= max_subs:
+                    continue
+                subs.append(sub)
+                _log(f"Subreddit search: r/{sub} for '{core}'")
+                future = pool.submit(_subreddit_search, sub, core, token, sort="relevance", timeframe=timeframe)
+                pending[future] = ("sub", sub)
+
+    return [global_posts[i] for i in range(len(queries))], sub_posts, subs
+
+
 def search_reddit(
     topic: str,
     from_date: str,
@@ -420,33 +498,28 @@ def search_reddit(
     queries = expand_reddit_queries(topic, depth)
     _log(f"Expanded '{topic}' into {len(queries)} queries: {queries}")
 
-    # === Phase 2: Global Discovery ===
-    all_raw_posts = []
-    max_global = config["global_searches"]
-
-    for i, query in enumerate(queries[:max_global]):
-        sort = "relevance" if i == 0 else "top"
-        _log(f"Global search {i+1}/{max_global}: '{query}' (sort={sort})")
-        posts = _global_search(query, token, sort=sort, timeframe=timeframe)
-        _log(f"  -> {len(posts)} results")
-        all_raw_posts.extend(posts)
+    # === Phases 2+3: Global Discovery, then Subreddit Discovery + Targeted Search ===
+    # Global searches run concurrently; subreddit searches start as soon as
+    # enough global results are in rather than after the slowest one.
+    global_posts, sub_posts, discovered_subs = _run_searches(
+        queries[:config["global_searches"]],
+        _extract_core_subject(topic),
+        topic,
+        token,
+        timeframe,
+        config["subreddit_searches"],
+    )
+    _log(f"Discovered subreddits: {discovered_subs}")
 
-    # Normalize all posts
+    # Normalize all posts (global results in query order, then by subreddit)
+    all_raw_posts = [post for posts in global_posts for post in posts]
     all_items = []
     for i, post in enumerate(all_raw_posts):
         item = _normalize_post(post, i + 1, "global")
         all_items.append(item)
 
-    # === Phase 3: Subreddit Discovery + Targeted Search ===
-    discovered_subs = discover_subreddits(all_raw_posts, topic=topic, max_subs=config["subreddit_searches"])
-    _log(f"Discovered subreddits: {discovered_subs}")
-
-    core = _extract_core_subject(topic)
-    for sub in discovered_subs[:config["subreddit_searches"]]:
-        _log(f"Subreddit search: r/{sub} for '{core}'")
-        sub_posts = _subreddit_search(sub, core, token, sort="relevance", timeframe=timeframe)
-        _log(f"  -> {len(sub_posts)} results from r/{sub}")
-        for j, post in enumerate(sub_posts):
+    for sub in discovered_subs:
+        for j, post in enumerate(sub_posts[sub]):
             item = _normalize_post(post, len(all_items) + j + 1, f"r/{sub}")
             all_items.append(item)
 
@@ -486,80 +559,99 @@ def search_reddit(
     return {"items": all_items}
 
 
+def _apply_comments(item: Dict[str, Any], raw_comments: List[Dict[str, Any]]):
+    """Parse raw ScrapeCreators comments into top_comments/comment_insights on item."""
+    top_comments = []
+    insights = []
+
+    for ci, c in enumerate(raw_comments[:10]):  # Take top 10 comments
+        body = c.get("body", "")
+        if not body or body in ("[deleted]", "[removed]"):
+            continue
+
+        score = c.get("ups") or c.get("score", 0)
+        author = c.get("author", "[deleted]")
+        permalink = c.get("permalink", "")
+        comment_url = f"https://reddit.com{permalink}" if permalink else ""
+
+        # Top comment gets more room (400 chars) — funny/clever comments need it
+        max_excerpt = 400 if ci == 0 else 300
+        top_comments.append({
+            "score": score,
+            "date": _parse_date(c.get("created_utc")),
+            "author": author,
+            "excerpt": body[:max_excerpt],
+            "url": comment_url,
+        })
+
+        # Extract insights from substantive comments
+        if len(body) >= 30 and author not in ("[deleted]", "[removed]", "AutoModerator"):
+            insight = body[:150]
+            if len(body) > 150:
+                for i, char in enumerate(insight):
+                    if char in '.!?' and i > 50:
+                        insight = insight[:i+1]
+                        break
+                else:
+                    insight = insight.rstrip() + "..."
+            insights.append(insight)
+
+    # Sort comments by score
+    top_comments.sort(key=lambda c: c.get("score", 0), reverse=True)
+
+    item["top_comments"] = top_comments[:10]
+    item["comment_insights"] = insights[:10]
+
+
 def enrich_with_comments(
     items: List[Dict[str, Any]],
     token: str,
     depth: str = "default",
+    budget: Optional[float] = None,
 ) -> List[Dict[str, Any]]:
     """Enrich top items with comment data from ScrapeCreators.
 
+    Comment fetches run concurrently (SC_MAX_WORKERS, paced by
+    SC_RATE_LIMITER). Items whose comments haven't arrived when the budget
+    runs out keep their search-result data.
+
     Args:
         items: Reddit items from search_reddit()
         token: ScrapeCreators API key
         depth: Depth for comment limit
+        budget: Total seconds to spend (default: the depth's comment_budget)
 
     Returns:
         Items with top_comments and comment_insights added.
     """
     config = DEPTH_CONFIG.get(depth, DEPTH_CONFIG["default"])
     max_comments = config["comment_enrichments"]
+    if budget is None:
+        budget = config["comment_budget"]
 
     if not items or not token:
         return items
 
-    top_items = items[:max_comments]
+    top_items = [item for item in items[:max_comments] if item.get("url")]
+    if not top_items:
+        return items
     _log(f"Enriching comments for {len(top_items)} posts")
 
-    for item in top_items:
-        url = item.get("url", "")
-        if not url:
-            continue
-
-        raw_comments = fetch_post_comments(url, token)
-        if not raw_comments:
-            continue
-
-        # Parse comments into our format
-        top_comments = []
-        insights = []
-
-        for ci, c in enumerate(raw_comments[:10]):  # Take top 10 comments
-            body = c.get("body", "")
-            if not body or body in ("[deleted]", "[removed]"):
-                continue
-
-            score = c.get("ups") or c.get("score", 0)
-            author = c.get("author", "[deleted]")
-            permalink = c.get("permalink", "")
-            comment_url = f"https://reddit.com{permalink}" if permalink else ""
-
-            # Top comment gets more room (400 chars) — funny/clever comments need it
-            max_excerpt = 400 if ci == 0 else 300
-            top_comments.append({
-                "score": score,
-                "date": _parse_date(c.get("created_utc")),
-                "author": author,
-                "excerpt": body[:max_excerpt],
-                "url": comment_url,
-            })
-
-            # Extract insights from substantive comments
-            if len(body) >= 30 and author not in ("[deleted]", "[removed]", "AutoModerator"):
-                insight = body[:150]
-                if len(body) > 150:
-                    for i, char in enumerate(insight):
-                        if char in '.!?' and i > 50:
-                            insight = insight[:i+1]
-                            break
-                    else:
-                        insight = insight.rstrip() + "..."
-                insights.append(insight)
-
-        # Sort comments by score
-        top_comments.sort(key=lambda c: c.get("score", 0), reverse=True)
-
-        item["top_comments"] = top_comments[:10]
-        item["comment_insights"] = insights[:10]
+    pool = ThreadPoolExecutor(max_workers=min(SC_MAX_WORKERS, len(top_items)))
+    futures = {pool.submit(fetch_post_comments, item["url"], token): item for item in top_items}
+    enriched = 0
+    try:
+        # Apply here, not in the workers, so late fetches can't touch items
+        # after we've returned them
+        for future in as_completed(futures, timeout=budget):
+            raw_comments = future.result()
+            if raw_comments:
+                _apply_comments(futures[future], raw_comments)
+                enriched += 1
+    except FutureTimeoutError:
+        _log(f"Comment budget ({budget}s) spent; {len(top_items) - enriched} posts kept without comments")
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
 
     return items
 
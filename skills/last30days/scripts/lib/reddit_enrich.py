@@ -6,11 +6,16 @@ Supports two backends:
 """
 
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Optional
 from urllib.parse import urlparse
 
 from . import http, dates
 
+# Reddit's /by_id listing accepts up to 100 fullnames per request
+BY_ID_BATCH_SIZE = 100
+
 
 def extract_reddit_path(url: str) -> Optional[str]:
     """Extract the path from a Reddit URL.
@@ -30,6 +35,22 @@ def extract_reddit_path(url: str) -> Optional[str]:
         return None
 
 
+def extract_post_id(url: str) -> Optional[str]:
+    """Extract the base36 post ID from a Reddit thread URL.
+
+    Args:
+        url: Reddit thread URL (.../comments/<id>/...)
+
+    Returns:
+        Post ID or None
+    """
+    path = extract_reddit_path(url)
+    if not path:
+        return None
+    match = re.search(r'/comments/([a-z0-9]+)', path, re.IGNORECASE)
+    return match.group(1).lower() if match else None
+
+
 class RedditRateLimitError(Exception):
     """Raised when Reddit returns HTTP 429 (rate limited)."""
     pass
@@ -71,6 +92,161 @@ def fetch_thread_data(
         return None
 
 
+class ThreadPrefetcher:
+    """Starts thread fetches for URLs as they stream in from discovery.
+
+    Only the first ``limit`` distinct threads are fetched, matching the
+    top-K cap on full thread fetches during enrichment. Once enrichment
+    knows which threads it wants, keep_only() cancels the queued rest.
+    Results are keyed by post ID so URL variants (www., trailing slash)
+    still line up.
+    """
+
+    def __init__(self, limit: int, timeout: int = 10, retries: int = 1, max_workers: int = 5):
+        self.limit = limit
+        self.timeout = timeout
+        self.retries = retries
+        self._futures = {}
+        self._lock = threading.Lock()
+        self._pool = ThreadPoolExecutor(max_workers=max_workers)
+
+    def add(self, url: str):
+        """Start fetching a thread, unless it is a repeat or the cap is hit."""
+        post_id = extract_post_id(url)
+        if not post_id:
+            return
+        with self._lock:
+            if post_id in self._futures or len(self._futures) >= self.limit:
+                return
+            try:
+                self._futures[post_id] = self._pool.submit(
+                    fetch_thread_data, url, timeout=self.timeout, retries=self.retries,
+                )
+            except RuntimeError:
+                pass  # Pool already closed
+
+    def get(self, url: str, timeout: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """Return prefetched thread data for a URL, or None if not prefetched.
+
+        Raises:
+            RedditRateLimitError: If the prefetch was rate limited
+        """
+        with self._lock:
+            future = self._futures.get(extract_post_id(url) or "")
+        if future is None:
+            return None
+        try:
+            return future.result(timeout=timeout)
+        except RedditRateLimitError:
+            raise
+        except Exception:
+            return None
+
+    def started(self, url: str) -> bool:
+        """True if a fetch for this thread has already gone out (or finished)."""
+        with self._lock:
+            future = self._futures.get(extract_post_id(url) or "")
+        return future is not None and (future.running() or future.done()) and not future.cancelled()
+
+    def keep_only(self, urls: List[str]):
+        """Cancel queued prefetches for threads outside urls.
+
+        A cancelled prefetch never runs, so it makes no request and takes
+        nothing from REDDIT_RATE_LIMITER. Fetches already in flight finish.
+        """
+        keep = {extract_post_id(url) for url in urls}
+        with self._lock:
+            for post_id, future in list(self._futures.items()):
+                if post_id not in keep and future.cancel():
+                    del self._futures[post_id]
+
+    def close(self):
+        """Stop the pool without waiting on in-flight fetches."""
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _parse_submission(sub_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Pick the fields we use from a t3 (submission) listing entry."""
+    return {
+        "score": sub_data.get("score"),
+        "num_comments": sub_data.get("num_comments"),
+        "upvote_ratio": sub_data.get("upvote_ratio"),
+        "created_utc": sub_data.get("created_utc"),
+        "permalink": sub_data.get("permalink"),
+        "title": sub_data.get("title"),
+        "selftext": (sub_data.get("selftext") or "")[:500],  # Truncate
+    }
+
+
+def fetch_engagement_batch(
+    items: List[Dict[str, Any]],
+    timeout: int = 10,
+    retries: int = 1,
+) -> Dict[str, Dict[str, Any]]:
+    """Fetch current engagement for many threads via Reddit's /by_id listing.
+
+    One request covers up to BY_ID_BATCH_SIZE posts, where
+    enrich_reddit_item pulls a full thread JSON per post. No comments are
+    returned; use enrich_reddit_item for threads whose comments we render.
+
+    Args:
+        items: Reddit item dicts with thread URLs
+        timeout: HTTP timeout per attempt in seconds
+        retries: Number of retries on failure
+
+    Returns:
+        Dict mapping item URL -> submission dict (same shape as
+        parse_thread_data's "submission"). Posts Reddit didn't return are
+        missing.
+
+    Raises:
+        RedditRateLimitError: When Reddit returns 429 (caller should bail)
+    """
+    urls_by_id = {}
+    for item in items:
+        post_id = extract_post_id(item.get("url", ""))
+        if post_id:
+            urls_by_id.setdefault(post_id, []).append(item["url"])
+
+    ids = list(urls_by_id)
+    result = {}
+    for start in range(0, len(ids), BY_ID_BATCH_SIZE):
+        chunk = ids[start:start + BY_ID_BATCH_SIZE]
+        path = "/by_id/" + ",".join(f"t3_{post_id}" for post_id in chunk)
+        try:
+            data = http.get_reddit_json(path, timeout=timeout, retries=retries)
+        except http.HTTPError as e:
+            if e.status_code == 429:
+                raise RedditRateLimitError("Reddit rate limited (429) fetching engagement batch") from e
+            continue
+
+        children = data.get("data", {}).get("children", []) if isinstance(data, dict) else []
+        for child in children:
+            if child.get("kind") != "t3":
+                continue
+            sub_data = child.get("data", {})
+            for url in urls_by_id.get(str(sub_data.get("id", "")).lower(), []):
+                result[url] = _parse_submission(sub_data)
+
+    return result
+
+
+def apply_engagement(item: Dict[str, Any], submission: Dict[str, Any]) -> Dict[str, Any]:
+    """Update an item's engagement and date from a parsed submission."""
+    item["engagement"] = {
+        "score": submission.get("score"),
+        "num_comments": submission.get("num_comments"),
+        "upvote_ratio": submission.get("upvote_ratio"),
+    }
+
+    # Update date from actual data
+    created_utc = submission.get("created_utc")
+    if created_utc:
+        item["date"] = dates.timestamp_to_date(created_utc)
+
+    return item
+
+
 def parse_thread_data(data: Any) -> Dict[str, Any]:
     """Parse Reddit thread JSON into structured data.
 
@@ -93,16 +269,7 @@ def parse_thread_data(data: Any) -> Dict[str, Any]:
     if isinstance(submission_listing, dict):
         children = submission_listing.get("data", {}).get("children", [])
         if children:
-            sub_data = children[0].get("data", {})
-            result["submission"] = {
-                "score": sub_data.get("score"),
-                "num_comments": sub_data.get("num_comments"),
-                "upvote_ratio": sub_data.get("upvote_ratio"),
-                "created_utc": sub_data.get("created_utc"),
-                "permalink": sub_data.get("permalink"),
-                "title": sub_data.get("title"),
-                "selftext": sub_data.get("selftext", "")[:500],  # Truncate
-            }
+            result["submission"] = _parse_submission(children[0].get("data", {}))
 
     # Second element is comments listing
     if len(data) >= 2:
@@ -202,6 +369,7 @@ def enrich_reddit_item(
     mock_thread_data: Optional[Dict] = None,
     timeout: int = 10,
     retries: int = 1,
+    prefetcher: Optional[ThreadPrefetcher] = None,
 ) -> Dict[str, Any]:
     """Enrich a Reddit item with real engagement data.
 
@@ -210,6 +378,7 @@ def enrich_reddit_item(
         mock_thread_data: Mock data for testing
         timeout: HTTP timeout per attempt (default 10s for enrichment)
         retries: Number of retries (default 1 — fail fast for enrichment)
+        prefetcher: Thread fetches started during discovery, if any
 
     Returns:
         Enriched item dict
@@ -220,7 +389,11 @@ def enrich_reddit_item(
     url = item.get("url", "")
 
     # Fetch thread data (RedditRateLimitError propagates to caller)
-    thread_data = fetch_thread_data(url, mock_thread_data, timeout=timeout, retries=retries)
+    thread_data = None
+    if prefetcher is not None and mock_thread_data is None:
+        thread_data = prefetcher.get(url, timeout=timeout)
+    if not thread_data:
+        thread_data = fetch_thread_data(url, mock_thread_data, timeout=timeout, retries=retries)
     if not thread_data:
         return item
 
@@ -230,16 +403,7 @@ def enrich_reddit_item(
 
     # Update engagement metrics
     if submission:
-        item["engagement"] = {
-            "score": submission.get("score"),
-            "num_comments": submission.get("num_comments"),
-            "upvote_ratio": submission.get("upvote_ratio"),
-        }
-
-        # Update date from actual data
-        created_utc = submission.get("created_utc")
-        if created_utc:
-            item["date"] = dates.timestamp_to_date(created_utc)
+        apply_engagement(item, submission)
 
     # Get top comments
     top_comments = get_top_comments(comments)
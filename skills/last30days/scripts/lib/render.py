@@ -10,6 +10,21 @@ from . import schema
 
 OUTPUT_DIR = Path.home() / ".local" / "share" / "last30days" / "out"
 
+# Display names for source keys used in Report.pending_sources
+SOURCE_LABELS = {
+    "reddit": "Reddit",
+    "x": "X",
+    "youtube": "YouTube",
+    "tiktok": "TikTok",
+    "instagram": "Instagram",
+    "xiaohongshu": "Xiaohongshu",
+    "hackernews": "HN",
+    "bluesky": "Bluesky",
+    "truthsocial": "Truth Social",
+    "polymarket": "Polymarket",
+    "web": "Web",
+}
+
 
 def _xref_tag(item) -> str:
     """Return ' [also on: Reddit, HN]' string if item has cross_refs, else ''."""
@@ -128,6 +143,13 @@ def render_compact(report: schema.Report, limit: int = 15, missing_keys: str = "
         lines.append(f"**⚡ CACHED RESULTS** ({age_str}) - use `--refresh` for fresh data")
         lines.append("")
 
+    # Quorum indicator: some sources were still running when this was emitted
+    if report.pending_sources:
+        pending = ", ".join(SOURCE_LABELS.get(s, s) for s in report.pending_sources)
+        lines.append(f"**⏳ PARTIAL RESULTS** - still waiting on: {pending}")
+        lines.append("Synthesize from the sources below; late results may follow.")
+        lines.append("")
+
     lines.append(f"**Date Range:** {report.range_from} to {report.range_to}")
     lines.append(f"**Mode:** {report.mode}")
     if report.openai_model_used:
@@ -635,10 +657,14 @@ def render_source_status(report: schema.Report, source_info: dict = None) -> str
         lines.append(f"  ❌ Web: error — {report.web_error}")
     elif report.web:
         lines.append(f"  ✅ Web: {len(report.web)} pages")
-    else:
+    elif "web" not in report.pending_sources:
         reason = source_info.get("web_skip_reason", "assistant will use WebSearch")
         lines.append(f"  ⚡ Web: {reason}")
 
+    # Sources cut off by a quorum report
+    for source in report.pending_sources:
+        lines.append(f"  ⏳ {SOURCE_LABELS.get(source, source)}: pending — still running")
+
     lines.append("")
     return "\n".join(lines)
 
@@ -506,6 +506,8 @@ class Report:
     bluesky_error: Optional[str] = None
     truthsocial_error: Optional[str] = None
     polymarket_error: Optional[str] = None
+    # Sources still running when a quorum report was emitted
+    pending_sources: List[str] = field(default_factory=list)
     # Handle resolution
     resolved_x_handle: Optional[str] = None
     # Cache info
@@ -559,6 +561,8 @@ class Report:
             d['truthsocial_error'] = self.truthsocial_error
         if self.polymarket_error:
             d['polymarket_error'] = self.polymarket_error
+        if self.pending_sources:
+            d['pending_sources'] = self.pending_sources
         if self.from_cache:
             d['from_cache'] = self.from_cache
         if self.cache_age_hours is not None:
@@ -814,6 +818,7 @@ class Report:
             hackernews_error=data.get('hackernews_error'),
             truthsocial_error=data.get('truthsocial_error'),
             polymarket_error=data.get('polymarket_error'),
+            pending_sources=data.get('pending_sources', []),
             resolved_x_handle=data.get('resolved_x_handle'),
             from_cache=data.get('from_cache', False),
             cache_age_hours=data.get('cache_age_hours'),
@@ -0,0 +1,295 @@
+"""Local research daemon for last30days skill.
+
+`last30days.py serve` keeps one process alive so repeat queries skip the
+cold start (imports, config, `bird whoami`, model selection). The CLI
+forwards its arguments here when the daemon is running and echoes the
+output as it streams back, so output is identical to a local run.
+
+Protocol: JSON objects, one per line, over a Unix socket.
+    -> {"op": "research", "argv": [...], "cwd": "/path",
+        "env": "<fingerprint>", "timeout": 320}
+    <- {"stdout": "..."} / {"stderr": "..."}  (zero or more, as written)
+    <- {"exit_code": 0}
+    <- {"error": "..."}  instead, if the daemon can't take the request
+    -> {"op": "ping"}      <- {"ok": true, "pid": 1234}
+    -> {"op": "shutdown"}  <- {"ok": true}
+
+The daemon only serves clients whose environment fingerprint
+(env.config_env_fingerprint) matches its own, and one request at a time;
+otherwise it answers with an error and the client runs locally.
+"""
+
+import json
+import os
+import socket
+import socketserver
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from . import cache, env
+
+# How long the client waits to connect before running locally instead
+CONNECT_TIMEOUT = 0.5
+
+# Extra seconds the client waits past the request timeout, for the
+# daemon's own timeout reply to arrive
+REPLY_GRACE = 5
+
+
+def _log(msg: str):
+    """Log to stderr."""
+    sys.stderr.write(f"[serve] {msg}\n")
+    sys.stderr.flush()
+
+
+def is_supported() -> bool:
+    """Unix sockets are unavailable on some platforms (older Windows Pythons)."""
+    return hasattr(socket, "AF_UNIX")
+
+
+def get_socket_path() -> Path:
+    """Get the daemon socket path (override with LAST30DAYS_SOCKET)."""
+    env_path = os.environ.get("LAST30DAYS_SOCKET")
+    if env_path:
+        return Path(env_path).expanduser()
+    return cache.CACHE_DIR / "serve.sock"
+
+
+def _connect(path: Optional[Path]) -> Optional[socket.socket]:
+    if not is_supported():
+        return None
+    path = path or get_socket_path()
+    if not path.exists():
+        return None
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.settimeout(CONNECT_TIMEOUT)
+        sock.connect(str(path))
+        return sock
+    except OSError:
+        sock.close()
+        return None
+
+
+def _call(message: Dict[str, Any], path: Optional[Path] = None, timeout: Optional[float] = None) -> Optional[Dict[str, Any]]:
+    """Send one message to the daemon and read its (single-line) reply.
+
+    Returns:
+        Parsed reply, or None if no daemon is listening or the connection
+        dropped before a full reply arrived
+    """
+    sock = _connect(path)
+    if sock is None:
+        return None
+    try:
+        with sock:
+            sock.settimeout(timeout)
+            sock.sendall((json.dumps(message) + "\n").encode("utf-8"))
+            with sock.makefile("r", encoding="utf-8") as f:
+                line = f.readline()
+        return json.loads(line) if line else None
+    except (OSError, ValueError):
+        return None
+
+
+def ping(path: Optional[Path] = None) -> Optional[Dict[str, Any]]:
+    """Return the daemon's ping reply, or None if it isn't running."""
+    return _call({"op": "ping"}, path, timeout=CONNECT_TIMEOUT)
+
+
+def research(
+    argv: List[str],
+    cwd: str,
+    path: Optional[Path] = None,
+    timeout: Optional[float] = None,
+    on_output: Optional[Callable[[str, str], None]] = None,
+) -> Optional[Dict[str, Any]]:
+    """Run a research request on the daemon.
+
+    Args:
+        argv: CLI arguments
+        cwd: Working directory to run in
+        path: Socket path (default: get_socket_path())
+        timeout: Seconds the run may take (the --timeout budget plus grace).
+            The daemon gives up on the request after this; the client
+            waits REPLY_GRACE longer for that reply.
+        on_output: on_output(stream, text) called with "stdout"/"stderr"
+            output as the daemon writes it
+
+    Returns:
+        {"exit_code", "stdout", "stderr"} with the output collected, or
+        None if the daemon isn't reachable or declined the request before
+        writing anything (the caller should run locally)
+    """
+    sock = _connect(path)
+    if sock is None:
+        return None
+    message = {
+        "op": "research",
+        "argv": argv,
+        "cwd": cwd,
+        "env": env.config_env_fingerprint(),
+        "timeout": timeout,
+    }
+    deadline = time.monotonic() + timeout + REPLY_GRACE if timeout else None
+    output = {"stdout": [], "stderr": []}
+    failure = None
+    try:
+        with sock:
+            sock.sendall((json.dumps(message) + "\n").encode("utf-8"))
+            with sock.makefile("r", encoding="utf-8") as f:
+                while True:
+                    if deadline is not None:
+                        sock.settimeout(max(0.1, deadline - time.monotonic()))
+                    line = f.readline()
+                    if not line:
+                        failure = "Daemon closed the connection mid-request"
+                        break
+                    reply = json.loads(line)
+                    if "exit_code" in reply:
+                        return {
+                            "exit_code": reply["exit_code"],
+                            "stdout": "".join(output["stdout"]),
+                            "stderr": "".join(output["stderr"]),
+                        }
+                    if "error" in reply:
+                        failure = reply["error"]
+                        break
+                    for stream in ("stdout", "stderr"):
+                        if stream in reply:
+                            output[stream].append(reply[stream])
+                            if on_output:
+                                on_output(stream, reply[stream])
+    except socket.timeout:
+        failure = f"Daemon did not finish within {timeout}s"
+    except (OSError, ValueError) as e:
+        failure = f"Lost daemon connection: {e}"
+
+    if not output["stdout"] and not output["stderr"]:
+        return None  # Nothing shown yet: safe to run locally instead
+    # Output already went out; running again would duplicate it
+    error = f"[serve] {failure}\n"
+    if on_output:
+        on_output("stderr", error)
+    return {
+        "exit_code": 1,
+        "stdout": "".join(output["stdout"]),
+        "stderr": "".join(output["stderr"]) + error,
+    }
+
+
+def shutdown(path: Optional[Path] = None) -> bool:
+    """Ask a running daemon to exit."""
+    return _call({"op": "shutdown"}, path, timeout=CONNECT_TIMEOUT) is not None
+
+
+class _Server(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+def serve(handler: Callable[[List[str], str, Callable[[str, str], None]], int], path: Optional[Path] = None):
+    """Serve research requests until shutdown.
+
+    Requests run one at a time (the handler swaps process-wide stdout, cwd
+    and the global deadline); a request arriving while another runs, or
+    from a client with a different environment, is declined so the client
+    runs locally. Pings and shutdowns are answered immediately.
+
+    A request still running past the timeout the client sent can't be
+    interrupted, so the daemon reports the timeout and exits, the same
+    way a local run's hard-exit backstop would.
+
+    Args:
+        handler: handler(argv, cwd, emit) -> exit_code, where
+            emit(stream, text) sends "stdout"/"stderr" output to the client
+        path: Socket path (default: get_socket_path())
+    """
+    path = path or get_socket_path()
+    if ping(path):
+        raise RuntimeError(f"A daemon is already listening on {path}")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        path.unlink()  # Stale socket from a daemon that died
+    except FileNotFoundError:
+        pass
+
+    research_lock = threading.Lock()
+    fingerprint = env.config_env_fingerprint()
+
+    class Handler(socketserver.StreamRequestHandler):
+        def setup(self):
+            super().setup()
+            self._send_lock = threading.Lock()
+
+        def _send(self, reply: Dict[str, Any]):
+            # The request's worker thread streams output through here too
+            with self._send_lock:
+                try:
+                    self.wfile.write((json.dumps(reply) + "\n").encode("utf-8"))
+                except OSError:
+                    pass  # Client went away
+
+        def _research(self, message: Dict[str, Any]):
+            if message.get("env") != fingerprint:
+                self._send({"error": "Client environment differs from the daemon's"})
+                return
+            if not research_lock.acquire(blocking=False):
+                self._send({"error": "Daemon is busy with another request"})
+                return
+
+            result = {}
+
+            def run():
+                try:
+                    result["code"] = handler(
+                        message["argv"], message.get("cwd") or os.getcwd(),
+                        lambda stream, text: self._send({stream: text}),
+                    )
+                finally:
+                    research_lock.release()
+
+            worker = threading.Thread(target=run, daemon=True)
+            worker.start()
+            worker.join(message.get("timeout"))
+            if worker.is_alive():
+                self._send({"stderr": "\n[TIMEOUT] Request did not finish in time. Restarting daemon.\n"})
+                self._send({"exit_code": 1})
+                # Clients then get "connection refused" and run locally
+                _log("Request wedged past its timeout; exiting")
+                os._exit(1)
+            self._send({"exit_code": result.get("code", 1)})
+
+        def handle(self):
+            try:
+                message = json.loads(self.rfile.readline() or b"{}")
+            except ValueError:
+                message = {}
+            op = message.get("op")
+            if op == "ping":
+                self._send({"ok": True, "pid": os.getpid()})
+            elif op == "shutdown":
+                self._send({"ok": True})
+                threading.Thread(target=server.shutdown, daemon=True).start()
+            elif op == "research" and isinstance(message.get("argv"), list):
+                self._research(message)
+            else:
+                self._send({"error": f"Unknown request: {op!r}"})
+
+    old_umask = os.umask(0o077)  # Socket is private to this user
+    try:
+        server = _Server(str(path), Handler)
+    finally:
+        os.umask(old_umask)
+    _log(f"Listening on {path} (pid {os.getpid()})")
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+        try:
+            path.unlink()
+        except OSError:
+            pass
+        _log("Stopped")
@@ -9,6 +9,9 @@ API docs: https://scrapecreators.com/docs
 
 import re
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional, Set
 
@@ -17,15 +20,20 @@ try:
 except ImportError:
     _requests = None
 
+from . import http
+
 SCRAPECREATORS_BASE = "https://api.scrapecreators.com/v1/tiktok"
 
 # Depth configurations: how many results to fetch / captions to extract
 DEPTH_CONFIG = {
-    "quick":   {"results_per_page": 10, "max_captions": 3},
-    "default": {"results_per_page": 20, "max_captions": 5},
-    "deep":    {"results_per_page": 40, "max_captions": 8},
+    "quick":   {"results_per_page": 10, "max_captions": 3, "caption_budget": 15},
+    "default": {"results_per_page": 20, "max_captions": 5, "caption_budget": 20},
+    "deep":    {"results_per_page": 40, "max_captions": 8, "caption_budget": 30},
 }
 
+# Concurrent /transcript calls (paced by http.SCRAPECREATORS_RATE_LIMITER)
+CAPTION_MAX_WORKERS = 4
+
 # Max words to keep from each caption
 CAPTION_MAX_WORDS = 500
 
@@ -300,10 +308,35 @@ def search_tiktok(
     return {"items": items}
 
 
+def _fetch_transcript(url: str, token: str) -> Optional[str]:
+    """Fetch the spoken-word transcript for one video (truncated to CAPTION_MAX_WORDS)."""
+    http.SCRAPECREATORS_RATE_LIMITER.acquire()
+    resp = _requests.get(
+        f"{SCRAPECREATORS_BASE}/video/transcript",
+        params={"url": url},
+        headers=_sc_headers(token),
+        timeout=15,
+    )
+    if resp.status_code == 200:
+        data = resp.json()
+        transcript = data.get("transcript")
+        if transcript:
+            if isinstance(transcript, list):
+                transcript = " ".join(str(s) for s in transcript)
+            transcript = _clean_webvtt(transcript)
+            if transcript:
+                words = transcript.split()
+                if len(words) > CAPTION_MAX_WORDS:
+                    transcript = ' '.join(words[:CAPTION_MAX_WORDS]) + '...'
+                return transcript
+    return None
+
+
 def fetch_captions(
     video_items: List[Dict[str, Any]],
     token: str,
     depth: str = "default",
+    budget: Optional[float] = None,
 ) -> Dict[str, str]:
     """Fetch transcripts for top N TikTok videos via ScrapeCreators.
 
@@ -315,12 +348,16 @@ def fetch_captions(
         video_items: Items from search_tiktok()
         token: ScrapeCreators API key
         depth: Depth level for caption limit
+        budget: Seconds to wait for transcripts (default: the depth's
+            caption_budget)
 
     Returns:
         Dict mapping video_id -> caption text (truncated to 500 words)
     """
     config = DEPTH_CONFIG.get(depth, DEPTH_CONFIG["default"])
     max_captions = config["max_captions"]
+    if budget is None:
+        budget = config["caption_budget"]
 
     if not video_items or not token or not _requests:
         return {}
@@ -340,33 +377,28 @@ def fetch_captions(
                 text = ' '.join(words[:CAPTION_MAX_WORDS]) + '...'
             captions[vid] = text
 
-    # Second pass: try to get spoken-word transcripts (1 credit each)
-    for item in top_items:
-        vid = item["video_id"]
-        url = item.get("url", "")
-        if not url:
-            continue
-        try:
-            resp = _requests.get(
-                f"{SCRAPECREATORS_BASE}/video/transcript",
-                params={"url": url},
-                headers=_sc_headers(token),
-                timeout=15,
-            )
-            if resp.status_code == 200:
-                data = resp.json()
-                transcript = data.get("transcript")
-                if transcript:
-                    if isinstance(transcript, list):
-                        transcript = " ".join(str(s) for s in transcript)
-                    transcript = _clean_webvtt(transcript)
-                    if transcript:
-                        words = transcript.split()
-                        if len(words) > CAPTION_MAX_WORDS:
-                            transcript = ' '.join(words[:CAPTION_MAX_WORDS]) + '...'
-                        captions[vid] = transcript
-        except Exception as e:
-            _log(f"Transcript fetch failed for {vid}: {e}")
+    # Second pass: spoken-word transcripts (1 credit each), fetched
+    # concurrently. Any still missing when the budget runs out keep the
+    # description from the first pass.
+    to_fetch = [item for item in top_items if item.get("url")] if budget > 0 else []
+    pool = ThreadPoolExecutor(max_workers=max(1, min(CAPTION_MAX_WORKERS, len(to_fetch))))
+    futures = {pool.submit(_fetch_transcript, item["url"], token): item["video_id"] for item in to_fetch}
+    pending = len(futures)
+    try:
+        for future in as_completed(futures, timeout=budget):
+            pending -= 1
+            vid = futures[future]
+            try:
+                transcript = future.result()
+            except Exception as e:
+                _log(f"Transcript fetch failed for {vid}: {e}")
+                continue
+            if transcript:
+                captions[vid] = transcript
+    except FutureTimeoutError:
+        _log(f"Caption budget ({budget}s) spent; {pending} videos kept with descriptions")
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
 
     got = sum(1 for v in captions.values() if v)
     _log(f"Got captions for {got}/{len(top_items)} videos")
@@ -379,6 +411,7 @@ def search_and_enrich(
     to_date: str,
     depth: str = "default",
     token: str = None,
+    budget: Optional[float] = None,
 ) -> Dict[str, Any]:
     """Full TikTok search: find videos, then fetch captions for top results.
 
@@ -388,10 +421,13 @@ def search_and_enrich(
         to_date: End date (YYYY-MM-DD)
         depth: 'quick', 'default', or 'deep'
         token: ScrapeCreators API key
+        budget: Seconds the search and caption fetches may take; captions
+            get whatever the search leaves, up to the depth's caption_budget
 
     Returns:
         Dict with 'items' list. Each item has a 'caption_snippet' field.
     """
+    started = time.monotonic()
     # Step 1: Search
     search_result = search_tiktok(topic, from_date, to_date, depth, token)
     items = search_result.get("items", [])
@@ -400,7 +436,13 @@ def search_and_enrich(
         return search_result
 
     # Step 2: Fetch captions for top N
-    captions = fetch_captions(items, token, depth)
+    caption_budget = None
+    if budget is not None:
+        caption_budget = min(
+            DEPTH_CONFIG.get(depth, DEPTH_CONFIG["default"])["caption_budget"],
+            max(0.0, budget - (time.monotonic() - started)),
+        )
+    captions = fetch_captions(items, token, depth, budget=caption_budget)
 
     # Step 3: Attach captions to items
     for item in items:
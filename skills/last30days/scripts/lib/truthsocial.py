@@ -19,6 +19,16 @@ DEPTH_CONFIG = {
     "deep": 60,
 }
 
+# Search pages (offset pagination, at most PAGE_LIMIT statuses each)
+DEPTH_PAGES = {
+    "quick": 1,
+    "default": 1,
+    "deep": 3,
+}
+
+# Mastodon caps search results per request at 40
+PAGE_LIMIT = 40
+
 
 def _log(msg: str):
     """Log to stderr (only in TTY mode to avoid cluttering Claude Code output)."""
@@ -100,19 +110,34 @@ def search_truthsocial(
     _log(f"Searching for '{core_topic}' (depth={depth}, limit={count})")
 
     from urllib.parse import urlencode
+    limit = min(count, PAGE_LIMIT)
     params = {
         "q": core_topic,
         "type": "statuses",
-        "limit": str(min(count, 40)),
+        "limit": str(limit),
     }
-    url = f"{TRUTHSOCIAL_SEARCH_URL}?{urlencode(params)}"
 
-    try:
+    def fetch_page(offset):
+        page_params = dict(params, offset=str(offset)) if offset else params
+        url = f"{TRUTHSOCIAL_SEARCH_URL}?{urlencode(page_params)}"
         response = http.request(
             "GET", url,
             headers={"Authorization": f"Bearer {token}"},
             timeout=30,
         )
+        got = len(response.get("statuses", []))
+        return response, (offset + got if got >= limit else None)
+
+    def has_recent(page):
+        # Stop paging once a whole page predates the range
+        return any(
+            (_parse_date(status) or to_date) >= from_date
+            for status in page.get("statuses", [])
+        )
+
+    max_pages = DEPTH_PAGES.get(depth, DEPTH_PAGES["default"])
+    try:
+        pages = http.fetch_pages(fetch_page, 0, max_pages, has_recent)
     except http.HTTPError as e:
         if e.status_code == 401:
             _log("Token expired")
@@ -130,8 +155,11 @@ def search_truthsocial(
         _log(f"Search failed: {e}")
         return {"statuses": [], "error": str(e)}
 
+    response = pages[0]
+    if len(pages) > 1:
+        response = dict(response, statuses=[s for page in pages for s in page.get("statuses", [])])
     statuses = response.get("statuses", [])
-    _log(f"Found {len(statuses)} posts")
+    _log(f"Found {len(statuses)} posts ({len(pages)} pages)")
     return response
 
 
@@ -3,7 +3,8 @@
 import json
 import re
 import sys
-from typing import Any, Dict, List, Optional
+import time
+from typing import Any, Callable, Dict, List, Optional
 
 from . import http
 
@@ -55,6 +56,82 @@ Rules:
 - Prefer posts with substantive content, not just links"""
 
 
+class _StreamedItemParser:
+    """Pulls complete objects out of a streamed {"items": [...]} JSON answer.
+
+    Output text arrives in arbitrary deltas; each item object is decoded
+    as soon as its closing brace lands, long before the array is done.
+    """
+
+    def __init__(self):
+        self.text = ""
+        self._pos = None  # Scan position inside the items array
+        self._depth = 0
+        self._start = None
+        self._in_string = False
+        self._escape = False
+        self._done = False
+
+    def feed(self, delta: str) -> List[Dict[str, Any]]:
+        """Add a text delta; return the item dicts it completed."""
+        self.text += delta
+        if self._done:
+            return []
+        if self._pos is None:
+            match = re.search(r'"items"\s*:\s*\[', self.text)
+            if not match:
+                return []
+            self._pos = match.end()
+
+        items = []
+        text = self.text
+        i = self._pos
+        while i < len(text):
+            ch = text[i]
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif ch == "\\":
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+            elif ch == '"':
+                self._in_string = True
+            elif ch in "{[":
+                if self._depth == 0 and ch == "{":
+                    self._start = i
+                self._depth += 1
+            elif ch in "}]":
+                if self._depth == 0:
+                    self._done = True  # End of the items array
+                    break
+                self._depth -= 1
+                if self._depth == 0 and self._start is not None:
+                    try:
+                        item = json.loads(text[self._start:i + 1])
+                        if isinstance(item, dict):
+                            items.append(item)
+                    except json.JSONDecodeError:
+                        pass
+                    self._start = None
+            i += 1
+        self._pos = i
+        return items
+
+
+def _items_response(items: Optional[List[Dict[str, Any]]], text: str = "") -> Dict[str, Any]:
+    """Wrap output text (or raw items) in a Responses-shaped dict."""
+    if items is not None:
+        text = json.dumps({"items": items})
+    if not text:
+        return {}
+    return {
+        "output": [
+            {"type": "message", "content": [{"type": "output_text", "text": text}]}
+        ]
+    }
+
+
 def search_x(
     api_key: str,
     model: str,
@@ -63,9 +140,14 @@ def search_x(
     to_date: str,
     depth: str = "default",
     mock_response: Optional[Dict] = None,
+    on_item: Optional[Callable[[Dict[str, Any]], None]] = None,
 ) -> Dict[str, Any]:
     """Search X for relevant posts using xAI API with live search.
 
+    The response is streamed. Each post is cleaned and passed to on_item
+    as soon as the model finishes writing it, and if the stream times out
+    or drops, the posts received so far are returned instead of an error.
+
     Args:
         api_key: xAI API key
         model: Model to use
@@ -74,9 +156,10 @@ def search_x(
         to_date: End date (YYYY-MM-DD)
         depth: Research depth - "quick", "default", or "deep"
         mock_response: Mock response for testing
+        on_item: Called with each cleaned X item as it streams in
 
     Returns:
-        Raw API response
+        Raw API response (marked "partial": True when cut short)
     """
     if mock_response is not None:
         return mock_response
@@ -94,6 +177,7 @@ def search_x(
     # Use Agent Tools API with x_search tool
     payload = {
         "model": model,
+        "stream": True,
         "tools": [
             {"type": "x_search"}
         ],
@@ -111,7 +195,34 @@ def search_x(
         ],
     }
 
-    return http.post(XAI_RESPONSES_URL, payload, headers=headers, timeout=timeout)
+    parser = _StreamedItemParser()
+    streamed = []  # Raw items, in order
+    events = []
+    deadline = time.monotonic() + timeout
+    try:
+        for event in http.stream_sse(XAI_RESPONSES_URL, payload, headers=headers, timeout=timeout):
+            events.append(event)
+            delta = event.get("delta")
+            if event.get("type") == "response.output_text.delta" and isinstance(delta, str):
+                for raw in parser.feed(delta):
+                    streamed.append(raw)
+                    if not on_item:
+                        continue
+                    try:
+                        clean = _clean_item(raw, len(streamed) - 1)
+                        if clean:
+                            on_item(clean)
+                    except Exception as e:
+                        _log_error(f"Streamed item callback failed: {e}")
+            if time.monotonic() > deadline:
+                raise http.HTTPError(f"Stream timed out after {timeout}s")
+    except http.HTTPError as e:
+        if not streamed:
+            raise
+        _log_error(f"{e}; keeping {len(streamed)} posts streamed so far")
+        return dict(_items_response(streamed), partial=True)
+
+    return http.response_from_events(events)
 
 
 def parse_x_response(response: Dict[str, Any]) -> List[Dict[str, Any]]:
@@ -178,40 +289,55 @@ def parse_x_response(response: Dict[str, Any]) -> List[Dict[str, Any]]:
     # Validate and clean items
     clean_items = []
     for i, item in enumerate(items):
-        if not isinstance(item, dict):
-            continue
-
-        url = item.get("url", "")
-        if not url:
-            continue
-
-        # Parse engagement
-        engagement = None
-        eng_raw = item.get("engagement")
-        if isinstance(eng_raw, dict):
-            engagement = {
-                "likes": int(eng_raw.get("likes", 0)) if eng_raw.get("likes") else None,
-                "reposts": int(eng_raw.get("reposts", 0)) if eng_raw.get("reposts") else None,
-                "replies": int(eng_raw.get("replies", 0)) if eng_raw.get("replies") else None,
-                "quotes": int(eng_raw.get("quotes", 0)) if eng_raw.get("quotes") else None,
-            }
+        clean_item = _clean_item(item, i)
+        if clean_item:
+            clean_items.append(clean_item)
+
+    return clean_items
 
-        clean_item = {
-            "id": f"X{i+1}",
-            "text": str(item.get("text", "")).strip()[:500],  # Truncate long text
-            "url": url,
-            "author_handle": str(item.get("author_handle", "")).strip().lstrip("@"),
-            "date": item.get("date"),
-            "engagement": engagement,
-            "why_relevant": str(item.get("why_relevant", "")).strip(),
-            "relevance": min(1.0, max(0.0, float(item.get("relevance", 0.5)))),
+
+def _clean_item(item: Any, index: int) -> Optional[Dict[str, Any]]:
+    """Validate and normalize one raw X item from the model's JSON.
+
+    Args:
+        item: Raw item from the "items" array
+        index: Position in the array (used for the item ID)
+
+    Returns:
+        Clean item dict, or None if the item is unusable
+    """
+    if not isinstance(item, dict):
+        return None
+
+    url = item.get("url", "")
+    if not url:
+        return None
+
+    # Parse engagement
+    engagement = None
+    eng_raw = item.get("engagement")
+    if isinstance(eng_raw, dict):
+        engagement = {
+            "likes": int(eng_raw.get("likes", 0)) if eng_raw.get("likes") else None,
+            "reposts": int(eng_raw.get("reposts", 0)) if eng_raw.get("reposts") else None,
+            "replies": int(eng_raw.get("replies", 0)) if eng_raw.get("replies") else None,
+            "quotes": int(eng_raw.get("quotes", 0)) if eng_raw.get("quotes") else None,
         }
 
-        # Validate date format
-        if clean_item["date"]:
-            if not re.match(r'^\d{4}-\d{2}-\d{2}$', str(clean_item["date"])):
-                clean_item["date"] = None
+    clean_item = {
+        "id": f"X{index+1}",
+        "text": str(item.get("text", "")).strip()[:500],  # Truncate long text
+        "url": url,
+        "author_handle": str(item.get("author_handle", "")).strip().lstrip("@"),
+        "date": item.get("date"),
+        "engagement": engagement,
+        "why_relevant": str(item.get("why_relevant", "")).strip(),
+        "relevance": min(1.0, max(0.0, float(item.get("relevance", 0.5)))),
+    }
 
-        clean_items.append(clean_item)
+    # Validate date format
+    if clean_item["date"]:
+        if not re.match(r'^\d{4}-\d{2}-\d{2}$', str(clean_item["date"])):
+            clean_item["date"] = None
 
-    return clean_items
+    return clean_item
@@ -15,9 +15,12 @@ import shutil
 import subprocess
 import sys
 import tempfile
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed, wait
+from concurrent.futures import TimeoutError as FuturesTimeout
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
 # Depth configurations: how many videos to search / transcribe
 DEPTH_CONFIG = {
@@ -32,6 +35,32 @@ TRANSCRIPT_LIMITS = {
     "deep": 8,
 }
 
+# yt-dlp search timeout (seconds); videos that streamed in before it are kept
+SEARCH_TIMEOUT = 120
+
+# Parallel transcript fetches (each one a single video or a batch)
+TRANSCRIPT_WORKERS = 5
+
+# Videos per batched yt-dlp run. Batching skips repeated process start-up and
+# extractor init; several small batches still run side by side because yt-dlp
+# handles the URLs in one run sequentially.
+TRANSCRIPT_BATCH_SIZE = 4
+
+# Subtitle fetch timeout (seconds) for one video, plus per extra batched video
+TRANSCRIPT_TIMEOUT = 30
+TRANSCRIPT_TIMEOUT_PER_VIDEO = 10
+
+# Longest wait (seconds) for transcripts once the search is done. The
+# in-process yt_dlp path can't be killed like a subprocess, so the wait is
+# bounded instead; videos whose transcript isn't back by then keep an empty
+# snippet.
+TRANSCRIPT_WAIT = TRANSCRIPT_TIMEOUT + TRANSCRIPT_TIMEOUT_PER_VIDEO * TRANSCRIPT_BATCH_SIZE
+
+# Transcript fetches that may start while the search is still running, as a
+# multiple of the transcript limit (caps work spent on videos that end up
+# outside the final top N)
+EARLY_TRANSCRIPT_FACTOR = 2
+
 # Max words to keep from each transcript
 TRANSCRIPT_MAX_WORDS = 500
 
@@ -102,6 +131,24 @@ def _log(msg: str):
     sys.stderr.flush()
 
 
+def _register_child(pid: int):
+    """Track a yt-dlp process so a global timeout can kill it (if available)."""
+    try:
+        from last30days import register_child_pid
+        register_child_pid(pid)
+    except ImportError:
+        pass
+
+
+def _unregister_child(pid: int):
+    """Stop tracking a finished yt-dlp process."""
+    try:
+        from last30days import unregister_child_pid
+        unregister_child_pid(pid)
+    except ImportError:
+        pass
+
+
 def is_ytdlp_installed() -> bool:
     """Check if yt-dlp is available in PATH."""
     return shutil.which("yt-dlp") is not None
@@ -145,19 +192,75 @@ def _extract_core_subject(topic: str) -> str:
     return result.rstrip('?!.')
 
 
+def _kill_process(proc: subprocess.Popen):
+    """Kill a yt-dlp process and its process group."""
+    try:
+        os.killpg(os.getpgid(proc.pid), signal.SIGTERM)
+    except (ProcessLookupError, PermissionError, OSError):
+        proc.kill()
+    try:
+        proc.wait(timeout=5)
+    except subprocess.TimeoutExpired:
+        pass
+
+
+def _parse_video(line: str, core_topic: str) -> Optional[Dict[str, Any]]:
+    """Parse one line of yt-dlp --dump-json output into an item dict."""
+    line = line.strip()
+    if not line:
+        return None
+    try:
+        video = json.loads(line)
+    except json.JSONDecodeError:
+        return None
+
+    video_id = video.get("id", "")
+    view_count = video.get("view_count") or 0
+    like_count = video.get("like_count") or 0
+    comment_count = video.get("comment_count") or 0
+    upload_date = video.get("upload_date", "")  # YYYYMMDD
+
+    # Convert YYYYMMDD to YYYY-MM-DD
+    date_str = None
+    if upload_date and len(upload_date) == 8:
+        date_str = f"{upload_date[:4]}-{upload_date[4:6]}-{upload_date[6:8]}"
+
+    return {
+        "video_id": video_id,
+        "title": video.get("title", ""),
+        "url": f"https://www.youtube.com/watch?v={video_id}",
+        "channel_name": video.get("channel", video.get("uploader", "")),
+        "date": date_str,
+        "engagement": {
+            "views": view_count,
+            "likes": like_count,
+            "comments": comment_count,
+        },
+        "duration": video.get("duration"),
+        "relevance": _compute_relevance(core_topic, video.get("title", "")),
+        "why_relevant": f"YouTube: {video.get('title', core_topic)[:60]}",
+    }
+
+
 def search_youtube(
     topic: str,
     from_date: str,
     to_date: str,
     depth: str = "default",
+    on_video: Optional[Callable[[Dict[str, Any]], None]] = None,
 ) -> Dict[str, Any]:
     """Search YouTube via yt-dlp. No API key needed.
 
+    yt-dlp prints one JSON line per video as it resolves, so results are
+    parsed as they stream in rather than after the whole search finishes.
+
     Args:
         topic: Search topic
         from_date: Start date (YYYY-MM-DD)
         to_date: End date (YYYY-MM-DD)
         depth: 'quick', 'default', or 'deep'
+        on_video: Called with each video item as soon as it is parsed
+            (before date filtering and sorting)
 
     Returns:
         Dict with 'items' list of video metadata dicts.
@@ -185,67 +288,55 @@ def search_youtube(
     preexec = os.setsid if hasattr(os, 'setsid') else None
 
     try:
+        # stderr is discarded so a chatty yt-dlp can't fill the pipe and
+        # stall while we only read stdout
         proc = subprocess.Popen(
             cmd,
             stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
             text=True,
             preexec_fn=preexec,
         )
-        try:
-            stdout, stderr = proc.communicate(timeout=120)
-        except subprocess.TimeoutExpired:
-            try:
-                os.killpg(os.getpgid(proc.pid), signal.SIGTERM)
-            except (ProcessLookupError, PermissionError, OSError):
-                proc.kill()
-            proc.wait(timeout=5)
-            _log("YouTube search timed out (120s)")
-            return {"items": [], "error": "Search timed out"}
     except FileNotFoundError:
         return {"items": [], "error": "yt-dlp not found"}
 
-    if not (stdout or "").strip():
-        _log("YouTube search returned 0 results")
-        return {"items": []}
+    _register_child(proc.pid)
+    timed_out = threading.Event()
+
+    def _on_timeout():
+        timed_out.set()
+        _kill_process(proc)
+
+    watchdog = threading.Timer(SEARCH_TIMEOUT, _on_timeout)
+    watchdog.daemon = True
+    watchdog.start()
 
-    # Parse JSON-per-line output
+    # Parse JSON-per-line output as it arrives
     items = []
-    for line in stdout.strip().split("\n"):
-        line = line.strip()
-        if not line:
-            continue
-        try:
-            video = json.loads(line)
-        except json.JSONDecodeError:
-            continue
-
-        video_id = video.get("id", "")
-        view_count = video.get("view_count") or 0
-        like_count = video.get("like_count") or 0
-        comment_count = video.get("comment_count") or 0
-        upload_date = video.get("upload_date", "")  # YYYYMMDD
-
-        # Convert YYYYMMDD to YYYY-MM-DD
-        date_str = None
-        if upload_date and len(upload_date) == 8:
-            date_str = f"{upload_date[:4]}-{upload_date[4:6]}-{upload_date[6:8]}"
-
-        items.append({
-            "video_id": video_id,
-            "title": video.get("title", ""),
-            "url": f"https://www.youtube.com/watch?v={video_id}",
-            "channel_name": video.get("channel", video.get("uploader", "")),
-            "date": date_str,
-            "engagement": {
-                "views": view_count,
-                "likes": like_count,
-                "comments": comment_count,
-            },
-            "duration": video.get("duration"),
-            "relevance": _compute_relevance(core_topic, video.get("title", "")),
-            "why_relevant": f"YouTube: {video.get('title', core_topic)[:60]}",
-        })
+    try:
+        for line in proc.stdout:
+            item = _parse_video(line, core_topic)
+            if item is None:
+                continue
+            items.append(item)
+            if on_video:
+                on_video(item)
+        proc.wait()
+    finally:
+        watchdog.cancel()
+        if proc.poll() is None:
+            _kill_process(proc)
+        proc.stdout.close()
+        _unregister_child(proc.pid)
+
+    if timed_out.is_set():
+        _log(f"YouTube search timed out ({SEARCH_TIMEOUT}s), keeping {len(items)} videos that arrived")
+        if not items:
+            return {"items": [], "error": "Search timed out"}
+
+    if not items:
+        _log("YouTube search returned 0 results")
+        return {"items": []}
 
     # Soft date filter: prefer recent items but fall back to all if too few
     recent = [i for i in items if i["date"] and i["date"] >= from_date]
@@ -283,15 +374,67 @@ def _clean_vtt(vtt_text: str) -> str:
     return re.sub(r'\s+', ' ', ' '.join(unique)).strip()
 
 
-def fetch_transcript(video_id: str, temp_dir: str) -> Optional[str]:
-    """Fetch auto-generated transcript for a YouTube video.
+def _video_url(video_id: str) -> str:
+    return f"https://www.youtube.com/watch?v={video_id}"
+
+
+# yt_dlp package: None = not checked yet, False = not importable
+_yt_dlp_module = None
+
+
+def _load_yt_dlp():
+    """Import the yt_dlp package when it is installed alongside the CLI."""
+    global _yt_dlp_module
+    if _yt_dlp_module is None:
+        try:
+            import yt_dlp
+            _yt_dlp_module = yt_dlp
+        except ImportError:
+            _yt_dlp_module = False
+    return _yt_dlp_module or None
+
+
+class _QuietLogger:
+    """Keeps in-process yt-dlp output off stdout (the report channel)."""
+
+    def debug(self, msg):
+        pass
+
+    def info(self, msg):
+        pass
+
+    def warning(self, msg):
+        pass
+
+    def error(self, msg):
+        pass
+
+
+def _write_subs_in_process(yt_dlp, video_ids: List[str], temp_dir: str):
+    """Write auto-subs for videos using the yt_dlp Python API (no process spawn)."""
+    opts = {
+        "writeautomaticsub": True,
+        "subtitleslangs": ["en"],
+        "subtitlesformat": "vtt",
+        "skip_download": True,
+        "ignoreerrors": True,
+        "quiet": True,
+        "no_warnings": True,
+        "noprogress": True,
+        "logger": _QuietLogger(),
+        "socket_timeout": TRANSCRIPT_TIMEOUT,
+        "outtmpl": f"{temp_dir}/%(id)s",
+    }
+    with yt_dlp.YoutubeDL(opts) as ydl:
+        ydl.download([_video_url(vid) for vid in video_ids])
 
-    Args:
-        video_id: YouTube video ID
-        temp_dir: Temporary directory for subtitle files
+
+def _write_subs_subprocess(video_ids: List[str], temp_dir: str, timeout: float) -> bool:
+    """Write auto-subs for videos with one yt-dlp process.
 
     Returns:
-        Plaintext transcript string, or None if no captions available.
+        False if yt-dlp couldn't be started. A timeout still returns True;
+        subtitles written before it are kept.
     """
     cmd = [
         "yt-dlp",
@@ -299,10 +442,10 @@ def fetch_transcript(video_id: str, temp_dir: str) -> Optional[str]:
         "--sub-lang", "en",
         "--sub-format", "vtt",
         "--skip-download",
+        "--ignore-errors",
         "--no-warnings",
         "-o", f"{temp_dir}/%(id)s",
-        f"https://www.youtube.com/watch?v={video_id}",
-    ]
+    ] + [_video_url(vid) for vid in video_ids]
 
     preexec = os.setsid if hasattr(os, 'setsid') else None
 
@@ -314,18 +457,20 @@ def fetch_transcript(video_id: str, temp_dir: str) -> Optional[str]:
             text=True,
             preexec_fn=preexec,
         )
-        try:
-            proc.communicate(timeout=30)
-        except subprocess.TimeoutExpired:
-            try:
-                os.killpg(os.getpgid(proc.pid), signal.SIGTERM)
-            except (ProcessLookupError, PermissionError, OSError):
-                proc.kill()
-            proc.wait(timeout=5)
-            return None
     except FileNotFoundError:
-        return None
+        return False
+    _register_child(proc.pid)
+    try:
+        proc.communicate(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        _kill_process(proc)
+    finally:
+        _unregister_child(proc.pid)
+    return True
+
 
+def _read_transcript(video_id: str, temp_dir: str) -> Optional[str]:
+    """Read and clean a subtitle file written by yt-dlp."""
     # yt-dlp may save as .en.vtt or .en-orig.vtt
     vtt_path = Path(temp_dir) / f"{video_id}.en.vtt"
     if not vtt_path.exists():
@@ -351,15 +496,60 @@ def fetch_transcript(video_id: str, temp_dir: str) -> Optional[str]:
     return transcript if transcript else None
 
 
+def fetch_transcript(video_id: str, temp_dir: str) -> Optional[str]:
+    """Fetch auto-generated transcript for a YouTube video (one yt-dlp process).
+
+    Args:
+        video_id: YouTube video ID
+        temp_dir: Temporary directory for subtitle files
+
+    Returns:
+        Plaintext transcript string, or None if no captions available.
+    """
+    _write_subs_subprocess([video_id], temp_dir, TRANSCRIPT_TIMEOUT)
+    return _read_transcript(video_id, temp_dir)
+
+
+def _fetch_chunk(video_ids: List[str], temp_dir: str) -> Dict[str, Optional[str]]:
+    """Fetch transcripts for a few videos with a single yt-dlp run.
+
+    Uses the yt_dlp Python API when importable, otherwise one CLI invocation
+    for the whole chunk. Falls back to a process per video if the batched
+    run fails outright.
+    """
+    yt_dlp = _load_yt_dlp()
+    ok = False
+    if yt_dlp:
+        try:
+            _write_subs_in_process(yt_dlp, video_ids, temp_dir)
+            ok = True
+        except Exception as e:
+            _log(f"In-process yt-dlp failed ({type(e).__name__}), using one process per video")
+    elif len(video_ids) > 1:
+        timeout = TRANSCRIPT_TIMEOUT + TRANSCRIPT_TIMEOUT_PER_VIDEO * len(video_ids)
+        ok = _write_subs_subprocess(video_ids, temp_dir, timeout)
+
+    if not ok:
+        return {vid: fetch_transcript(vid, temp_dir) for vid in video_ids}
+    return {vid: _read_transcript(vid, temp_dir) for vid in video_ids}
+
+
+def _chunks(video_ids: List[str]) -> List[List[str]]:
+    return [video_ids[i:i + TRANSCRIPT_BATCH_SIZE] for i in range(0, len(video_ids), TRANSCRIPT_BATCH_SIZE)]
+
+
 def fetch_transcripts_parallel(
     video_ids: List[str],
-    max_workers: int = 5,
+    max_workers: int = TRANSCRIPT_WORKERS,
 ) -> Dict[str, Optional[str]]:
-    """Fetch transcripts for multiple videos in parallel.
+    """Fetch transcripts for multiple videos.
+
+    Videos are grouped into batches of TRANSCRIPT_BATCH_SIZE, one yt-dlp
+    run each, and the batches run in parallel.
 
     Args:
         video_ids: List of YouTube video IDs
-        max_workers: Max parallel fetches
+        max_workers: Max parallel batches
 
     Returns:
         Dict mapping video_id to transcript text (or None).
@@ -369,61 +559,136 @@ def fetch_transcripts_parallel(
 
     _log(f"Fetching transcripts for {len(video_ids)} videos")
 
-    results = {}
-    with tempfile.TemporaryDirectory() as temp_dir:
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            futures = {
-                executor.submit(fetch_transcript, vid, temp_dir): vid
-                for vid in video_ids
-            }
-            for future in as_completed(futures):
-                vid = futures[future]
-                try:
-                    results[vid] = future.result()
-                except Exception:
-                    results[vid] = None
+    results = {vid: None for vid in video_ids}
+    temp_dir = tempfile.mkdtemp(prefix="last30days-yt-")
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    futures = {
+        executor.submit(_fetch_chunk, chunk, temp_dir): chunk
+        for chunk in _chunks(video_ids)
+    }
+    try:
+        for future in as_completed(futures, timeout=TRANSCRIPT_WAIT):
+            try:
+                results.update(future.result())
+            except Exception:
+                pass
+    except FuturesTimeout:
+        _log(f"Transcript fetches still running after {TRANSCRIPT_WAIT}s, continuing without them")
+    finally:
+        _release_fetches(executor, list(futures), temp_dir)
 
     got = sum(1 for v in results.values() if v)
     _log(f"Got transcripts for {got}/{len(video_ids)} videos")
     return results
 
 
+def _release_fetches(executor: ThreadPoolExecutor, futures: List[Future], temp_dir: str):
+    """Stop waiting on transcript fetches; remove temp_dir once they finish."""
+    executor.shutdown(wait=False, cancel_futures=True)
+    pending = [f for f in futures if not f.done()]
+    if pending:
+        threading.Thread(
+            target=lambda: (wait(pending), shutil.rmtree(temp_dir, ignore_errors=True)),
+            daemon=True,
+        ).start()
+    else:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
 def search_and_transcribe(
     topic: str,
     from_date: str,
     to_date: str,
     depth: str = "default",
+    budget: Optional[float] = None,
 ) -> Dict[str, Any]:
     """Full YouTube search: find videos, then fetch transcripts for top results.
 
+    Transcript fetches start while the search is still streaming: any recent
+    video that ranks in the top N by views among those seen so far is
+    dispatched immediately. Once the search finishes, the rest of the final
+    top N are fetched in batches and only their transcripts are attached.
+
     Args:
         topic: Search topic
         from_date: Start date (YYYY-MM-DD)
         to_date: End date (YYYY-MM-DD)
         depth: 'quick', 'default', or 'deep'
+        budget: Seconds the whole call may take. Transcripts not back by
+            then (or TRANSCRIPT_WAIT after the search, if sooner) are
+            skipped and their videos returned without one.
 
     Returns:
         Dict with 'items' list. Each item has a 'transcript_snippet' field.
     """
-    # Step 1: Search
-    search_result = search_youtube(topic, from_date, to_date, depth)
-    items = search_result.get("items", [])
-
-    if not items:
-        return search_result
-
-    # Step 2: Fetch transcripts for top N by views
+    started = time.monotonic()
     transcript_limit = TRANSCRIPT_LIMITS.get(depth, TRANSCRIPT_LIMITS["default"])
-    top_ids = [item["video_id"] for item in items[:transcript_limit]]
-    transcripts = fetch_transcripts_parallel(top_ids)
-
-    # Step 3: Attach transcripts to items
-    for item in items:
-        vid = item["video_id"]
-        transcript = transcripts.get(vid)
-        item["transcript_snippet"] = transcript or ""
+    early_limit = transcript_limit * EARLY_TRANSCRIPT_FACTOR
+    temp_dir = tempfile.mkdtemp(prefix="last30days-yt-")
+    executor = ThreadPoolExecutor(max_workers=TRANSCRIPT_WORKERS)
+    futures: Dict[str, Future] = {}
+    seen: List[Dict[str, Any]] = []
+
+    def dispatch(video_ids: List[str]):
+        future = executor.submit(_fetch_chunk, video_ids, temp_dir)
+        for vid in video_ids:
+            futures[vid] = future
+
+    def on_video(item: Dict[str, Any]):
+        seen.append(item)
+        if len(futures) >= early_limit:
+            return
+        if item["date"] and item["date"] < from_date:
+            return  # Likely dropped by the soft date filter
+        views = item["engagement"]["views"]
+        rank = sum(1 for other in seen if other["engagement"]["views"] > views)
+        if rank < transcript_limit and item["video_id"] not in futures:
+            dispatch([item["video_id"]])
 
-    return {"items": items}
+    try:
+        # Step 1: Search, dispatching transcripts for strong candidates
+        search_result = search_youtube(topic, from_date, to_date, depth, on_video=on_video)
+        items = search_result.get("items", [])
+
+        if not items:
+            return search_result
+
+        # Step 2: Fetch transcripts for top N by views (reusing early fetches)
+        top_ids = [item["video_id"] for item in items[:transcript_limit]]
+        remaining = [vid for vid in top_ids if vid not in futures]
+        for chunk in _chunks(remaining):
+            dispatch(chunk)
+        _log(f"Fetching transcripts for {len(top_ids)} videos "
+             f"({len(top_ids) - len(remaining)} started during search)")
+
+        wait_for = TRANSCRIPT_WAIT
+        if budget is not None:
+            wait_for = max(0.0, min(wait_for, started + budget - time.monotonic()))
+        done, not_done = wait({futures[vid] for vid in top_ids}, timeout=wait_for)
+        if not_done:
+            _log(f"{len(not_done)} transcript fetches still running after {wait_for:.0f}s, skipping them")
+
+        transcripts = {}
+        for vid in top_ids:
+            future = futures[vid]
+            try:
+                transcripts[vid] = future.result().get(vid) if future in done else None
+            except Exception:
+                transcripts[vid] = None
+        got = sum(1 for v in transcripts.values() if v)
+        _log(f"Got transcripts for {got}/{len(top_ids)} videos")
+
+        # Step 3: Attach transcripts to items
+        for item in items:
+            vid = item["video_id"]
+            transcript = transcripts.get(vid)
+            item["transcript_snippet"] = transcript or ""
+
+        return {"items": items}
+    finally:
+        # Don't wait on speculative fetches that missed the final top N (or
+        # the wait); remove the temp dir once they finish
+        _release_fetches(executor, list(futures.values()), temp_dir)
 
 
 def parse_youtube_response(response: Dict[str, Any]) -> List[Dict[str, Any]]:
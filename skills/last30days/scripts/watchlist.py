@@ -28,6 +28,9 @@ sys.path.insert(0, str(SCRIPT_DIR))
 
 import store
 
+# Topics researched at once by run-all (see last30days.py --batch-concurrency)
+BATCH_CONCURRENCY = 3
+
 
 def cmd_add(args):
     """Add a topic to the watchlist."""
@@ -102,19 +105,19 @@ def cmd_run_all(args):
     budget_limit = float(store.get_setting("daily_budget", "5.00"))
     results = []
 
-    for topic in enabled:
-        # Budget guard
+    # Topics run concurrently in waves of BATCH_CONCURRENCY, so the budget
+    # guard is checked before each wave rather than before each topic
+    for i in range(0, len(enabled), BATCH_CONCURRENCY):
+        wave = enabled[i:i + BATCH_CONCURRENCY]
         daily_cost = store.get_daily_cost()
         if daily_cost >= budget_limit:
-            results.append({
+            results.extend({
                 "topic": topic["name"],
                 "status": "skipped",
                 "reason": f"Budget exceeded: ${daily_cost:.2f}/${budget_limit:.2f}",
-            })
+            } for topic in wave)
             continue
-
-        result = _run_topic(topic)
-        results.append(result)
+        results.extend(_run_topics(wave))
 
     print(json.dumps({
         "action": "run_all",
@@ -124,22 +127,112 @@ def cmd_run_all(args):
     }, default=str))
 
 
+def _search_term(topic: dict) -> str:
+    """Prefer custom search_queries over topic name (#40)."""
+    search_queries = json.loads(topic["search_queries"]) if topic.get("search_queries") else None
+    return search_queries[0] if search_queries else topic["name"]
+
+
+def _findings_from_research(data: dict) -> list:
+    """Convert last30days JSON output to findings format."""
+    findings = []
+    for item in data.get("reddit", []):
+        findings.append({
+            "source": "reddit",
+            "url": item.get("url", ""),
+            "title": item.get("title", ""),
+            "author": item.get("author", ""),
+            "content": item.get("title", ""),
+            "summary": item.get("top_comments_summary", ""),
+            "engagement_score": item.get("upvotes", 0),
+            "relevance_score": item.get("relevance", 0),
+        })
+    for item in data.get("x", []):
+        findings.append({
+            "source": "x",
+            "url": item.get("url", ""),
+            "title": item.get("text", "")[:100],
+            "author": item.get("author_handle", ""),
+            "content": item.get("text", ""),
+            "engagement_score": (item.get("engagement") or {}).get("likes", 0),
+            "relevance_score": item.get("relevance", 0),
+        })
+    for item in data.get("youtube", []):
+        findings.append({
+            "source": "youtube",
+            "url": item.get("url", ""),
+            "title": item.get("title", ""),
+            "author": item.get("channel_name", item.get("channel", "")),
+            "content": item.get("transcript_snippet", "") or item.get("title", ""),
+            "engagement_score": (item.get("engagement") or {}).get("views", 0),
+            "relevance_score": item.get("relevance", 0),
+        })
+    for item in data.get("tiktok", []):
+        findings.append({
+            "source": "tiktok",
+            "url": item.get("url", ""),
+            "title": (item.get("caption_snippet", "") or "")[:120],
+            "author": item.get("author", ""),
+            "content": item.get("caption_snippet", ""),
+            "engagement_score": (item.get("engagement") or {}).get("views", 0),
+            "relevance_score": item.get("relevance", 0),
+        })
+    for item in data.get("instagram", []):
+        findings.append({
+            "source": "instagram",
+            "url": item.get("url", ""),
+            "title": (item.get("caption_snippet", "") or "")[:120],
+            "author": item.get("author_name", ""),
+            "content": item.get("caption_snippet", ""),
+            "engagement_score": (item.get("engagement") or {}).get("views", 0),
+            "relevance_score": item.get("relevance", 0),
+        })
+    return findings
+
+
+def _store_research(topic: dict, run_id: int, data: dict, duration: float) -> dict:
+    """Store findings from one topic's research output and close its run."""
+    counts = store.store_findings(run_id, topic["id"], _findings_from_research(data))
+
+    store.update_run(
+        run_id,
+        status="completed",
+        duration_seconds=duration,
+        findings_new=counts["new"],
+        findings_updated=counts["updated"],
+    )
+
+    return {
+        "topic": topic["name"],
+        "status": "completed",
+        "new": counts["new"],
+        "updated": counts["updated"],
+        "duration": duration,
+    }
+
+
+def _fail_run(topic: dict, run_id: int, message: str, error: str, duration: float) -> dict:
+    """Mark a run failed and build its result entry."""
+    store.update_run(
+        run_id, status="failed",
+        error_message=message[:500],
+        duration_seconds=duration,
+    )
+    return {"topic": topic["name"], "status": "failed", "error": error, "duration": duration}
+
+
 def _run_topic(topic: dict) -> dict:
     """Run research for a single topic and store findings."""
     start_time = time.time()
-    topic_id = topic["id"]
 
     # Record the run
-    run_id = store.record_run(topic_id, source_mode="both", status="running")
+    run_id = store.record_run(topic["id"], source_mode="both", status="running")
 
     try:
-        # Prefer custom search_queries over topic name (#40)
-        search_queries = json.loads(topic["search_queries"]) if topic.get("search_queries") else None
-        search_term = search_queries[0] if search_queries else topic["name"]
         cmd = [
             sys.executable,
             str(SCRIPT_DIR / "last30days.py"),
-            search_term,
+            _search_term(topic),
             "--emit=json",
         ]
         result = subprocess.run(
@@ -152,121 +245,85 @@ def _run_topic(topic: dict) -> dict:
         duration = time.time() - start_time
 
         if result.returncode != 0:
-            store.update_run(
-                run_id,
-                status="failed",
-                error_message=result.stderr[:500],
-                duration_seconds=duration,
-            )
-            return {
-                "topic": topic["name"],
-                "status": "failed",
-                "error": result.stderr[:200],
-                "duration": duration,
-            }
-
-        # Parse research output
-        data = json.loads(result.stdout)
-
-        # Convert research items to findings format
-        findings = []
-        for item in data.get("reddit", []):
-            findings.append({
-                "source": "reddit",
-                "url": item.get("url", ""),
-                "title": item.get("title", ""),
-                "author": item.get("author", ""),
-                "content": item.get("title", ""),
-                "summary": item.get("top_comments_summary", ""),
-                "engagement_score": item.get("upvotes", 0),
-                "relevance_score": item.get("relevance", 0),
-            })
-        for item in data.get("x", []):
-            findings.append({
-                "source": "x",
-                "url": item.get("url", ""),
-                "title": item.get("text", "")[:100],
-                "author": item.get("author_handle", ""),
-                "content": item.get("text", ""),
-                "engagement_score": (item.get("engagement") or {}).get("likes", 0),
-                "relevance_score": item.get("relevance", 0),
-            })
-        for item in data.get("youtube", []):
-            findings.append({
-                "source": "youtube",
-                "url": item.get("url", ""),
-                "title": item.get("title", ""),
-                "author": item.get("channel_name", item.get("channel", "")),
-                "content": item.get("transcript_snippet", "") or item.get("title", ""),
-                "engagement_score": (item.get("engagement") or {}).get("views", 0),
-                "relevance_score": item.get("relevance", 0),
-            })
-        for item in data.get("tiktok", []):
-            findings.append({
-                "source": "tiktok",
-                "url": item.get("url", ""),
-                "title": (item.get("caption_snippet", "") or "")[:120],
-                "author": item.get("author", ""),
-                "content": item.get("caption_snippet", ""),
-                "engagement_score": (item.get("engagement") or {}).get("views", 0),
-                "relevance_score": item.get("relevance", 0),
-            })
-        for item in data.get("instagram", []):
-            findings.append({
-                "source": "instagram",
-                "url": item.get("url", ""),
-                "title": (item.get("caption_snippet", "") or "")[:120],
-                "author": item.get("author_name", ""),
-                "content": item.get("caption_snippet", ""),
-                "engagement_score": (item.get("engagement") or {}).get("views", 0),
-                "relevance_score": item.get("relevance", 0),
-            })
-
-        # Store with dedup
-        counts = store.store_findings(run_id, topic_id, findings)
-
-        store.update_run(
-            run_id,
-            status="completed",
-            duration_seconds=duration,
-            findings_new=counts["new"],
-            findings_updated=counts["updated"],
-        )
+            return _fail_run(topic, run_id, result.stderr, result.stderr[:200], duration)
 
-        return {
-            "topic": topic["name"],
-            "status": "completed",
-            "new": counts["new"],
-            "updated": counts["updated"],
-            "duration": duration,
-        }
+        return _store_research(topic, run_id, json.loads(result.stdout), duration)
 
     except subprocess.TimeoutExpired:
-        duration = time.time() - start_time
-        store.update_run(
-            run_id, status="failed",
-            error_message="Research timed out after 300s",
-            duration_seconds=duration,
-        )
-        return {"topic": topic["name"], "status": "failed", "error": "timeout"}
+        return _fail_run(topic, run_id, "Research timed out after 300s", "timeout", time.time() - start_time)
 
     except json.JSONDecodeError as e:
-        duration = time.time() - start_time
-        store.update_run(
-            run_id, status="failed",
-            error_message=f"Invalid JSON output: {e}",
-            duration_seconds=duration,
-        )
-        return {"topic": topic["name"], "status": "failed", "error": f"parse error: {e}"}
+        return _fail_run(topic, run_id, f"Invalid JSON output: {e}", f"parse error: {e}", time.time() - start_time)
 
     except Exception as e:
-        duration = time.time() - start_time
-        store.update_run(
-            run_id, status="failed",
-            error_message=str(e)[:500],
-            duration_seconds=duration,
+        return _fail_run(topic, run_id, str(e), str(e), time.time() - start_time)
+
+
+def _parse_batch_output(stdout) -> dict:
+    """Map topic -> research doc from batch NDJSON output (complete lines only)."""
+    if isinstance(stdout, bytes):
+        stdout = stdout.decode("utf-8", errors="replace")
+    docs = {}
+    for line in (stdout or "").splitlines():
+        try:
+            doc = json.loads(line)
+        except json.JSONDecodeError:
+            continue
+        docs[doc.get("topic")] = doc
+    return docs
+
+
+def _run_topics(topics: list) -> list:
+    """Run research for several topics in one last30days batch process.
+
+    Config, source probes and model selection happen once for the whole
+    batch instead of once per topic, and topics run concurrently. If the
+    batch times out, topics that had already finished are still stored.
+    """
+    start_time = time.time()
+    run_ids = {t["id"]: store.record_run(t["id"], source_mode="both", status="running") for t in topics}
+    terms = [_search_term(t) for t in topics]
+    timeout = 300 * -(-len(set(terms)) // BATCH_CONCURRENCY)
+
+    docs = {}
+    stderr = ""
+    try:
+        cmd = [
+            sys.executable,
+            str(SCRIPT_DIR / "last30days.py"),
+            "--topics-file", "-",
+            f"--batch-concurrency={BATCH_CONCURRENCY}",
+        ]
+        result = subprocess.run(
+            cmd,
+            input="\n".join(terms) + "\n",
+            capture_output=True,
+            text=True,
+            timeout=timeout,
         )
-        return {"topic": topic["name"], "status": "failed", "error": str(e)}
+        stderr = result.stderr
+        docs = _parse_batch_output(result.stdout)
+    except subprocess.TimeoutExpired as e:
+        # Each topic is one line written when it finishes, so whatever
+        # arrived before the timeout is usable
+        docs = _parse_batch_output(e.stdout)
+        stderr = f"Research timed out after {timeout}s"
+
+    duration = time.time() - start_time
+    results = []
+    for topic, term in zip(topics, terms):
+        run_id = run_ids[topic["id"]]
+        doc = docs.get(term)
+        try:
+            if doc is None:
+                results.append(_fail_run(topic, run_id, stderr or "No output for topic", (stderr or "no output")[:200], duration))
+            elif doc.get("error"):
+                results.append(_fail_run(topic, run_id, doc["error"], doc["error"][:200], duration))
+            else:
+                results.append(_store_research(topic, run_id, doc, duration))
+        except Exception as e:
+            results.append(_fail_run(topic, run_id, str(e), str(e), duration))
+    return results
 
 
 def cmd_config(args):
@@ -0,0 +1,66 @@
+"""Tests for multi-topic batch mode (--topics-file)."""
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+import last30days
+
+
+class TestLoadTopicsFile(unittest.TestCase):
+    def test_skips_blanks_comments_and_duplicates(self):
+        with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False) as f:
+            f.write("ai agents\n\n# weekly\n  rust async  \nai agents\n")
+        try:
+            self.assertEqual(last30days.load_topics_file(f.name), ["ai agents", "rust async"])
+        finally:
+            Path(f.name).unlink()
+
+    def test_reads_stdin(self):
+        with mock.patch.object(sys, "stdin") as stdin:
+            stdin.read.return_value = "one\ntwo\n"
+            self.assertEqual(last30days.load_topics_file("-"), ["one", "two"])
+
+
+class TestRunBatch(unittest.TestCase):
+    def _run(self, topics, **kwargs):
+        return last30days.run_batch(
+            topics, "reddit", {}, {"openai": "gpt", "xai": "grok"},
+            "2026-01-01", "2026-01-31", "quick", "reddit-only", mock=True,
+            do_hackernews=False, do_bluesky=False, do_truthsocial=False,
+            do_polymarket=False, **kwargs,
+        )
+
+    def test_results_in_input_order(self):
+        seen = []
+        batch = self._run(
+            ["alpha", "beta", "gamma"], concurrency=2,
+            on_result=lambda topic, report, error: seen.append(topic),
+        )
+        self.assertEqual([topic for topic, _, _ in batch], ["alpha", "beta", "gamma"])
+        self.assertEqual(sorted(seen), ["alpha", "beta", "gamma"])
+        for topic, report, error in batch:
+            self.assertIsNone(error)
+            self.assertEqual(report.topic, topic)
+
+    def test_failed_topic_does_not_sink_batch(self):
+        real = last30days.run_research
+
+        def flaky(topic, *args, **kwargs):
+            if topic == "bad":
+                raise RuntimeError("boom")
+            return real(topic, *args, **kwargs)
+
+        with mock.patch.object(last30days, "run_research", side_effect=flaky):
+            batch = self._run(["good", "bad"])
+        self.assertIsNotNone(batch[0][1])
+        self.assertIsNone(batch[1][1])
+        self.assertIn("boom", batch[1][2])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,10 @@
 """Tests for bird_x module."""
 
+import os
+import shutil
 import sys
+import threading
+import time
 import unittest
 from pathlib import Path
 from unittest import mock
@@ -53,5 +57,160 @@ class TestBirdSearchRetries(unittest.TestCase):
         self.assertEqual(run_mock.call_count, 1)
 
 
+class TestSearchHandles(unittest.TestCase):
+    def test_concurrent_and_capped(self):
+        active = [0]
+        peak = [0]
+        lock = threading.Lock()
+
+        def fake_spawn(cmd, timeout, cancel=None):
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.1)
+            with lock:
+                active[0] -= 1
+            handle = cmd[2].split()[0][len("from:"):]
+            return [{"id": handle, "text": "t", "url": f"https://x.com/{handle}/status/1"}]
+
+        streamed = []
+        handles = [f"h{i}" for i in range(bird_x.BIRD_MAX_CONCURRENCY + 2)]
+        with mock.patch.object(bird_x, "_worker_call", return_value=None), \
+             mock.patch.object(bird_x, "_spawn_bird_search", side_effect=fake_spawn):
+            items = bird_x.search_handles(handles, "topic", "2026-01-01", on_items=streamed.extend)
+
+        self.assertEqual(peak[0], bird_x.BIRD_MAX_CONCURRENCY)
+        self.assertEqual(len(items), len(handles))
+        self.assertEqual(len(streamed), len(handles))
+
+    def test_failed_handle_skipped(self):
+        def fake_run(query, count, timeout):
+            if "from:bad" in query:
+                return {"error": "boom", "items": []}
+            return [{"id": "1", "text": "ok", "url": "https://x.com/good/status/1"}]
+
+        with mock.patch.object(bird_x, "_run_bird_search", side_effect=fake_run):
+            items = bird_x.search_handles(["good", "bad"], None, "2026-01-01")
+        self.assertEqual(len(items), 1)
+
+
+@unittest.skipUnless(shutil.which("node"), "node not installed")
+class TestBirdWorker(unittest.TestCase):
+    """The long-lived bird-search.mjs --worker process."""
+
+    def setUp(self):
+        bird_x._stop_worker()
+        patcher = mock.patch.dict(os.environ, {"AUTH_TOKEN": "tok", "CT0": "ct0", "LAST30DAYS_BIRD_WORKER": "1"})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(bird_x._stop_worker)
+
+    def test_whoami_reuses_one_process(self):
+        self.assertEqual(bird_x.is_bird_authenticated(), "env AUTH_TOKEN")
+        worker = bird_x._worker
+        self.assertEqual(bird_x.is_bird_authenticated(), "env AUTH_TOKEN")
+        self.assertIs(bird_x._worker, worker)
+
+    def test_concurrent_requests_matched_by_id(self):
+        worker = bird_x._BirdWorker()
+        self.addCleanup(worker.close)
+        replies = {}
+
+        def call(op):
+            replies[op] = worker.call({"op": op}, 15)
+
+        threads = [threading.Thread(target=call, args=(op,)) for op in ("whoami", "bogus")]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join(20)
+        self.assertEqual(replies["whoami"]["result"], "env AUTH_TOKEN")
+        self.assertFalse(replies["bogus"]["ok"])
+
+    def test_dead_worker_falls_back_to_spawn(self):
+        worker = bird_x._get_worker()
+        worker._proc.kill()
+        worker._proc.wait()
+        with mock.patch.object(bird_x, "WORKER_MAX_RESTARTS", 0), \
+             mock.patch.object(bird_x, "_worker_starts", 1), \
+             mock.patch.object(bird_x, "_spawn_bird_search", return_value=[]) as spawn:
+            bird_x._run_bird_search("q since:2026-01-01", 5, 5)
+        spawn.assert_called_once()
+
+
+class TestSpeculativeSearch(unittest.TestCase):
+    """search_x(speculative=True) runs fallbacks alongside the primary query."""
+
+    def _run(self, results, delays=None):
+        delays = delays or {}
+
+        def fake_run(query, count, timeout, cancel=None):
+            terms = query.split(" since:")[0]
+            time.sleep(delays.get(terms, 0))
+            return results.get(terms, [])
+
+        with mock.patch.object(bird_x, "_extract_core_subject", return_value="codex skill plugin"), \
+             mock.patch.object(bird_x, "_run_bird_search", side_effect=fake_run) as run_mock:
+            started = time.monotonic()
+            response = bird_x.search_x(
+                "best codex skill plugin", "2026-01-01", "2026-01-31",
+                depth="quick", speculative=True,
+            )
+            return response, time.monotonic() - started, run_mock
+
+    def _tweet(self, tid):
+        return [{"id": tid, "text": "t", "url": f"https://x.com/a/status/{tid}"}]
+
+    def test_primary_wins_when_non_empty(self):
+        response, _, _ = self._run({
+            "codex skill plugin": self._tweet("1"),
+            "codex": self._tweet("3"),
+        })
+        self.assertEqual(response[0]["id"], "1")
+
+    def test_fallback_used_without_serial_wait(self):
+        # Primary and shorter come back empty after 0.3s; strongest has results
+        response, elapsed, _ = self._run(
+            {"codex": self._tweet("3")},
+            delays={"codex skill plugin": 0.3, "codex skill": 0.3, "codex": 0.3},
+        )
+        self.assertEqual(response[0]["id"], "3")
+        self.assertLess(elapsed, 0.8)
+
+    def test_does_not_wait_for_lower_priority(self):
+        response, elapsed, _ = self._run(
+            {"codex skill plugin": self._tweet("1")},
+            delays={"codex": 2},
+        )
+        self.assertEqual(response[0]["id"], "1")
+        self.assertLess(elapsed, 1.5)
+
+    def test_abandoned_queries_release_slots(self):
+        # Lower-priority queries wedge on the worker; once the primary wins
+        # they must give their slots back rather than sit out the timeout.
+        def fake_worker_call(request, timeout, cancel=None):
+            if request["query"].startswith("codex skill plugin "):
+                return {"ok": True, "result": self._tweet("1")}
+            cancel.wait(timeout)
+            return {"ok": False, "error": "Search cancelled"}
+
+        with mock.patch.object(bird_x, "_extract_core_subject", return_value="codex skill plugin"), \
+             mock.patch.object(bird_x, "_worker_call", side_effect=fake_worker_call):
+            response = bird_x.search_x(
+                "best codex skill plugin", "2026-01-01", "2026-01-31",
+                depth="quick", speculative=True,
+            )
+            self.assertEqual(response[0]["id"], "1")
+            acquired = []
+            try:
+                for _ in range(bird_x.BIRD_MAX_CONCURRENCY):
+                    acquired.append(bird_x._bird_slots.acquire(timeout=2))
+            finally:
+                for ok in acquired:
+                    if ok:
+                        bird_x._bird_slots.release()
+        self.assertEqual(acquired, [True] * bird_x.BIRD_MAX_CONCURRENCY)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,6 +1,11 @@
 """Tests for bluesky module."""
 
+import base64
+import json
+import os
 import sys
+import tempfile
+import time
 import unittest
 from pathlib import Path
 from unittest.mock import patch, MagicMock
@@ -174,5 +179,126 @@ class TestSearchBlueskyAuth(unittest.TestCase):
         self.assertEqual(search_call.kwargs.get("headers", {}), {"Authorization": "Bearer tok123"})
 
 
+def _jwt(exp_offset):
+    """Unsigned JWT whose exp is now + exp_offset seconds."""
+    payload = base64.urlsafe_b64encode(json.dumps({"exp": int(time.time()) + exp_offset}).encode())
+    return "eyJhbGciOiJub25lIn0." + payload.decode().rstrip("=") + ".sig"
+
+
+class TestSessionCache(unittest.TestCase):
+    HANDLE = "user.bsky.social"
+
+    def setUp(self):
+        bluesky._cached_token = None
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.path = Path(self._tmp.name) / "bluesky_sessions.json"
+        patcher = patch.object(bluesky, "_sessions_path", return_value=self.path)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        bluesky._cached_token = None
+
+    def _store(self, access, refresh):
+        self.path.write_text(json.dumps({self.HANDLE: {"accessJwt": access, "refreshJwt": refresh}}))
+
+    @patch("lib.bluesky.http.request")
+    def test_login_persists_session_privately(self, mock_request):
+        access, refresh = _jwt(3600), _jwt(86400)
+        mock_request.return_value = {"accessJwt": access, "refreshJwt": refresh}
+        self.assertEqual(bluesky._get_access_token(self.HANDLE, "pw"), access)
+        stored = json.loads(self.path.read_text())
+        self.assertEqual(stored[self.HANDLE], {"accessJwt": access, "refreshJwt": refresh})
+        self.assertEqual(os.stat(self.path).st_mode & 0o777, 0o600)
+
+    @patch("lib.bluesky.http.request")
+    def test_fresh_stored_token_needs_no_request(self, mock_request):
+        access = _jwt(3600)
+        self._store(access, _jwt(86400))
+        self.assertEqual(bluesky._get_access_token(self.HANDLE, "pw"), access)
+        mock_request.assert_not_called()
+
+    @patch("lib.bluesky.http.request")
+    def test_expired_access_uses_refresh_session(self, mock_request):
+        refresh = _jwt(86400)
+        self._store(_jwt(-10), refresh)
+        new_access, new_refresh = _jwt(3600), _jwt(86400 * 2)
+        mock_request.return_value = {"accessJwt": new_access, "refreshJwt": new_refresh}
+
+        self.assertEqual(bluesky._get_access_token(self.HANDLE, "pw"), new_access)
+        mock_request.assert_called_once()
+        self.assertEqual(mock_request.call_args[0][1], bluesky.BSKY_REFRESH_URL)
+        self.assertEqual(mock_request.call_args.kwargs["headers"], {"Authorization": f"Bearer {refresh}"})
+        self.assertEqual(json.loads(self.path.read_text())[self.HANDLE]["refreshJwt"], new_refresh)
+
+    @patch("lib.bluesky.http.request")
+    def test_failed_refresh_falls_back_to_login(self, mock_request):
+        self._store(_jwt(-10), _jwt(86400))
+        access = _jwt(3600)
+        mock_request.side_effect = [Exception("ExpiredToken"), {"accessJwt": access, "refreshJwt": _jwt(86400)}]
+        self.assertEqual(bluesky._get_access_token(self.HANDLE, "pw"), access)
+        self.assertEqual(mock_request.call_args[0][1], bluesky.BSKY_SESSION_URL)
+
+    @patch("lib.bluesky.http.request")
+    def test_search_401_refreshes_and_retries(self, mock_request):
+        self._store(_jwt(3600), _jwt(86400))
+        new_access = _jwt(3600)
+        mock_request.side_effect = [
+            bluesky.http.HTTPError("expired", status_code=401),
+            {"accessJwt": new_access, "refreshJwt": _jwt(86400)},
+            {"posts": [{"uri": "at://did/app.bsky.feed.post/abc"}]},
+        ]
+        config = {"BSKY_HANDLE": self.HANDLE, "BSKY_APP_PASSWORD": "pw"}
+        result = bluesky.search_bluesky("test", "2026-01-01", "2026-03-09", config=config)
+        self.assertEqual(len(result["posts"]), 1)
+        self.assertEqual(mock_request.call_args_list[1][0][1], bluesky.BSKY_REFRESH_URL)
+        self.assertEqual(mock_request.call_args.kwargs["headers"], {"Authorization": f"Bearer {new_access}"})
+
+
+class TestDeepPagination(unittest.TestCase):
+    """Deep mode follows the searchPosts cursor, prefetching the next page."""
+
+    CONFIG = {"BSKY_HANDLE": "user.bsky.social", "BSKY_APP_PASSWORD": "pw"}
+
+    def setUp(self):
+        patcher = patch.object(bluesky, "_get_access_token", return_value="tok")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    @staticmethod
+    def _page(date, cursor=None, n=2):
+        page = {"posts": [{"uri": f"at://did/app.bsky.feed.post/{date}-{i}", "indexedAt": f"{date}T00:00:00Z"}
+                          for i in range(n)]}
+        if cursor:
+            page["cursor"] = cursor
+        return page
+
+    @patch("lib.bluesky.http.request")
+    def test_follows_cursor_up_to_depth_pages(self, mock_request):
+        mock_request.side_effect = [
+            self._page("2026-03-01", "c1"), self._page("2026-02-20", "c2"), self._page("2026-02-10", "c3"),
+        ]
+        result = bluesky.search_bluesky("test", "2026-02-01", "2026-03-09", depth="deep", config=self.CONFIG)
+        self.assertEqual(len(result["posts"]), 6)
+        self.assertEqual(mock_request.call_count, bluesky.DEPTH_PAGES["deep"])
+        self.assertIn("cursor=c1", mock_request.call_args_list[1][0][1])
+        self.assertIn("cursor=c2", mock_request.call_args_list[2][0][1])
+
+    @patch("lib.bluesky.http.request")
+    def test_stops_when_page_predates_range(self, mock_request):
+        mock_request.side_effect = [self._page("2026-01-01", "c1"), self._page("2025-12-01", "c2")]
+        result = bluesky.search_bluesky("test", "2026-02-01", "2026-03-09", depth="deep", config=self.CONFIG)
+        self.assertEqual(len(result["posts"]), 2)
+        self.assertLessEqual(mock_request.call_count, 2)
+
+    @patch("lib.bluesky.http.request")
+    def test_later_page_error_keeps_earlier_pages(self, mock_request):
+        mock_request.side_effect = [self._page("2026-03-01", "c1"), bluesky.http.HTTPError("boom", status_code=500)]
+        result = bluesky.search_bluesky("test", "2026-02-01", "2026-03-09", depth="deep", config=self.CONFIG)
+        self.assertEqual(len(result["posts"]), 2)
+        self.assertNotIn("error", result)
+
+
 if __name__ == "__main__":
     unittest.main()
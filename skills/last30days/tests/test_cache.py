@@ -1,8 +1,13 @@
 """Tests for cache module."""
 
+import os
 import sys
+import tempfile
+import threading
+import time
 import unittest
 from pathlib import Path
+from unittest import mock
 
 # Add lib to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
@@ -54,6 +59,32 @@ class TestModelCache(unittest.TestCase):
         # May be None or a cached value, but should not error
         self.assertTrue(result is None or isinstance(result, str))
 
+    def test_concurrent_updates_keep_every_provider(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        load = cache.load_model_cache
+
+        def slow_load():
+            data = load()
+            time.sleep(0.05)  # Widen the read-modify-write window
+            return data
+
+        with mock.patch.dict(os.environ, {"LAST30DAYS_CACHE_DIR": tmp.name}), \
+             mock.patch.object(cache, "CACHE_DIR", Path(tmp.name)), \
+             mock.patch.object(cache, "MODEL_CACHE_FILE", Path(tmp.name) / "model_selection.json"), \
+             mock.patch.object(cache, "load_model_cache", side_effect=slow_load):
+            threads = [
+                threading.Thread(target=cache.set_cached_model, args=(provider, f"{provider}-model"))
+                for provider in ("openai", "xai")
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join(5)
+            saved = load()
+        self.assertEqual(saved["openai"], "openai-model")
+        self.assertEqual(saved["xai"], "xai-model")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,84 @@
+"""Tests for cooperative global-timeout handling in last30days.py."""
+
+import sys
+import time
+import threading
+import unittest
+from pathlib import Path
+from unittest import mock
+
+# Add scripts to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+import last30days
+
+
+class TestDeadline(unittest.TestCase):
+    """Tests for deadline_passed() and time_left()."""
+
+    def setUp(self):
+        self._saved = (last30days._deadline, last30days._deadline_seconds)
+        last30days._deadline_hit.clear()
+
+    def tearDown(self):
+        last30days._deadline, last30days._deadline_seconds = self._saved
+        last30days._deadline_hit.clear()
+
+    def test_no_deadline(self):
+        last30days._deadline = None
+        self.assertFalse(last30days.deadline_passed())
+        self.assertEqual(last30days.time_left(30), 30)
+
+    def test_caps_wait_at_remaining_time(self):
+        last30days._deadline = time.monotonic() + 5
+        self.assertLessEqual(last30days.time_left(30), 5)
+        self.assertEqual(last30days.time_left(1), 1)
+        self.assertFalse(last30days.deadline_passed())
+
+    def test_past_deadline(self):
+        last30days._deadline = time.monotonic() - 1
+        self.assertTrue(last30days.deadline_passed())
+        self.assertEqual(last30days.time_left(30), 0)
+
+    def test_event_marks_deadline(self):
+        last30days._deadline = time.monotonic() + 60
+        last30days._deadline_hit.set()
+        self.assertTrue(last30days.deadline_passed())
+
+
+class TestChildRegistry(unittest.TestCase):
+    """lib modules import last30days to register children; it must be this module."""
+
+    def test_register_and_unregister(self):
+        last30days.register_child_pid(999999)
+        self.assertIn(999999, last30days._child_pids)
+        last30days.unregister_child_pid(999999)
+        self.assertNotIn(999999, last30days._child_pids)
+
+
+class TestSupplementalDeadline(unittest.TestCase):
+    """Phase 2 keeps whatever streamed in before its deadline."""
+
+    def test_partial_results_kept(self):
+        release = threading.Event()
+
+        def slow_subreddits(subs, topic, from_date, to_date, count_per, on_items=None):
+            on_items([{"url": "https://www.reddit.com/r/a/comments/new/x/", "title": "early"}])
+            release.wait(5)  # Second subreddit never makes the deadline
+            return []
+
+        entities = {"x_handles": [], "reddit_subreddits": ["a", "b"]}
+        with mock.patch.object(last30days, "SUPPLEMENTAL_TIMEOUT", 0.3), \
+             mock.patch.object(last30days.entity_extract, "extract_entities", return_value=entities), \
+             mock.patch.object(last30days.openai_reddit, "search_subreddits", side_effect=slow_subreddits):
+            reddit, x = last30days._run_supplemental(
+                "topic", [{"url": "https://www.reddit.com/r/a/comments/old/x/"}], [],
+                "2026-01-01", "2026-01-31", "default", "xai",
+            )
+            release.set()
+        self.assertEqual([item["title"] for item in reddit], ["early"])
+        self.assertEqual(x, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
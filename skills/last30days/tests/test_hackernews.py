@@ -3,11 +3,12 @@
 import sys
 import unittest
 from pathlib import Path
+from unittest import mock
 
 # Add lib to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
 
-from lib import hackernews, normalize, schema, score
+from lib import hackernews, http, normalize, schema, score
 
 
 class TestDateToUnix(unittest.TestCase):
@@ -215,5 +216,121 @@ class TestSortItemsWithHN(unittest.TestCase):
         self.assertIsInstance(sorted_items[2], schema.HackerNewsItem)
 
 
+def _comment_hit(object_id, story_id, parent_id=None, text="A useful comment. More.", points=None):
+    return {
+        "objectID": object_id,
+        "story_id": story_id,
+        "parent_id": parent_id if parent_id is not None else story_id,
+        "author": "user" + str(object_id),
+        "comment_text": text,
+        "points": points,
+    }
+
+
+class TestFetchCommentsBatch(unittest.TestCase):
+    def test_one_search_grouped_by_story(self):
+        response = {"nbHits": 3, "hits": [
+            _comment_hit(11, 1, text="First story comment. Details."),
+            _comment_hit(12, 1, parent_id=11, text="Nested reply"),
+            _comment_hit(21, 2, text="<p>Second &amp; story</p>"),
+        ]}
+        with mock.patch.object(http, "request", return_value=response) as req:
+            result = hackernews.fetch_comments_batch(["1", "2", "3"])
+        req.assert_called_once()
+        self.assertIn("tags=comment%2C%28story_1%2Cstory_2%2Cstory_3%29", req.call_args[0][1])
+        self.assertEqual([c["author"] for c in result["1"]["comments"]], ["user11"])
+        self.assertEqual(result["1"]["comment_insights"], ["First story comment"])
+        self.assertEqual(result["2"]["comments"][0]["text"], "Second & story")
+        self.assertEqual(result["3"], {"comments": [], "comment_insights": []})
+
+    def test_full_page_retries_short_stories_once(self):
+        first = {"nbHits": 500, "hits": [_comment_hit(i, 1) for i in range(10, 15)]}
+        second = {"nbHits": 1, "hits": [_comment_hit(21, 2)]}
+        with mock.patch.object(http, "request", side_effect=[first, second]) as req:
+            result = hackernews.fetch_comments_batch(["1", "2"], max_comments=5)
+        self.assertEqual(req.call_count, 2)
+        self.assertIn("story_2", req.call_args[0][1])
+        self.assertNotIn("story_1", req.call_args[0][1])
+        self.assertEqual(len(result["1"]["comments"]), 5)
+        self.assertEqual(len(result["2"]["comments"]), 1)
+
+    def test_all_stories_short_fetches_next_page(self):
+        first = {"nbHits": 500, "hits": [_comment_hit(i, 1, parent_id=99) for i in range(10, 15)]}
+        second = {"nbHits": 500, "hits": [_comment_hit(21, 1), _comment_hit(31, 2)]}
+        with mock.patch.object(http, "request", side_effect=[first, second]) as req:
+            result = hackernews.fetch_comments_batch(["1", "2"], max_comments=5)
+        self.assertIn("page=0", req.call_args_list[0][0][1])
+        self.assertIn("page=1", req.call_args_list[1][0][1])
+        self.assertEqual(len(result["1"]["comments"]), 1)
+        self.assertEqual(len(result["2"]["comments"]), 1)
+
+    def test_enrich_falls_back_to_per_story(self):
+        items = [{"object_id": "1", "engagement": {"points": 10}}]
+        per_story = {"comments": [{"author": "a", "text": "t", "points": 1}], "comment_insights": ["t"]}
+        with mock.patch.object(http, "request", side_effect=http.HTTPError("down", status_code=503)), \
+             mock.patch.object(hackernews, "_fetch_item_comments", return_value=per_story) as fetch:
+            hackernews.enrich_top_stories(items)
+        fetch.assert_called_once_with("1")
+        self.assertEqual(items[0]["top_comments"], per_story["comments"])
+
+
+def _story_hit(object_id):
+    return {"objectID": object_id, "title": f"Story {object_id}", "points": 10, "created_at_i": 1767225600}
+
+
+class TestMultiQuerySearch(unittest.TestCase):
+    def test_expand_queries(self):
+        self.assertEqual(
+            hackernews._expand_queries("what are people saying about the Rust compiler"),
+            ["what are people saying about the Rust compiler", "the Rust compiler", "Rust compiler"],
+        )
+        self.assertEqual(hackernews._expand_queries("sqlite"), ["sqlite"])
+
+    def test_runs_both_endpoints_and_merges_by_object_id(self):
+        lists = {
+            ("search", "the rust compiler"): [_story_hit("a"), _story_hit("b")],
+            ("search_by_date", "the rust compiler"): [_story_hit("c"), _story_hit("b")],
+            ("search", "rust compiler"): [_story_hit("b"), _story_hit("d")],
+            ("search_by_date", "rust compiler"): http.HTTPError("down", status_code=503),
+        }
+
+        def fake_request(method, url, timeout=None):
+            from urllib.parse import parse_qs, urlparse
+            parsed = urlparse(url)
+            result = lists[(parsed.path.rsplit("/", 1)[-1], parse_qs(parsed.query)["query"][0])]
+            if isinstance(result, Exception):
+                raise result
+            return {"hits": result}
+
+        with mock.patch.object(http, "request", side_effect=fake_request) as req:
+            response = hackernews.search_hackernews("the rust compiler", "2026-01-01", "2026-01-31")
+        self.assertEqual(req.call_count, 4)
+        ids = [h["objectID"] for h in response["hits"]]
+        self.assertEqual(ids[0], "b")  # Ranked in three lists
+        self.assertEqual(sorted(ids), ["a", "b", "c", "d"])
+        self.assertNotIn("error", response)
+
+    def test_relevance_only_hit_beats_by_date_only_hit(self):
+        lists = {
+            "search": [_story_hit("x"), _story_hit("relevant")],
+            "search_by_date": [_story_hit("recent"), _story_hit("x")],
+        }
+
+        def fake_request(method, url, timeout=None):
+            from urllib.parse import urlparse
+            return {"hits": lists[urlparse(url).path.rsplit("/", 1)[-1]]}
+
+        with mock.patch.object(http, "request", side_effect=fake_request):
+            response = hackernews.search_hackernews("sqlite", "2026-01-01", "2026-01-31")
+        ids = [h["objectID"] for h in response["hits"]]
+        self.assertEqual(ids, ["x", "relevant", "recent"])
+
+    def test_all_searches_failing_reports_error(self):
+        with mock.patch.object(http, "request", side_effect=http.HTTPError("down", status_code=503)):
+            response = hackernews.search_hackernews("sqlite", "2026-01-01", "2026-01-31")
+        self.assertEqual(response["hits"], [])
+        self.assertIn("down", response["error"])
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,131 @@
+"""Tests for connection warm-up (http.warm_connections and its use in last30days.py)."""
+
+import socket
+import sys
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from lib import env, http
+
+
+class _WarmStateTestCase(unittest.TestCase):
+    def setUp(self):
+        for state in (http._dns_cache, http._tls_sessions, http._warmed):
+            patcher = mock.patch.dict(state, clear=True)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+
+class TestWarmConnection(_WarmStateTestCase):
+    def _connect(self, create_side_effect):
+        conn = http._WarmHTTPSConnection("api.example.com", timeout=5)
+        context = mock.Mock()
+        context.wrap_socket.return_value = "tls"
+        with mock.patch.object(http, "_get_ssl_context", return_value=context), \
+             mock.patch.object(socket, "create_connection", side_effect=create_side_effect) as create:
+            conn.connect()
+        return conn, create, context
+
+    def test_connect_uses_cached_address(self):
+        http._dns_cache[("api.example.com", 443)] = (time.monotonic(), [("10.0.0.1", 443)])
+        http._tls_sessions["api.example.com"] = "session"
+        sock = mock.Mock()
+        conn, create, context = self._connect([sock])
+        create.assert_called_once_with(("10.0.0.1", 443), 5, None)
+        context.wrap_socket.assert_called_once_with(
+            sock, server_hostname="api.example.com", session="session",
+        )
+        self.assertEqual(conn.sock, "tls")
+
+    def test_connect_falls_back_to_hostname(self):
+        http._dns_cache[("api.example.com", 443)] = (time.monotonic(), [("10.0.0.1", 443)])
+        conn, create, _ = self._connect([OSError("unreachable"), mock.Mock()])
+        self.assertEqual(create.call_args.args[0], ("api.example.com", 443))
+
+    def test_tunnelled_connection_left_to_base_class(self):
+        http._dns_cache[("proxy.local", 8080)] = (time.monotonic(), [("10.0.0.1", 8080)])
+        conn = http._WarmHTTPSConnection("proxy.local", 8080, timeout=5)
+        conn.set_tunnel("api.example.com")
+        with mock.patch.object(http.http.client.HTTPSConnection, "connect") as base_connect, \
+             mock.patch.object(socket, "create_connection") as create:
+            conn.connect()
+        base_connect.assert_called_once()
+        create.assert_not_called()
+
+    def test_expired_dns_answer_ignored(self):
+        stale = time.monotonic() - http.DNS_CACHE_TTL - 1
+        http._dns_cache[("api.example.com", 443)] = (stale, [("10.0.0.1", 443)])
+        with mock.patch.object(socket, "getaddrinfo",
+                               return_value=[(2, 1, 6, "", ("10.0.0.2", 443))]):
+            self.assertEqual(http._resolve("api.example.com", 443), [("10.0.0.2", 443)])
+
+    def test_recently_warmed_hosts_skipped(self):
+        with mock.patch.object(http, "_warm_host") as warm_host:
+            threads = http.warm_connections(["a.com", "b.com", "a.com"])
+            threads += http.warm_connections(["a.com", "c.com"])
+            for thread in threads:
+                thread.join(5)
+        self.assertEqual(len(threads), 3)
+        self.assertEqual(sorted(c.args[0] for c in warm_host.call_args_list), ["a.com", "b.com", "c.com"])
+
+    def test_rate_limited_host_takes_a_token(self):
+        limiter = mock.Mock()
+        conn = mock.Mock()
+        with mock.patch.dict(http._WARM_RATE_LIMITERS, {"www.reddit.com": limiter}), \
+             mock.patch.object(http, "_resolve"), \
+             mock.patch.object(http, "_WarmHTTPSConnection", return_value=conn):
+            http._warm_host("www.reddit.com", 5)
+            http._warm_host("hn.algolia.com", 5)
+        limiter.acquire.assert_called_once_with()
+        self.assertEqual(conn.request.call_count, 2)
+
+
+class TestPrewarmHosts(unittest.TestCase):
+    def setUp(self):
+        import last30days
+        self.prewarm_hosts = last30days._prewarm_hosts
+
+    def test_keyless_hosts_before_config(self):
+        self.assertEqual(
+            self.prewarm_hosts({}),
+            ["www.reddit.com", "hn.algolia.com", "gamma-api.polymarket.com"],
+        )
+
+    def test_keyed_hosts_follow_config(self):
+        config = {
+            "OPENAI_API_KEY": "k",
+            "OPENAI_AUTH_SOURCE": env.AUTH_SOURCE_CODEX,
+            "XAI_API_KEY": "x",
+            "SCRAPECREATORS_API_KEY": "s",
+            "BSKY_HANDLE": "me.bsky.social",
+            "BSKY_APP_PASSWORD": "p",
+            "BRAVE_API_KEY": "b",
+        }
+        hosts = self.prewarm_hosts(config)
+        for host in ("chatgpt.com", "api.x.ai", "bsky.social",
+                     "public.api.bsky.app", "api.search.brave.com"):
+            self.assertIn(host, hosts)
+        self.assertNotIn("api.openai.com", hosts)
+        self.assertNotIn("truthsocial.com", hosts)
+
+    def test_scrapecreators_only_warmed_without_requests(self):
+        # With requests installed no ScrapeCreators call uses http's opener
+        import last30days
+        config = {"SCRAPECREATORS_API_KEY": "s"}
+        with mock.patch.object(last30days.reddit, "_requests", object()):
+            self.assertNotIn("api.scrapecreators.com", self.prewarm_hosts(config))
+        with mock.patch.object(last30days.reddit, "_requests", None):
+            self.assertIn("api.scrapecreators.com", self.prewarm_hosts(config))
+            self.assertNotIn("api.scrapecreators.com", self.prewarm_hosts(config, {"tiktok"}))
+
+    def test_search_flag_limits_hosts(self):
+        hosts = self.prewarm_hosts({"XAI_API_KEY": "x"}, {"hn", "x"})
+        self.assertEqual(hosts, ["api.x.ai", "hn.algolia.com"])
+
+
+if __name__ == "__main__":
+    unittest.main()
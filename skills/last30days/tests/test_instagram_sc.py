@@ -1,8 +1,11 @@
 """Tests for instagram.py — ScrapeCreators Instagram search module."""
 
 import sys
+import threading
+import time
 import unittest
 from pathlib import Path
+from unittest import mock
 
 # Add lib to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
@@ -84,5 +87,49 @@ class TestInstagramDepthConfig(unittest.TestCase):
         )
 
 
+class TestFetchCaptionsConcurrent(unittest.TestCase):
+    """Transcript pass runs concurrently under a budget."""
+
+    ITEMS = [
+        {"video_id": "fast", "text": "fast description", "url": "https://example.com/fast"},
+        {"video_id": "slow", "text": "slow description", "url": "https://example.com/slow"},
+        {"video_id": "nourl", "text": "no url description", "url": ""},
+    ]
+
+    def test_late_transcripts_fall_back_to_description(self):
+        release = threading.Event()
+        self.addCleanup(release.set)
+
+        def fake_fetch(url, token):
+            if url.endswith("slow"):
+                release.wait(timeout=5)
+                return "late transcript"
+            return "spoken words"
+
+        with mock.patch.object(instagram, "_requests", mock.Mock()), \
+             mock.patch.object(instagram, "_fetch_transcript", side_effect=fake_fetch):
+            start = time.monotonic()
+            captions = instagram.fetch_captions(self.ITEMS, "tok", budget=0.3)
+            elapsed = time.monotonic() - start
+
+        self.assertLess(elapsed, 2)
+        self.assertEqual(captions["fast"], "spoken words")
+        self.assertEqual(captions["slow"], "slow description")
+        self.assertEqual(captions["nourl"], "no url description")
+
+    def test_failed_fetch_keeps_description(self):
+        def fake_fetch(url, token):
+            if url.endswith("slow"):
+                raise RuntimeError("boom")
+            return None
+
+        with mock.patch.object(instagram, "_requests", mock.Mock()), \
+             mock.patch.object(instagram, "_fetch_transcript", side_effect=fake_fetch):
+            captions = instagram.fetch_captions(self.ITEMS, "tok")
+
+        self.assertEqual(captions["fast"], "fast description")
+        self.assertEqual(captions["slow"], "slow description")
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,99 @@
+"""Tests for journal module (crash-resumable run journal)."""
+
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+# Add lib to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from lib import cache, journal
+
+
+class JournalTestCase(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        patcher = mock.patch.object(cache, "CACHE_DIR", Path(self._tmp.name))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self._tmp.cleanup)
+        env_patcher = mock.patch.dict(os.environ, {}, clear=False)
+        env_patcher.start()
+        os.environ.pop("LAST30DAYS_CACHE_DIR", None)
+        self.addCleanup(env_patcher.stop)
+
+    def _open(self, resume=False, topic="test topic"):
+        return journal.RunJournal(topic, "2026-01-01", "2026-01-31", "default", resume=resume)
+
+
+class TestRunJournal(JournalTestCase):
+    def test_resume_reloads_sources_and_enriched(self):
+        j = self._open()
+        j.record_source("reddit", ([{"url": "https://reddit.com/r/a/1"}], None, {"raw": 1}, True))
+        j.record_enriched({"url": "https://reddit.com/r/a/1", "title": "enriched"})
+
+        resumed = self._open(resume=True)
+        items, error, raw, used_sc = resumed.sources["reddit"]
+        self.assertEqual(items, [{"url": "https://reddit.com/r/a/1"}])
+        self.assertIsNone(error)
+        self.assertEqual(raw, {"raw": 1})
+        self.assertTrue(used_sc)
+        self.assertEqual(resumed.get_enriched("https://reddit.com/r/a/1")["title"], "enriched")
+
+    def test_fresh_run_discards_previous_journal(self):
+        j = self._open()
+        j.record_source("x", ([], None, None, False))
+        fresh = self._open(resume=False)
+        self.assertEqual(fresh.sources, {})
+        self.assertEqual(self._open(resume=True).sources, {})
+
+    def test_truncated_line_skipped(self):
+        j = self._open()
+        j.record_source("hackernews", ([{"id": "HN1"}], None, None, False))
+        with open(j.path, "a", encoding="utf-8") as f:
+            f.write('{"type": "source", "name": "x", "ite')
+        resumed = self._open(resume=True)
+        self.assertIn("hackernews", resumed.sources)
+        self.assertNotIn("x", resumed.sources)
+
+    def test_keyed_by_topic(self):
+        self._open(topic="topic a").record_source("x", ([], None, None, False))
+        self.assertEqual(self._open(resume=True, topic="topic b").sources, {})
+
+    def test_discard_removes_file(self):
+        j = self._open()
+        j.record_source("x", ([], None, None, False))
+        j.discard()
+        self.assertFalse(j.path.exists())
+
+
+class TestRunResearchResume(JournalTestCase):
+    """run_research() reuses journaled sources instead of fetching them."""
+
+    def test_journaled_source_not_refetched(self):
+        sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+        import last30days
+
+        j = self._open()
+        journaled_x = [{"id": "X1", "text": "from journal", "url": "https://x.com/a/status/1"}]
+        j.record_source("x", (journaled_x, None, {"journaled": True}, False))
+
+        with mock.patch.object(last30days, "_search_x") as search_x:
+            results = last30days.run_research(
+                "test topic", "both", {}, {"openai": "gpt", "xai": "grok"},
+                "2026-01-01", "2026-01-31", depth="quick", mock=True,
+                do_hackernews=False, do_bluesky=False, do_truthsocial=False,
+                do_polymarket=False, journal=self._open(resume=True),
+            )
+        search_x.assert_not_called()
+        self.assertEqual(results[1], journaled_x)
+        self.assertEqual(results[12], {"journaled": True})
+        # Reddit ran (mock fixture) and was journaled for next time
+        self.assertIn("reddit", self._open(resume=True).sources)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,8 +1,11 @@
 """Tests for models module."""
 
 import sys
+import threading
+import time
 import unittest
 from pathlib import Path
+from unittest import mock
 
 # Add lib to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
@@ -131,5 +134,59 @@ class TestGetModels(unittest.TestCase):
         self.assertEqual(result["xai"], "grok-4-latest")
 
 
+class TestConcurrentDiscovery(unittest.TestCase):
+    def test_lookups_run_concurrently(self):
+        both_started = threading.Barrier(2, timeout=2)
+
+        def select(*args):
+            both_started.wait()
+            return "picked"
+
+        config = {"OPENAI_API_KEY": "sk-test", "XAI_API_KEY": "xai-test"}
+        with mock.patch.object(models, "select_openai_model", side_effect=select), \
+             mock.patch.object(models, "select_xai_model", side_effect=select):
+            result = models.get_models(config, deadline=5)
+        self.assertEqual(result, {"openai": "picked", "xai": "picked"})
+
+    def test_slow_lookup_falls_back_at_deadline(self):
+        release = threading.Event()
+        self.addCleanup(release.set)
+
+        def slow(*args):
+            release.wait(5)
+            return "gpt-9"
+
+        config = {"OPENAI_API_KEY": "sk-test", "XAI_API_KEY": "xai-test"}
+        start = time.monotonic()
+        with mock.patch.object(models, "select_openai_model", side_effect=slow), \
+             mock.patch.object(models, "select_xai_model", return_value="grok-x"):
+            result = models.get_models(config, deadline=0.1)
+        self.assertLess(time.monotonic() - start, 2)
+        self.assertEqual(result["openai"], models.OPENAI_FALLBACK_MODELS[0])
+        self.assertEqual(result["xai"], "grok-x")
+
+    def test_each_provider_gets_its_own_policy(self):
+        config = {
+            "OPENAI_API_KEY": "sk-test",
+            "OPENAI_MODEL_POLICY": "pinned",
+            "OPENAI_MODEL_PIN": "gpt-4o",
+            "XAI_API_KEY": "xai-test",
+        }
+        with mock.patch.object(models, "select_openai_model", return_value="gpt-4o") as openai, \
+             mock.patch.object(models, "select_xai_model", return_value="grok-x") as xai:
+            models.get_models(config, deadline=5)
+        openai.assert_called_once_with("sk-test", "pinned", "gpt-4o", None)
+        xai.assert_called_once_with("xai-test", "latest", None, None)
+
+    def test_failed_lookup_uses_pin_as_fallback(self):
+        config = {
+            "XAI_API_KEY": "xai-test",
+            "XAI_MODEL_POLICY": "pinned",
+            "XAI_MODEL_PIN": "grok-pinned",
+        }
+        with mock.patch.object(models, "select_xai_model", side_effect=RuntimeError("boom")):
+            self.assertEqual(models.get_models(config)["xai"], "grok-pinned")
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,13 +1,15 @@
 """Tests for openai_reddit module."""
 
 import sys
+import threading
 import unittest
 from pathlib import Path
+from unittest import mock
 
 # Add scripts directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
 
-from lib import http
+from lib import http, openai_reddit
 from lib.openai_reddit import _is_model_access_error, MODEL_FALLBACK_ORDER
 
 
@@ -73,5 +75,151 @@ class TestModelFallbackOrder(unittest.TestCase):
         self.assertEqual(MODEL_FALLBACK_ORDER[0], "gpt-4o")
 
 
+class TestSearchSubreddits(unittest.TestCase):
+    def test_streams_items_with_unique_ids(self):
+        streamed = []
+        started = threading.Barrier(2, timeout=2)
+
+        def fake_search(sub, core, count_per):
+            started.wait()  # Both subreddits in flight at once
+            return [{"title": sub, "url": f"https://www.reddit.com/r/{sub}/comments/1/x/"}]
+
+        with mock.patch.object(openai_reddit, "_search_subreddit", side_effect=fake_search):
+            items = openai_reddit.search_subreddits(
+                ["python", "golang"], "topic", "2026-01-01", "2026-01-31",
+                on_items=streamed.extend,
+            )
+        self.assertEqual(sorted(i["title"] for i in items), ["golang", "python"])
+        self.assertEqual(sorted(i["id"] for i in items), ["RS1", "RS2"])
+        self.assertEqual(len(streamed), 2)
+
+    def test_rate_limit_skips_remaining(self):
+        calls = []
+
+        def fake_search(sub, core, count_per):
+            calls.append(sub)
+            raise http.HTTPError("Too many requests", 429)
+
+        with mock.patch.object(openai_reddit, "SUBREDDIT_SEARCH_WORKERS", 1), \
+             mock.patch.object(openai_reddit, "_search_subreddit", side_effect=fake_search):
+            items = openai_reddit.search_subreddits(
+                ["aa", "bb", "cc"], "topic", "2026-01-01", "2026-01-31",
+            )
+        self.assertEqual(items, [])
+        self.assertEqual(calls, ["aa"])
+
+
+class _FakeStream:
+    """_urlopen() stand-in that yields SSE lines as bytes."""
+
+    def __init__(self, lines):
+        self._lines = lines
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def __iter__(self):
+        return (line.encode("utf-8") for line in self._lines)
+
+
+class TestStreamSse(unittest.TestCase):
+    def test_yields_events_and_skips_done(self):
+        lines = [
+            'event: response.output_text.delta\n',
+            'data: {"type": "response.output_text.delta", "delta": "hi"}\n',
+            '\n',
+            ': keep-alive\n',
+            'data: [DONE]\n',
+            '\n',
+            'data: {"type": "response.completed", "response": {"id": "r1"}}\n',
+        ]
+        with mock.patch.object(http, "_urlopen", return_value=_FakeStream(lines)):
+            events = list(http.stream_sse("https://example.com", {"stream": True}))
+        self.assertEqual([e["type"] for e in events], ["response.output_text.delta", "response.completed"])
+
+    def test_dropped_stream_raises_after_earlier_events(self):
+        class Dropping(_FakeStream):
+            def __iter__(self):
+                yield b'data: {"type": "a"}\n'
+                yield b'\n'
+                raise ConnectionResetError("reset")
+
+        seen = []
+        with mock.patch.object(http, "_urlopen", return_value=Dropping([])):
+            with self.assertRaises(http.HTTPError):
+                for event in http.stream_sse("https://example.com", {}):
+                    seen.append(event)
+        self.assertEqual(seen, [{"type": "a"}])
+
+
+def _delta(text):
+    return {"type": "response.output_text.delta", "delta": text}
+
+
+class TestStreamedUrls(unittest.TestCase):
+    URL = "https://www.reddit.com/r/python/comments/abc123/some_title/"
+
+    def test_url_split_across_deltas_reported_once_complete(self):
+        found = []
+        extractor = openai_reddit._ThreadUrlExtractor(found.append)
+        extractor.feed('{"items": [{"title": "x", "url": "https://www.reddit.com/r/py')
+        self.assertEqual(found, [])
+        extractor.feed('thon/comments/abc123/some_title/"')
+        extractor.feed(', "url": "https://www.reddit.com/r/python/comments/abc123/some_title/"}')
+        self.assertEqual(found, [self.URL])
+
+    def test_non_thread_urls_ignored(self):
+        found = []
+        extractor = openai_reddit._ThreadUrlExtractor(found.append)
+        extractor.feed('"url": "https://www.reddit.com/r/python/"')
+        self.assertEqual(found, [])
+
+    def test_on_url_fires_before_stream_ends(self):
+        output = '{"items": [{"title": "t", "url": "%s", "subreddit": "python"}]}' % self.URL
+        seen_at = []
+        progress = []
+
+        def fake_stream(url, payload, headers=None, timeout=None):
+            self.assertTrue(payload["stream"])
+            progress.append("start")
+            yield _delta(output[:60])
+            yield _delta(output[60:])
+            progress.append("after-url")
+            yield {"type": "response.completed", "response": {"output": [
+                {"type": "message", "content": [{"type": "output_text", "text": output}]},
+            ]}}
+            progress.append("done")
+
+        with mock.patch.object(http, "stream_sse", side_effect=fake_stream):
+            response = openai_reddit.search_reddit(
+                "key", "gpt-4.1", "python", "2026-01-01", "2026-01-31",
+                on_url=lambda u: seen_at.append((u, list(progress))),
+            )
+        self.assertEqual(seen_at, [(self.URL, ["start"])])
+        items = openai_reddit.parse_reddit_response(response)
+        self.assertEqual(items[0]["url"], self.URL)
+
+    def test_model_fallback_on_access_error_at_open(self):
+        error = http.HTTPError(
+            "Bad request", status_code=400,
+            body='{"error": {"message": "The model gpt-5.2 was not found"}}',
+        )
+        models = []
+
+        def fake_stream(url, payload, headers=None, timeout=None):
+            models.append(payload["model"])
+            if payload["model"] == "gpt-5.2":
+                raise error
+            yield {"type": "response.completed", "response": {"output": []}}
+
+        with mock.patch.object(http, "stream_sse", side_effect=fake_stream):
+            response = openai_reddit.search_reddit("key", "gpt-5.2", "python", "2026-01-01", "2026-01-31")
+        self.assertEqual(response, {"output": []})
+        self.assertEqual(models[:2], ["gpt-5.2", MODEL_FALLBACK_ORDER[0]])
+
+
 if __name__ == "__main__":
     unittest.main()
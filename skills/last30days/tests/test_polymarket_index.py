@@ -0,0 +1,214 @@
+"""Tests for the local Polymarket event index."""
+
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from lib import http, polymarket, polymarket_index
+
+
+def _event(event_id, title, updated, tags=(), question=None, price="0.6"):
+    return {
+        "id": event_id,
+        "title": title,
+        "slug": title.lower().replace(" ", "-"),
+        "updatedAt": updated,
+        "active": True,
+        "closed": False,
+        "tags": [{"label": t} for t in tags],
+        "markets": [{
+            "question": question or title,
+            "outcomes": '["Yes", "No"]',
+            "outcomePrices": f'["{price}", "0.4"]',
+            "liquidity": "1000",
+            "volume": "5000",
+            "active": True,
+            "closed": False,
+        }],
+    }
+
+
+class _IndexTestCase(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        patcher = mock.patch.object(polymarket_index, "_db_override", Path(self._tmp.name) / "pm.db")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.conn = polymarket_index.connect()
+        if self.conn is None:
+            self.skipTest("SQLite FTS5 not available")
+        self.addCleanup(self.conn.close)
+
+
+class _FakeGamma:
+    """Gamma /events listing over an in-memory event list."""
+
+    def __init__(self, events, page_size):
+        self.events = list(events)
+        self.page_size = page_size
+        self.calls = []
+        self.fail_after = None
+
+    def __call__(self, params):
+        self.calls.append(params)
+        if self.fail_after is not None and len(self.calls) > self.fail_after:
+            raise http.HTTPError("timeout")
+        events = self.events
+        if params.get("closed") == "false":
+            events = [e for e in events if not e.get("closed")]
+        if params.get("order") == "id":
+            events = sorted(events, key=lambda e: int(e["id"]))
+        else:
+            events = sorted(events, key=lambda e: e["updatedAt"], reverse=True)
+        offset = int(params.get("offset", 0))
+        return events[offset:offset + int(params.get("limit", self.page_size))]
+
+
+class TestRefresh(_IndexTestCase):
+    def _patch(self, gamma):
+        return mock.patch.multiple(polymarket_index, PAGE_SIZE=gamma.page_size,
+                                   _fetch_events_page=mock.Mock(side_effect=gamma))
+
+    def _ids(self):
+        return sorted(int(row[0]) for row in self.conn.execute("SELECT id FROM events"))
+
+    def test_build_resumes_by_id_across_runs(self):
+        gamma = _FakeGamma([_event(str(i), f"Event {i}", f"2026-03-0{i}T00:00:00Z") for i in range(1, 6)], 2)
+        gamma.fail_after = 2  # watermark probe + first page
+        with self._patch(gamma):
+            self.assertFalse(polymarket_index.refresh(self.conn))
+        self.assertEqual(polymarket_index._get_meta(self.conn, "build_cursor"), "2")
+
+        gamma.fail_after = None
+        with self._patch(gamma):
+            self.assertTrue(polymarket_index.refresh(self.conn))
+        self.assertEqual(self._ids(), [1, 2, 3, 4, 5])
+        self.assertEqual(polymarket_index._get_meta(self.conn, "watermark"), "2026-03-05T00:00:00Z")
+
+    def test_events_closing_between_runs_do_not_skip_others(self):
+        events = [_event(str(i), f"Event {i}", "2026-03-01T00:00:00Z") for i in range(1, 8)]
+        gamma = _FakeGamma(events, 3)
+        gamma.fail_after = 2
+        with self._patch(gamma):
+            polymarket_index.refresh(self.conn)
+        self.assertEqual(self._ids(), [1, 2, 3])
+
+        # Two already-indexed events close: offsets shift left by two
+        events[0]["closed"] = events[1]["closed"] = True
+        gamma.fail_after = None
+        with self._patch(gamma):
+            self.assertTrue(polymarket_index.refresh(self.conn))
+        self.assertEqual(self._ids()[-4:], [4, 5, 6, 7])
+
+    def test_incremental_refresh_sees_closures(self):
+        old = _event("1", "Old market", "2026-03-01T00:00:00Z")
+        gamma = _FakeGamma([old], 3)
+        with self._patch(gamma):
+            polymarket_index.refresh(self.conn)
+
+        gamma.events = [
+            _event("2", "New market", "2026-03-05T00:00:00Z"),
+            dict(_event("1", "Old market", "2026-03-04T00:00:00Z"), closed=True),
+            _event("0", "Older market", "2026-02-01T00:00:00Z"),
+        ]
+        gamma.calls.clear()
+        with self._patch(gamma):
+            self.assertTrue(polymarket_index.refresh(self.conn, force=True))
+        self.assertEqual(len(gamma.calls), 1)
+        self.assertNotIn("closed", gamma.calls[0])
+        self.assertEqual(polymarket_index._get_meta(self.conn, "watermark"), "2026-03-05T00:00:00Z")
+        self.assertEqual(self._ids(), [2])
+
+    def test_recent_index_skips_network(self):
+        with self._patch(_FakeGamma([], 2)):
+            polymarket_index.refresh(self.conn)
+        with mock.patch.object(polymarket_index, "_fetch_events_page") as fetch:
+            self.assertTrue(polymarket_index.refresh(self.conn))
+        fetch.assert_not_called()
+
+
+class TestBackgroundRefresh(_IndexTestCase):
+    def test_cold_index_searches_gamma_without_waiting(self):
+        release = threading.Event()
+        self.addCleanup(release.set)
+
+        def slow_page(params):
+            release.wait(5)
+            return []
+
+        with mock.patch.object(polymarket_index, "_fetch_events_page", side_effect=slow_page), \
+             mock.patch.object(polymarket, "_search_single_query",
+                               return_value={"events": []}) as gamma_search:
+            start = time.monotonic()
+            polymarket.search_polymarket("bitcoin", "2026-02-01", "2026-03-02", depth="quick")
+            self.assertLess(time.monotonic() - start, 2)
+            gamma_search.assert_called()
+            self.assertIsNone(polymarket_index.refresh_in_background())  # One at a time
+            release.set()
+            for _ in range(100):
+                if not polymarket_index._refresh_lock.locked():
+                    break
+                time.sleep(0.02)
+
+    def test_stale_index_served_while_refreshing(self):
+        polymarket_index.upsert_events(self.conn, [_event("1", "Fed rate cut in March?", "2026-03-01")])
+        polymarket_index._set_meta(self.conn, "complete", "1")
+        polymarket_index._set_meta(self.conn, "refreshed_at", "0")
+        self.conn.commit()
+        with mock.patch.object(polymarket_index, "refresh_in_background") as background, \
+             mock.patch.object(polymarket_index, "_fetch_events_by_id", return_value=[]), \
+             mock.patch.object(polymarket, "_search_single_query") as gamma_search:
+            result = polymarket.search_polymarket("fed rate", "2026-02-01", "2026-03-02")
+        background.assert_called_once()
+        gamma_search.assert_not_called()
+        self.assertEqual([e["id"] for e in result["events"]], ["1"])
+
+
+class TestLookup(_IndexTestCase):
+    def setUp(self):
+        super().setUp()
+        polymarket_index.upsert_events(self.conn, [
+            _event("1", "Fed rate cut in March?", "2026-03-01", tags=["Economy"]),
+            _event("2", "Who wins the Super Bowl?", "2026-03-01", tags=["NFL"],
+                   question="Will the Chiefs win the Super Bowl?"),
+        ])
+        polymarket_index._set_meta(self.conn, "complete", "1")
+        polymarket_index._set_meta(self.conn, "refreshed_at", "9999999999")
+        self.conn.commit()
+
+    def test_search_matches_titles_and_market_questions(self):
+        self.assertEqual([e["id"] for e in polymarket_index.search(self.conn, ["rate cuts"], 10)], ["1"])
+        self.assertEqual([e["id"] for e in polymarket_index.search(self.conn, ["chiefs"], 10)], ["2"])
+        self.assertEqual(polymarket_index.search(self.conn, ["bitcoin"], 10), [])
+
+    def test_search_polymarket_uses_index_and_refreshes_prices(self):
+        fresh = _event("2", "Who wins the Super Bowl?", "2026-03-02", price="0.9")
+        with mock.patch.object(polymarket_index, "_fetch_events_by_id", return_value=[fresh]) as by_id, \
+             mock.patch.object(polymarket, "_search_single_query") as gamma_search:
+            result = polymarket.search_polymarket("super bowl", "2026-02-01", "2026-03-02")
+        gamma_search.assert_not_called()
+        by_id.assert_called_once_with(["2"])
+        self.assertEqual(result["events"], [fresh])
+
+    def test_no_local_match_falls_back_to_gamma_search(self):
+        with mock.patch.object(polymarket, "_search_single_query",
+                               return_value={"events": []}) as gamma_search:
+            polymarket.search_polymarket("bitcoin", "2026-02-01", "2026-03-02", depth="quick")
+        gamma_search.assert_called()
+
+    def test_price_refresh_failure_keeps_indexed_copy(self):
+        events = polymarket_index.search(self.conn, ["fed"], 10)
+        with mock.patch.object(polymarket_index, "_fetch_events_by_id",
+                               side_effect=http.HTTPError("down")):
+            self.assertEqual(polymarket_index.refresh_prices(self.conn, events), events)
+
+
+if __name__ == "__main__":
+    unittest.main()
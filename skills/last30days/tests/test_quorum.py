@@ -0,0 +1,92 @@
+"""Tests for quorum (early-return) mode in last30days.py."""
+
+import sys
+import unittest
+from pathlib import Path
+
+# Add scripts to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+import last30days
+
+
+class TestParseQuorumFlag(unittest.TestCase):
+    """Tests for parse_quorum_flag()."""
+
+    def test_sources_and_others(self):
+        quorum = last30days.parse_quorum_flag("reddit,x,+2")
+        self.assertEqual(quorum["required"], {"reddit", "x"})
+        self.assertEqual(quorum["others"], 2)
+        self.assertEqual(quorum["min_items"], 0)
+
+    def test_min_items(self):
+        quorum = last30days.parse_quorum_flag("items=40")
+        self.assertEqual(quorum["required"], set())
+        self.assertEqual(quorum["min_items"], 40)
+
+    def test_aliases_normalized(self):
+        quorum = last30days.parse_quorum_flag("hn, bsky")
+        self.assertEqual(quorum["required"], {"hackernews", "bluesky"})
+
+    def test_unknown_source_exits(self):
+        with self.assertRaises(SystemExit):
+            last30days.parse_quorum_flag("myspace")
+
+    def test_bad_number_exits(self):
+        with self.assertRaises(SystemExit):
+            last30days.parse_quorum_flag("+two")
+
+    def test_empty_exits(self):
+        with self.assertRaises(SystemExit):
+            last30days.parse_quorum_flag(" , ")
+
+
+class TestQuorumMet(unittest.TestCase):
+    """Tests for quorum_met()."""
+
+    def setUp(self):
+        self.quorum = last30days.parse_quorum_flag("reddit,x,+2")
+
+    def test_missing_required_source(self):
+        settled = {"reddit": 10, "hackernews": 3, "youtube": 2, "web": 5}
+        self.assertFalse(last30days.quorum_met(self.quorum, settled))
+
+    def test_not_enough_others(self):
+        settled = {"reddit": 10, "x": 8, "hackernews": 3}
+        self.assertFalse(last30days.quorum_met(self.quorum, settled))
+
+    def test_met(self):
+        settled = {"reddit": 10, "x": 0, "hackernews": 3, "polymarket": 1}
+        self.assertTrue(last30days.quorum_met(self.quorum, settled))
+
+    def test_empty_or_failed_others_not_counted(self):
+        settled = {"reddit": 10, "x": 8, "hackernews": 3, "xiaohongshu": 0, "bluesky": 0}
+        self.assertFalse(last30days.quorum_met(self.quorum, settled))
+
+    def test_item_threshold(self):
+        quorum = last30days.parse_quorum_flag("items=20")
+        self.assertFalse(last30days.quorum_met(quorum, {"reddit": 12}))
+        self.assertTrue(last30days.quorum_met(quorum, {"reddit": 12, "x": 8}))
+
+
+class TestGatherResults(unittest.TestCase):
+    """Tests for _gather_results()."""
+
+    def test_tuple_shape_and_pending(self):
+        outcomes = {
+            "reddit": ([{"url": "r1"}], None, {"raw": 1}, True),
+            "web": ([{"url": "w1"}], None, None, False),
+            "xiaohongshu": ([{"url": "xhs1"}], None, None, False),
+            "hackernews": ([], "HN search timed out after 60s", None, False),
+        }
+        results = last30days._gather_results(outcomes, False, [], ["youtube"])
+        self.assertEqual(len(results), 25)
+        self.assertEqual(results[0], [{"url": "r1"}])
+        self.assertEqual([w["url"] for w in results[9]], ["w1", "xhs1"])
+        self.assertEqual(results[11], {"raw": 1})
+        self.assertEqual(results[19], "HN search timed out after 60s")
+        self.assertEqual(results[24], ["youtube"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,13 +2,16 @@
 
 import json
 import sys
+import threading
+import time
 import unittest
 from pathlib import Path
+from unittest import mock
 
 # Add lib to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
 
-from lib import reddit_enrich
+from lib import http, reddit_enrich
 
 FIXTURES_DIR = Path(__file__).parent.parent / "fixtures"
 
@@ -125,5 +128,143 @@ class TestExtractCommentInsights(unittest.TestCase):
         self.assertLessEqual(len(insights), 3)
 
 
+class TestExtractPostId(unittest.TestCase):
+    """Tests for extract_post_id()."""
+
+    def test_thread_url(self):
+        url = "https://www.reddit.com/r/ClaudeAI/comments/1AbC23/some_title/"
+        self.assertEqual(reddit_enrich.extract_post_id(url), "1abc23")
+
+    def test_non_thread_url(self):
+        self.assertIsNone(reddit_enrich.extract_post_id("https://www.reddit.com/r/ClaudeAI/"))
+        self.assertIsNone(reddit_enrich.extract_post_id("https://example.com/comments/abc"))
+
+
+class TestFetchEngagementBatch(unittest.TestCase):
+    """Tests for fetch_engagement_batch() (one /by_id request for many posts)."""
+
+    ITEMS = [
+        {"url": "https://www.reddit.com/r/a/comments/aaa/x/"},
+        {"url": "https://www.reddit.com/r/b/comments/bbb/y/"},
+        {"url": "https://example.com/not-reddit"},
+    ]
+
+    LISTING = {"data": {"children": [
+        {"kind": "t3", "data": {"id": "aaa", "score": 120, "num_comments": 40,
+                                "upvote_ratio": 0.93, "created_utc": 1767225600}},
+        {"kind": "t3", "data": {"id": "bbb", "score": 7, "num_comments": 2, "upvote_ratio": 0.8}},
+    ]}}
+
+    def test_single_request_for_all_posts(self):
+        with mock.patch.object(http, "get_reddit_json", return_value=self.LISTING) as get:
+            result = reddit_enrich.fetch_engagement_batch(self.ITEMS)
+        get.assert_called_once()
+        self.assertEqual(get.call_args[0][0], "/by_id/t3_aaa,t3_bbb")
+        self.assertEqual(result[self.ITEMS[0]["url"]]["score"], 120)
+        self.assertEqual(result[self.ITEMS[1]["url"]]["num_comments"], 2)
+        self.assertNotIn(self.ITEMS[2]["url"], result)
+
+    def test_chunks_past_batch_size(self):
+        items = [{"url": f"https://www.reddit.com/r/a/comments/p{i}/t/"} for i in range(5)]
+        with mock.patch.object(reddit_enrich, "BY_ID_BATCH_SIZE", 2), \
+             mock.patch.object(http, "get_reddit_json", return_value={"data": {"children": []}}) as get:
+            reddit_enrich.fetch_engagement_batch(items)
+        self.assertEqual(get.call_count, 3)
+
+    def test_rate_limit_raises(self):
+        error = http.HTTPError("429", status_code=429)
+        with mock.patch.object(http, "get_reddit_json", side_effect=error):
+            with self.assertRaises(reddit_enrich.RedditRateLimitError):
+                reddit_enrich.fetch_engagement_batch(self.ITEMS)
+
+    def test_apply_engagement_updates_item(self):
+        item = {"url": self.ITEMS[0]["url"], "engagement": None, "date": None}
+        with mock.patch.object(http, "get_reddit_json", return_value=self.LISTING):
+            submission = reddit_enrich.fetch_engagement_batch([item])[item["url"]]
+        reddit_enrich.apply_engagement(item, submission)
+        self.assertEqual(item["engagement"], {"score": 120, "num_comments": 40, "upvote_ratio": 0.93})
+        self.assertEqual(item["date"], "2026-01-01")
+
+
+    def test_threads_go_to_top_scored_items(self):
+        # Full thread fetches pick candidates by their post-refresh score,
+        # not by the order discovery returned them in
+        import last30days
+        items = [
+            {"url": "u0", "date": "2026-01-20", "relevance": 0.5, "engagement": {"score": 1, "num_comments": 0}},
+            {"url": "u1", "date": "2026-01-20", "relevance": 0.9, "engagement": {"score": 900, "num_comments": 300}},
+            {"url": "u2", "date": "2026-01-20", "relevance": 0.7, "engagement": {"score": 50, "num_comments": 10}},
+        ]
+        self.assertEqual(last30days._rank_reddit_items(items, "2026-01-01", "2026-01-31"), [1, 2, 0])
+
+
+class TestThreadPrefetcher(unittest.TestCase):
+    """Tests for ThreadPrefetcher (thread fetches started during discovery)."""
+
+    THREAD = [
+        {"data": {"children": [{"kind": "t3", "data": {"title": "T", "score": 5, "num_comments": 1}}]}},
+        {"data": {"children": []}},
+    ]
+
+    def test_caps_and_dedupes_by_post_id(self):
+        prefetcher = reddit_enrich.ThreadPrefetcher(limit=2)
+        self.addCleanup(prefetcher.close)
+        with mock.patch.object(reddit_enrich, "fetch_thread_data", return_value=self.THREAD) as fetch:
+            prefetcher.add("https://www.reddit.com/r/a/comments/aaa/x/")
+            prefetcher.add("https://reddit.com/r/a/comments/aaa/x")
+            prefetcher.add("https://www.reddit.com/r/b/comments/bbb/y/")
+            prefetcher.add("https://www.reddit.com/r/c/comments/ccc/z/")
+            self.assertEqual(prefetcher.get("https://old.reddit.com/r/a/comments/aaa/x/", timeout=2), self.THREAD)
+            self.assertEqual(prefetcher.get("https://www.reddit.com/r/b/comments/bbb/y/", timeout=2), self.THREAD)
+            self.assertIsNone(prefetcher.get("https://www.reddit.com/r/c/comments/ccc/z/"))
+        self.assertEqual(fetch.call_count, 2)
+
+    def test_enrich_uses_prefetched_thread(self):
+        prefetcher = reddit_enrich.ThreadPrefetcher(limit=5)
+        self.addCleanup(prefetcher.close)
+        url = "https://www.reddit.com/r/a/comments/aaa/x/"
+        with mock.patch.object(reddit_enrich, "fetch_thread_data", return_value=self.THREAD) as fetch:
+            prefetcher.add(url)
+            prefetcher.get(url, timeout=2)
+            item = reddit_enrich.enrich_reddit_item({"url": url}, prefetcher=prefetcher)
+        self.assertEqual(fetch.call_count, 1)
+        self.assertEqual(item["engagement"]["score"], 5)
+
+    def test_keep_only_cancels_queued_prefetches(self):
+        release = threading.Event()
+        self.addCleanup(release.set)
+        prefetcher = reddit_enrich.ThreadPrefetcher(limit=5, max_workers=1)
+        self.addCleanup(prefetcher.close)
+        urls = [f"https://www.reddit.com/r/a/comments/p{i}/x/" for i in range(3)]
+        fetched = []
+
+        def fake_fetch(url, timeout=None, retries=None):
+            fetched.append(url)
+            release.wait(5)
+            return self.THREAD
+
+        with mock.patch.object(reddit_enrich, "fetch_thread_data", side_effect=fake_fetch):
+            for url in urls:
+                prefetcher.add(url)
+            time.sleep(0.1)  # p0 is in flight, p1 and p2 are queued
+            self.assertTrue(prefetcher.started(urls[0]))
+            self.assertFalse(prefetcher.started(urls[1]))
+            prefetcher.keep_only([urls[2]])
+            release.set()
+            self.assertEqual(prefetcher.get(urls[2], timeout=2), self.THREAD)
+            self.assertIsNone(prefetcher.get(urls[1]))
+        self.assertEqual(fetched, [urls[0], urls[2]])
+
+    def test_prefetch_rate_limit_propagates(self):
+        prefetcher = reddit_enrich.ThreadPrefetcher(limit=5)
+        self.addCleanup(prefetcher.close)
+        url = "https://www.reddit.com/r/a/comments/aaa/x/"
+        with mock.patch.object(reddit_enrich, "fetch_thread_data",
+                               side_effect=reddit_enrich.RedditRateLimitError("429")):
+            prefetcher.add(url)
+            with self.assertRaises(reddit_enrich.RedditRateLimitError):
+                prefetcher.get(url, timeout=2)
+
+
 if __name__ == "__main__":
     unittest.main()
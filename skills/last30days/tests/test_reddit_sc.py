@@ -1,8 +1,11 @@
 """Tests for reddit.py — ScrapeCreators Reddit search module."""
 
 import sys
+import threading
+import time
 import unittest
 from pathlib import Path
+from unittest import mock
 
 # Add lib to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
@@ -146,5 +149,115 @@ class TestDepthConfig(unittest.TestCase):
         )
 
 
+class TestSearchFanOut(unittest.TestCase):
+    """search_reddit() runs its ScrapeCreators calls concurrently."""
+
+    def _post(self, pid, sub, ups=10):
+        return {"id": pid, "title": f"post {pid}", "permalink": f"/r/{sub}/comments/{pid}/x/",
+                "subreddit": sub, "ups": ups, "created_utc": None}
+
+    def test_calls_overlap_and_results_keep_order(self):
+        active = [0]
+        peak = [0]
+        lock = threading.Lock()
+
+        def slow(result):
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.2)
+            with lock:
+                active[0] -= 1
+            return result
+
+        def fake_global(query, token, sort="relevance", timeframe="month"):
+            return slow([self._post(f"g{query[:3]}{i}", "cursor", ups=i) for i in range(3)])
+
+        def fake_sub(sub, query, token, sort="relevance", timeframe="month"):
+            return slow([self._post(f"s{sub}", sub)])
+
+        with mock.patch.object(reddit, "_global_search", side_effect=fake_global), \
+             mock.patch.object(reddit, "_subreddit_search", side_effect=fake_sub) as sub_search:
+            started = time.monotonic()
+            result = reddit.search_reddit("cursor ide", "2026-01-01", "2026-01-31", "deep", token="t")
+            elapsed = time.monotonic() - started
+
+        self.assertGreater(peak[0], 1)
+        # Two rounds (globals, then subreddits), not one call after another
+        self.assertLess(elapsed, 0.2 * 4)
+        self.assertEqual(sub_search.call_count, 1)
+        urls = [item["url"] for item in result["items"]]
+        self.assertEqual(len(urls), len(set(urls)))
+
+    def test_early_subreddit_dispatch(self):
+        """Subreddit searches start once enough global results are in."""
+        gate = threading.Event()
+        sub_started = threading.Event()
+
+        def fake_global(query, token, sort="relevance", timeframe="month"):
+            if sort == "relevance":
+                return [self._post(f"a{i}", "cursor") for i in range(reddit.SUBREDDIT_DISCOVERY_MIN_POSTS)]
+            gate.wait(5)  # Slow second query
+            return []
+
+        def fake_sub(sub, query, token, sort="relevance", timeframe="month"):
+            sub_started.set()
+            return []
+
+        with mock.patch.object(reddit, "_global_search", side_effect=fake_global), \
+             mock.patch.object(reddit, "_subreddit_search", side_effect=fake_sub):
+            t = threading.Thread(
+                target=reddit.search_reddit,
+                args=("cursor ide", "2026-01-01", "2026-01-31", "default"),
+                kwargs={"token": "t"},
+            )
+            t.start()
+            self.assertTrue(sub_started.wait(2))
+            gate.set()
+            t.join(5)
+
+
+class TestEnrichWithComments(unittest.TestCase):
+    """Comment enrichment is concurrent and bounded by a total budget."""
+
+    def test_slow_post_keeps_search_data(self):
+        items = [
+            {"id": "R1", "url": "https://www.reddit.com/r/a/comments/fast/x/", "title": "fast"},
+            {"id": "R2", "url": "https://www.reddit.com/r/a/comments/slow/x/", "title": "slow"},
+        ]
+        release = threading.Event()
+
+        def fake_fetch(url, token):
+            if "slow" in url:
+                release.wait(5)
+            return [{"body": "This is a substantive comment about the thing.", "ups": 5, "author": "u1"}]
+
+        with mock.patch.object(reddit, "fetch_post_comments", side_effect=fake_fetch):
+            started = time.monotonic()
+            result = reddit.enrich_with_comments(items, "t", "quick", budget=0.3)
+            elapsed = time.monotonic() - started
+            release.set()
+
+        self.assertLess(elapsed, 2)
+        self.assertEqual(result[0]["top_comments"][0]["author"], "u1")
+        self.assertNotIn("top_comments", result[1])
+        self.assertEqual(result[1]["title"], "slow")
+
+    def test_budget_defaults_per_depth(self):
+        for config in reddit.DEPTH_CONFIG.values():
+            self.assertGreater(config["comment_budget"], 0)
+
+
+class TestRateLimiter(unittest.TestCase):
+    def test_paces_after_burst(self):
+        from lib import http
+        limiter = http.RateLimiter(rate=20.0, burst=2)
+        started = time.monotonic()
+        for _ in range(4):
+            limiter.acquire()
+        # 2 immediate, then 2 more at 20/s
+        self.assertGreaterEqual(time.monotonic() - started, 0.09)
+
+
 if __name__ == "__main__":
     unittest.main()
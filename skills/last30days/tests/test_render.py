@@ -160,5 +160,39 @@ class TestRenderEmptyReport(unittest.TestCase):
         self.assertIsInstance(output, str)
 
 
+class TestRenderPendingSources(unittest.TestCase):
+    """Test quorum reports flag the sources still running."""
+
+    def _report(self, pending):
+        return schema.Report(
+            topic="test",
+            range_from="2026-02-04",
+            range_to="2026-03-06",
+            generated_at="2026-03-06T00:00:00+00:00",
+            mode="both",
+            pending_sources=pending,
+        )
+
+    def test_compact_banner(self):
+        output = render.render_compact(self._report(["youtube", "hackernews"]))
+        self.assertIn("PARTIAL RESULTS", output)
+        self.assertIn("YouTube, HN", output)
+
+    def test_source_status_lines(self):
+        output = render.render_source_status(self._report(["web"]))
+        self.assertIn("Web: pending", output)
+        self.assertNotIn("assistant will use WebSearch", output)
+
+    def test_no_banner_when_complete(self):
+        output = render.render_compact(self._report([]))
+        self.assertNotIn("PARTIAL RESULTS", output)
+
+    def test_roundtrip(self):
+        report = self._report(["x"])
+        restored = schema.Report.from_dict(report.to_dict())
+        self.assertEqual(restored.pending_sources, ["x"])
+        self.assertNotIn("pending_sources", self._report([]).to_dict())
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,199 @@
+"""Tests for serve module (local research daemon)."""
+
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from lib import serve
+
+
+@unittest.skipUnless(serve.is_supported(), "Unix sockets not available")
+class TestServeRoundTrip(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory(dir="/tmp")
+        self.addCleanup(self._tmp.cleanup)
+        self.path = Path(self._tmp.name) / "t.sock"
+        self.calls = []
+
+        self.release = threading.Event()
+        self.addCleanup(self.release.set)
+
+        def handler(argv, cwd, emit):
+            self.calls.append((argv, cwd))
+            if argv == ["hang"]:
+                emit("stdout", "started\n")
+                self.release.wait(5)
+                return 0
+            emit("stdout", "out:")
+            emit("stderr", "err")
+            emit("stdout", " ".join(argv))
+            return 3
+
+        self.thread = threading.Thread(target=serve.serve, args=(handler, self.path), daemon=True)
+        self.thread.start()
+        for _ in range(50):
+            if serve.ping(self.path):
+                break
+            time.sleep(0.05)
+
+    def tearDown(self):
+        serve.shutdown(self.path)
+        self.thread.join(timeout=5)
+
+    def test_ping(self):
+        reply = serve.ping(self.path)
+        self.assertTrue(reply["ok"])
+
+    def test_research_forwards_argv_and_cwd(self):
+        reply = serve.research(["--mock", "topic"], "/somewhere", self.path)
+        self.assertEqual(reply, {"exit_code": 3, "stdout": "out:--mock topic", "stderr": "err"})
+        self.assertEqual(self.calls, [(["--mock", "topic"], "/somewhere")])
+
+    def test_output_streams_in_order(self):
+        seen = []
+        serve.research(["a"], "/", self.path, on_output=lambda stream, text: seen.append((stream, text)))
+        self.assertEqual(seen, [("stdout", "out:"), ("stderr", "err"), ("stdout", "a")])
+
+    def test_different_environment_runs_locally(self):
+        with mock.patch.dict("os.environ", {"XAI_API_KEY": "someone-else"}):
+            self.assertIsNone(serve.research(["topic"], "/", self.path))
+        self.assertEqual(self.calls, [])
+
+    def test_busy_daemon_declines(self):
+        first = threading.Thread(target=serve.research, args=(["hang"], "/", self.path), daemon=True)
+        first.start()
+        for _ in range(50):
+            if self.calls:
+                break
+            time.sleep(0.02)
+        self.assertIsNone(serve.research(["topic"], "/", self.path))
+        self.release.set()
+        first.join(5)
+
+    def test_wedged_request_times_out(self):
+        with mock.patch.object(serve, "REPLY_GRACE", 2), \
+             mock.patch.object(serve.os, "_exit") as hard_exit:
+            reply = serve.research(["hang"], "/", self.path, timeout=0.2)
+        hard_exit.assert_called_once_with(1)
+        self.assertEqual(reply["exit_code"], 1)
+        self.assertEqual(reply["stdout"], "started\n")
+        self.assertIn("[TIMEOUT]", reply["stderr"])
+        self.release.set()
+
+    def test_second_daemon_refused(self):
+        with self.assertRaises(RuntimeError):
+            serve.serve(lambda argv, cwd, emit: 0, self.path)
+
+    def test_shutdown_removes_socket(self):
+        self.assertTrue(serve.shutdown(self.path))
+        self.thread.join(timeout=5)
+        self.assertFalse(self.path.exists())
+        self.assertIsNone(serve.ping(self.path))
+
+
+class TestNoDaemon(unittest.TestCase):
+    def test_research_returns_none_without_socket(self):
+        self.assertIsNone(serve.research(["topic"], "/", Path("/tmp/does-not-exist.sock")))
+
+    def test_socket_path_env_override(self):
+        with mock.patch.dict("os.environ", {"LAST30DAYS_SOCKET": "/tmp/x.sock"}):
+            self.assertEqual(serve.get_socket_path(), Path("/tmp/x.sock"))
+
+
+class TestServeRequest(unittest.TestCase):
+    def setUp(self):
+        import io
+        import last30days
+        self.last30days = last30days
+        self.daemon_err = io.StringIO()
+        # Routing replaces process-wide state; put it back after each test
+        for patcher in (
+            mock.patch.object(sys, "stdout", io.StringIO()),
+            mock.patch.object(sys, "stderr", self.daemon_err),
+            mock.patch.object(threading.Thread, "start", threading.Thread.start),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        last30days._install_output_routing()
+
+    def test_deadline_timers_cancelled_after_request(self):
+        last30days = self.last30days
+
+        def fake_main(argv, warm=None):
+            last30days._install_global_timeout(100, backstop=False)
+            print("report")
+
+        emitted = []
+        with mock.patch.object(last30days, "main", side_effect=fake_main):
+            code = last30days._serve_request(["t"], "/", {}, lambda stream, text: emitted.append(text))
+        self.assertEqual(code, 0)
+        self.assertEqual("".join(emitted), "report\n")
+        self.assertEqual(last30days._deadline_timers, [])
+        self.assertIsNone(last30days._deadline)
+
+    def test_abandoned_thread_output_stays_out_of_next_request(self):
+        last30days = self.last30days
+        wrote_late = threading.Event()
+        go = threading.Event()
+        self.addCleanup(go.set)
+
+        def straggler():
+            sys.stderr.write("source thread: started\n")
+            go.wait(5)
+            sys.stderr.write("source thread: late\n")
+            wrote_late.set()
+
+        def first_main(argv, warm=None):
+            threading.Thread(target=straggler, daemon=True).start()
+            time.sleep(0.05)
+
+        def second_main(argv, warm=None):
+            go.set()
+            wrote_late.wait(5)
+            print("second report")
+
+        first, second = [], []
+        with mock.patch.object(last30days, "main", side_effect=first_main):
+            last30days._serve_request(["a"], "/", {}, lambda stream, text: first.append(text))
+        with mock.patch.object(last30days, "main", side_effect=second_main):
+            last30days._serve_request(["b"], "/", {}, lambda stream, text: second.append(text))
+        self.assertEqual("".join(first), "source thread: started\n")
+        self.assertEqual("".join(second), "second report\n")
+        self.assertEqual(self.daemon_err.getvalue(), "source thread: late\n")
+
+
+class TestWarmSetup(unittest.TestCase):
+    """The daemon probes sources once and reuses the result."""
+
+    def test_probes_reused_until_config_changes(self):
+        import last30days
+
+        config = {"OPENAI_API_KEY": "a"}
+        warm = {}
+        with mock.patch.object(last30days.env, "get_config", side_effect=lambda: dict(config)), \
+             mock.patch.object(last30days, "probe_sources", return_value={"p": 1}) as probe:
+            last30days._warm_setup(warm)
+            last30days._warm_setup(warm)
+            self.assertEqual(probe.call_count, 1)
+            config["OPENAI_API_KEY"] = "b"
+            last30days._warm_setup(warm)
+            self.assertEqual(probe.call_count, 2)
+
+    def test_no_warm_state_always_probes(self):
+        import last30days
+
+        with mock.patch.object(last30days.env, "get_config", return_value={}), \
+             mock.patch.object(last30days, "probe_sources", return_value={}) as probe:
+            last30days._warm_setup()
+            last30days._warm_setup()
+            self.assertEqual(probe.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -94,6 +94,41 @@ class TestMockMode(unittest.TestCase):
         self.assertIn("topic", data)
         self.assertEqual(data["topic"], "test topic")
 
+    def test_mock_quorum_marks_pending(self):
+        rc, stdout, stderr = _run(
+            ["--mock", "--emit", "json", "--quorum", "reddit,x", "test topic"], timeout=120,
+        )
+        self.assertEqual(rc, 0, f"--quorum failed: {stderr}")
+        data = json.loads(stdout)
+        self.assertNotIn("reddit", data.get("pending_sources", []))
+        self.assertNotIn("x", data.get("pending_sources", []))
+
+    def test_mock_topics_file_emits_one_document_per_topic(self):
+        import tempfile
+        with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False) as f:
+            f.write("first topic\nsecond topic\n")
+        try:
+            rc, stdout, stderr = _run(
+                ["--mock", "--search", "reddit", "--topics-file", f.name], timeout=120,
+            )
+        finally:
+            Path(f.name).unlink()
+        self.assertEqual(rc, 0, f"--topics-file failed: {stderr}")
+        docs = [json.loads(line) for line in stdout.splitlines() if line.strip()]
+        self.assertEqual(sorted(d["topic"] for d in docs), ["first topic", "second topic"])
+
+
+class TestGlobalTimeout(unittest.TestCase):
+    """A global timeout yields a partial report instead of killing the run."""
+
+    def test_timeout_emits_partial_json(self):
+        rc, stdout, stderr = _run(
+            ["--mock", "--emit", "json", "--timeout", "2", "test topic"], timeout=60,
+        )
+        self.assertEqual(rc, 0, f"timed-out run failed: {stderr}")
+        data = json.loads(stdout)
+        self.assertEqual(data["topic"], "test topic")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -2,8 +2,11 @@
 
 import json
 import sys
+import threading
+import time
 import unittest
 from pathlib import Path
+from unittest import mock
 
 # Add lib to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
@@ -264,5 +267,68 @@ class TestSchemaRoundtrip(unittest.TestCase):
         self.assertEqual(tk.cross_refs, ["R1"])
 
 
+class TestFetchCaptionsConcurrent(unittest.TestCase):
+    """Transcript pass runs concurrently under a budget."""
+
+    ITEMS = [
+        {"video_id": "fast", "text": "fast description", "url": "https://example.com/fast"},
+        {"video_id": "slow", "text": "slow description", "url": "https://example.com/slow"},
+        {"video_id": "nourl", "text": "no url description", "url": ""},
+    ]
+
+    def test_late_transcripts_fall_back_to_description(self):
+        release = threading.Event()
+        self.addCleanup(release.set)
+
+        def fake_fetch(url, token):
+            if url.endswith("slow"):
+                release.wait(timeout=5)
+                return "late transcript"
+            return "spoken words"
+
+        with mock.patch.object(tiktok, "_requests", mock.Mock()), \
+             mock.patch.object(tiktok, "_fetch_transcript", side_effect=fake_fetch):
+            start = time.monotonic()
+            captions = tiktok.fetch_captions(self.ITEMS, "tok", budget=0.3)
+            elapsed = time.monotonic() - start
+
+        self.assertLess(elapsed, 2)
+        self.assertEqual(captions["fast"], "spoken words")
+        self.assertEqual(captions["slow"], "slow description")
+        self.assertEqual(captions["nourl"], "no url description")
+
+    def test_failed_fetch_keeps_description(self):
+        def fake_fetch(url, token):
+            if url.endswith("slow"):
+                raise RuntimeError("boom")
+            return None
+
+        with mock.patch.object(tiktok, "_requests", mock.Mock()), \
+             mock.patch.object(tiktok, "_fetch_transcript", side_effect=fake_fetch):
+            captions = tiktok.fetch_captions(self.ITEMS, "tok")
+
+        self.assertEqual(captions["fast"], "fast description")
+        self.assertEqual(captions["slow"], "slow description")
+
+    def test_search_and_enrich_passes_remaining_budget(self):
+        def slow_search(*args, **kwargs):
+            time.sleep(0.2)
+            return {"items": [dict(item) for item in self.ITEMS]}
+
+        with mock.patch.object(tiktok, "search_tiktok", side_effect=slow_search), \
+             mock.patch.object(tiktok, "fetch_captions", return_value={}) as fetch:
+            tiktok.search_and_enrich("topic", "2026-01-01", "2026-01-31", token="tok", budget=1.0)
+        budget = fetch.call_args.kwargs["budget"]
+        self.assertLessEqual(budget, 0.8)
+        self.assertGreater(budget, 0)
+
+    def test_spent_budget_skips_transcripts(self):
+        with mock.patch.object(tiktok, "_requests", mock.Mock()), \
+             mock.patch.object(tiktok, "_fetch_transcript") as fetch:
+            captions = tiktok.fetch_captions(self.ITEMS, "tok", budget=0)
+        fetch.assert_not_called()
+        self.assertEqual(captions["fast"], "fast description")
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -224,3 +224,47 @@ class TestParseTruthSocialResponse:
         items = truthsocial.parse_truthsocial_response(response)
         assert "<" not in items[0]["text"]
         assert ">" not in items[0]["text"]
+
+
+class TestDeepPagination:
+    """Deep mode walks offset pages, stopping once a page predates the range."""
+
+    @staticmethod
+    def _page(n, date):
+        return {"statuses": [
+            {"content": f"<p>post {i}</p>", "created_at": f"{date}T12:00:00.000Z", "url": f"https://t/{i}"}
+            for i in range(n)
+        ]}
+
+    @patch("scripts.lib.truthsocial.http.request")
+    def test_fetches_offset_pages(self, mock_request):
+        mock_request.side_effect = [self._page(40, "2026-03-01"), self._page(40, "2026-02-20"), self._page(5, "2026-02-15")]
+        result = truthsocial.search_truthsocial(
+            "tariffs", "2026-02-09", "2026-03-09", depth="deep",
+            config={"TRUTHSOCIAL_TOKEN": "valid_token"},
+        )
+        assert len(result["statuses"]) == 85
+        urls = [c[0][1] for c in mock_request.call_args_list]
+        assert "offset" not in urls[0]
+        assert "offset=40" in urls[1]
+        assert "offset=80" in urls[2]
+
+    @patch("scripts.lib.truthsocial.http.request")
+    def test_stops_after_page_older_than_range(self, mock_request):
+        mock_request.side_effect = [self._page(40, "2026-01-01"), self._page(40, "2025-12-01"), self._page(40, "2025-11-01")]
+        result = truthsocial.search_truthsocial(
+            "tariffs", "2026-02-09", "2026-03-09", depth="deep",
+            config={"TRUTHSOCIAL_TOKEN": "valid_token"},
+        )
+        # The second page was prefetched but is discarded
+        assert len(result["statuses"]) == 40
+        assert mock_request.call_count <= 2
+
+    @patch("scripts.lib.truthsocial.http.request")
+    def test_default_depth_is_single_request(self, mock_request):
+        mock_request.return_value = self._page(40, "2026-03-01")
+        truthsocial.search_truthsocial(
+            "tariffs", "2026-02-09", "2026-03-09",
+            config={"TRUTHSOCIAL_TOKEN": "valid_token"},
+        )
+        assert mock_request.call_count == 1
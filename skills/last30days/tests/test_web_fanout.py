@@ -0,0 +1,137 @@
+"""Tests for racing and merging native web search backends in last30days.py."""
+
+import sys
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+import last30days
+from lib import env
+
+CONFIG = {"PARALLEL_API_KEY": "p", "BRAVE_API_KEY": "b", "OPENROUTER_API_KEY": "o"}
+
+
+def _result(url, backend):
+    return {
+        "title": backend, "url": url, "source_domain": "example.com",
+        "snippet": "", "date": None, "relevance": 0.5,
+    }
+
+
+class TestWebSearchConfig(unittest.TestCase):
+    def test_backends_in_priority_order(self):
+        self.assertEqual(env.get_web_search_backends(CONFIG), ["parallel", "brave", "openrouter"])
+        self.assertEqual(env.get_web_search_backends({"OPENROUTER_API_KEY": "o"}), ["openrouter"])
+
+    def test_mode_defaults_to_priority(self):
+        self.assertEqual(env.get_web_search_mode({}), "priority")
+        self.assertEqual(env.get_web_search_mode({"WEB_SEARCH_MODE": "Merge"}), "merge")
+        self.assertEqual(env.get_web_search_mode({"WEB_SEARCH_MODE": "fastest"}), "priority")
+
+
+class TestWebFanOut(unittest.TestCase):
+    def _run(self, mode, behaviour, budget=5):
+        def fake_backend(backend, topic, config, from_date, to_date, depth):
+            return behaviour[backend]()
+
+        with mock.patch.object(last30days, "_search_web_backend", side_effect=fake_backend):
+            return last30days._search_web(
+                "topic", dict(CONFIG, WEB_SEARCH_MODE=mode), "2026-01-01", "2026-01-31", "default",
+                budget=budget,
+            )
+
+    def test_priority_mode_runs_one_backend(self):
+        calls = []
+
+        def fake_backend(backend, *args):
+            calls.append(backend)
+            return [_result("https://a.com", backend)]
+
+        with mock.patch.object(last30days, "_search_web_backend", side_effect=fake_backend):
+            items, error = last30days._search_web("topic", CONFIG, "2026-01-01", "2026-01-31", "default")
+        self.assertEqual(calls, ["parallel"])
+        self.assertEqual(items[0]["id"], "W1")
+
+    def test_race_takes_first_good_response(self):
+        release = threading.Event()
+        self.addCleanup(release.set)
+
+        def slow():
+            release.wait(5)
+            return [_result("https://slow.com", "parallel")]
+
+        items, error = self._run("race", {
+            "parallel": slow,
+            "brave": lambda: [_result("https://fast.com", "brave")],
+            "openrouter": lambda: [],
+        })
+        self.assertIsNone(error)
+        self.assertEqual([i["url"] for i in items], ["https://fast.com"])
+
+    def test_merge_dedupes_urls_across_backends(self):
+        def boom():
+            raise RuntimeError("down")
+
+        items, error = self._run("merge", {
+            "parallel": lambda: [_result("https://a.com/x", "parallel"), _result("https://b.com", "parallel")],
+            "brave": lambda: [_result("https://A.com/x/", "brave"), _result("https://c.com", "brave")],
+            "openrouter": boom,
+        })
+        self.assertIsNone(error)
+        self.assertEqual([i["url"] for i in items], ["https://a.com/x", "https://b.com", "https://c.com"])
+        self.assertEqual(items[0]["title"], "parallel")
+        self.assertEqual([i["id"] for i in items], ["W1", "W2", "W3"])
+
+    def test_merge_stops_waiting_after_grace(self):
+        release = threading.Event()
+        self.addCleanup(release.set)
+
+        def hung():
+            release.wait(5)
+            return [_result("https://late.com", "brave")]
+
+        with mock.patch.object(last30days, "WEB_MERGE_GRACE", 0.1):
+            items, error = self._run("merge", {
+                "parallel": lambda: [_result("https://a.com", "parallel")],
+                "brave": hung,
+                "openrouter": lambda: [],
+            })
+        self.assertEqual([i["url"] for i in items], ["https://a.com"])
+
+    def test_later_answers_do_not_extend_grace(self):
+        release = threading.Event()
+        self.addCleanup(release.set)
+
+        def second():
+            time.sleep(0.2)
+            return [_result("https://b.com", "openrouter")]
+
+        def hung():
+            release.wait(5)
+            return [_result("https://late.com", "brave")]
+
+        started = time.monotonic()
+        with mock.patch.object(last30days, "WEB_MERGE_GRACE", 0.3):
+            items, error = self._run("merge", {
+                "parallel": lambda: [_result("https://a.com", "parallel")],
+                "brave": hung,
+                "openrouter": second,
+            })
+        self.assertLess(time.monotonic() - started, 0.45)
+        self.assertEqual([i["url"] for i in items], ["https://a.com", "https://b.com"])
+
+    def test_all_backends_failing_reports_errors(self):
+        def boom():
+            raise RuntimeError("down")
+
+        items, error = self._run("race", {"parallel": boom, "brave": boom, "openrouter": boom})
+        self.assertEqual(items, [])
+        self.assertIn("brave: RuntimeError: down", error)
+
+
+if __name__ == "__main__":
+    unittest.main()
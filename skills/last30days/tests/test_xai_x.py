@@ -0,0 +1,118 @@
+"""Tests for xai_x streamed X search."""
+
+import json
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from lib import http, xai_x
+
+
+def _post(n):
+    return {
+        "text": f"post {n} with a }} brace and \"quote\"",
+        "url": f"https://x.com/u{n}/status/{n}",
+        "author_handle": f"@u{n}",
+        "date": "2026-01-15",
+        "engagement": {"likes": n, "reposts": None},
+        "relevance": 0.9,
+    }
+
+
+OUTPUT = json.dumps({"items": [_post(1), _post(2), _post(3)]})
+
+
+def _delta(text):
+    return {"type": "response.output_text.delta", "delta": text}
+
+
+def _deltas(text, size=7):
+    return [_delta(text[i:i + size]) for i in range(0, len(text), size)]
+
+
+class TestStreamedItemParser(unittest.TestCase):
+    def test_items_decoded_as_their_braces_close(self):
+        parser = xai_x._StreamedItemParser()
+        found = []
+        for i in range(0, len(OUTPUT), 5):
+            found.extend(parser.feed(OUTPUT[i:i + 5]))
+        self.assertEqual([item["url"] for item in found], [_post(n)["url"] for n in (1, 2, 3)])
+
+    def test_nothing_before_items_array(self):
+        parser = xai_x._StreamedItemParser()
+        self.assertEqual(parser.feed('Here you go: {"it'), [])
+        self.assertEqual(parser.feed('ems": [{"url": "a"}'), [{"url": "a"}])
+
+
+class TestSearchXStreaming(unittest.TestCase):
+    def _search(self, events, on_item=None):
+        def fake_stream(url, payload, headers=None, timeout=None):
+            self.assertTrue(payload["stream"])
+            for event in events:
+                if isinstance(event, Exception):
+                    raise event
+                yield event
+
+        with mock.patch.object(http, "stream_sse", side_effect=fake_stream):
+            return xai_x.search_x("key", "grok", "topic", "2026-01-01", "2026-01-31", on_item=on_item)
+
+    def test_on_item_receives_clean_items_in_order(self):
+        seen = []
+        completed = {"type": "response.completed", "response": xai_x._items_response(None, OUTPUT)}
+        response = self._search(_deltas(OUTPUT) + [completed], on_item=seen.append)
+        self.assertEqual([i["id"] for i in seen], ["X1", "X2", "X3"])
+        self.assertEqual(seen[0]["author_handle"], "u1")
+        self.assertEqual(xai_x.parse_x_response(response), seen)
+
+    def test_dropped_stream_keeps_streamed_items(self):
+        cut = OUTPUT.index('"text": "post 3')
+        events = _deltas(OUTPUT[:cut]) + [http.HTTPError("Stream interrupted: timeout")]
+        response = self._search(events)
+        self.assertTrue(response["partial"])
+        items = xai_x.parse_x_response(response)
+        self.assertEqual([i["url"] for i in items], [_post(1)["url"], _post(2)["url"]])
+
+    def test_error_before_any_item_raises(self):
+        with self.assertRaises(http.HTTPError):
+            self._search([_delta('{"items": [{"te'), http.HTTPError("Stream interrupted")])
+
+    def test_no_completed_event_rebuilds_from_deltas(self):
+        response = self._search(_deltas(OUTPUT))
+        self.assertEqual(len(xai_x.parse_x_response(response)), 3)
+
+
+class TestResponseFromEvents(unittest.TestCase):
+    """http.response_from_events, shared by the xAI and OpenAI streams."""
+
+    def test_only_output_text_deltas_rebuild_text(self):
+        events = [
+            {"type": "response.reasoning_summary_text.delta", "delta": "thinking"},
+            {"type": "response.output_text.delta", "delta": "hel"},
+            {"type": "response.output_text.delta", "delta": "lo"},
+            {"type": "response.output_text.done", "text": "hello"},
+        ]
+        response = http.response_from_events(events)
+        self.assertEqual(response["output"][0]["content"][0]["text"], "hello")
+
+    def test_error_event_reported(self):
+        response = http.response_from_events([{"type": "error", "error": {"message": "quota"}}])
+        self.assertEqual(response, {"error": {"message": "quota"}})
+
+
+class TestTimedOutOutcome(unittest.TestCase):
+    def test_streamed_items_kept_on_timeout(self):
+        import last30days
+
+        streamed = {"x": [{"id": "X1"}]}
+        items, error, raw, used_sc = last30days._timed_out_outcome("x", "X search timed out", streamed)
+        self.assertEqual(items, [{"id": "X1"}])
+        self.assertIn("kept 1 streamed", error)
+        items, error, _, _ = last30days._timed_out_outcome("youtube", "YouTube timed out", streamed)
+        self.assertEqual((items, error), ([], "YouTube timed out"))
+
+
+if __name__ == "__main__":
+    unittest.main()
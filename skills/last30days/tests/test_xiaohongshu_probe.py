@@ -0,0 +1,92 @@
+"""Tests for the lazy, negatively cached Xiaohongshu availability probe."""
+
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from lib import cache, env
+
+CONFIG = {"XIAOHONGSHU_API_BASE": "http://127.0.0.1:18060"}
+
+
+class _CacheDirTestCase(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        for patcher in (
+            mock.patch.dict(os.environ, {"LAST30DAYS_CACHE_DIR": tmp.name}),
+            mock.patch.object(cache, "CACHE_DIR", Path(tmp.name)),
+            mock.patch.object(cache, "MODEL_CACHE_FILE", Path(tmp.name) / "model_selection.json"),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+
+class TestNegativeCache(_CacheDirTestCase):
+    def test_failed_probe_is_cached(self):
+        with mock.patch.object(env, "_probe_xiaohongshu", return_value=False) as probe:
+            self.assertFalse(env.is_xiaohongshu_available(CONFIG))
+            self.assertTrue(env.is_xiaohongshu_known_down(CONFIG))
+            self.assertFalse(env.is_xiaohongshu_available(CONFIG))
+        probe.assert_called_once()
+
+    def test_cache_is_per_api_base(self):
+        with mock.patch.object(env, "_probe_xiaohongshu", return_value=False):
+            env.is_xiaohongshu_available(CONFIG)
+        self.assertFalse(env.is_xiaohongshu_known_down({"XIAOHONGSHU_API_BASE": "http://other:1"}))
+
+    def test_uncached_probe_leaves_cache_alone(self):
+        with mock.patch.object(env, "_probe_xiaohongshu", return_value=False):
+            self.assertFalse(env.is_xiaohongshu_available(CONFIG, use_cache=False))
+        self.assertFalse(env.is_xiaohongshu_known_down(CONFIG))
+
+    def test_successful_uncached_probe_clears_record(self):
+        with mock.patch.object(env, "_probe_xiaohongshu", return_value=False):
+            env.is_xiaohongshu_available(CONFIG)
+        self.assertTrue(env.is_xiaohongshu_known_down(CONFIG))
+        with mock.patch.object(env, "_probe_xiaohongshu", return_value=True):
+            self.assertTrue(env.is_xiaohongshu_available(CONFIG, use_cache=False))
+        self.assertFalse(env.is_xiaohongshu_known_down(CONFIG))
+
+
+class TestLazyProbe(_CacheDirTestCase):
+    def setUp(self):
+        super().setUp()
+        import last30days
+        self.last30days = last30days
+
+    def test_probe_sources_does_not_probe(self):
+        with mock.patch.object(env, "_probe_xiaohongshu") as probe, \
+             mock.patch.object(env, "get_x_source_status", return_value={}), \
+             mock.patch.object(env, "is_ytdlp_available", return_value=False):
+            probes = self.last30days.probe_sources(CONFIG)
+        probe.assert_not_called()
+        self.assertTrue(probes["has_xiaohongshu"])
+
+    def test_unavailable_api_skipped_quietly_in_task(self):
+        with mock.patch.object(env, "_probe_xiaohongshu", return_value=False), \
+             mock.patch.object(self.last30days.xiaohongshu_api, "search_feeds") as search:
+            result = self.last30days._search_xiaohongshu(
+                "topic", CONFIG, "2026-01-01", "2026-01-31", "default", probe=True,
+            )
+        self.assertEqual(result, ([], None))
+        search.assert_not_called()
+
+    def test_explicit_search_skips_probe(self):
+        with mock.patch.object(env, "_probe_xiaohongshu") as probe, \
+             mock.patch.object(self.last30days.xiaohongshu_api, "search_feeds",
+                               return_value=[{"url": "https://xiaohongshu.com/1"}]):
+            items, error = self.last30days._search_xiaohongshu(
+                "topic", CONFIG, "2026-01-01", "2026-01-31", "default",
+            )
+        probe.assert_not_called()
+        self.assertEqual(items[0]["id"], "XHS1")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,213 @@
+"""Tests for youtube_yt search streaming and transcript dispatch."""
+
+import json
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from lib import youtube_yt
+
+
+def _video_line(video_id, views, upload_date="20260301"):
+    return json.dumps({
+        "id": video_id,
+        "title": f"Video {video_id}",
+        "view_count": views,
+        "upload_date": upload_date,
+    }) + "\n"
+
+
+class _FakeProc:
+    """Popen stand-in whose stdout is an arbitrary line iterator."""
+
+    pid = 99999
+
+    def __init__(self, lines):
+        self.stdout = _Lines(lines)
+        self.returncode = None
+
+    def wait(self, timeout=None):
+        self.returncode = 0
+        return 0
+
+    def poll(self):
+        return self.returncode
+
+    def kill(self):
+        self.returncode = -9
+
+
+class _Lines:
+    def __init__(self, lines):
+        self._lines = lines
+
+    def __iter__(self):
+        return iter(self._lines)
+
+    def close(self):
+        pass
+
+
+def _patch_search(lines):
+    return mock.patch.multiple(
+        youtube_yt,
+        is_ytdlp_installed=mock.Mock(return_value=True),
+        _register_child=mock.Mock(),
+        _unregister_child=mock.Mock(),
+    ), mock.patch.object(youtube_yt.subprocess, "Popen", return_value=_FakeProc(lines))
+
+
+class TestStreamedSearch(unittest.TestCase):
+    def test_on_video_called_per_line_and_result_sorted(self):
+        lines = [_video_line("a", 10), "not json\n", _video_line("b", 500), _video_line("c", 50)]
+        seen = []
+        p1, p2 = _patch_search(lines)
+        with p1, p2:
+            result = youtube_yt.search_youtube(
+                "topic", "2026-02-01", "2026-03-02", on_video=lambda item: seen.append(item["video_id"]),
+            )
+        self.assertEqual(seen, ["a", "b", "c"])
+        self.assertEqual([i["video_id"] for i in result["items"]], ["b", "c", "a"])
+        self.assertEqual(result["items"][0]["date"], "2026-03-01")
+
+
+class TestEarlyTranscriptDispatch(unittest.TestCase):
+    def test_transcripts_start_before_search_finishes(self):
+        fetch_started = threading.Event()
+        dispatched_during_search = []
+
+        def lines():
+            yield _video_line("a", 1000)
+            # The top candidate's transcript should be fetching by now
+            dispatched_during_search.append(fetch_started.wait(timeout=5))
+            yield _video_line("b", 5)
+            yield _video_line("c", 20)
+
+        def fake_fetch(video_ids, temp_dir):
+            fetch_started.set()
+            return {vid: f"transcript {vid}" for vid in video_ids}
+
+        p1, p2 = _patch_search(lines())
+        with p1, p2, mock.patch.object(youtube_yt, "_fetch_chunk", side_effect=fake_fetch):
+            result = youtube_yt.search_and_transcribe("topic", "2026-02-01", "2026-03-02", depth="quick")
+
+        self.assertEqual(dispatched_during_search, [True])
+        snippets = {i["video_id"]: i["transcript_snippet"] for i in result["items"]}
+        self.assertEqual(snippets, {"a": "transcript a", "b": "transcript b", "c": "transcript c"})
+
+    def test_stuck_transcript_fetch_keeps_videos(self):
+        release = threading.Event()
+        self.addCleanup(release.set)
+
+        def fake_fetch(video_ids, temp_dir):
+            if "b" in video_ids:
+                release.wait(5)  # In-process yt_dlp wedged on this one
+            return {vid: f"transcript {vid}" for vid in video_ids}
+
+        lines = [_video_line("a", 1000), _video_line("b", 500)]
+        p1, p2 = _patch_search(lines)
+        start = time.monotonic()
+        with p1, p2, mock.patch.object(youtube_yt, "_fetch_chunk", side_effect=fake_fetch):
+            result = youtube_yt.search_and_transcribe(
+                "topic", "2026-02-01", "2026-03-02", depth="quick", budget=0.5,
+            )
+        self.assertLess(time.monotonic() - start, 3)
+        snippets = {i["video_id"]: i["transcript_snippet"] for i in result["items"]}
+        self.assertEqual(snippets, {"a": "transcript a", "b": ""})
+
+    def test_only_final_top_n_get_transcripts(self):
+        # quick depth: top 3 by views. "old" predates from_date so is never
+        # dispatched early, and the soft date filter drops it.
+        lines = [
+            _video_line("v1", 1), _video_line("v2", 2), _video_line("v3", 3),
+            _video_line("v4", 400), _video_line("old", 9999, upload_date="20250101"),
+        ]
+        fetched = []
+
+        def fake_fetch(video_ids, temp_dir):
+            fetched.extend(video_ids)
+            return {vid: f"t-{vid}" for vid in video_ids}
+
+        p1, p2 = _patch_search(lines)
+        with p1, p2, mock.patch.object(youtube_yt, "_fetch_chunk", side_effect=fake_fetch):
+            result = youtube_yt.search_and_transcribe("topic", "2026-02-01", "2026-03-02", depth="quick")
+
+        self.assertNotIn("old", fetched)
+        self.assertEqual(len(fetched), len(set(fetched)))
+        snippets = {i["video_id"]: i["transcript_snippet"] for i in result["items"]}
+        self.assertEqual(snippets["v4"], "t-v4")
+        self.assertEqual(snippets["v3"], "t-v3")
+        self.assertEqual(snippets["v2"], "t-v2")
+        self.assertEqual(snippets["v1"], "")
+
+
+VTT = "WEBVTT\n\n00:00:00.000 --> 00:00:02.000\nhello world\n"
+
+
+class TestBatchedTranscripts(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.temp_dir = self._tmp.name
+
+    def test_in_process_api_fetches_chunk_in_one_run(self):
+        runs = []
+        temp_dir = self.temp_dir
+
+        class FakeYDL:
+            def __init__(self, opts):
+                self.opts = opts
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc):
+                return False
+
+            def download(self, urls):
+                runs.append(urls)
+                Path(temp_dir, "a.en.vtt").write_text(VTT)
+
+        fake_module = mock.Mock(YoutubeDL=FakeYDL)
+        with mock.patch.object(youtube_yt, "_load_yt_dlp", return_value=fake_module), \
+             mock.patch.object(youtube_yt, "fetch_transcript") as per_video:
+            result = youtube_yt._fetch_chunk(["a", "b"], self.temp_dir)
+
+        self.assertEqual(len(runs), 1)
+        self.assertEqual(len(runs[0]), 2)
+        self.assertEqual(result, {"a": "hello world", "b": None})
+        per_video.assert_not_called()
+
+    def test_in_process_failure_falls_back_to_per_video(self):
+        fake_module = mock.Mock()
+        fake_module.YoutubeDL.side_effect = RuntimeError("broken")
+        with mock.patch.object(youtube_yt, "_load_yt_dlp", return_value=fake_module), \
+             mock.patch.object(youtube_yt, "fetch_transcript", side_effect=lambda vid, d: f"t-{vid}"):
+            result = youtube_yt._fetch_chunk(["a", "b"], self.temp_dir)
+        self.assertEqual(result, {"a": "t-a", "b": "t-b"})
+
+    def test_cli_batch_passes_all_urls_to_one_process(self):
+        with mock.patch.object(youtube_yt, "_load_yt_dlp", return_value=None), \
+             mock.patch.object(youtube_yt, "_write_subs_subprocess", return_value=True) as write, \
+             mock.patch.object(youtube_yt, "fetch_transcript") as per_video:
+            youtube_yt._fetch_chunk(["a", "b", "c"], self.temp_dir)
+        write.assert_called_once()
+        self.assertEqual(write.call_args[0][0], ["a", "b", "c"])
+        per_video.assert_not_called()
+
+    def test_cli_missing_falls_back_to_per_video(self):
+        with mock.patch.object(youtube_yt, "_load_yt_dlp", return_value=None), \
+             mock.patch.object(youtube_yt, "_write_subs_subprocess", return_value=False), \
+             mock.patch.object(youtube_yt, "fetch_transcript", return_value=None) as per_video:
+            youtube_yt._fetch_chunk(["a", "b"], self.temp_dir)
+        self.assertEqual(per_video.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()